@@ -18,6 +18,7 @@ module.exports = {
     '^@shared/(.*)$': '<rootDir>/shared/$1',
     '^@modules/(.*)$': '<rootDir>/modules/$1',
     '^@config/(.*)$': '<rootDir>/config/$1',
+    '^@generated/(.*)$': '<rootDir>/generated/$1',
     '^uuid$': require.resolve('uuid'),
   },
   transformIgnorePatterns: [
@@ -0,0 +1,16 @@
+-- CreateTable
+CREATE TABLE "token_revocations" (
+    "id" TEXT NOT NULL,
+    "userId" TEXT NOT NULL,
+    "tokenId" TEXT,
+    "revokedAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "expiresAt" TIMESTAMP(3) NOT NULL,
+
+    CONSTRAINT "token_revocations_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateIndex
+CREATE INDEX "token_revocations_revokedAt_idx" ON "token_revocations"("revokedAt");
+
+-- CreateIndex
+CREATE INDEX "token_revocations_expiresAt_idx" ON "token_revocations"("expiresAt");
@@ -0,0 +1,47 @@
+-- CreateTable
+CREATE TABLE "outbox_events" (
+    "id" TEXT NOT NULL,
+    "eventName" VARCHAR(100) NOT NULL,
+    "aggregateId" TEXT NOT NULL,
+    "payload" JSONB NOT NULL,
+    "occurredAt" TIMESTAMP(3) NOT NULL,
+    "attempts" INTEGER NOT NULL DEFAULT 0,
+    "availableAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "lockedUntil" TIMESTAMP(3),
+    "lastError" TEXT,
+    "createdAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT "outbox_events_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateTable
+CREATE TABLE "outbox_dead_letters" (
+    "id" TEXT NOT NULL,
+    "eventName" VARCHAR(100) NOT NULL,
+    "aggregateId" TEXT NOT NULL,
+    "payload" JSONB NOT NULL,
+    "occurredAt" TIMESTAMP(3) NOT NULL,
+    "attempts" INTEGER NOT NULL,
+    "lastError" TEXT,
+    "failedAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT "outbox_dead_letters_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateTable
+CREATE TABLE "processed_events" (
+    "eventId" TEXT NOT NULL,
+    "handler" VARCHAR(150) NOT NULL,
+    "processedAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT "processed_events_pkey" PRIMARY KEY ("eventId","handler")
+);
+
+-- CreateIndex
+CREATE INDEX "outbox_events_availableAt_idx" ON "outbox_events"("availableAt");
+
+-- CreateIndex
+CREATE INDEX "outbox_dead_letters_eventName_idx" ON "outbox_dead_letters"("eventName");
+
+-- CreateIndex
+CREATE INDEX "processed_events_processedAt_idx" ON "processed_events"("processedAt");
@@ -0,0 +1,18 @@
+-- CreateTable
+CREATE TABLE "ranking_changes" (
+    "id" BIGSERIAL NOT NULL,
+    "userId" TEXT,
+    "globalFrom" INTEGER NOT NULL,
+    "globalTo" INTEGER NOT NULL,
+    "weeklyFrom" INTEGER NOT NULL,
+    "weeklyTo" INTEGER NOT NULL,
+    "createdAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT "ranking_changes_pkey" PRIMARY KEY ("id")
+);
+
+-- Rank every existing player on the first recalculation run
+INSERT INTO "ranking_changes" ("globalFrom", "globalTo", "weeklyFrom", "weeklyTo")
+SELECT MIN("globalScore"), MAX("globalScore"), MIN("weeklyScore"), MAX("weeklyScore")
+FROM "player_rankings"
+HAVING COUNT(*) > 0;
@@ -0,0 +1,14 @@
+-- AlterTable
+-- Existing weekly scores belong to the current week. NOW() is evaluated once,
+-- so the column is added without rewriting the table.
+ALTER TABLE "player_rankings"
+ADD COLUMN "weeklyEpoch" INTEGER NOT NULL
+DEFAULT FLOOR((EXTRACT(EPOCH FROM NOW()) - 345600) / 604800)::int;
+
+ALTER TABLE "player_rankings" ALTER COLUMN "weeklyEpoch" SET DEFAULT 0;
+
+-- DropIndex
+DROP INDEX "player_rankings_weeklyScore_idx";
+
+-- CreateIndex
+CREATE INDEX "player_rankings_weeklyEpoch_weeklyScore_idx" ON "player_rankings"("weeklyEpoch", "weeklyScore" DESC);
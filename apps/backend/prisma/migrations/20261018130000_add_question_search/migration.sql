@@ -0,0 +1,58 @@
+-- CreateExtension
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- AlterTable
+ALTER TABLE "questions" ADD COLUMN "searchVector" tsvector;
+
+-- Search document: question text (A), answers (B), explanation (C)
+CREATE FUNCTION questions_search_vector(question_id TEXT, question_text TEXT, question_explanation TEXT)
+RETURNS tsvector LANGUAGE sql STABLE AS $$
+  SELECT setweight(to_tsvector('french', coalesce(question_text, '')), 'A')
+      || setweight(to_tsvector('french', coalesce(
+           (SELECT string_agg(a."text", ' ') FROM "answers" a WHERE a."questionId" = question_id),
+           '')), 'B')
+      || setweight(to_tsvector('french', coalesce(question_explanation, '')), 'C');
+$$;
+
+CREATE FUNCTION questions_search_vector_refresh() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+  NEW."searchVector" := questions_search_vector(NEW."id", NEW."text", NEW."explanation");
+  RETURN NEW;
+END;
+$$;
+
+CREATE TRIGGER questions_search_vector_refresh
+BEFORE INSERT OR UPDATE OF "text", "explanation" ON "questions"
+FOR EACH ROW EXECUTE FUNCTION questions_search_vector_refresh();
+
+-- Answer changes refresh each affected question once per statement, so a
+-- multi-row insert of answers costs one UPDATE
+CREATE FUNCTION answers_search_vector_refresh() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+  UPDATE "questions" q
+  SET "searchVector" = questions_search_vector(q."id", q."text", q."explanation")
+  WHERE q."id" IN (SELECT DISTINCT "questionId" FROM changed_answers);
+  RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER answers_search_vector_insert
+AFTER INSERT ON "answers" REFERENCING NEW TABLE AS changed_answers
+FOR EACH STATEMENT EXECUTE FUNCTION answers_search_vector_refresh();
+
+CREATE TRIGGER answers_search_vector_update
+AFTER UPDATE ON "answers" REFERENCING NEW TABLE AS changed_answers
+FOR EACH STATEMENT EXECUTE FUNCTION answers_search_vector_refresh();
+
+CREATE TRIGGER answers_search_vector_delete
+AFTER DELETE ON "answers" REFERENCING OLD TABLE AS changed_answers
+FOR EACH STATEMENT EXECUTE FUNCTION answers_search_vector_refresh();
+
+-- Backfill
+UPDATE "questions" SET "searchVector" = questions_search_vector("id", "text", "explanation");
+
+-- CreateIndex
+CREATE INDEX "questions_searchVector_idx" ON "questions" USING GIN ("searchVector");
+
+-- CreateIndex
+CREATE INDEX "questions_text_idx" ON "questions" USING GIN ("text" gin_trgm_ops);
@@ -0,0 +1,18 @@
+-- AlterTable
+ALTER TABLE "quiz_sessions" ADD COLUMN "correctAnswers" INTEGER NOT NULL DEFAULT 0,
+ADD COLUMN "totalQuestions" INTEGER NOT NULL DEFAULT 0;
+
+-- Backfill the summary of existing sessions
+UPDATE "quiz_sessions" s
+SET "correctAnswers" = a."correctAnswers", "totalQuestions" = a."totalQuestions"
+FROM (
+    SELECT "sessionId",
+           COUNT(*) FILTER (WHERE "isCorrect")::int AS "correctAnswers",
+           COUNT(*)::int AS "totalQuestions"
+    FROM "session_answers"
+    GROUP BY "sessionId"
+) a
+WHERE s."id" = a."sessionId";
+
+-- CreateIndex
+CREATE INDEX "quiz_sessions_userId_startedAt_id_idx" ON "quiz_sessions"("userId", "startedAt" DESC, "id" DESC);
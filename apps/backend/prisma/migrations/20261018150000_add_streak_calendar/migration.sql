@@ -0,0 +1,10 @@
+-- AlterTable
+ALTER TABLE "player_progress" ADD COLUMN "streakDate" DATE,
+ADD COLUMN "timeZone" VARCHAR(64) NOT NULL DEFAULT 'Europe/Paris';
+
+-- Running streaks were counted per completion without a play date: anchor
+-- them on the last update so they keep going if the player plays today
+UPDATE "player_progress"
+SET "lastPlayedAt" = COALESCE("lastPlayedAt", "updatedAt"),
+    "streakDate" = ((COALESCE("lastPlayedAt", "updatedAt") AT TIME ZONE 'UTC') AT TIME ZONE "timeZone")::date
+WHERE "currentStreak" > 0;
@@ -0,0 +1,44 @@
+/**
+ * Category Stats Backfill
+ *
+ * Rebuilds category_stats from the completed sessions of every player.
+ * Safe to run while the API is serving traffic: completions not yet
+ * applied by the projection are left to it.
+ *
+ * Requires a migrated database (DATABASE_URL).
+ *
+ * Usage:
+ *   npm run stats:backfill-categories -- [--chunk-size 500]
+ */
+import 'reflect-metadata';
+import { NestFactory } from '@nestjs/core';
+import { CommandBus } from '@nestjs/cqrs';
+import { AppModule } from '../src/app.module';
+import { RebuildCategoryStatsCommand } from '../src/modules/gamification/application/commands/rebuild-category-stats.command';
+import { RebuildCategoryStatsResult } from '../src/modules/gamification/application/commands/rebuild-category-stats.handler';
+
+function arg(name: string, fallback: string): string {
+  const index = process.argv.indexOf(`--${name}`);
+  return index >= 0 && process.argv[index + 1] ? process.argv[index + 1] : fallback;
+}
+
+async function main() {
+  const app = await NestFactory.createApplicationContext(AppModule, {
+    logger: ['log', 'error', 'warn'],
+  });
+
+  try {
+    const result: RebuildCategoryStatsResult = await app
+      .get(CommandBus)
+      .execute(new RebuildCategoryStatsCommand(parseInt(arg('chunk-size', '500'), 10)));
+
+    console.log(`Rebuilt category stats of ${result.players} players in ${result.chunks} chunks`);
+  } finally {
+    await app.close();
+  }
+}
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
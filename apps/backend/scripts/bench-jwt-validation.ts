@@ -0,0 +1,185 @@
+/**
+ * JWT Validation Benchmark
+ *
+ * Boots the API once per JWT validation mode and measures authenticated
+ * requests/sec against the same endpoint:
+ * - database-uncached: user row read on every request (previous behaviour)
+ * - database: user row read through the UserLoader cache
+ * - stateless: signed claims trusted, revocation checked in memory
+ *
+ * Requires a migrated database (DATABASE_URL) and JWT_SECRET.
+ *
+ * Usage:
+ *   npm run bench:jwt -- [--duration 10] [--connections 50] [--path /api/v1/leaderboard?limit=10]
+ */
+import 'reflect-metadata';
+import * as http from 'http';
+import { AddressInfo } from 'net';
+import { NestFactory } from '@nestjs/core';
+import { INestApplication, ValidationPipe } from '@nestjs/common';
+import { AppModule } from '../src/app.module';
+
+interface BenchMode {
+  name: string;
+  env: Record<string, string>;
+}
+
+interface BenchResult {
+  mode: string;
+  requests: number;
+  errors: number;
+  requestsPerSec: number;
+  p99Ms: number;
+}
+
+const MODES: BenchMode[] = [
+  { name: 'database-uncached', env: { JWT_VALIDATION_MODE: 'database', USER_CACHE_TTL_MS: '0' } },
+  { name: 'database', env: { JWT_VALIDATION_MODE: 'database', USER_CACHE_TTL_MS: '60000' } },
+  { name: 'stateless', env: { JWT_VALIDATION_MODE: 'stateless' } },
+];
+
+function arg(name: string, fallback: string): string {
+  const index = process.argv.indexOf(`--${name}`);
+  return index >= 0 && process.argv[index + 1] ? process.argv[index + 1] : fallback;
+}
+
+async function startApp(mode: BenchMode): Promise<{ app: INestApplication; port: number }> {
+  Object.assign(process.env, mode.env);
+
+  const app = await NestFactory.create(AppModule, { logger: ['error', 'warn'] });
+  app.useGlobalPipes(
+    new ValidationPipe({
+      whitelist: true,
+      transform: true,
+      transformOptions: { enableImplicitConversion: true },
+    }),
+  );
+  app.setGlobalPrefix('api/v1');
+  await app.listen(0);
+
+  return { app, port: (app.getHttpServer().address() as AddressInfo).port };
+}
+
+function request(
+  agent: http.Agent,
+  port: number,
+  method: string,
+  path: string,
+  headers: Record<string, string> = {},
+  body?: unknown,
+): Promise<{ status: number; body: string }> {
+  return new Promise((resolve, reject) => {
+    const payload = body ? JSON.stringify(body) : undefined;
+    const req = http.request(
+      {
+        agent,
+        host: '127.0.0.1',
+        port,
+        method,
+        path,
+        headers: payload
+          ? { ...headers, 'content-type': 'application/json', 'content-length': Buffer.byteLength(payload) }
+          : headers,
+      },
+      (res) => {
+        const chunks: Buffer[] = [];
+        res.on('data', (chunk) => chunks.push(chunk));
+        res.on('end', () =>
+          resolve({ status: res.statusCode ?? 0, body: Buffer.concat(chunks).toString('utf8') }),
+        );
+      },
+    );
+    req.on('error', reject);
+    if (payload) {
+      req.write(payload);
+    }
+    req.end();
+  });
+}
+
+async function registerBenchUser(port: number): Promise<string> {
+  const agent = new http.Agent({ keepAlive: true });
+  const suffix = Date.now().toString(36);
+  const response = await request(agent, port, 'POST', '/api/v1/auth/register', {}, {
+    email: `bench_${suffix}@example.com`,
+    username: `bench_${suffix}`,
+    password: 'Bench123!pass',
+  });
+  agent.destroy();
+
+  if (response.status !== 201) {
+    throw new Error(`Could not register benchmark user (${response.status}): ${response.body}`);
+  }
+  return JSON.parse(response.body).accessToken;
+}
+
+async function run(
+  mode: string,
+  port: number,
+  path: string,
+  token: string,
+  durationMs: number,
+  connections: number,
+): Promise<BenchResult> {
+  const agent = new http.Agent({ keepAlive: true, maxSockets: connections });
+  const headers = { authorization: `Bearer ${token}` };
+  const latencies: number[] = [];
+  let errors = 0;
+
+  // Warm up caches and connections
+  await Promise.all(
+    Array.from({ length: connections }, () => request(agent, port, 'GET', path, headers)),
+  );
+
+  const deadline = Date.now() + durationMs;
+  const startedAt = process.hrtime.bigint();
+
+  const worker = async () => {
+    while (Date.now() < deadline) {
+      const sentAt = process.hrtime.bigint();
+      const response = await request(agent, port, 'GET', path, headers);
+      latencies.push(Number(process.hrtime.bigint() - sentAt) / 1e6);
+      if (response.status !== 200) {
+        errors += 1;
+      }
+    }
+  };
+  await Promise.all(Array.from({ length: connections }, worker));
+
+  const elapsedSec = Number(process.hrtime.bigint() - startedAt) / 1e9;
+  agent.destroy();
+  latencies.sort((a, b) => a - b);
+
+  return {
+    mode,
+    requests: latencies.length,
+    errors,
+    requestsPerSec: Math.round(latencies.length / elapsedSec),
+    p99Ms: Number((latencies[Math.floor(latencies.length * 0.99)] ?? 0).toFixed(2)),
+  };
+}
+
+async function main() {
+  const durationMs = parseInt(arg('duration', '10'), 10) * 1000;
+  const connections = parseInt(arg('connections', '50'), 10);
+  const path = arg('path', '/api/v1/leaderboard?limit=10');
+  const results: BenchResult[] = [];
+  let token: string | null = null;
+
+  for (const mode of MODES) {
+    const { app, port } = await startApp(mode);
+    try {
+      token ??= await registerBenchUser(port);
+      results.push(await run(mode.name, port, path, token, durationMs, connections));
+    } finally {
+      await app.close();
+    }
+  }
+
+  console.table(results);
+}
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
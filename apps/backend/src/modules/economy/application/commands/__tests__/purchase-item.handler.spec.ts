@@ -0,0 +1,143 @@
+import { BadRequestException, ConflictException, NotFoundException } from '@nestjs/common';
+import { PurchaseItemHandler } from '../purchase-item.handler';
+import { PurchaseItemCommand } from '../purchase-item.command';
+import { Lives } from '../../../domain/aggregates/lives.aggregate';
+import {
+  IShopRepository,
+  ShopItemData,
+} from '../../../domain/repositories/shop.repository.interface';
+import { IWalletRepository } from '../../../domain/repositories/wallet.repository.interface';
+import { ILivesRepository } from '../../../domain/repositories/lives.repository.interface';
+import { ReferenceCatalog } from '@shared/infrastructure/cache/reference-catalog.service';
+import { EventBusService } from '@shared/infrastructure/events/event-bus.service';
+import { PrismaService } from '@shared/infrastructure/database/prisma.service';
+
+describe('PurchaseItemHandler', () => {
+  const life: ShopItemData = {
+    id: 'item-1',
+    type: 'LIFE',
+    name: 'Extra Life',
+    description: 'Restore one life',
+    price: 50,
+    available: true,
+  };
+
+  let handler: PurchaseItemHandler;
+  let catalog: ReferenceCatalog;
+  let findItems: jest.Mock;
+  let purchase: jest.Mock;
+  let walletRepository: { getOrCreate: jest.Mock };
+  let livesRepository: { lock: jest.Mock; save: jest.Mock };
+  let eventBus: { publishAll: jest.Mock };
+
+  beforeEach(() => {
+    findItems = jest.fn().mockResolvedValue([{ ...life }]);
+    purchase = jest.fn().mockResolvedValue({ status: 'purchased', balanceAfter: 150 });
+    walletRepository = { getOrCreate: jest.fn() };
+    livesRepository = {
+      lock: jest.fn().mockResolvedValue(Lives.create('lives-1', 'user-1')),
+      save: jest.fn(),
+    };
+    eventBus = { publishAll: jest.fn() };
+
+    const prisma = {
+      client: { shopItem: { findMany: findItems } },
+      runOnPrimary: (work: () => Promise<unknown>) => work(),
+      runInTransaction: (work: () => Promise<unknown>) => work(),
+    } as unknown as PrismaService;
+    catalog = new ReferenceCatalog(prisma);
+    handler = new PurchaseItemHandler(
+      catalog,
+      { purchase } as unknown as IShopRepository,
+      walletRepository as unknown as IWalletRepository,
+      livesRepository as unknown as ILivesRepository,
+      prisma,
+      eventBus as unknown as EventBusService,
+    );
+  });
+
+  const publishedEvents = () =>
+    eventBus.publishAll.mock.calls.flatMap(([events]) => events.map((e: any) => e.eventName));
+
+  it('should debit the wallet and restore a life in one transaction', async () => {
+    const result = await handler.execute(new PurchaseItemCommand('user-1', 'item-1'));
+
+    expect(result).toEqual({ itemId: 'item-1', itemName: 'Extra Life', price: 50, balanceAfter: 150 });
+    expect(purchase).toHaveBeenCalledWith({
+      userId: 'user-1',
+      item: life,
+      description: 'Purchased Extra Life',
+    });
+    expect(livesRepository.lock).toHaveBeenCalledWith('user-1');
+    expect(livesRepository.save.mock.calls[0][0].currentLives).toBe(6);
+    expect(publishedEvents()).toEqual(['life.restored', 'coins.spent']);
+  });
+
+  it('should serve repeated purchases from the cached catalog', async () => {
+    await handler.execute(new PurchaseItemCommand('user-1', 'item-1'));
+    await handler.execute(new PurchaseItemCommand('user-1', 'item-1'));
+
+    expect(findItems).toHaveBeenCalledTimes(1);
+  });
+
+  it('should reject the purchase without side effects when the balance is short', async () => {
+    purchase.mockResolvedValue({ status: 'insufficient_balance' });
+
+    await expect(
+      handler.execute(new PurchaseItemCommand('user-1', 'item-1')),
+    ).rejects.toBeInstanceOf(BadRequestException);
+
+    expect(livesRepository.lock).not.toHaveBeenCalled();
+    expect(eventBus.publishAll).not.toHaveBeenCalled();
+  });
+
+  it('should create a missing wallet and run the purchase again', async () => {
+    purchase
+      .mockResolvedValueOnce({ status: 'no_wallet' })
+      .mockResolvedValueOnce({ status: 'insufficient_balance' });
+
+    await expect(
+      handler.execute(new PurchaseItemCommand('user-1', 'item-1')),
+    ).rejects.toBeInstanceOf(BadRequestException);
+
+    expect(walletRepository.getOrCreate).toHaveBeenCalledWith('user-1');
+    expect(purchase).toHaveBeenCalledTimes(2);
+    expect(eventBus.publishAll).not.toHaveBeenCalled();
+  });
+
+  it('should reload the catalog and retry once when the item changed', async () => {
+    purchase
+      .mockResolvedValueOnce({ status: 'item_changed' })
+      .mockResolvedValueOnce({ status: 'purchased', balanceAfter: 120 });
+    findItems.mockResolvedValueOnce([{ ...life }]).mockResolvedValueOnce([{ ...life, price: 80 }]);
+
+    const result = await handler.execute(new PurchaseItemCommand('user-1', 'item-1'));
+
+    expect(findItems).toHaveBeenCalledTimes(2);
+    expect(result.price).toBe(80);
+    expect(result.balanceAfter).toBe(120);
+  });
+
+  it('should give up when the item keeps changing', async () => {
+    purchase.mockResolvedValue({ status: 'item_changed' });
+
+    await expect(
+      handler.execute(new PurchaseItemCommand('user-1', 'item-1')),
+    ).rejects.toBeInstanceOf(ConflictException);
+
+    expect(purchase).toHaveBeenCalledTimes(2);
+  });
+
+  it('should reject unknown and unavailable items', async () => {
+    await expect(
+      handler.execute(new PurchaseItemCommand('user-1', 'missing')),
+    ).rejects.toBeInstanceOf(NotFoundException);
+
+    findItems.mockResolvedValue([{ ...life, available: false }]);
+    await catalog.invalidate('shopItems');
+    await expect(
+      handler.execute(new PurchaseItemCommand('user-1', 'item-1')),
+    ).rejects.toBeInstanceOf(BadRequestException);
+    expect(purchase).not.toHaveBeenCalled();
+  });
+});
@@ -0,0 +1,34 @@
+import { CommandHandler, ICommandHandler } from '@nestjs/cqrs';
+import { Injectable, Inject, Logger } from '@nestjs/common';
+import { MaterializeLivesCommand } from './materialize-lives.command';
+import { ILivesRepository } from '../../domain/repositories/lives.repository.interface';
+
+export interface MaterializeLivesResult {
+  updated: number;
+}
+
+/**
+ * Materialize Lives Command Handler
+ *
+ * Writes regenerated lives back for every player in one bulk update.
+ * Reads never need this; it is for exports and reporting that query the
+ * lives table directly, or before changing the regeneration rate.
+ */
+@Injectable()
+@CommandHandler(MaterializeLivesCommand)
+export class MaterializeLivesHandler
+  implements ICommandHandler<MaterializeLivesCommand, MaterializeLivesResult>
+{
+  private readonly logger = new Logger(MaterializeLivesHandler.name);
+
+  constructor(
+    @Inject('ILivesRepository')
+    private readonly livesRepository: ILivesRepository,
+  ) {}
+
+  async execute(): Promise<MaterializeLivesResult> {
+    const updated = await this.livesRepository.materializeRegeneration();
+    this.logger.log(`Materialized regenerated lives for ${updated} players`);
+    return { updated };
+  }
+}
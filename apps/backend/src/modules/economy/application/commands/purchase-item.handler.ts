@@ -1,8 +1,21 @@
 import { CommandHandler, ICommandHandler } from '@nestjs/cqrs';
-import { Injectable, Inject, NotFoundException, BadRequestException } from '@nestjs/common';
+import {
+  Injectable,
+  Inject,
+  NotFoundException,
+  BadRequestException,
+  ConflictException,
+} from '@nestjs/common';
 import { PurchaseItemCommand } from './purchase-item.command';
+import {
+  IShopRepository,
+  PurchaseOutcome,
+  ShopItemData,
+} from '../../domain/repositories/shop.repository.interface';
 import { IWalletRepository } from '../../domain/repositories/wallet.repository.interface';
 import { ILivesRepository } from '../../domain/repositories/lives.repository.interface';
+import { CoinsSpentEvent } from '../../domain/events/coins-spent.event';
+import { ReferenceCatalog } from '@shared/infrastructure/cache/reference-catalog.service';
 import { PrismaService } from '@shared/infrastructure/database/prisma.service';
 import { EventBusService } from '@shared/infrastructure/events/event-bus.service';
 
@@ -17,12 +30,12 @@ export interface PurchaseItemResult {
  * Purchase Item Command Handler
  *
  * Handles shop item purchases:
- * 1. Validate item exists and is available
- * 2. Check user has sufficient balance
- * 3. Deduct coins from wallet
- * 4. Apply item effect (restore life, etc.)
- * 5. Record transaction
- * 6. Publish events
+ * 1. Look the item up in the reference catalog
+ * 2. In one transaction: check the item is unchanged, debit the wallet if
+ *    its balance covers the price and record the transaction (one statement),
+ *    apply the item effect (restore life, etc.) and publish events. A buyer
+ *    without a wallet row gets one created and the statement runs again
+ * 3. If the item changed since the catalog was loaded, reload it and retry once
  */
 @Injectable()
 @CommandHandler(PurchaseItemCommand)
@@ -30,6 +43,9 @@ export class PurchaseItemHandler
   implements ICommandHandler<PurchaseItemCommand, PurchaseItemResult>
 {
   constructor(
+    private readonly catalog: ReferenceCatalog,
+    @Inject('IShopRepository')
+    private readonly shopRepository: IShopRepository,
     @Inject('IWalletRepository')
     private readonly walletRepository: IWalletRepository,
     @Inject('ILivesRepository')
@@ -39,69 +55,82 @@ export class PurchaseItemHandler
   ) {}
 
   async execute(command: PurchaseItemCommand): Promise<PurchaseItemResult> {
-    // Get item
-    const item = await this.prisma.shopItem.findUnique({
-      where: { id: command.itemId },
-    });
+    for (let attempt = 1; ; attempt++) {
+      const item = (await this.catalog.get('shopItems')).byId.get(command.itemId);
 
-    if (!item) {
-      throw new NotFoundException('Shop item not found');
-    }
+      if (!item) {
+        throw new NotFoundException('Shop item not found');
+      }
 
-    if (!item.available) {
-      throw new BadRequestException('Item is not available for purchase');
-    }
+      if (!item.available) {
+        throw new BadRequestException('Item is not available for purchase');
+      }
 
-    // Get wallet
-    const wallet = await this.walletRepository.getOrCreate(command.userId);
+      const outcome = await this.purchase(command.userId, item);
 
-    // Check balance
-    if (!wallet.hasBalance(item.price)) {
-      throw new BadRequestException('Insufficient balance');
+      switch (outcome.status) {
+        case 'purchased':
+          return {
+            itemId: item.id,
+            itemName: item.name,
+            price: item.price,
+            balanceAfter: outcome.balanceAfter,
+          };
+        case 'no_wallet':
+        case 'insufficient_balance':
+          throw new BadRequestException('Insufficient balance');
+        case 'item_changed':
+          if (attempt > 1) {
+            throw new ConflictException('Shop item changed, please try again');
+          }
+          await this.catalog.invalidate('shopItems');
+      }
     }
+  }
 
-    // Spend coins
-    wallet.spendCoins(item.price, 'shop_purchase', `Purchased ${item.name}`);
-
-    // Apply item effect
-    await this.applyItemEffect(command.userId, item.type);
+  private purchase(userId: string, item: ShopItemData): Promise<PurchaseOutcome> {
+    const description = `Purchased ${item.name}`;
 
-    // Save wallet
-    await this.walletRepository.save(wallet);
+    return this.prisma.runInTransaction(async () => {
+      let outcome = await this.shopRepository.purchase({ userId, item, description });
+      if (outcome.status === 'no_wallet') {
+        // First use of the wallet: create it like any other read would
+        await this.walletRepository.getOrCreate(userId);
+        outcome = await this.shopRepository.purchase({ userId, item, description });
+      }
+      if (outcome.status !== 'purchased') {
+        return outcome;
+      }
 
-    // Record transaction
-    await this.prisma.transaction.create({
-      data: {
-        userId: command.userId,
-        type: 'SPENT',
-        amount: item.price,
-        source: 'shop_purchase',
-        description: `Purchased ${item.name}`,
-        balanceAfter: wallet.balance,
-      },
-    });
+      // Apply item effect
+      await this.applyItemEffect(userId, item.type);
 
-    // Publish events
-    await this.eventBus.publishAll([...wallet.domainEvents]);
-    wallet.clearEvents();
+      await this.eventBus.publishAll([
+        new CoinsSpentEvent({
+          userId,
+          amount: item.price,
+          source: 'shop_purchase',
+          description,
+          balanceAfter: outcome.balanceAfter,
+          occurredAt: new Date(),
+        }),
+      ]);
 
-    return {
-      itemId: item.id,
-      itemName: item.name,
-      price: item.price,
-      balanceAfter: wallet.balance,
-    };
+      return outcome;
+    });
   }
 
   private async applyItemEffect(userId: string, itemType: string): Promise<void> {
     switch (itemType) {
-      case 'LIFE':
-        const lives = await this.livesRepository.getOrCreate(userId);
+      case 'LIFE': {
+        // Locked, so a concurrent life purchase or consumption cannot be lost
+        const lives = await this.livesRepository.lock(userId);
         lives.restoreLife(true);
         await this.livesRepository.save(lives);
         await this.eventBus.publishAll([...lives.domainEvents]);
         lives.clearEvents();
         break;
+      }
       // Future: Handle other item types (powerups, streak freeze, etc.)
       default:
         break;
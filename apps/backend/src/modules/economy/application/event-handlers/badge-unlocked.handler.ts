@@ -0,0 +1,76 @@
+import { Inject, Logger } from '@nestjs/common';
+import { OnDomainEvent } from '@shared/infrastructure/events/on-domain-event.decorator';
+import { DeliveredDomainEvent } from '@shared/infrastructure/events/outbox-dispatcher.service';
+import {
+  IWalletRepository,
+  WalletCredit,
+} from '../../domain/repositories/wallet.repository.interface';
+import { CoinsEarnedEvent } from '../../domain/events/coins-earned.event';
+import { EventBusService } from '@shared/infrastructure/events/event-bus.service';
+
+/**
+ * Badge Unlocked Event Handler (Economy Context)
+ *
+ * Awards the coin reward of the unlocked badge.
+ *
+ * Unlocks are received in batches and credited with one bulk update, with
+ * one ledger entry per badge.
+ */
+export class BadgeUnlockedEconomyHandler {
+  private readonly logger = new Logger(BadgeUnlockedEconomyHandler.name);
+
+  constructor(
+    @Inject('IWalletRepository')
+    private readonly walletRepository: IWalletRepository,
+    private readonly eventBus: EventBusService,
+  ) {}
+
+  @OnDomainEvent('badge.unlocked', { batch: true })
+  async handle(events: DeliveredDomainEvent[]) {
+    const credits: WalletCredit[] = [];
+    for (const event of events) {
+      const { userId, badgeName, coinReward } = event.props as {
+        userId: string;
+        badgeName: string;
+        coinReward: number;
+      };
+
+      if (coinReward > 0) {
+        credits.push({
+          userId,
+          amount: coinReward,
+          source: 'badge_reward',
+          description: `Badge unlocked: ${badgeName}`,
+        });
+      }
+    }
+
+    if (credits.length === 0) {
+      return;
+    }
+
+    this.logger.log(`Awarding ${credits.length} badge rewards`);
+
+    try {
+      const balances = await this.walletRepository.creditMany(credits);
+
+      // Publish wallet events
+      await this.eventBus.publishAll(
+        balances.map(({ userId, balance }) => {
+          const awarded = credits.filter((credit) => credit.userId === userId);
+          return new CoinsEarnedEvent({
+            userId,
+            amount: awarded.reduce((sum, credit) => sum + credit.amount, 0),
+            source: 'badge_reward',
+            description: awarded.length === 1 ? awarded[0].description : 'Badge rewards',
+            balanceAfter: balance,
+            occurredAt: new Date(),
+          });
+        }),
+      );
+    } catch (error) {
+      this.logger.error(`Failed to award ${credits.length} badge rewards`, error);
+      throw error;
+    }
+  }
+}
@@ -1,12 +1,14 @@
 import { Inject, Logger } from '@nestjs/common';
-import { OnEvent } from '@nestjs/event-emitter';
+import { OnDomainEvent } from '@shared/infrastructure/events/on-domain-event.decorator';
 import { IWalletRepository } from '../../domain/repositories/wallet.repository.interface';
+import { CoinsEarnedEvent } from '../../domain/events/coins-earned.event';
 import { EventBusService } from '@shared/infrastructure/events/event-bus.service';
 
 /**
  * Level Up Event Handler (Economy Context)
  *
- * Awards bonus coins when player levels up.
+ * Awards bonus coins when player levels up. The balance is incremented in
+ * the statement, so concurrent credits and purchases are never lost.
  */
 export class LevelUpEconomyHandler {
   private readonly logger = new Logger(LevelUpEconomyHandler.name);
@@ -18,26 +20,25 @@ export class LevelUpEconomyHandler {
     private readonly eventBus: EventBusService,
   ) {}
 
-  @OnEvent('player.level_up')
+  @OnDomainEvent('player.level_up')
   async handle(event: any) {
     const { userId, newLevel } = event.props;
 
     this.logger.log(`Awarding level up bonus for user: ${userId} (Level ${newLevel})`);
 
     try {
-      const wallet = await this.walletRepository.getOrCreate(userId);
-
-      wallet.addCoins(
-        LevelUpEconomyHandler.LEVEL_UP_BONUS,
-        'level_up_bonus',
-        `Reached Level ${newLevel}!`,
-      );
-
-      await this.walletRepository.save(wallet);
+      const credit = {
+        userId,
+        amount: LevelUpEconomyHandler.LEVEL_UP_BONUS,
+        source: 'level_up_bonus',
+        description: `Reached Level ${newLevel}!`,
+      };
+      const [{ balance }] = await this.walletRepository.creditMany([credit]);
 
       // Publish wallet events
-      await this.eventBus.publishAll([...wallet.domainEvents]);
-      wallet.clearEvents();
+      await this.eventBus.publishAll([
+        new CoinsEarnedEvent({ ...credit, balanceAfter: balance, occurredAt: new Date() }),
+      ]);
 
       this.logger.log(
         `Awarded ${LevelUpEconomyHandler.LEVEL_UP_BONUS} coins to user: ${userId}`,
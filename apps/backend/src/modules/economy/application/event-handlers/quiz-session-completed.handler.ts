@@ -1,6 +1,11 @@
 import { Inject, Logger } from '@nestjs/common';
-import { OnEvent } from '@nestjs/event-emitter';
-import { IWalletRepository } from '../../domain/repositories/wallet.repository.interface';
+import { OnDomainEvent } from '@shared/infrastructure/events/on-domain-event.decorator';
+import { DeliveredDomainEvent } from '@shared/infrastructure/events/outbox-dispatcher.service';
+import {
+  IWalletRepository,
+  WalletCredit,
+} from '../../domain/repositories/wallet.repository.interface';
+import { CoinsEarnedEvent } from '../../domain/events/coins-earned.event';
 import { EventBusService } from '@shared/infrastructure/events/event-bus.service';
 
 /**
@@ -9,6 +14,9 @@ import { EventBusService } from '@shared/infrastructure/events/event-bus.service
  * Awards coins based on quiz performance:
  * - Base: 10 coins per correct answer
  * - Perfect score bonus: 50 coins
+ *
+ * Completions are received in batches and credited with one bulk update,
+ * with one ledger entry per session.
  */
 export class QuizSessionCompletedEconomyHandler {
   private readonly logger = new Logger(QuizSessionCompletedEconomyHandler.name);
@@ -21,41 +29,53 @@ export class QuizSessionCompletedEconomyHandler {
     private readonly eventBus: EventBusService,
   ) {}
 
-  @OnEvent('quiz.session.completed')
-  async handle(event: any) {
-    const { userId, correctAnswers, totalQuestions } = event.props;
+  @OnDomainEvent('quiz.session.completed', { batch: true })
+  async handle(events: DeliveredDomainEvent[]) {
+    const credits: WalletCredit[] = [];
+    const coins = new Map<string, number>();
+    for (const event of events) {
+      const { userId, correctAnswers, totalQuestions } = event.props as {
+        userId: string;
+        correctAnswers: number;
+        totalQuestions: number;
+      };
 
-    this.logger.log(
-      `Awarding coins for quiz: ${correctAnswers}/${totalQuestions} correct (user: ${userId})`,
-    );
+      let earned = correctAnswers * QuizSessionCompletedEconomyHandler.COINS_PER_CORRECT;
+      if (totalQuestions > 0 && correctAnswers === totalQuestions) {
+        earned += QuizSessionCompletedEconomyHandler.PERFECT_SCORE_BONUS;
+      }
 
-    try {
-      const wallet = await this.walletRepository.getOrCreate(userId);
-
-      // Award coins for correct answers
-      const baseCoins = correctAnswers * QuizSessionCompletedEconomyHandler.COINS_PER_CORRECT;
-      wallet.addCoins(baseCoins, 'quiz_reward', `Answered ${correctAnswers} questions correctly`);
-
-      // Perfect score bonus
-      if (event.props.isPerfectScore) {
-        wallet.addCoins(
-          QuizSessionCompletedEconomyHandler.PERFECT_SCORE_BONUS,
-          'perfect_score_bonus',
-          'Perfect quiz score!',
-        );
+      if (earned > 0) {
+        credits.push({ userId, amount: earned, source: 'quiz_reward', description: 'Quiz rewards' });
+        coins.set(userId, (coins.get(userId) ?? 0) + earned);
       }
+    }
 
-      await this.walletRepository.save(wallet);
+    if (coins.size === 0) {
+      return;
+    }
 
-      // Publish wallet events
-      await this.eventBus.publishAll([...wallet.domainEvents]);
-      wallet.clearEvents();
+    this.logger.log(`Awarding quiz coins to ${coins.size} players (${events.length} sessions)`);
+
+    try {
+      const balances = await this.walletRepository.creditMany(credits);
 
-      const totalCoins =
-        baseCoins + (event.props.isPerfectScore ? QuizSessionCompletedEconomyHandler.PERFECT_SCORE_BONUS : 0);
-      this.logger.log(`Awarded ${totalCoins} coins to user: ${userId}`);
+      // Publish wallet events
+      await this.eventBus.publishAll(
+        balances.map(
+          ({ userId, balance }) =>
+            new CoinsEarnedEvent({
+              userId,
+              amount: coins.get(userId)!,
+              source: 'quiz_reward',
+              description: 'Quiz rewards',
+              balanceAfter: balance,
+              occurredAt: new Date(),
+            }),
+        ),
+      );
     } catch (error) {
-      this.logger.error(`Failed to award coins for user: ${userId}`, error);
+      this.logger.error(`Failed to award coins to ${coins.size} players`, error);
       throw error;
     }
   }
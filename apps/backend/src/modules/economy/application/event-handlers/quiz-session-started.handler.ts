@@ -1,5 +1,5 @@
-import { Inject, Logger, BadRequestException } from '@nestjs/common';
-import { OnEvent } from '@nestjs/event-emitter';
+import { Inject, Logger } from '@nestjs/common';
+import { OnDomainEvent } from '@shared/infrastructure/events/on-domain-event.decorator';
 import { ILivesRepository } from '../../domain/repositories/lives.repository.interface';
 import { EventBusService } from '@shared/infrastructure/events/event-bus.service';
 
@@ -8,6 +8,8 @@ import { EventBusService } from '@shared/infrastructure/events/event-bus.service
  *
  * Consumes 1 life when a quiz session starts.
  * If no lives available, the quiz start should be prevented at the application layer.
+ * The event is delivered after the session was committed, so an empty
+ * balance is only logged: throwing would retry an event that cannot succeed.
  */
 export class QuizSessionStartedEconomyHandler {
   private readonly logger = new Logger(QuizSessionStartedEconomyHandler.name);
@@ -18,14 +20,15 @@ export class QuizSessionStartedEconomyHandler {
     private readonly eventBus: EventBusService,
   ) {}
 
-  @OnEvent('quiz.session.started')
+  @OnDomainEvent('quiz.session.started')
   async handle(event: any) {
     const { userId, sessionId } = event.props;
 
     this.logger.log(`Consuming life for quiz session: ${sessionId} (user: ${userId})`);
 
     try {
-      const lives = await this.livesRepository.getOrCreate(userId);
+      // Locked, so a concurrent purchase or consumption cannot overwrite it
+      const lives = await this.livesRepository.lock(userId);
 
       // Trigger regeneration check before consuming
       lives.regenerateLives();
@@ -33,7 +36,7 @@ export class QuizSessionStartedEconomyHandler {
       if (!lives.hasLives()) {
         this.logger.warn(`User ${userId} has no lives available`);
         // Note: This should ideally be checked before quiz starts
-        throw new BadRequestException('No lives available');
+        return;
       }
 
       lives.consumeLife();
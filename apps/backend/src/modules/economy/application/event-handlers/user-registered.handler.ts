@@ -1,6 +1,6 @@
 import { EventsHandler, IEventHandler } from '@nestjs/cqrs';
 import { Inject, Logger } from '@nestjs/common';
-import { OnEvent } from '@nestjs/event-emitter';
+import { OnDomainEvent } from '@shared/infrastructure/events/on-domain-event.decorator';
 import { IWalletRepository } from '../../domain/repositories/wallet.repository.interface';
 import { ILivesRepository } from '../../domain/repositories/lives.repository.interface';
 
@@ -21,7 +21,7 @@ export class UserRegisteredEconomyHandler {
     private readonly livesRepository: ILivesRepository,
   ) {}
 
-  @OnEvent('user.registered')
+  @OnDomainEvent('user.registered')
   async handle(event: any) {
     this.logger.log(`Creating economy for user: ${event.props.userId}`);
 
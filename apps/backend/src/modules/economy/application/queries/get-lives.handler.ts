@@ -7,12 +7,14 @@ export interface GetLivesResult {
   currentLives: number;
   maxLives: number;
   lastRegenAt: Date | null;
+  nextLifeAt: Date | null;
 }
 
 /**
  * Get Lives Query Handler
  *
- * Returns user's lives status with regeneration.
+ * Returns user's lives status with regeneration. Regeneration is computed
+ * for the response only; nothing is written back on read.
  */
 @Injectable()
 @QueryHandler(GetLivesQuery)
@@ -24,17 +26,8 @@ export class GetLivesHandler implements IQueryHandler<GetLivesQuery, GetLivesRes
 
   async execute(query: GetLivesQuery): Promise<GetLivesResult> {
     const lives = await this.livesRepository.getOrCreate(query.userId);
+    const { currentLives, maxLives, lastRegenAt, nextLifeAt } = lives.livesAt();
 
-    // Trigger regeneration check
-    const restored = lives.regenerateLives();
-    if (restored > 0) {
-      await this.livesRepository.save(lives);
-    }
-
-    return {
-      currentLives: lives.currentLives,
-      maxLives: lives.maxLives,
-      lastRegenAt: lives.lastRegenAt,
-    };
+    return { currentLives, maxLives, lastRegenAt, nextLifeAt };
   }
 }
@@ -145,6 +145,66 @@ describe('Lives Aggregate', () => {
 
       expect(restored).toBe(0);
     });
+
+    it('should restore one life per elapsed interval and keep partial progress', () => {
+      const lastRegenAt = new Date('2026-10-18T10:00:00Z');
+      const lives = Lives.fromPersistence({
+        id: livesId,
+        userId,
+        currentLives: 1,
+        maxLives: 5,
+        lastRegenAt,
+        createdAt: lastRegenAt,
+        updatedAt: lastRegenAt,
+      });
+
+      const restored = lives.regenerateLives(new Date('2026-10-18T11:05:00Z'));
+
+      expect(restored).toBe(2);
+      expect(lives.currentLives).toBe(3);
+      expect(lives.lastRegenAt).toEqual(new Date('2026-10-18T11:00:00Z'));
+    });
+
+    it('should emit a single LifeRestoredEvent for several lives', () => {
+      const lastRegenAt = new Date('2026-10-18T10:00:00Z');
+      const lives = Lives.fromPersistence({
+        id: livesId,
+        userId,
+        currentLives: 0,
+        maxLives: 5,
+        lastRegenAt,
+        createdAt: lastRegenAt,
+        updatedAt: lastRegenAt,
+      });
+
+      lives.regenerateLives(new Date('2026-10-19T10:00:00Z'));
+
+      expect(lives.currentLives).toBe(5);
+      expect(lives.lastRegenAt).toBeNull();
+      expect(lives.domainEvents).toHaveLength(1);
+    });
+  });
+
+  describe('livesAt', () => {
+    it('should compute regenerated lives without changing the aggregate', () => {
+      const lastRegenAt = new Date('2026-10-18T10:00:00Z');
+      const lives = Lives.fromPersistence({
+        id: livesId,
+        userId,
+        currentLives: 2,
+        maxLives: 5,
+        lastRegenAt,
+        createdAt: lastRegenAt,
+        updatedAt: lastRegenAt,
+      });
+
+      const snapshot = lives.livesAt(new Date('2026-10-18T10:45:00Z'));
+
+      expect(snapshot.currentLives).toBe(3);
+      expect(snapshot.nextLifeAt).toEqual(new Date('2026-10-18T11:00:00Z'));
+      expect(lives.currentLives).toBe(2);
+      expect(lives.domainEvents).toHaveLength(0);
+    });
   });
 
   describe('hasLives', () => {
@@ -1,6 +1,7 @@
 import { AggregateRoot } from '@shared/domain/base/aggregate-root.base';
 import { LifeConsumedEvent } from '../events/life-consumed.event';
 import { LifeRestoredEvent } from '../events/life-restored.event';
+import { regenerateLives, RegeneratedLives } from '../services/life-regeneration';
 
 export interface LivesProps {
   id: string;
@@ -21,10 +22,12 @@ export interface LivesProps {
  * - Cannot exceed max lives from regeneration
  * - Can purchase lives to exceed max temporarily
  * - Minimum 0 lives
+ *
+ * Regeneration is computed on read (`livesAt`) and only written back when
+ * the aggregate changes for another reason: consuming or restoring a life
+ * materializes it first.
  */
 export class Lives extends AggregateRoot<string> {
-  private static readonly REGEN_INTERVAL_MINUTES = 30;
-
   private constructor(private props: LivesProps) {
     super(props.id);
   }
@@ -65,7 +68,16 @@ export class Lives extends AggregateRoot<string> {
     });
   }
 
+  /**
+   * Lives as of `now`, including regeneration, without changing the aggregate
+   */
+  livesAt(now: Date = new Date()): RegeneratedLives {
+    return regenerateLives(this.props, now);
+  }
+
   consumeLife(): void {
+    this.regenerateLives();
+
     if (this.props.currentLives <= 0) {
       throw new Error('No lives available');
     }
@@ -88,6 +100,8 @@ export class Lives extends AggregateRoot<string> {
   }
 
   restoreLife(isPurchased: boolean = false): void {
+    this.regenerateLives();
+
     // If purchased, can exceed max lives
     if (!isPurchased && this.props.currentLives >= this.props.maxLives) {
       throw new Error('Lives already at maximum');
@@ -96,12 +110,9 @@ export class Lives extends AggregateRoot<string> {
     this.props.currentLives += 1;
     this.props.updatedAt = new Date();
 
-    // Stop regeneration timer if at max
+    // Stop regeneration timer if at max, otherwise keep its progress
     if (this.props.currentLives >= this.props.maxLives) {
       this.props.lastRegenAt = null;
-    } else {
-      // Continue regeneration timer
-      this.props.lastRegenAt = new Date();
     }
 
     this.addDomainEvent(
@@ -114,34 +125,29 @@ export class Lives extends AggregateRoot<string> {
     );
   }
 
-  regenerateLives(): number {
-    if (this.props.currentLives >= this.props.maxLives) {
-      return 0; // No regeneration needed
-    }
-
-    if (!this.props.lastRegenAt) {
-      return 0; // No regeneration in progress
-    }
-
-    const now = new Date();
-    const minutesSinceRegen =
-      (now.getTime() - this.props.lastRegenAt.getTime()) / (1000 * 60);
-    const livesToRestore = Math.floor(minutesSinceRegen / Lives.REGEN_INTERVAL_MINUTES);
-
-    if (livesToRestore === 0) {
+  /**
+   * Persist regeneration up to `now` into the aggregate
+   */
+  regenerateLives(now: Date = new Date()): number {
+    const regenerated = regenerateLives(this.props, now);
+    if (regenerated.restored === 0) {
       return 0;
     }
 
-    const actualRestore = Math.min(
-      livesToRestore,
-      this.props.maxLives - this.props.currentLives,
-    );
+    this.props.currentLives = regenerated.currentLives;
+    this.props.lastRegenAt = regenerated.lastRegenAt;
+    this.props.updatedAt = now;
 
-    for (let i = 0; i < actualRestore; i++) {
-      this.restoreLife(false);
-    }
+    this.addDomainEvent(
+      new LifeRestoredEvent({
+        userId: this.props.userId,
+        livesRemaining: this.props.currentLives,
+        isPurchased: false,
+        occurredAt: now,
+      }),
+    );
 
-    return actualRestore;
+    return regenerated.restored;
   }
 
   hasLives(): boolean {
@@ -9,4 +9,14 @@ export interface ILivesRepository {
   save(lives: Lives): Promise<void>;
   findByUserId(userId: string): Promise<Lives | null>;
   getOrCreate(userId: string): Promise<Lives>;
+  /**
+   * Load the user's lives (created if missing) and lock the row until the
+   * current transaction ends; must run inside a transaction
+   */
+  lock(userId: string): Promise<Lives>;
+  /**
+   * Persist regenerated lives for every player whose regeneration is due,
+   * in one statement. Returns the number of rows updated.
+   */
+  materializeRegeneration(): Promise<number>;
 }
@@ -0,0 +1,41 @@
+/**
+ * Shop item as the buyer saw it in the reference catalog
+ */
+export interface ShopItemData {
+  id: string;
+  type: string;
+  name: string;
+  description: string;
+  price: number;
+  available: boolean;
+}
+
+export interface PurchaseRequest {
+  userId: string;
+  /**
+   * The item as the buyer saw it; the purchase fails with `item_changed`
+   * if its price, type or availability changed since
+   */
+  item: ShopItemData;
+  description: string;
+}
+
+export type PurchaseOutcome =
+  | { status: 'purchased'; balanceAfter: number }
+  | { status: 'item_changed' }
+  /** The buyer has no wallet row yet; nothing was written */
+  | { status: 'no_wallet' }
+  | { status: 'insufficient_balance' };
+
+/**
+ * Shop Repository Interface
+ *
+ * Defines contract for shop purchases.
+ */
+export interface IShopRepository {
+  /**
+   * Check the item, debit the wallet if its balance covers the price and
+   * record the ledger entry, in one statement
+   */
+  purchase(request: PurchaseRequest): Promise<PurchaseOutcome>;
+}
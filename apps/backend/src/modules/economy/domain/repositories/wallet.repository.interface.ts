@@ -1,12 +1,27 @@
 import { Wallet } from '../aggregates/wallet.aggregate';
 
+export interface WalletCredit {
+  userId: string;
+  amount: number;
+  /** Ledger source, e.g. quiz_reward */
+  source: string;
+  description: string | null;
+}
+
 /**
  * Wallet Repository Interface
  *
- * Defines contract for wallet persistence operations.
+ * Defines contract for wallet persistence operations. Balances only change
+ * through in-statement increments (creditMany, IShopRepository.purchase),
+ * never by writing back a balance read earlier.
  */
 export interface IWalletRepository {
-  save(wallet: Wallet): Promise<void>;
   findByUserId(userId: string): Promise<Wallet | null>;
   getOrCreate(userId: string): Promise<Wallet>;
+  /**
+   * Credit many wallets in one statement, creating missing ones, and record
+   * one ledger entry per credit. A player may appear in several credits.
+   * Returns the balance of each credited wallet.
+   */
+  creditMany(credits: WalletCredit[]): Promise<{ userId: string; balance: number }[]>;
 }
@@ -0,0 +1,49 @@
+export const LIFE_REGEN_INTERVAL_MS = 30 * 60 * 1000;
+
+export interface LivesState {
+  currentLives: number;
+  maxLives: number;
+  lastRegenAt: Date | null;
+}
+
+export interface RegeneratedLives extends LivesState {
+  restored: number;
+  nextLifeAt: Date | null;
+}
+
+/**
+ * Life Regeneration
+ *
+ * Lives regenerate at one per LIFE_REGEN_INTERVAL_MS from `lastRegenAt`
+ * until `maxLives`. Nothing is stored while a player waits: the current
+ * value is a function of the stored state and the clock. `lastRegenAt`
+ * advances by whole intervals only, so partial progress is never lost.
+ */
+export function regenerateLives(
+  state: LivesState,
+  now: Date,
+  intervalMs: number = LIFE_REGEN_INTERVAL_MS,
+): RegeneratedLives {
+  const { currentLives, maxLives, lastRegenAt } = state;
+
+  if (currentLives >= maxLives || !lastRegenAt) {
+    return { currentLives, maxLives, lastRegenAt, restored: 0, nextLifeAt: null };
+  }
+
+  const elapsed = Math.max(0, now.getTime() - lastRegenAt.getTime());
+  const restored = Math.min(Math.floor(elapsed / intervalMs), maxLives - currentLives);
+  const lives = currentLives + restored;
+
+  if (lives >= maxLives) {
+    return { currentLives: lives, maxLives, lastRegenAt: null, restored, nextLifeAt: null };
+  }
+
+  const anchor = new Date(lastRegenAt.getTime() + restored * intervalMs);
+  return {
+    currentLives: lives,
+    maxLives,
+    lastRegenAt: anchor,
+    restored,
+    nextLifeAt: new Date(anchor.getTime() + intervalMs),
+  };
+}
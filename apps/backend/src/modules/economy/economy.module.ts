@@ -7,6 +7,7 @@ import { EconomyController } from './presentation/controllers/economy.controller
 
 // Command Handlers
 import { PurchaseItemHandler } from './application/commands/purchase-item.handler';
+import { MaterializeLivesHandler } from './application/commands/materialize-lives.handler';
 
 // Query Handlers
 import { GetWalletHandler } from './application/queries/get-wallet.handler';
@@ -15,20 +16,23 @@ import { GetLivesHandler } from './application/queries/get-lives.handler';
 // Repositories
 import { WalletRepository } from './infrastructure/repositories/wallet.repository';
 import { LivesRepository } from './infrastructure/repositories/lives.repository';
+import { ShopRepository } from './infrastructure/repositories/shop.repository';
 
 // Event Handlers
 import { UserRegisteredEconomyHandler } from './application/event-handlers/user-registered.handler';
 import { QuizSessionCompletedEconomyHandler } from './application/event-handlers/quiz-session-completed.handler';
 import { QuizSessionStartedEconomyHandler } from './application/event-handlers/quiz-session-started.handler';
 import { LevelUpEconomyHandler } from './application/event-handlers/level-up.handler';
+import { BadgeUnlockedEconomyHandler } from './application/event-handlers/badge-unlocked.handler';
 
-const CommandHandlers = [PurchaseItemHandler];
+const CommandHandlers = [PurchaseItemHandler, MaterializeLivesHandler];
 const QueryHandlers = [GetWalletHandler, GetLivesHandler];
 const EventHandlers = [
   UserRegisteredEconomyHandler,
   QuizSessionCompletedEconomyHandler,
   QuizSessionStartedEconomyHandler,
   LevelUpEconomyHandler,
+  BadgeUnlockedEconomyHandler,
 ];
 
 const Repositories = [
@@ -40,6 +44,10 @@ const Repositories = [
     provide: 'ILivesRepository',
     useClass: LivesRepository,
   },
+  {
+    provide: 'IShopRepository',
+    useClass: ShopRepository,
+  },
 ];
 
 /**
@@ -62,6 +70,8 @@ const Repositories = [
  * - UserRegisteredEvent -> Create wallet and lives
  * - QuizSessionStartedEvent -> Consume 1 life
  * - QuizSessionCompletedEvent -> Award coins based on score
+ * - LevelUpEvent -> Award level up bonus
+ * - BadgeUnlockedEvent -> Award the badge coin reward
  */
 @Module({
   imports: [CqrsModule, SharedModule],
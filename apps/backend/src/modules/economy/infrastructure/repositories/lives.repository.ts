@@ -1,20 +1,23 @@
 import { Injectable } from '@nestjs/common';
+import { Lives as LivesRow } from '@generated/prisma/client';
 import { PrismaService } from '@shared/infrastructure/database/prisma.service';
 import { ILivesRepository } from '../../domain/repositories/lives.repository.interface';
 import { Lives } from '../../domain/aggregates/lives.aggregate';
+import { LIFE_REGEN_INTERVAL_MS } from '../../domain/services/life-regeneration';
 import { v4 as uuidv4 } from 'uuid';
 
 /**
  * Lives Repository Implementation
  *
  * Implements persistence for Lives aggregate using Prisma.
+ * Stored lives only change on writes; regeneration is derived on read.
  */
 @Injectable()
 export class LivesRepository implements ILivesRepository {
   constructor(private readonly prisma: PrismaService) {}
 
   async save(lives: Lives): Promise<void> {
-    await this.prisma.lives.upsert({
+    await this.prisma.client.lives.upsert({
       where: { userId: lives.userId },
       create: {
         id: lives.id,
@@ -33,33 +36,80 @@ export class LivesRepository implements ILivesRepository {
   }
 
   async findByUserId(userId: string): Promise<Lives | null> {
-    const livesData = await this.prisma.lives.findUnique({
+    const livesData = await this.prisma.client.lives.findUnique({
       where: { userId },
     });
 
-    if (!livesData) {
-      return null;
-    }
-
-    return Lives.fromPersistence({
-      id: livesData.id,
-      userId: livesData.userId,
-      currentLives: livesData.currentLives,
-      maxLives: livesData.maxLives,
-      lastRegenAt: livesData.lastRegenAt,
-      createdAt: livesData.createdAt,
-      updatedAt: livesData.updatedAt,
-    });
+    return livesData ? this.toDomain(livesData) : null;
   }
 
   async getOrCreate(userId: string): Promise<Lives> {
     let lives = await this.findByUserId(userId);
 
     if (!lives) {
-      lives = Lives.create(uuidv4(), userId);
-      await this.save(lives);
+      if (this.prisma.onReplica) {
+        // Created on the primary, which may also have it already
+        return this.prisma.runOnPrimary(() => this.getOrCreate(userId));
+      }
+      // Insert only: a row created concurrently must not be reset
+      await this.prisma.client.lives.createMany({
+        data: [{ id: uuidv4(), userId }],
+        skipDuplicates: true,
+      });
+      lives = (await this.findByUserId(userId))!;
     }
 
     return lives;
   }
+
+  async lock(userId: string): Promise<Lives> {
+    await this.prisma.client.lives.createMany({
+      data: [{ id: uuidv4(), userId }],
+      skipDuplicates: true,
+    });
+
+    const [row] = await this.prisma.client.$queryRaw<LivesRow[]>`
+      SELECT * FROM lives WHERE "userId" = ${userId} FOR UPDATE
+    `;
+
+    return this.toDomain(row);
+  }
+
+  async materializeRegeneration(): Promise<number> {
+    // Same rule as regenerateLives(): whole intervals since lastRegenAt,
+    // capped at maxLives, with the timer advanced by the intervals used
+    return this.prisma.client.$executeRaw`
+      WITH due AS (
+        SELECT id, FLOOR(
+          EXTRACT(EPOCH FROM ((NOW() AT TIME ZONE 'UTC') - "lastRegenAt")) * 1000
+            / ${LIFE_REGEN_INTERVAL_MS}::int
+        )::int AS intervals
+        FROM lives
+        WHERE "lastRegenAt" IS NOT NULL
+          AND "lastRegenAt" <= (NOW() AT TIME ZONE 'UTC') - (${LIFE_REGEN_INTERVAL_MS}::int * INTERVAL '1 millisecond')
+          AND "currentLives" < "maxLives"
+      )
+      UPDATE lives SET
+        "currentLives" = LEAST(lives."maxLives", lives."currentLives" + due.intervals),
+        "lastRegenAt" = CASE
+          WHEN lives."currentLives" + due.intervals >= lives."maxLives" THEN NULL
+          ELSE lives."lastRegenAt" + due.intervals * (${LIFE_REGEN_INTERVAL_MS}::int * INTERVAL '1 millisecond')
+        END,
+        "updatedAt" = NOW() AT TIME ZONE 'UTC'
+      FROM due
+      WHERE lives.id = due.id
+    `;
+  }
+
+  private toDomain(data: LivesRow): Lives {
+    return Lives.fromPersistence({
+      id: data.id,
+      userId: data.userId,
+      currentLives: data.currentLives,
+      maxLives: data.maxLives,
+      lastRegenAt: data.lastRegenAt,
+      createdAt: data.createdAt,
+      updatedAt: data.updatedAt,
+    });
+  }
 }
@@ -0,0 +1,65 @@
+import { Injectable } from '@nestjs/common';
+import { PrismaService } from '@shared/infrastructure/database/prisma.service';
+import {
+  IShopRepository,
+  PurchaseOutcome,
+  PurchaseRequest,
+} from '../../domain/repositories/shop.repository.interface';
+import { v4 as uuidv4 } from 'uuid';
+
+/**
+ * Shop Repository Implementation
+ *
+ * Purchases are one conditional statement: the item must still match the
+ * buyer's copy, and `balance >= price` is checked by the UPDATE itself, so
+ * concurrent purchases can never overdraw a wallet.
+ */
+@Injectable()
+export class ShopRepository implements IShopRepository {
+  constructor(private readonly prisma: PrismaService) {}
+
+  async purchase(request: PurchaseRequest): Promise<PurchaseOutcome> {
+    const { userId, item, description } = request;
+
+    const [row] = await this.prisma.client.$queryRaw<
+      { itemCurrent: boolean; walletFound: boolean; balanceAfter: number | null }[]
+    >`
+      WITH item AS (
+        SELECT 1 FROM shop_items
+        WHERE id = ${item.id}
+          AND available
+          AND price = ${item.price}::int
+          AND type::text = ${item.type}
+      ), debit AS (
+        UPDATE wallets SET
+          balance = balance - ${item.price}::int,
+          "lifetimeSpent" = "lifetimeSpent" + ${item.price}::int,
+          "updatedAt" = (NOW() AT TIME ZONE 'UTC')
+        WHERE "userId" = ${userId}
+          AND balance >= ${item.price}::int
+          AND EXISTS (SELECT 1 FROM item)
+        RETURNING balance
+      ), ledger AS (
+        INSERT INTO transactions
+          (id, "userId", type, amount, source, description, "balanceAfter", "createdAt")
+        SELECT ${uuidv4()}, ${userId}, 'SPENT'::"TransactionType", ${item.price}::int,
+               'shop_purchase', ${description}, balance, (NOW() AT TIME ZONE 'UTC')
+        FROM debit
+      )
+      SELECT EXISTS (SELECT 1 FROM item) AS "itemCurrent",
+             EXISTS (SELECT 1 FROM wallets WHERE "userId" = ${userId}) AS "walletFound",
+             (SELECT balance FROM debit) AS "balanceAfter"
+    `;
+
+    if (!row.itemCurrent) {
+      return { status: 'item_changed' };
+    }
+    if (!row.walletFound) {
+      return { status: 'no_wallet' };
+    }
+    if (row.balanceAfter === null) {
+      return { status: 'insufficient_balance' };
+    }
+    return { status: 'purchased', balanceAfter: row.balanceAfter };
+  }
+}
@@ -1,6 +1,10 @@
 import { Injectable } from '@nestjs/common';
+import { Prisma } from '@generated/prisma/client';
 import { PrismaService } from '@shared/infrastructure/database/prisma.service';
-import { IWalletRepository } from '../../domain/repositories/wallet.repository.interface';
+import {
+  IWalletRepository,
+  WalletCredit,
+} from '../../domain/repositories/wallet.repository.interface';
 import { Wallet } from '../../domain/aggregates/wallet.aggregate';
 import { v4 as uuidv4 } from 'uuid';
 
@@ -13,27 +17,51 @@ import { v4 as uuidv4 } from 'uuid';
 export class WalletRepository implements IWalletRepository {
   constructor(private readonly prisma: PrismaService) {}
 
-  async save(wallet: Wallet): Promise<void> {
-    await this.prisma.wallet.upsert({
-      where: { userId: wallet.userId },
-      create: {
-        id: wallet.id,
-        userId: wallet.userId,
-        balance: wallet.balance,
-        lifetimeEarned: wallet.lifetimeEarned,
-        lifetimeSpent: wallet.lifetimeSpent,
-      },
-      update: {
-        balance: wallet.balance,
-        lifetimeEarned: wallet.lifetimeEarned,
-        lifetimeSpent: wallet.lifetimeSpent,
-        updatedAt: new Date(),
-      },
-    });
+  async creditMany(credits: WalletCredit[]): Promise<{ userId: string; balance: number }[]> {
+    if (credits.length === 0) {
+      return [];
+    }
+
+    const values = Prisma.join(
+      credits.map(
+        (c, i) => Prisma.sql`(
+          ${uuidv4()}, ${c.userId}, ${c.amount}::int, ${c.source}, ${c.description}::text, ${i}::int
+        )`,
+      ),
+    );
+
+    // Each ledger entry's balanceAfter is the final balance minus the
+    // player's credits that come after it in the list
+    return this.prisma.client.$queryRaw<{ userId: string; balance: number }[]>`
+      WITH credits AS (
+        SELECT * FROM (VALUES ${values}) AS v(id, "userId", amount, source, description, ord)
+      ), credited AS (
+        INSERT INTO wallets (id, "userId", balance, "lifetimeEarned", "updatedAt")
+        SELECT gen_random_uuid(), "userId", SUM(amount)::int, SUM(amount)::int,
+               (NOW() AT TIME ZONE 'UTC')
+        FROM credits
+        GROUP BY "userId"
+        ON CONFLICT ("userId") DO UPDATE SET
+          balance = wallets.balance + EXCLUDED.balance,
+          "lifetimeEarned" = wallets."lifetimeEarned" + EXCLUDED."lifetimeEarned",
+          "updatedAt" = (NOW() AT TIME ZONE 'UTC')
+        RETURNING "userId", balance
+      ), ledger AS (
+        INSERT INTO transactions
+          (id, "userId", type, amount, source, description, "balanceAfter", "createdAt")
+        SELECT c.id, c."userId", 'EARNED'::"TransactionType", c.amount, c.source, c.description,
+               w.balance + c.amount
+                 - SUM(c.amount) OVER (PARTITION BY c."userId" ORDER BY c.ord DESC)::int,
+               (NOW() AT TIME ZONE 'UTC')
+        FROM credits c
+        JOIN credited w ON w."userId" = c."userId"
+      )
+      SELECT "userId", balance FROM credited
+    `;
   }
 
   async findByUserId(userId: string): Promise<Wallet | null> {
-    const walletData = await this.prisma.wallet.findUnique({
+    const walletData = await this.prisma.client.wallet.findUnique({
       where: { userId },
     });
 
@@ -56,8 +84,16 @@ export class WalletRepository implements IWalletRepository {
     let wallet = await this.findByUserId(userId);
 
     if (!wallet) {
-      wallet = Wallet.create(uuidv4(), userId);
-      await this.save(wallet);
+      if (this.prisma.onReplica) {
+        // Created on the primary, which may also have it already
+        return this.prisma.runOnPrimary(() => this.getOrCreate(userId));
+      }
+      // Insert only: a row created concurrently must not be reset
+      await this.prisma.client.wallet.createMany({
+        data: [{ id: uuidv4(), userId }],
+        skipDuplicates: true,
+      });
+      wallet = (await this.findByUserId(userId))!;
     }
 
     return wallet;
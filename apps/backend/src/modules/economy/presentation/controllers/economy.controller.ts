@@ -10,8 +10,11 @@ import {
 import { CommandBus, QueryBus } from '@nestjs/cqrs';
 import { ApiTags, ApiOperation, ApiResponse, ApiBearerAuth } from '@nestjs/swagger';
 import { JwtAuthGuard } from '@shared/presentation/guards/jwt-auth.guard';
+import { RolesGuard } from '@shared/presentation/guards/roles.guard';
+import { Roles } from '@shared/presentation/decorators/roles.decorator';
 import { CurrentUser } from '@shared/presentation/decorators/current-user.decorator';
-import { PrismaService } from '@shared/infrastructure/database/prisma.service';
+import { ConditionalGet } from '@shared/presentation/decorators/conditional-get.decorator';
+import { ReferenceCatalog } from '@shared/infrastructure/cache/reference-catalog.service';
 import {
   PurchaseItemDto,
   PurchaseItemResponseDto,
@@ -20,6 +23,8 @@ import {
   ShopItemDto,
 } from '../dtos/purchase-item.dto';
 import { PurchaseItemCommand } from '../../application/commands/purchase-item.command';
+import { MaterializeLivesCommand } from '../../application/commands/materialize-lives.command';
+import { MaterializeLivesResult } from '../../application/commands/materialize-lives.handler';
 import { GetWalletQuery } from '../../application/queries/get-wallet.query';
 import { GetLivesQuery } from '../../application/queries/get-lives.query';
 
@@ -34,15 +39,16 @@ import { GetLivesQuery } from '../../application/queries/get-lives.query';
 @ApiTags('economy')
 @ApiBearerAuth()
 @Controller('economy')
-@UseGuards(JwtAuthGuard)
+@UseGuards(JwtAuthGuard, RolesGuard)
 export class EconomyController {
   constructor(
     private readonly commandBus: CommandBus,
     private readonly queryBus: QueryBus,
-    private readonly prisma: PrismaService,
+    private readonly catalog: ReferenceCatalog,
   ) {}
 
   @Get('wallet')
+  @ConditionalGet({ resource: 'wallet', invalidatedBy: ['coins.earned', 'coins.spent'] })
   @ApiOperation({ summary: 'Get user wallet information' })
   @ApiResponse({
     status: 200,
@@ -55,6 +61,11 @@ export class EconomyController {
   }
 
   @Get('lives')
+  @ConditionalGet({
+    resource: 'lives',
+    invalidatedBy: ['life.consumed', 'life.restored'],
+    validUntil: (lives: LivesResponseDto) => lives.nextLifeAt,
+  })
   @ApiOperation({ summary: 'Get user lives status' })
   @ApiResponse({
     status: 200,
@@ -66,6 +77,16 @@ export class EconomyController {
     return this.queryBus.execute(new GetLivesQuery(user.userId));
   }
 
+  @Post('lives/materialize')
+  @Roles('ADMIN', 'SUPER_ADMIN')
+  @HttpCode(HttpStatus.OK)
+  @ApiOperation({ summary: 'Persist regenerated lives for all players (Admin only)' })
+  @ApiResponse({ status: 200, description: 'Number of players updated' })
+  @ApiResponse({ status: 403, description: 'Forbidden - Admin access required' })
+  async materializeLives(): Promise<MaterializeLivesResult> {
+    return this.commandBus.execute(new MaterializeLivesCommand());
+  }
+
   @Get('shop')
   @ApiOperation({ summary: 'Get available shop items' })
   @ApiResponse({
@@ -75,11 +96,9 @@ export class EconomyController {
   })
   @ApiResponse({ status: 401, description: 'Unauthorized' })
   async getShopItems(): Promise<ShopItemDto[]> {
-    const items = await this.prisma.shopItem.findMany({
-      where: { available: true },
-    });
+    const { byId } = await this.catalog.get('shopItems');
 
-    return items.map((item) => ({
+    return [...byId.values()].filter((item) => item.available).map((item) => ({
       id: item.id,
       type: item.type,
       name: item.name,
@@ -46,6 +46,13 @@ export class LivesResponseDto {
     nullable: true,
   })
   lastRegenAt!: Date | null;
+
+  @ApiProperty({
+    example: '2024-01-01T12:30:00Z',
+    description: 'When the next life regenerates',
+    nullable: true,
+  })
+  nextLifeAt!: Date | null;
 }
 
 export class ShopItemDto {
@@ -0,0 +1,3 @@
+export class RebuildCategoryStatsCommand {
+  constructor(public readonly chunkSize: number = 500) {}
+}
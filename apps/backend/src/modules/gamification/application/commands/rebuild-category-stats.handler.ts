@@ -0,0 +1,56 @@
+import { CommandHandler, ICommandHandler } from '@nestjs/cqrs';
+import { Injectable, Inject, Logger } from '@nestjs/common';
+import { RebuildCategoryStatsCommand } from './rebuild-category-stats.command';
+import { ICategoryStatRepository } from '../../domain/repositories/category-stat.repository.interface';
+import { CategoryStatsProjectionHandler } from '../event-handlers/category-stats-projection.handler';
+
+export interface RebuildCategoryStatsResult {
+  players: number;
+  chunks: number;
+}
+
+/**
+ * Rebuild Category Stats Command Handler
+ *
+ * One-off backfill of category_stats from session history, run with
+ * `npm run stats:backfill-categories`. Players are walked in id order one
+ * chunk at a time, each chunk replaced in its own transaction, so it can
+ * run against a live database while the projection keeps applying new
+ * completions.
+ */
+@Injectable()
+@CommandHandler(RebuildCategoryStatsCommand)
+export class RebuildCategoryStatsHandler
+  implements ICommandHandler<RebuildCategoryStatsCommand, RebuildCategoryStatsResult>
+{
+  private readonly logger = new Logger(RebuildCategoryStatsHandler.name);
+
+  constructor(
+    @Inject('ICategoryStatRepository')
+    private readonly categoryStatRepository: ICategoryStatRepository,
+  ) {}
+
+  async execute(command: RebuildCategoryStatsCommand): Promise<RebuildCategoryStatsResult> {
+    const handlerKey = `${CategoryStatsProjectionHandler.name}.handle`;
+    const result: RebuildCategoryStatsResult = { players: 0, chunks: 0 };
+    let cursor: string | null = null;
+
+    for (;;) {
+      const userIds = await this.categoryStatRepository.rebuildChunk(
+        cursor,
+        command.chunkSize,
+        handlerKey,
+      );
+      if (userIds.length === 0) {
+        break;
+      }
+
+      cursor = userIds[userIds.length - 1];
+      result.players += userIds.length;
+      result.chunks++;
+      this.logger.log(`Rebuilt category stats of ${result.players} players`);
+    }
+
+    return result;
+  }
+}
@@ -0,0 +1,6 @@
+export class SetTimeZoneCommand {
+  constructor(
+    public readonly userId: string,
+    public readonly timeZone: string,
+  ) {}
+}
@@ -0,0 +1,29 @@
+import { CommandHandler, ICommandHandler } from '@nestjs/cqrs';
+import { Injectable, Inject } from '@nestjs/common';
+import { SetTimeZoneCommand } from './set-time-zone.command';
+import { IPlayerProgressRepository } from '../../domain/repositories/player-progress.repository.interface';
+
+/**
+ * Set Time Zone Command Handler
+ *
+ * The time zone decides when a player's day starts for streaks.
+ */
+@Injectable()
+@CommandHandler(SetTimeZoneCommand)
+export class SetTimeZoneHandler
+  implements ICommandHandler<SetTimeZoneCommand, { timeZone: string }>
+{
+  constructor(
+    @Inject('IPlayerProgressRepository')
+    private readonly progressRepository: IPlayerProgressRepository,
+  ) {}
+
+  async execute(command: SetTimeZoneCommand): Promise<{ timeZone: string }> {
+    const progress = await this.progressRepository.getOrCreate(command.userId);
+
+    progress.changeTimeZone(command.timeZone);
+    await this.progressRepository.save(progress);
+
+    return { timeZone: progress.timeZone };
+  }
+}
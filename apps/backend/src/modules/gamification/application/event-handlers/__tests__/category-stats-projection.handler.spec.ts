@@ -0,0 +1,79 @@
+import { CategoryStatsProjectionHandler } from '../category-stats-projection.handler';
+import { ICategoryStatRepository } from '../../../domain/repositories/category-stat.repository.interface';
+import { BadgeEvaluator } from '../../../infrastructure/badges/badge-evaluator.service';
+import { DeliveredDomainEvent } from '@shared/infrastructure/events/outbox-dispatcher.service';
+
+describe('CategoryStatsProjectionHandler', () => {
+  let increment: jest.Mock;
+  let evaluate: jest.Mock;
+  let handler: CategoryStatsProjectionHandler;
+
+  const completion = (
+    userId: string,
+    categoryId: string | null,
+    correctAnswers: number,
+    totalQuestions: number,
+  ): DeliveredDomainEvent => ({
+    eventId: `${userId}-${Math.random()}`,
+    eventName: 'quiz.session.completed',
+    occurredOn: new Date(),
+    props: { userId, categoryId, correctAnswers, totalQuestions },
+    getAggregateId: () => 'session-1',
+  });
+
+  beforeEach(() => {
+    increment = jest.fn();
+    evaluate = jest.fn().mockResolvedValue([]);
+    handler = new CategoryStatsProjectionHandler(
+      {
+        increment,
+        findCorrectByCategory: jest.fn().mockResolvedValue(new Map()),
+      } as unknown as ICategoryStatRepository,
+      { evaluate } as unknown as BadgeEvaluator,
+    );
+  });
+
+  it('should sum completions per player and category into one write', async () => {
+    await handler.handle([
+      completion('user-1', 'cat-1', 7, 10),
+      completion('user-1', 'cat-1', 10, 10),
+      completion('user-1', 'cat-2', 3, 10),
+      completion('user-2', 'cat-1', 5, 10),
+    ]);
+
+    expect(increment).toHaveBeenCalledTimes(1);
+    expect(increment.mock.calls[0][0]).toEqual([
+      {
+        userId: 'user-1',
+        categoryId: 'cat-1',
+        quizzesPlayed: 2,
+        correctAnswers: 17,
+        totalAnswers: 20,
+      },
+      {
+        userId: 'user-1',
+        categoryId: 'cat-2',
+        quizzesPlayed: 1,
+        correctAnswers: 3,
+        totalAnswers: 10,
+      },
+      {
+        userId: 'user-2',
+        categoryId: 'cat-1',
+        quizzesPlayed: 1,
+        correctAnswers: 5,
+        totalAnswers: 10,
+      },
+    ]);
+    expect(evaluate.mock.calls[0][0].map((change: { userId: string }) => change.userId)).toEqual([
+      'user-1',
+      'user-2',
+    ]);
+  });
+
+  it('should skip sessions without a category', async () => {
+    await handler.handle([completion('user-1', null, 7, 10)]);
+
+    expect(increment).toHaveBeenCalledWith([]);
+  });
+});
@@ -0,0 +1,47 @@
+import { Logger } from '@nestjs/common';
+import { OnDomainEvent } from '@shared/infrastructure/events/on-domain-event.decorator';
+import { DeliveredDomainEvent } from '@shared/infrastructure/events/outbox-dispatcher.service';
+import {
+  BadgeChange,
+  BadgeEvaluator,
+} from '../../infrastructure/badges/badge-evaluator.service';
+
+/**
+ * Badge Evaluation Handler (Gamification Context)
+ *
+ * Unlocks level and streak badges. Both events carry the new value, so
+ * only the badges depending on it are tested and nothing is reloaded.
+ */
+export class BadgeEvaluationHandler {
+  private readonly logger = new Logger(BadgeEvaluationHandler.name);
+
+  constructor(private readonly badgeEvaluator: BadgeEvaluator) {}
+
+  @OnDomainEvent('player.level_up', { batch: true })
+  async onLevelUp(events: DeliveredDomainEvent[]) {
+    const unlocked = await this.badgeEvaluator.evaluate(
+      events.map((event): BadgeChange => {
+        const { userId, newLevel } = event.props as { userId: string; newLevel: number };
+        return { userId, inputs: ['level'], facts: { level: newLevel } };
+      }),
+    );
+    this.logUnlocked(unlocked.length, events.length);
+  }
+
+  @OnDomainEvent('player.streak_updated', { batch: true })
+  async onStreakUpdated(events: DeliveredDomainEvent[]) {
+    const unlocked = await this.badgeEvaluator.evaluate(
+      events.map((event): BadgeChange => {
+        const { userId, currentStreak } = event.props as { userId: string; currentStreak: number };
+        return { userId, inputs: ['streak'], facts: { streak: currentStreak } };
+      }),
+    );
+    this.logUnlocked(unlocked.length, events.length);
+  }
+
+  private logUnlocked(unlocked: number, events: number) {
+    if (unlocked > 0) {
+      this.logger.log(`Unlocked ${unlocked} badges (${events} events)`);
+    }
+  }
+}
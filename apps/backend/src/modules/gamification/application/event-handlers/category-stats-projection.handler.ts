@@ -0,0 +1,77 @@
+import { Inject, Logger } from '@nestjs/common';
+import { OnDomainEvent } from '@shared/infrastructure/events/on-domain-event.decorator';
+import { DeliveredDomainEvent } from '@shared/infrastructure/events/outbox-dispatcher.service';
+import {
+  CategoryStatDelta,
+  ICategoryStatRepository,
+} from '../../domain/repositories/category-stat.repository.interface';
+import {
+  BadgeChange,
+  BadgeEvaluator,
+} from '../../infrastructure/badges/badge-evaluator.service';
+
+/**
+ * Category Stats Projection Handler (Gamification Context)
+ *
+ * Keeps category_stats up to date from completed sessions, so per-category
+ * accuracy is read from one row per category instead of being aggregated
+ * from session answers. Completions of a batch are summed per player and
+ * category and applied with a single upsert. Sessions without a category
+ * (mixed quizzes) are not counted.
+ */
+export class CategoryStatsProjectionHandler {
+  private readonly logger = new Logger(CategoryStatsProjectionHandler.name);
+
+  constructor(
+    @Inject('ICategoryStatRepository')
+    private readonly categoryStatRepository: ICategoryStatRepository,
+    private readonly badgeEvaluator: BadgeEvaluator,
+  ) {}
+
+  @OnDomainEvent('quiz.session.completed', { batch: true })
+  async handle(events: DeliveredDomainEvent[]) {
+    const deltas = new Map<string, CategoryStatDelta>();
+
+    for (const event of events) {
+      const { userId, categoryId, correctAnswers, totalQuestions } = event.props as {
+        userId: string;
+        categoryId: string | null;
+        correctAnswers: number;
+        totalQuestions: number;
+      };
+      if (!categoryId) {
+        continue;
+      }
+
+      const key = `${userId}|${categoryId}`;
+      const delta = deltas.get(key) ?? {
+        userId,
+        categoryId,
+        quizzesPlayed: 0,
+        correctAnswers: 0,
+        totalAnswers: 0,
+      };
+      delta.quizzesPlayed++;
+      delta.correctAnswers += correctAnswers;
+      delta.totalAnswers += totalQuestions;
+      deltas.set(key, delta);
+    }
+
+    try {
+      await this.categoryStatRepository.increment([...deltas.values()]);
+
+      const userIds = [...new Set([...deltas.values()].map((delta) => delta.userId))];
+      const correct = await this.categoryStatRepository.findCorrectByCategory(userIds);
+      await this.badgeEvaluator.evaluate(
+        userIds.map((userId): BadgeChange => ({
+          userId,
+          inputs: ['categories'],
+          facts: { categoryCorrect: correct.get(userId) },
+        })),
+      );
+    } catch (error) {
+      this.logger.error(`Failed to update category stats (${events.length} sessions)`, error);
+      throw error;
+    }
+  }
+}
@@ -1,7 +1,24 @@
 import { Inject, Logger } from '@nestjs/common';
-import { OnEvent } from '@nestjs/event-emitter';
+import { OnDomainEvent } from '@shared/infrastructure/events/on-domain-event.decorator';
+import { DeliveredDomainEvent } from '@shared/infrastructure/events/outbox-dispatcher.service';
 import { IPlayerProgressRepository } from '../../domain/repositories/player-progress.repository.interface';
 import { EventBusService } from '@shared/infrastructure/events/event-bus.service';
+import {
+  BadgeChange,
+  BadgeEvaluator,
+} from '../../infrastructure/badges/badge-evaluator.service';
+import { SessionFacts } from '../../domain/services/badge-rules';
+import { PlayerProgressUpdatedEvent } from '../../domain/events/player-progress-updated.event';
+import { StreakSettlement } from '../../infrastructure/streaks/streak-settlement.service';
+
+interface Completion {
+  userId: string;
+  difficultyId: string;
+  correctAnswers: number;
+  totalQuestions: number;
+  averageTimeSpent?: number;
+  occurredAt: Date;
+}
 
 /**
  * Quiz Session Completed Event Handler (Gamification Context)
@@ -9,7 +26,15 @@ import { EventBusService } from '@shared/infrastructure/events/event-bus.service
  * Updates player progress:
  * - Award XP based on correct answers (50 XP per correct answer)
  * - Record quiz completion stats
- * - Increment daily streak
+ * - Count the first quiz of each local day in the streak
+ * - Unlock the badges depending on quiz counters and on the sessions
+ *   themselves, evaluated against the updated progress in memory
+ *
+ * Completions are received in batches: the affected progress rows are
+ * locked once, every completion is applied in memory in order, and the
+ * results are written back with one bulk update. Players whose streak
+ * lapsed since their last play are settled first (reset, or covered by a
+ * streak protection) with the same statement as the periodic pass.
  */
 export class QuizSessionCompletedGamificationHandler {
   private readonly logger = new Logger(QuizSessionCompletedGamificationHandler.name);
@@ -19,41 +44,77 @@ export class QuizSessionCompletedGamificationHandler {
     @Inject('IPlayerProgressRepository')
     private readonly progressRepository: IPlayerProgressRepository,
     private readonly eventBus: EventBusService,
+    private readonly badgeEvaluator: BadgeEvaluator,
+    private readonly streakSettlement: StreakSettlement,
   ) {}
 
-  @OnEvent('quiz.session.completed')
-  async handle(event: any) {
-    const { userId, correctAnswers, totalQuestions } = event.props;
+  @OnDomainEvent('quiz.session.completed', { batch: true })
+  async handle(events: DeliveredDomainEvent[]) {
+    const completions = events.map((event) => event.props as unknown as Completion);
+    const userIds = [...new Set(completions.map((c) => c.userId))];
 
     this.logger.log(
-      `Updating progress for quiz: ${correctAnswers}/${totalQuestions} (user: ${userId})`,
+      `Updating progress for ${userIds.length} players (${completions.length} sessions)`,
     );
 
     try {
-      const progress = await this.progressRepository.getOrCreate(userId);
+      let progresses = await this.progressRepository.lockMany(userIds);
+
+      const lapsed = progresses.filter((p) => p.hasLapsedStreak()).map((p) => p.userId);
+      if (lapsed.length > 0) {
+        await this.streakSettlement.settle(lapsed);
+        progresses = await this.progressRepository.lockMany(userIds);
+      }
 
-      // Award XP
-      const xpEarned =
-        correctAnswers * QuizSessionCompletedGamificationHandler.XP_PER_CORRECT;
-      progress.addXP(xpEarned);
+      const byUser = new Map(progresses.map((progress) => [progress.userId, progress]));
 
-      // Record quiz stats
-      progress.recordQuizCompletion(correctAnswers, totalQuestions);
+      for (const { userId, correctAnswers, totalQuestions, occurredAt } of completions) {
+        const progress = byUser.get(userId)!;
 
-      // Increment streak (simplified - in production, check if daily quiz)
-      progress.incrementStreak();
+        // Award XP
+        progress.addXP(correctAnswers * QuizSessionCompletedGamificationHandler.XP_PER_CORRECT);
 
-      await this.progressRepository.save(progress);
+        // Record quiz stats
+        progress.recordQuizCompletion(correctAnswers, totalQuestions);
 
-      // Publish progress events (level up, streak updated)
-      await this.eventBus.publishAll([...progress.domainEvents]);
-      progress.clearEvents();
+        // Streak moves once per local day
+        progress.recordPlay(occurredAt);
+      }
+
+      await this.progressRepository.saveMany(progresses);
+
+      await this.badgeEvaluator.evaluate(
+        progresses.map((progress): BadgeChange => ({
+          userId: progress.userId,
+          inputs: ['quizzes', 'perfectQuizzes', 'correctAnswers', 'session'],
+          facts: {
+            totalQuizzes: progress.totalQuizzes,
+            perfectQuizzes: progress.perfectQuizzes,
+            totalCorrect: progress.totalCorrect,
+            sessions: completions
+              .filter((c) => c.userId === progress.userId)
+              .map((c): SessionFacts => ({ ...c, completedAt: c.occurredAt })),
+          },
+        })),
+      );
 
-      this.logger.log(
-        `Progress updated for user ${userId}: +${xpEarned} XP, Level ${progress.currentLevel}, Streak ${progress.currentStreak}`,
+      // Publish progress events (level up, streak updated, progress updated)
+      const now = new Date();
+      await this.eventBus.publishAll(
+        progresses.flatMap((progress) => [
+          ...progress.domainEvents,
+          new PlayerProgressUpdatedEvent({
+            userId: progress.userId,
+            currentXP: progress.currentXP,
+            currentLevel: progress.currentLevel,
+            totalQuizzes: progress.totalQuizzes,
+            occurredAt: now,
+          }),
+        ]),
       );
+      progresses.forEach((progress) => progress.clearEvents());
     } catch (error) {
-      this.logger.error(`Failed to update progress for user: ${userId}`, error);
+      this.logger.error(`Failed to update progress for ${userIds.length} players`, error);
       throw error;
     }
   }
@@ -1,5 +1,5 @@
 import { Inject, Logger } from '@nestjs/common';
-import { OnEvent } from '@nestjs/event-emitter';
+import { OnDomainEvent } from '@shared/infrastructure/events/on-domain-event.decorator';
 import { IPlayerProgressRepository } from '../../domain/repositories/player-progress.repository.interface';
 
 /**
@@ -15,7 +15,7 @@ export class UserRegisteredGamificationHandler {
     private readonly progressRepository: IPlayerProgressRepository,
   ) {}
 
-  @OnEvent('user.registered')
+  @OnDomainEvent('user.registered')
   async handle(event: any) {
     this.logger.log(`Creating player progress for user: ${event.props.userId}`);
 
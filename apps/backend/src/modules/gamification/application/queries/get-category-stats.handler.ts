@@ -0,0 +1,31 @@
+import { QueryHandler, IQueryHandler } from '@nestjs/cqrs';
+import { Injectable, Inject } from '@nestjs/common';
+import { GetCategoryStatsQuery } from './get-category-stats.query';
+import {
+  CategoryStatView,
+  ICategoryStatRepository,
+} from '../../domain/repositories/category-stat.repository.interface';
+
+export interface CategoryStatResult extends CategoryStatView {
+  accuracy: number;
+}
+
+@Injectable()
+@QueryHandler(GetCategoryStatsQuery)
+export class GetCategoryStatsHandler
+  implements IQueryHandler<GetCategoryStatsQuery, CategoryStatResult[]>
+{
+  constructor(
+    @Inject('ICategoryStatRepository')
+    private readonly categoryStatRepository: ICategoryStatRepository,
+  ) {}
+
+  async execute(query: GetCategoryStatsQuery): Promise<CategoryStatResult[]> {
+    const stats = await this.categoryStatRepository.findByUserId(query.userId);
+
+    return stats.map((stat) => ({
+      ...stat,
+      accuracy: stat.totalAnswers === 0 ? 0 : (stat.correctAnswers / stat.totalAnswers) * 100,
+    }));
+  }
+}
@@ -0,0 +1,3 @@
+export class GetCategoryStatsQuery {
+  constructor(public readonly userId: string) {}
+}
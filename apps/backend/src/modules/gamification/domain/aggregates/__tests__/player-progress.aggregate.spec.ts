@@ -185,6 +185,79 @@ describe('PlayerProgress Aggregate', () => {
     });
   });
 
+  describe('recordPlay', () => {
+    // Europe/Paris is UTC+2 in July
+    const at = (iso: string) => new Date(iso);
+
+    it('should move the streak once per local day', () => {
+      const progress = PlayerProgress.create(progressId, userId);
+
+      progress.recordPlay(at('2026-07-01T08:00:00Z'));
+      progress.recordPlay(at('2026-07-01T20:00:00Z'));
+
+      expect(progress.currentStreak).toBe(1);
+      expect(progress.domainEvents).toHaveLength(1);
+      expect(progress.lastPlayedAt).toEqual(at('2026-07-01T20:00:00Z'));
+    });
+
+    it('should continue the streak on the next local day', () => {
+      const progress = PlayerProgress.create(progressId, userId);
+
+      progress.recordPlay(at('2026-07-01T08:00:00Z'));
+      // 00:30 on July 2nd in Paris
+      progress.recordPlay(at('2026-07-01T22:30:00Z'));
+
+      expect(progress.currentStreak).toBe(2);
+      expect(progress.longestStreak).toBe(2);
+    });
+
+    it('should start over after a missed day', () => {
+      const progress = PlayerProgress.create(progressId, userId);
+
+      progress.recordPlay(at('2026-07-01T08:00:00Z'));
+      progress.recordPlay(at('2026-07-02T08:00:00Z'));
+      progress.recordPlay(at('2026-07-04T08:00:00Z'));
+
+      expect(progress.currentStreak).toBe(1);
+      expect(progress.longestStreak).toBe(2);
+    });
+
+    it('should follow the player time zone', () => {
+      const progress = PlayerProgress.create(progressId, userId);
+      progress.changeTimeZone('America/New_York');
+
+      // July 1st, 23:00 and July 2nd, 01:00 in New York
+      progress.recordPlay(at('2026-07-02T03:00:00Z'));
+      progress.recordPlay(at('2026-07-02T05:00:00Z'));
+
+      expect(progress.currentStreak).toBe(2);
+    });
+
+    it('should reject an unknown time zone', () => {
+      const progress = PlayerProgress.create(progressId, userId);
+
+      expect(() => progress.changeTimeZone('Mars/Olympus_Mons')).toThrow(
+        'Unknown time zone: Mars/Olympus_Mons',
+      );
+    });
+  });
+
+  describe('hasLapsedStreak', () => {
+    it('should be lapsed once a whole local day passed without play', () => {
+      const progress = PlayerProgress.create(progressId, userId);
+      progress.recordPlay(new Date('2026-07-01T08:00:00Z'));
+
+      expect(progress.hasLapsedStreak(new Date('2026-07-02T21:00:00Z'))).toBe(false);
+      expect(progress.hasLapsedStreak(new Date('2026-07-02T22:30:00Z'))).toBe(true);
+    });
+
+    it('should not be lapsed without a streak', () => {
+      const progress = PlayerProgress.create(progressId, userId);
+
+      expect(progress.hasLapsedStreak(new Date('2026-07-10T08:00:00Z'))).toBe(false);
+    });
+  });
+
   describe('accuracy', () => {
     it('should calculate accuracy correctly', () => {
       const progress = PlayerProgress.create(progressId, userId);
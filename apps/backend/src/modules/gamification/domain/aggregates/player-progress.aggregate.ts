@@ -1,6 +1,8 @@
 import { AggregateRoot } from '@shared/domain/base/aggregate-root.base';
 import { LevelUpEvent } from '../events/level-up.event';
 import { StreakUpdatedEvent } from '../events/streak-updated.event';
+import { InvalidArgumentException } from '@shared/domain/exceptions';
+import { DEFAULT_TIME_ZONE, isValidTimeZone, localDay } from '../services/streak-calendar';
 
 export interface PlayerProgressProps {
   id: string;
@@ -13,6 +15,13 @@ export interface PlayerProgressProps {
   perfectQuizzes: number;
   totalCorrect: number;
   totalAnswers: number;
+  lastPlayedAt: Date | null;
+  /**
+   * Last local day counted in the streak (played or covered by a
+   * protection), see streak-calendar
+   */
+  streakDay: number | null;
+  timeZone: string;
   createdAt: Date;
   updatedAt: Date;
 }
@@ -24,7 +33,8 @@ export interface PlayerProgressProps {
  * Business rules:
  * - XP increases with quiz completion
  * - Level up at 1000 XP intervals
- * - Streak increases with daily quiz completion
+ * - Streak increases with the first quiz of each local day in the
+ *   player's time zone, and starts over after a missed day
  */
 export class PlayerProgress extends AggregateRoot<string> {
   private static readonly XP_PER_LEVEL = 1000;
@@ -69,6 +79,18 @@ export class PlayerProgress extends AggregateRoot<string> {
     return this.props.totalAnswers;
   }
 
+  get lastPlayedAt(): Date | null {
+    return this.props.lastPlayedAt;
+  }
+
+  get streakDay(): number | null {
+    return this.props.streakDay;
+  }
+
+  get timeZone(): string {
+    return this.props.timeZone;
+  }
+
   get createdAt(): Date {
     return this.props.createdAt;
   }
@@ -89,6 +111,9 @@ export class PlayerProgress extends AggregateRoot<string> {
       perfectQuizzes: 0,
       totalCorrect: 0,
       totalAnswers: 0,
+      lastPlayedAt: null,
+      streakDay: null,
+      timeZone: DEFAULT_TIME_ZONE,
       createdAt: new Date(),
       updatedAt: new Date(),
     });
@@ -146,6 +171,50 @@ export class PlayerProgress extends AggregateRoot<string> {
     );
   }
 
+  /**
+   * Count a quiz played at `playedAt` in the streak. Only the first play
+   * of a local day moves the streak; missed days must have been settled
+   * (streak reset or protected) beforehand, see `hasLapsedStreak`.
+   */
+  recordPlay(playedAt: Date = new Date()): void {
+    const today = localDay(playedAt, this.props.timeZone);
+
+    if (!this.props.lastPlayedAt || playedAt > this.props.lastPlayedAt) {
+      this.props.lastPlayedAt = playedAt;
+    }
+    this.props.updatedAt = new Date();
+
+    if (this.props.streakDay !== null && this.props.streakDay >= today) {
+      return;
+    }
+
+    if (this.props.streakDay !== today - 1) {
+      this.props.currentStreak = 0;
+    }
+    this.props.streakDay = today;
+    this.incrementStreak();
+  }
+
+  /**
+   * Whether a whole local day has passed since the last streak day
+   */
+  hasLapsedStreak(now: Date = new Date()): boolean {
+    return (
+      this.props.currentStreak > 0 &&
+      this.props.streakDay !== null &&
+      this.props.streakDay < localDay(now, this.props.timeZone) - 1
+    );
+  }
+
+  changeTimeZone(timeZone: string): void {
+    if (!isValidTimeZone(timeZone)) {
+      throw new InvalidArgumentException(`Unknown time zone: ${timeZone}`);
+    }
+
+    this.props.timeZone = timeZone;
+    this.props.updatedAt = new Date();
+  }
+
   resetStreak(): void {
     this.props.currentStreak = 0;
     this.props.updatedAt = new Date();
@@ -0,0 +1,32 @@
+import { DomainEvent } from '@shared/domain/base/domain-event.base';
+
+export interface BadgeUnlockedEventProps {
+  userId: string;
+  badgeId: string;
+  badgeName: string;
+  rarity: string;
+  coinReward: number;
+  occurredAt: Date;
+}
+
+export class BadgeUnlockedEvent extends DomainEvent {
+  constructor(public readonly props: BadgeUnlockedEventProps) {
+    super('badge.unlocked');
+  }
+
+  getAggregateId(): string {
+    return this.props.userId;
+  }
+
+  get userId(): string {
+    return this.props.userId;
+  }
+
+  get badgeId(): string {
+    return this.props.badgeId;
+  }
+
+  get coinReward(): number {
+    return this.props.coinReward;
+  }
+}
@@ -0,0 +1,29 @@
+import { DomainEvent } from '@shared/domain/base/domain-event.base';
+
+export interface PlayerProgressUpdatedEventProps {
+  userId: string;
+  currentXP: number;
+  currentLevel: number;
+  totalQuizzes: number;
+  occurredAt: Date;
+}
+
+/**
+ * Player Progress Updated Domain Event
+ *
+ * Published when a completed quiz has been counted in a player's progress
+ * (XP, quiz stats, streak). Used to invalidate cached progress responses.
+ */
+export class PlayerProgressUpdatedEvent extends DomainEvent {
+  constructor(public readonly props: PlayerProgressUpdatedEventProps) {
+    super('player.progress_updated');
+  }
+
+  getAggregateId(): string {
+    return this.props.userId;
+  }
+
+  get userId(): string {
+    return this.props.userId;
+  }
+}
@@ -0,0 +1,13 @@
+export interface BadgeUnlock {
+  userId: string;
+  badgeId: string;
+}
+
+export interface IBadgeRepository {
+  findUnlockedBadgeIds(userIds: string[]): Promise<Map<string, string[]>>;
+  /**
+   * Insert player badges, ignoring those already unlocked; returns the
+   * ones actually inserted
+   */
+  unlock(unlocks: BadgeUnlock[]): Promise<BadgeUnlock[]>;
+}
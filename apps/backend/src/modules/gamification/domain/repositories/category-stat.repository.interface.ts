@@ -0,0 +1,36 @@
+/**
+ * Counters to add to a player's stats in one category
+ */
+export interface CategoryStatDelta {
+  userId: string;
+  categoryId: string;
+  quizzesPlayed: number;
+  correctAnswers: number;
+  totalAnswers: number;
+}
+
+export interface CategoryStatView {
+  categoryName: string;
+  quizzesPlayed: number;
+  correctAnswers: number;
+  totalAnswers: number;
+}
+
+export interface ICategoryStatRepository {
+  /**
+   * Add the deltas with one batched upsert
+   */
+  increment(deltas: CategoryStatDelta[]): Promise<void>;
+  findByUserId(userId: string): Promise<CategoryStatView[]>;
+  /**
+   * Correct answers by category name, for each of the players
+   */
+  findCorrectByCategory(userIds: string[]): Promise<Map<string, Map<string, number>>>;
+  /**
+   * Recompute the stats of the next `limit` players after `afterUserId`
+   * from their completed sessions, leaving out completions whose event
+   * `handlerKey` has not processed yet. Returns the players of the chunk
+   * in id order, none when there are no players left.
+   */
+  rebuildChunk(afterUserId: string | null, limit: number, handlerKey: string): Promise<string[]>;
+}
@@ -1,7 +1,27 @@
 import { PlayerProgress } from '../aggregates/player-progress.aggregate';
 
+export interface SettledStreak {
+  userId: string;
+  previousStreak: number;
+  longestStreak: number;
+  /** A streak protection was consumed instead of resetting the streak */
+  protected: boolean;
+}
+
 export interface IPlayerProgressRepository {
   save(progress: PlayerProgress): Promise<void>;
   findByUserId(userId: string): Promise<PlayerProgress | null>;
   getOrCreate(userId: string): Promise<PlayerProgress>;
+  /**
+   * Load (creating missing ones) and lock the progress of many players
+   * until the current transaction ends
+   */
+  lockMany(userIds: string[]): Promise<PlayerProgress[]>;
+  saveMany(progresses: PlayerProgress[]): Promise<void>;
+  /**
+   * Settle the streaks of players who missed a local day (all players, or
+   * only `userIds`): consume a streak protection if they have one,
+   * otherwise reset the streak. Rows locked elsewhere are skipped.
+   */
+  settleLapsedStreaks(userIds?: string[]): Promise<SettledStreak[]>;
 }
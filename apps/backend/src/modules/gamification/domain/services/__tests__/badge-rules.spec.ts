@@ -0,0 +1,85 @@
+import { BadgeDefinition, BadgeReferences, BadgeRuleSet } from '../badge-rules';
+
+describe('BadgeRuleSet', () => {
+  const references: BadgeReferences = {
+    categoryNames: new Map([['chocolat', 'Chocolat & Confiserie']]),
+    difficultyIds: new Map([['mof', 'diff-mof']]),
+  };
+
+  const badge = (id: string, conditionData: unknown): BadgeDefinition => ({
+    id,
+    name: id,
+    rarity: 'COMMON',
+    coinReward: 25,
+    conditionData,
+  });
+
+  const compile = (...badges: BadgeDefinition[]) =>
+    BadgeRuleSet.compile(badges, references, 'Europe/Paris');
+
+  it('should index rules by the fact they read', () => {
+    const ruleSet = compile(
+      badge('first-quiz', { type: 'quizzes_completed', count: 1 }),
+      badge('streak-7', { type: 'streak', days: 7 }),
+      badge('level-20', { type: 'level', value: 20 }),
+    );
+
+    expect(ruleSet.rulesFor(['streak']).map((rule) => rule.badge.id)).toEqual(['streak-7']);
+    expect(ruleSet.rulesFor(['level', 'quizzes'])).toHaveLength(2);
+    expect(ruleSet.rulesFor(['categories'])).toEqual([]);
+    expect(ruleSet.bitOf('level-20')).toBe(2);
+  });
+
+  it('should test counters against the snapshot', () => {
+    const [perfect] = compile(badge('perfect-10', { type: 'perfect_quizzes', count: 10 })).rules;
+
+    expect(perfect.test({ perfectQuizzes: 9 })).toBe(false);
+    expect(perfect.test({ perfectQuizzes: 10 })).toBe(true);
+  });
+
+  it('should resolve category and difficulty names when compiling', () => {
+    const [chocolate, played, mof] = compile(
+      badge('chocolatier', { type: 'category_answers', category: 'chocolat', count: 50 }),
+      badge('curious', { type: 'categories_played', count: 3 }),
+      badge('mof', { type: 'perfect_quiz_difficulty', difficulty: 'mof' }),
+    ).rules;
+
+    const categoryCorrect = new Map([
+      ['Chocolat & Confiserie', 50],
+      ['Viennoiseries', 2],
+    ]);
+    expect(chocolate.test({ categoryCorrect })).toBe(true);
+    expect(played.test({ categoryCorrect })).toBe(false);
+
+    const session = { completedAt: new Date(), difficultyId: 'diff-mof', totalQuestions: 10 };
+    expect(mof.test({ sessions: [{ ...session, correctAnswers: 10 }] })).toBe(true);
+    expect(mof.test({ sessions: [{ ...session, correctAnswers: 9 }] })).toBe(false);
+  });
+
+  it('should read session hours in the configured time zone', () => {
+    const [morning] = compile(badge('morning', { type: 'time_of_day', before: 9 })).rules;
+    const session = { difficultyId: 'diff-1', correctAnswers: 5, totalQuestions: 10 };
+
+    // 07:30 UTC is 09:30 in Paris (summer time)
+    expect(
+      morning.test({ sessions: [{ ...session, completedAt: new Date('2026-07-01T07:30:00Z') }] }),
+    ).toBe(false);
+    expect(
+      morning.test({ sessions: [{ ...session, completedAt: new Date('2026-07-01T06:30:00Z') }] }),
+    ).toBe(true);
+  });
+
+  it('should skip badges whose condition cannot be compiled', () => {
+    const ruleSet = compile(
+      badge('unknown', { type: 'moon_phase' }),
+      badge('bad-category', { type: 'category_answers', category: 'sushi', count: 5 }),
+      badge('first-quiz', { type: 'quizzes_completed', count: 1 }),
+    );
+
+    expect(ruleSet.rules.map((rule) => [rule.badge.id, rule.bit])).toEqual([['first-quiz', 0]]);
+    expect(ruleSet.skipped.map(({ reason }) => reason)).toEqual([
+      'Unknown condition type: moon_phase',
+      'Unknown category: sushi',
+    ]);
+  });
+});
@@ -0,0 +1,244 @@
+/**
+ * Badge Rules
+ *
+ * Compiles the structured `Badge.conditionData` into predicates once, and
+ * indexes them by the player fact they read, so an event only evaluates
+ * the badges whose input it changed.
+ */
+
+/**
+ * Player facts a badge condition can depend on
+ */
+export type BadgeInput =
+  | 'quizzes'
+  | 'perfectQuizzes'
+  | 'correctAnswers'
+  | 'level'
+  | 'streak'
+  | 'categories'
+  | 'session';
+
+export interface SessionFacts {
+  completedAt: Date;
+  difficultyId: string;
+  correctAnswers: number;
+  totalQuestions: number;
+  /**
+   * Average time per answer in milliseconds, when known
+   */
+  averageTimeSpent?: number;
+}
+
+/**
+ * Snapshot of the facts that changed; a rule only reads the fact of its input
+ */
+export interface BadgeFacts {
+  totalQuizzes?: number;
+  perfectQuizzes?: number;
+  totalCorrect?: number;
+  level?: number;
+  streak?: number;
+  /**
+   * Correct answers by category name, one entry per category played
+   */
+  categoryCorrect?: Map<string, number>;
+  sessions?: SessionFacts[];
+}
+
+export interface BadgeDefinition {
+  id: string;
+  name: string;
+  rarity: string;
+  coinReward: number;
+  conditionData: unknown;
+}
+
+/**
+ * Lookups resolving the names used in conditions to stored values
+ */
+export interface BadgeReferences {
+  /** Category slug -> category name */
+  categoryNames: Map<string, string>;
+  /** Difficulty level -> difficulty id */
+  difficultyIds: Map<string, string>;
+}
+
+export interface CompiledBadgeRule {
+  badge: BadgeDefinition;
+  /** Position of the badge in unlocked-badge bitsets */
+  bit: number;
+  input: BadgeInput;
+  test: (facts: BadgeFacts) => boolean;
+}
+
+type Condition = Record<string, unknown> & { type?: unknown };
+
+export class BadgeRuleSet {
+  private readonly byInput = new Map<BadgeInput, CompiledBadgeRule[]>();
+  private readonly bits = new Map<string, number>();
+
+  private constructor(
+    readonly rules: CompiledBadgeRule[],
+    readonly skipped: { badge: BadgeDefinition; reason: string }[],
+  ) {
+    for (const rule of rules) {
+      const indexed = this.byInput.get(rule.input) ?? [];
+      indexed.push(rule);
+      this.byInput.set(rule.input, indexed);
+      this.bits.set(rule.badge.id, rule.bit);
+    }
+  }
+
+  /**
+   * Compile badge conditions. Badges with a condition that cannot be
+   * compiled are reported in `skipped` and never unlock.
+   *
+   * @param timeZone Time zone of `time_of_day` conditions
+   */
+  static compile(
+    badges: BadgeDefinition[],
+    references: BadgeReferences,
+    timeZone: string,
+  ): BadgeRuleSet {
+    const rules: CompiledBadgeRule[] = [];
+    const skipped: { badge: BadgeDefinition; reason: string }[] = [];
+    const hourOf = hourFormatter(timeZone);
+
+    for (const badge of badges) {
+      try {
+        const { input, test } = compileCondition(badge.conditionData, references, hourOf);
+        rules.push({ badge, bit: rules.length, input, test });
+      } catch (error) {
+        skipped.push({ badge, reason: (error as Error).message });
+      }
+    }
+
+    return new BadgeRuleSet(rules, skipped);
+  }
+
+  /**
+   * Rules depending on any of `inputs`
+   */
+  rulesFor(inputs: Iterable<BadgeInput>): CompiledBadgeRule[] {
+    const rules: CompiledBadgeRule[] = [];
+    for (const input of new Set(inputs)) {
+      rules.push(...(this.byInput.get(input) ?? []));
+    }
+    return rules;
+  }
+
+  bitOf(badgeId: string): number | undefined {
+    return this.bits.get(badgeId);
+  }
+}
+
+function compileCondition(
+  data: unknown,
+  references: BadgeReferences,
+  hourOf: (date: Date) => number,
+): Pick<CompiledBadgeRule, 'input' | 'test'> {
+  if (!data || typeof data !== 'object') {
+    throw new Error('Condition is not an object');
+  }
+  const condition = data as Condition;
+
+  switch (condition.type) {
+    case 'quizzes_completed': {
+      const count = positive(condition, 'count');
+      return { input: 'quizzes', test: (f) => (f.totalQuizzes ?? 0) >= count };
+    }
+    case 'perfect_quizzes': {
+      const count = positive(condition, 'count');
+      return { input: 'perfectQuizzes', test: (f) => (f.perfectQuizzes ?? 0) >= count };
+    }
+    case 'total_correct_answers': {
+      const count = positive(condition, 'count');
+      return { input: 'correctAnswers', test: (f) => (f.totalCorrect ?? 0) >= count };
+    }
+    case 'level': {
+      const value = positive(condition, 'value');
+      return { input: 'level', test: (f) => (f.level ?? 0) >= value };
+    }
+    case 'streak': {
+      const days = positive(condition, 'days');
+      return { input: 'streak', test: (f) => (f.streak ?? 0) >= days };
+    }
+    case 'categories_played': {
+      const count = positive(condition, 'count');
+      return { input: 'categories', test: (f) => (f.categoryCorrect?.size ?? 0) >= count };
+    }
+    case 'category_answers': {
+      const count = positive(condition, 'count');
+      const name = references.categoryNames.get(String(condition.category));
+      if (!name) {
+        throw new Error(`Unknown category: ${condition.category}`);
+      }
+      return { input: 'categories', test: (f) => (f.categoryCorrect?.get(name) ?? 0) >= count };
+    }
+    case 'time_of_day': {
+      const before = optionalHour(condition, 'before');
+      const after = optionalHour(condition, 'after');
+      if (before === undefined && after === undefined) {
+        throw new Error('time_of_day needs "before" or "after"');
+      }
+      const matches = (hour: number) =>
+        (before === undefined || hour < before) && (after === undefined || hour >= after);
+      return {
+        input: 'session',
+        test: (f) => (f.sessions ?? []).some((s) => matches(hourOf(s.completedAt))),
+      };
+    }
+    case 'average_time': {
+      const maxMs = positive(condition, 'maxSeconds') * 1000;
+      return {
+        input: 'session',
+        test: (f) =>
+          (f.sessions ?? []).some(
+            (s) => s.averageTimeSpent !== undefined && s.averageTimeSpent < maxMs,
+          ),
+      };
+    }
+    case 'perfect_quiz_difficulty': {
+      const difficultyId = references.difficultyIds.get(String(condition.difficulty));
+      if (!difficultyId) {
+        throw new Error(`Unknown difficulty: ${condition.difficulty}`);
+      }
+      return {
+        input: 'session',
+        test: (f) =>
+          (f.sessions ?? []).some(
+            (s) =>
+              s.difficultyId === difficultyId &&
+              s.totalQuestions > 0 &&
+              s.correctAnswers === s.totalQuestions,
+          ),
+      };
+    }
+    default:
+      throw new Error(`Unknown condition type: ${condition.type}`);
+  }
+}
+
+function positive(condition: Condition, field: string): number {
+  const value = condition[field];
+  if (typeof value !== 'number' || !(value > 0)) {
+    throw new Error(`"${field}" must be a positive number`);
+  }
+  return value;
+}
+
+function optionalHour(condition: Condition, field: string): number | undefined {
+  const value = condition[field];
+  if (value === undefined) {
+    return undefined;
+  }
+  if (typeof value !== 'number' || value < 0 || value > 24) {
+    throw new Error(`"${field}" must be an hour between 0 and 24`);
+  }
+  return value;
+}
+
+function hourFormatter(timeZone: string): (date: Date) => number {
+  const format = new Intl.DateTimeFormat('en-GB', { timeZone, hour: 'numeric', hourCycle: 'h23' });
+  return (date) => parseInt(format.format(date), 10);
+}
@@ -0,0 +1,51 @@
+/**
+ * Streak Calendar
+ *
+ * Streaks count local calendar days in the player's time zone. Days are
+ * numbered from 1970-01-01, so "yesterday" is simply `day - 1`.
+ */
+
+export const DEFAULT_TIME_ZONE = 'Europe/Paris';
+
+const DAY_MS = 24 * 60 * 60 * 1000;
+const formatters = new Map<string, Intl.DateTimeFormat>();
+
+/**
+ * Local calendar day of `date` in `timeZone`
+ */
+export function localDay(date: Date, timeZone: string): number {
+  let format = formatters.get(timeZone);
+  if (!format) {
+    // en-CA formats dates as YYYY-MM-DD
+    format = new Intl.DateTimeFormat('en-CA', {
+      timeZone,
+      year: 'numeric',
+      month: '2-digit',
+      day: '2-digit',
+    });
+    formatters.set(timeZone, format);
+  }
+
+  const [year, month, day] = format.format(date).split('-').map(Number);
+  return Date.UTC(year, month - 1, day) / DAY_MS;
+}
+
+/**
+ * Calendar day stored in a DATE column (midnight UTC) <-> day number
+ */
+export function dayFromDate(date: Date): number {
+  return Math.floor(date.getTime() / DAY_MS);
+}
+
+export function dateFromDay(day: number): Date {
+  return new Date(day * DAY_MS);
+}
+
+export function isValidTimeZone(timeZone: string): boolean {
+  try {
+    new Intl.DateTimeFormat('en-CA', { timeZone });
+    return true;
+  } catch {
+    return false;
+  }
+}
@@ -5,20 +5,38 @@ import { SharedModule } from '@shared/shared.module';
 // Controllers
 import { GamificationController } from './presentation/controllers/gamification.controller';
 
+// Command Handlers
+import { RebuildCategoryStatsHandler } from './application/commands/rebuild-category-stats.handler';
+import { SetTimeZoneHandler } from './application/commands/set-time-zone.handler';
+
 // Query Handlers
 import { GetProgressHandler } from './application/queries/get-progress.handler';
+import { GetCategoryStatsHandler } from './application/queries/get-category-stats.handler';
 
 // Repositories
 import { PlayerProgressRepository } from './infrastructure/repositories/player-progress.repository';
+import { CategoryStatRepository } from './infrastructure/repositories/category-stat.repository';
+import { BadgeRepository } from './infrastructure/repositories/badge.repository';
+
+// Badges
+import { BadgeEvaluator } from './infrastructure/badges/badge-evaluator.service';
+
+// Streaks
+import { StreakSettlement } from './infrastructure/streaks/streak-settlement.service';
 
 // Event Handlers
 import { UserRegisteredGamificationHandler } from './application/event-handlers/user-registered.handler';
 import { QuizSessionCompletedGamificationHandler } from './application/event-handlers/quiz-session-completed.handler';
+import { CategoryStatsProjectionHandler } from './application/event-handlers/category-stats-projection.handler';
+import { BadgeEvaluationHandler } from './application/event-handlers/badge-evaluation.handler';
 
-const QueryHandlers = [GetProgressHandler];
+const CommandHandlers = [RebuildCategoryStatsHandler, SetTimeZoneHandler];
+const QueryHandlers = [GetProgressHandler, GetCategoryStatsHandler];
 const EventHandlers = [
   UserRegisteredGamificationHandler,
   QuizSessionCompletedGamificationHandler,
+  CategoryStatsProjectionHandler,
+  BadgeEvaluationHandler,
 ];
 
 const Repositories = [
@@ -26,27 +44,51 @@ const Repositories = [
     provide: 'IPlayerProgressRepository',
     useClass: PlayerProgressRepository,
   },
+  {
+    provide: 'ICategoryStatRepository',
+    useClass: CategoryStatRepository,
+  },
+  {
+    provide: 'IBadgeRepository',
+    useClass: BadgeRepository,
+  },
 ];
 
+const Badges = [BadgeEvaluator];
+
+const Streaks = [StreakSettlement];
+
 /**
  * Gamification Bounded Context
  *
  * Responsibilities:
  * - Player progress tracking (XP, levels)
- * - Streak management
- * - Statistics tracking
+ * - Streak management (local calendar days, periodic break/protect pass)
+ * - Statistics tracking (overall and per category)
+ * - Badge unlocking
  *
  * Domain Events Emitted:
  * - LevelUpEvent
  * - StreakUpdatedEvent
+ * - BadgeUnlockedEvent
+ * - PlayerProgressUpdatedEvent
  *
  * Domain Events Consumed:
- * - QuizSessionCompletedEvent -> Add XP, update stats, update streak
+ * - QuizSessionCompletedEvent -> Add XP, update stats, update streak,
+ *   update category stats, unlock badges
+ * - LevelUpEvent / StreakUpdatedEvent -> Unlock level and streak badges
  */
 @Module({
   imports: [CqrsModule, SharedModule],
   controllers: [GamificationController],
-  providers: [...QueryHandlers, ...EventHandlers, ...Repositories],
+  providers: [
+    ...CommandHandlers,
+    ...QueryHandlers,
+    ...EventHandlers,
+    ...Repositories,
+    ...Badges,
+    ...Streaks,
+  ],
   exports: [],
 })
 export class GamificationModule {}
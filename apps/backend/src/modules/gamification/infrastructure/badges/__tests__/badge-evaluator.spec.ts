@@ -0,0 +1,115 @@
+import { BadgeEvaluator } from '../badge-evaluator.service';
+import { IBadgeRepository } from '../../../domain/repositories/badge.repository.interface';
+import { BadgeDefinition } from '../../../domain/services/badge-rules';
+import { ReferenceCatalog } from '@shared/infrastructure/cache/reference-catalog.service';
+import { EventBusService } from '@shared/infrastructure/events/event-bus.service';
+import { PrismaService } from '@shared/infrastructure/database/prisma.service';
+
+describe('BadgeEvaluator', () => {
+  let badgeRepository: jest.Mocked<IBadgeRepository>;
+  let publishAll: jest.Mock;
+  let evaluator: BadgeEvaluator;
+  let tables: Record<string, { version: string; byId: Map<string, BadgeDefinition> }>;
+
+  const streak7: BadgeDefinition = {
+    id: 'streak-7',
+    name: 'Régulier',
+    rarity: 'RARE',
+    coinReward: 100,
+    conditionData: { type: 'streak', days: 7 },
+  };
+  const level20: BadgeDefinition = {
+    id: 'level-20',
+    name: 'Expert',
+    rarity: 'EPIC',
+    coinReward: 250,
+    conditionData: { type: 'level', value: 20 },
+  };
+
+  const table = (rows: BadgeDefinition[], version = 'v1') => ({
+    version,
+    byId: new Map(rows.map((row) => [row.id, row])),
+  });
+
+  beforeEach(() => {
+    tables = {
+      badges: table([streak7, level20]),
+      categories: table([]),
+      difficulties: table([]),
+    };
+    badgeRepository = {
+      findUnlockedBadgeIds: jest.fn().mockResolvedValue(new Map([['user-1', []]])),
+      unlock: jest.fn().mockImplementation(async (unlocks) => unlocks),
+    };
+    publishAll = jest.fn();
+
+    evaluator = new BadgeEvaluator(
+      badgeRepository,
+      { get: async (name: string) => tables[name] } as unknown as ReferenceCatalog,
+      { publishAll } as unknown as EventBusService,
+      { afterCommit: (hook: () => void) => hook() } as unknown as PrismaService,
+    );
+  });
+
+  it('should only test the badges of the changed inputs', async () => {
+    const unlocked = await evaluator.evaluate([
+      { userId: 'user-1', inputs: ['streak'], facts: { streak: 7, level: 25 } },
+    ]);
+
+    expect(unlocked).toEqual([{ userId: 'user-1', badgeId: 'streak-7' }]);
+
+    const [[[event]]] = publishAll.mock.calls;
+    expect(event.eventName).toBe('badge.unlocked');
+    expect(event.props).toMatchObject({ userId: 'user-1', badgeId: 'streak-7', coinReward: 100 });
+  });
+
+  it('should skip badges the player already has without querying again', async () => {
+    await evaluator.evaluate([{ userId: 'user-1', inputs: ['streak'], facts: { streak: 7 } }]);
+    badgeRepository.unlock.mockClear();
+
+    const unlocked = await evaluator.evaluate([
+      { userId: 'user-1', inputs: ['streak'], facts: { streak: 8 } },
+    ]);
+
+    expect(unlocked).toEqual([]);
+    expect(badgeRepository.unlock).not.toHaveBeenCalled();
+    expect(badgeRepository.findUnlockedBadgeIds).toHaveBeenCalledTimes(1);
+  });
+
+  it('should load unlocked badges from the database on a cache miss', async () => {
+    badgeRepository.findUnlockedBadgeIds.mockResolvedValue(new Map([['user-1', ['level-20']]]));
+
+    const unlocked = await evaluator.evaluate([
+      { userId: 'user-1', inputs: ['level'], facts: { level: 30 } },
+    ]);
+
+    expect(unlocked).toEqual([]);
+  });
+
+  it('should recompile the rules when the badges change', async () => {
+    await evaluator.evaluate([{ userId: 'user-1', inputs: ['streak'], facts: { streak: 7 } }]);
+
+    tables.badges = table(
+      [
+        {
+          id: 'streak-3',
+          name: 'Assidu',
+          rarity: 'COMMON',
+          coinReward: 20,
+          conditionData: { type: 'streak', days: 3 },
+        },
+        streak7,
+        level20,
+      ],
+      'v2',
+    );
+    badgeRepository.findUnlockedBadgeIds.mockResolvedValue(new Map([['user-1', ['streak-7']]]));
+
+    const unlocked = await evaluator.evaluate([
+      { userId: 'user-1', inputs: ['streak'], facts: { streak: 7 } },
+    ]);
+
+    expect(unlocked).toEqual([{ userId: 'user-1', badgeId: 'streak-3' }]);
+    expect(badgeRepository.findUnlockedBadgeIds).toHaveBeenCalledTimes(2);
+  });
+});
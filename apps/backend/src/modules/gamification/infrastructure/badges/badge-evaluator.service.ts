@@ -0,0 +1,207 @@
+import { Inject, Injectable, Logger, OnApplicationBootstrap } from '@nestjs/common';
+import { PrismaService } from '@shared/infrastructure/database/prisma.service';
+import { EventBusService } from '@shared/infrastructure/events/event-bus.service';
+import { LruCache } from '@shared/infrastructure/cache/lru-cache';
+import { ReferenceCatalog } from '@shared/infrastructure/cache/reference-catalog.service';
+import {
+  BadgeUnlock,
+  IBadgeRepository,
+} from '../../domain/repositories/badge.repository.interface';
+import {
+  BadgeFacts,
+  BadgeInput,
+  BadgeRuleSet,
+  CompiledBadgeRule,
+} from '../../domain/services/badge-rules';
+import { BadgeUnlockedEvent } from '../../domain/events/badge-unlocked.event';
+
+/**
+ * Facts of one player that just changed
+ */
+export interface BadgeChange {
+  userId: string;
+  inputs: BadgeInput[];
+  facts: BadgeFacts;
+}
+
+/**
+ * Badge Evaluator
+ *
+ * Badge conditions are compiled at startup (see BadgeRuleSet), from the
+ * badges, categories and difficulties of the reference catalog, and
+ * compiled again whenever one of those tables changes. For each
+ * change only the rules of the changed inputs are tested, against the
+ * facts carried by the change, with no per-badge queries.
+ *
+ * Badges a player already has are skipped through a per-player bitset of
+ * unlocked rules, loaded once per player and kept in an LRU cache. Bits
+ * are only set after the unlocking transaction commits; a bit missing on
+ * this node (unlocked elsewhere) only costs a re-test and an insert that
+ * is ignored.
+ */
+@Injectable()
+export class BadgeEvaluator implements OnApplicationBootstrap {
+  private readonly logger = new Logger(BadgeEvaluator.name);
+  private readonly timeZone = process.env.BADGE_TIME_ZONE || 'Europe/Paris';
+  private readonly unlocked = new LruCache<string, Uint32Array>({
+    maxSize: parseInt(process.env.BADGE_CACHE_MAX_ENTRIES || '10000', 10),
+    ttlMs: parseInt(process.env.BADGE_CACHE_TTL_MS || '3600000', 10),
+  });
+  private compiled: { versions: string; ruleSet: BadgeRuleSet } | null = null;
+
+  constructor(
+    @Inject('IBadgeRepository')
+    private readonly badgeRepository: IBadgeRepository,
+    private readonly catalog: ReferenceCatalog,
+    private readonly eventBus: EventBusService,
+    private readonly prisma: PrismaService,
+  ) {}
+
+  async onApplicationBootstrap(): Promise<void> {
+    await this.rules();
+  }
+
+  /**
+   * Unlock the badges earned by the changes and publish a
+   * BadgeUnlockedEvent for each; returns the new unlocks
+   */
+  async evaluate(changes: BadgeChange[]): Promise<BadgeUnlock[]> {
+    const ruleSet = await this.rules();
+    const candidates = changes
+      .map((change) => ({ change, rules: ruleSet.rulesFor(change.inputs) }))
+      .filter(({ rules }) => rules.length > 0);
+    if (candidates.length === 0) {
+      return [];
+    }
+
+    const bitsets = await this.unlockedBits(
+      [...new Set(candidates.map(({ change }) => change.userId))],
+      ruleSet,
+    );
+    const earned = new Map<string, CompiledBadgeRule>();
+
+    for (const { change, rules } of candidates) {
+      const bits = bitsets.get(change.userId)!;
+      for (const rule of rules) {
+        const key = `${change.userId}|${rule.badge.id}`;
+        if (hasBit(bits, rule.bit) || earned.has(key) || !rule.test(change.facts)) {
+          continue;
+        }
+        earned.set(key, rule);
+      }
+    }
+    if (earned.size === 0) {
+      return [];
+    }
+
+    const unlocks = [...earned.keys()].map((key) => {
+      const [userId, badgeId] = key.split('|');
+      return { userId, badgeId };
+    });
+    const inserted = await this.badgeRepository.unlock(unlocks);
+
+    const now = new Date();
+    await this.eventBus.publishAll(
+      inserted.map(({ userId, badgeId }) => {
+        const { badge } = earned.get(`${userId}|${badgeId}`)!;
+        return new BadgeUnlockedEvent({
+          userId,
+          badgeId,
+          badgeName: badge.name,
+          rarity: badge.rarity,
+          coinReward: badge.coinReward,
+          occurredAt: now,
+        });
+      }),
+    );
+
+    // Skipped inserts were unlocked concurrently: remember them too
+    this.prisma.afterCommit(() => {
+      if (this.compiled?.ruleSet !== ruleSet) {
+        return; // Recompiled meanwhile: bit positions may have moved
+      }
+      for (const { userId, badgeId } of unlocks) {
+        const bits = this.unlocked.get(userId);
+        if (bits) {
+          setBit(bits, earned.get(`${userId}|${badgeId}`)!.bit);
+        }
+      }
+    });
+
+    return inserted;
+  }
+
+  private async rules(): Promise<BadgeRuleSet> {
+    const [badges, categories, difficulties] = await Promise.all([
+      this.catalog.get('badges'),
+      this.catalog.get('categories'),
+      this.catalog.get('difficulties'),
+    ]);
+    const versions = [badges.version, categories.version, difficulties.version].join('|');
+    if (this.compiled?.versions === versions) {
+      return this.compiled.ruleSet;
+    }
+
+    const ruleSet = BadgeRuleSet.compile(
+      [...badges.byId.values()],
+      {
+        categoryNames: new Map([...categories.byId.values()].map((c) => [c.slug, c.name])),
+        difficultyIds: new Map([...difficulties.byId.values()].map((d) => [d.level, d.id])),
+      },
+      this.timeZone,
+    );
+
+    for (const { badge, reason } of ruleSet.skipped) {
+      this.logger.warn(`Badge "${badge.name}" is ignored: ${reason}`);
+    }
+    this.logger.log(`Compiled ${ruleSet.rules.length} badge rules`);
+
+    // Bitsets of the previous rules do not match the new bit positions
+    this.compiled = { versions, ruleSet };
+    this.unlocked.clear();
+
+    return ruleSet;
+  }
+
+  private async unlockedBits(
+    userIds: string[],
+    ruleSet: BadgeRuleSet,
+  ): Promise<Map<string, Uint32Array>> {
+    const bitsets = new Map<string, Uint32Array>();
+    const missing: string[] = [];
+
+    for (const userId of userIds) {
+      const bits = this.unlocked.get(userId);
+      if (bits) {
+        bitsets.set(userId, bits);
+      } else {
+        missing.push(userId);
+      }
+    }
+
+    if (missing.length > 0) {
+      const unlocked = await this.badgeRepository.findUnlockedBadgeIds(missing);
+      for (const userId of missing) {
+        const bits = new Uint32Array(Math.ceil(ruleSet.rules.length / 32));
+        for (const badgeId of unlocked.get(userId) ?? []) {
+          const bit = ruleSet.bitOf(badgeId);
+          if (bit !== undefined) {
+            setBit(bits, bit);
+          }
+        }
+        this.unlocked.set(userId, bits);
+        bitsets.set(userId, bits);
+      }
+    }
+
+    return bitsets;
+  }
+}
+
+function hasBit(bits: Uint32Array, bit: number): boolean {
+  return (bits[bit >>> 5] & (1 << (bit & 31))) !== 0;
+}
+
+function setBit(bits: Uint32Array, bit: number): void {
+  bits[bit >>> 5] |= 1 << (bit & 31);
+}
@@ -0,0 +1,47 @@
+import { Injectable } from '@nestjs/common';
+import { Prisma } from '@generated/prisma/client';
+import { PrismaService } from '@shared/infrastructure/database/prisma.service';
+import {
+  BadgeUnlock,
+  IBadgeRepository,
+} from '../../domain/repositories/badge.repository.interface';
+import { v4 as uuidv4 } from 'uuid';
+
+@Injectable()
+export class BadgeRepository implements IBadgeRepository {
+  constructor(private readonly prisma: PrismaService) {}
+
+  async findUnlockedBadgeIds(userIds: string[]): Promise<Map<string, string[]>> {
+    const unlocked = new Map<string, string[]>(userIds.map((userId) => [userId, []]));
+    if (userIds.length === 0) {
+      return unlocked;
+    }
+
+    const rows = await this.prisma.client.playerBadge.findMany({
+      where: { userId: { in: userIds } },
+      select: { userId: true, badgeId: true },
+    });
+    for (const row of rows) {
+      unlocked.get(row.userId)!.push(row.badgeId);
+    }
+
+    return unlocked;
+  }
+
+  async unlock(unlocks: BadgeUnlock[]): Promise<BadgeUnlock[]> {
+    if (unlocks.length === 0) {
+      return [];
+    }
+
+    const values = Prisma.join(
+      unlocks.map((u) => Prisma.sql`(${uuidv4()}, ${u.userId}, ${u.badgeId})`),
+    );
+
+    return this.prisma.client.$queryRaw<BadgeUnlock[]>`
+      INSERT INTO player_badges (id, "userId", "badgeId")
+      VALUES ${values}
+      ON CONFLICT ("userId", "badgeId") DO NOTHING
+      RETURNING "userId", "badgeId"
+    `;
+  }
+}
@@ -0,0 +1,144 @@
+import { Injectable } from '@nestjs/common';
+import { Prisma } from '@generated/prisma/client';
+import { PrismaService } from '@shared/infrastructure/database/prisma.service';
+import {
+  CategoryStatDelta,
+  CategoryStatView,
+  ICategoryStatRepository,
+} from '../../domain/repositories/category-stat.repository.interface';
+import { v4 as uuidv4 } from 'uuid';
+
+/**
+ * Category Stat Repository
+ *
+ * Incremental writes and rebuilds are serialized by an advisory lock:
+ * increments share it, a rebuild chunk holds it exclusively, so a rebuild
+ * never reads a completion that an increment is still applying.
+ */
+@Injectable()
+export class CategoryStatRepository implements ICategoryStatRepository {
+  private static readonly LOCK_KEY = 'category_stats';
+
+  constructor(private readonly prisma: PrismaService) {}
+
+  async increment(deltas: CategoryStatDelta[]): Promise<void> {
+    if (deltas.length === 0) {
+      return;
+    }
+
+    const values = Prisma.join(
+      deltas.map(
+        (d) => Prisma.sql`(
+          ${uuidv4()}, ${d.userId}, ${d.categoryId}, ${d.quizzesPlayed}::int,
+          ${d.correctAnswers}::int, ${d.totalAnswers}::int
+        )`,
+      ),
+    );
+
+    await this.prisma.runInTransaction(async () => {
+      await this.prisma.client.$executeRaw`
+        SELECT pg_advisory_xact_lock_shared(hashtext(${CategoryStatRepository.LOCK_KEY}))
+      `;
+
+      // Stats are keyed by category name; sorted so concurrent batches lock rows in order
+      await this.prisma.client.$executeRaw`
+        INSERT INTO category_stats
+          (id, "userId", "categoryName", "quizzesPlayed", "correctAnswers", "totalAnswers", "updatedAt")
+        SELECT v.id, v."userId", c.name, v.quizzes, v.correct, v.answers, (NOW() AT TIME ZONE 'UTC')
+        FROM (VALUES ${values}) AS v(id, "userId", "categoryId", quizzes, correct, answers)
+        JOIN categories c ON c.id = v."categoryId"
+        ORDER BY v."userId", c.name
+        ON CONFLICT ("userId", "categoryName") DO UPDATE SET
+          "quizzesPlayed" = category_stats."quizzesPlayed" + EXCLUDED."quizzesPlayed",
+          "correctAnswers" = category_stats."correctAnswers" + EXCLUDED."correctAnswers",
+          "totalAnswers" = category_stats."totalAnswers" + EXCLUDED."totalAnswers",
+          "updatedAt" = (NOW() AT TIME ZONE 'UTC')
+      `;
+    });
+  }
+
+  async findByUserId(userId: string): Promise<CategoryStatView[]> {
+    return this.prisma.client.categoryStat.findMany({
+      where: { userId },
+      select: {
+        categoryName: true,
+        quizzesPlayed: true,
+        correctAnswers: true,
+        totalAnswers: true,
+      },
+      orderBy: { categoryName: 'asc' },
+    });
+  }
+
+  async findCorrectByCategory(userIds: string[]): Promise<Map<string, Map<string, number>>> {
+    const correct = new Map<string, Map<string, number>>(
+      userIds.map((userId) => [userId, new Map()]),
+    );
+    if (userIds.length === 0) {
+      return correct;
+    }
+
+    const rows = await this.prisma.client.categoryStat.findMany({
+      where: { userId: { in: userIds } },
+      select: { userId: true, categoryName: true, correctAnswers: true },
+    });
+    for (const row of rows) {
+      correct.get(row.userId)!.set(row.categoryName, row.correctAnswers);
+    }
+
+    return correct;
+  }
+
+  async rebuildChunk(
+    afterUserId: string | null,
+    limit: number,
+    handlerKey: string,
+  ): Promise<string[]> {
+    return this.prisma.runInTransaction(async () => {
+      await this.prisma.client.$executeRaw`
+        SELECT pg_advisory_xact_lock(hashtext(${CategoryStatRepository.LOCK_KEY}))
+      `;
+
+      const users = await this.prisma.client.user.findMany({
+        where: afterUserId ? { id: { gt: afterUserId } } : undefined,
+        select: { id: true },
+        orderBy: { id: 'asc' },
+        take: limit,
+      });
+      if (users.length === 0) {
+        return [];
+      }
+
+      const userIds = users.map((user) => user.id);
+
+      await this.prisma.client.categoryStat.deleteMany({
+        where: { userId: { in: userIds } },
+      });
+
+      // Completions still waiting in the outbox for the projector are left to it
+      await this.prisma.client.$executeRaw`
+        INSERT INTO category_stats
+          (id, "userId", "categoryName", "quizzesPlayed", "correctAnswers", "totalAnswers", "updatedAt")
+        SELECT gen_random_uuid(), s."userId", c.name, COUNT(*)::int,
+               SUM(s."correctAnswers")::int, SUM(s."totalQuestions")::int,
+               (NOW() AT TIME ZONE 'UTC')
+        FROM quiz_sessions s
+        JOIN categories c ON c.id = s."categoryId"
+        WHERE s."userId" IN (${Prisma.join(userIds)})
+          AND s.status = 'COMPLETED'
+          AND NOT EXISTS (
+            SELECT 1 FROM outbox_events o
+            WHERE o."aggregateId" = s.id
+              AND o."eventName" = 'quiz.session.completed'
+              AND NOT EXISTS (
+                SELECT 1 FROM processed_events p
+                WHERE p."eventId" = o.id AND p.handler = ${handlerKey}
+              )
+          )
+        GROUP BY s."userId", c.name
+      `;
+
+      return userIds;
+    });
+  }
+}
@@ -1,7 +1,12 @@
 import { Injectable } from '@nestjs/common';
+import { Prisma, PlayerProgress as PlayerProgressRow } from '@generated/prisma/client';
 import { PrismaService } from '@shared/infrastructure/database/prisma.service';
-import { IPlayerProgressRepository } from '../../domain/repositories/player-progress.repository.interface';
+import {
+  IPlayerProgressRepository,
+  SettledStreak,
+} from '../../domain/repositories/player-progress.repository.interface';
 import { PlayerProgress } from '../../domain/aggregates/player-progress.aggregate';
+import { dateFromDay, dayFromDate } from '../../domain/services/streak-calendar';
 import { v4 as uuidv4 } from 'uuid';
 
 @Injectable()
@@ -9,7 +14,7 @@ export class PlayerProgressRepository implements IPlayerProgressRepository {
   constructor(private readonly prisma: PrismaService) {}
 
   async save(progress: PlayerProgress): Promise<void> {
-    await this.prisma.playerProgress.upsert({
+    await this.prisma.client.playerProgress.upsert({
       where: { userId: progress.userId },
       create: {
         id: progress.id,
@@ -22,6 +27,9 @@ export class PlayerProgressRepository implements IPlayerProgressRepository {
         perfectQuizzes: progress.perfectQuizzes,
         totalCorrect: progress.totalCorrect,
         totalAnswers: progress.totalAnswers,
+        lastPlayedAt: progress.lastPlayedAt,
+        streakDate: progress.streakDay === null ? null : dateFromDay(progress.streakDay),
+        timeZone: progress.timeZone,
       },
       update: {
         currentXP: progress.currentXP,
@@ -32,18 +40,144 @@ export class PlayerProgressRepository implements IPlayerProgressRepository {
         perfectQuizzes: progress.perfectQuizzes,
         totalCorrect: progress.totalCorrect,
         totalAnswers: progress.totalAnswers,
+        lastPlayedAt: progress.lastPlayedAt,
+        streakDate: progress.streakDay === null ? null : dateFromDay(progress.streakDay),
+        timeZone: progress.timeZone,
         updatedAt: new Date(),
       },
     });
   }
 
   async findByUserId(userId: string): Promise<PlayerProgress | null> {
-    const data = await this.prisma.playerProgress.findUnique({
+    const data = await this.prisma.client.playerProgress.findUnique({
       where: { userId },
     });
 
     if (!data) return null;
 
+    return this.toDomain(data);
+  }
+
+  async getOrCreate(userId: string): Promise<PlayerProgress> {
+    let progress = await this.findByUserId(userId);
+
+    if (!progress) {
+      if (this.prisma.onReplica) {
+        // Created on the primary, which may also have it already
+        return this.prisma.runOnPrimary(() => this.getOrCreate(userId));
+      }
+      progress = PlayerProgress.create(uuidv4(), userId);
+      await this.save(progress);
+    }
+
+    return progress;
+  }
+
+  async lockMany(userIds: string[]): Promise<PlayerProgress[]> {
+    if (userIds.length === 0) {
+      return [];
+    }
+
+    // Sorted lock order keeps concurrent batches from deadlocking
+    const sorted = [...new Set(userIds)].sort();
+
+    await this.prisma.client.playerProgress.createMany({
+      data: sorted.map((userId) => ({ id: uuidv4(), userId })),
+      skipDuplicates: true,
+    });
+
+    const rows = await this.prisma.client.$queryRaw<PlayerProgressRow[]>`
+      SELECT * FROM player_progress
+      WHERE "userId" IN (${Prisma.join(sorted)})
+      ORDER BY "userId"
+      FOR UPDATE
+    `;
+
+    return rows.map((row) => this.toDomain(row));
+  }
+
+  async saveMany(progresses: PlayerProgress[]): Promise<void> {
+    if (progresses.length === 0) {
+      return;
+    }
+
+    const values = Prisma.join(
+      progresses.map(
+        (p) => Prisma.sql`(
+          ${p.userId}, ${p.currentXP}::int, ${p.currentLevel}::int, ${p.currentStreak}::int,
+          ${p.longestStreak}::int, ${p.totalQuizzes}::int, ${p.perfectQuizzes}::int,
+          ${p.totalCorrect}::int, ${p.totalAnswers}::int, ${p.lastPlayedAt}::timestamp,
+          ${p.streakDay === null ? null : dateFromDay(p.streakDay)}::date
+        )`,
+      ),
+    );
+
+    await this.prisma.client.$executeRaw`
+      UPDATE player_progress AS p SET
+        "currentXP" = v.xp,
+        "currentLevel" = v.level,
+        "currentStreak" = v.streak,
+        "longestStreak" = v.longest,
+        "totalQuizzes" = v.quizzes,
+        "perfectQuizzes" = v.perfect,
+        "totalCorrect" = v.correct,
+        "totalAnswers" = v.answers,
+        "lastPlayedAt" = v.played,
+        "streakDate" = v.day,
+        "updatedAt" = (NOW() AT TIME ZONE 'UTC')
+      FROM (VALUES ${values})
+        AS v("userId", xp, level, streak, longest, quizzes, perfect, correct, answers, played, day)
+      WHERE p."userId" = v."userId"
+    `;
+  }
+
+  async settleLapsedStreaks(userIds?: string[]): Promise<SettledStreak[]> {
+    if (userIds?.length === 0) {
+      return [];
+    }
+    const scope = userIds ? Prisma.sql`AND p."userId" IN (${Prisma.join(userIds)})` : Prisma.empty;
+
+    // Players who let a whole local day pass: a day without play is at
+    // least 23 hours (DST), which keeps the scan on the lastPlayedAt index.
+    // One active protection (the first to expire) covers the gap, otherwise
+    // the streak is reset.
+    return this.prisma.client.$queryRaw<SettledStreak[]>`
+      WITH lapsed AS (
+        SELECT p.id, p."userId", p."currentStreak",
+               (NOW() AT TIME ZONE p."timeZone")::date AS today
+        FROM player_progress p
+        WHERE p."lastPlayedAt" < (NOW() AT TIME ZONE 'UTC') - INTERVAL '23 hours'
+          AND p."currentStreak" > 0
+          AND p."streakDate" < (NOW() AT TIME ZONE p."timeZone")::date - 1
+          ${scope}
+        FOR UPDATE OF p SKIP LOCKED
+      ),
+      protection AS (
+        SELECT DISTINCT ON (s."userId") s.id, s."userId"
+        FROM streak_protections s
+        JOIN lapsed l ON l."userId" = s."userId"
+        WHERE s."expiresAt" > (NOW() AT TIME ZONE 'UTC')
+        ORDER BY s."userId", s."expiresAt", s.id
+      ),
+      consumed AS (
+        DELETE FROM streak_protections s
+        USING protection
+        WHERE s.id = protection.id
+        RETURNING s."userId"
+      )
+      UPDATE player_progress p SET
+        "currentStreak" = CASE WHEN c."userId" IS NULL THEN 0 ELSE p."currentStreak" END,
+        "streakDate" = CASE WHEN c."userId" IS NULL THEN p."streakDate" ELSE l.today - 1 END,
+        "updatedAt" = (NOW() AT TIME ZONE 'UTC')
+      FROM lapsed l
+      LEFT JOIN consumed c ON c."userId" = l."userId"
+      WHERE p.id = l.id
+      RETURNING p."userId", l."currentStreak" AS "previousStreak", p."longestStreak",
+                (c."userId" IS NOT NULL) AS protected
+    `;
+  }
+
+  private toDomain(data: PlayerProgressRow): PlayerProgress {
     return PlayerProgress.fromPersistence({
       id: data.id,
       userId: data.userId,
@@ -55,19 +189,11 @@ export class PlayerProgressRepository implements IPlayerProgressRepository {
       perfectQuizzes: data.perfectQuizzes,
       totalCorrect: data.totalCorrect,
       totalAnswers: data.totalAnswers,
+      lastPlayedAt: data.lastPlayedAt,
+      streakDay: data.streakDate ? dayFromDate(data.streakDate) : null,
+      timeZone: data.timeZone,
       createdAt: data.createdAt,
       updatedAt: data.updatedAt,
     });
   }
-
-  async getOrCreate(userId: string): Promise<PlayerProgress> {
-    let progress = await this.findByUserId(userId);
-
-    if (!progress) {
-      progress = PlayerProgress.create(uuidv4(), userId);
-      await this.save(progress);
-    }
-
-    return progress;
-  }
 }
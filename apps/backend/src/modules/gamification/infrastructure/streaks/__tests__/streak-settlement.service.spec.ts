@@ -0,0 +1,42 @@
+import { StreakSettlement } from '../streak-settlement.service';
+import { IPlayerProgressRepository } from '../../../domain/repositories/player-progress.repository.interface';
+import { EventBusService } from '@shared/infrastructure/events/event-bus.service';
+import { PrismaService } from '@shared/infrastructure/database/prisma.service';
+import { MetricsService } from '@shared/infrastructure/metrics/metrics.service';
+
+describe('StreakSettlement', () => {
+  let settleLapsedStreaks: jest.Mock;
+  let eventBus: { publishAll: jest.Mock };
+  let settlement: StreakSettlement;
+
+  beforeEach(() => {
+    settleLapsedStreaks = jest.fn().mockResolvedValue([
+      { userId: 'user-1', previousStreak: 12, longestStreak: 20, protected: false },
+      { userId: 'user-2', previousStreak: 4, longestStreak: 4, protected: true },
+    ]);
+    eventBus = { publishAll: jest.fn() };
+
+    settlement = new StreakSettlement(
+      { settleLapsedStreaks } as unknown as IPlayerProgressRepository,
+      eventBus as unknown as EventBusService,
+      { runInTransaction: (work: () => Promise<unknown>) => work() } as unknown as PrismaService,
+      new MetricsService(),
+    );
+  });
+
+  it('should publish a streak update for every reset, so cached progress is invalidated', async () => {
+    await settlement.run();
+
+    const [[events]] = eventBus.publishAll.mock.calls;
+    expect(events).toHaveLength(1);
+    expect(events[0].eventName).toBe('player.streak_updated');
+    expect(events[0].getAggregateId()).toBe('user-1');
+    expect(events[0].props).toMatchObject({ currentStreak: 0, longestStreak: 20 });
+  });
+
+  it('should settle only the given players', async () => {
+    await settlement.settle(['user-1']);
+
+    expect(settleLapsedStreaks).toHaveBeenCalledWith(['user-1']);
+  });
+});
@@ -0,0 +1,115 @@
+import { Inject, Injectable, Logger, OnApplicationBootstrap, OnModuleDestroy } from '@nestjs/common';
+import { PrismaService } from '@shared/infrastructure/database/prisma.service';
+import { EventBusService } from '@shared/infrastructure/events/event-bus.service';
+import { MetricsService } from '@shared/infrastructure/metrics/metrics.service';
+import {
+  IPlayerProgressRepository,
+  SettledStreak,
+} from '../../domain/repositories/player-progress.repository.interface';
+import { StreakUpdatedEvent } from '../../domain/events/streak-updated.event';
+
+/**
+ * Streak Settlement
+ *
+ * Breaks or protects the streaks of players who let a whole local day
+ * pass without playing, with one set-based statement (see
+ * `IPlayerProgressRepository.settleLapsedStreaks`) instead of loading
+ * players one by one. A StreakUpdatedEvent is published for every reset,
+ * which also invalidates the cached progress responses of those players.
+ *
+ * Local midnight depends on each player's time zone, so the pass runs
+ * every STREAK_SETTLE_INTERVAL_MS (hourly by default, 0 disables it);
+ * a pass only touches players who crossed a midnight since the last one.
+ * Completions settle their own player first, so a late pass never
+ * counts a play on a lapsed streak.
+ */
+@Injectable()
+export class StreakSettlement implements OnApplicationBootstrap, OnModuleDestroy {
+  private readonly logger = new Logger(StreakSettlement.name);
+  private readonly intervalMs = parseInt(process.env.STREAK_SETTLE_INTERVAL_MS || '3600000', 10);
+  private timer?: NodeJS.Timeout;
+  private running: Promise<SettledStreak[]> | null = null;
+
+  constructor(
+    @Inject('IPlayerProgressRepository')
+    private readonly progressRepository: IPlayerProgressRepository,
+    private readonly eventBus: EventBusService,
+    private readonly prisma: PrismaService,
+    private readonly metrics: MetricsService,
+  ) {}
+
+  onApplicationBootstrap(): void {
+    if (this.intervalMs <= 0) {
+      return;
+    }
+
+    this.timer = setInterval(() => void this.run(), this.intervalMs);
+    this.timer.unref();
+  }
+
+  async onModuleDestroy(): Promise<void> {
+    clearInterval(this.timer);
+    await this.running;
+  }
+
+  /**
+   * Settle every lapsed streak. Failures are logged and retried on the
+   * next pass.
+   */
+  run(): Promise<SettledStreak[]> {
+    this.running ??= this.settle()
+      .catch((error) => {
+        this.metrics.increment('gamification.streak_settle_failures');
+        this.logger.error('Streak settlement failed', error);
+        return [];
+      })
+      .finally(() => {
+        this.running = null;
+      });
+    return this.running;
+  }
+
+  /**
+   * Settle the lapsed streaks of all players, or only of `userIds`, in the
+   * current transaction (or a new one)
+   */
+  async settle(userIds?: string[]): Promise<SettledStreak[]> {
+    const startedAt = performance.now();
+
+    const settled = await this.prisma.runInTransaction(
+      async () => {
+        const settled = await this.progressRepository.settleLapsedStreaks(userIds);
+        const now = new Date();
+
+        await this.eventBus.publishAll(
+          settled
+            .filter((streak) => !streak.protected)
+            .map(
+              (streak) =>
+                new StreakUpdatedEvent({
+                  userId: streak.userId,
+                  currentStreak: 0,
+                  longestStreak: streak.longestStreak,
+                  occurredAt: now,
+                }),
+            ),
+        );
+
+        return settled;
+      },
+      { bulk: !userIds },
+    );
+
+    if (!userIds) {
+      const protectedCount = settled.filter((streak) => streak.protected).length;
+      this.metrics.observe('gamification.streak_settle_ms', performance.now() - startedAt);
+      this.metrics.increment('gamification.streaks_reset', settled.length - protectedCount);
+      this.metrics.increment('gamification.streak_protections_used', protectedCount);
+      this.logger.log(
+        `Streaks settled: ${settled.length - protectedCount} reset, ${protectedCount} protected`,
+      );
+    }
+
+    return settled;
+  }
+}
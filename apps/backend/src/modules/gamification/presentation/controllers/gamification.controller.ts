@@ -1,22 +1,53 @@
-import { Controller, Get, UseGuards } from '@nestjs/common';
-import { QueryBus } from '@nestjs/cqrs';
+import { Body, Controller, Get, Put, UseGuards } from '@nestjs/common';
+import { CommandBus, QueryBus } from '@nestjs/cqrs';
 import { ApiTags, ApiOperation, ApiResponse, ApiBearerAuth } from '@nestjs/swagger';
 import { JwtAuthGuard } from '@shared/presentation/guards/jwt-auth.guard';
 import { CurrentUser } from '@shared/presentation/decorators/current-user.decorator';
+import { ConditionalGet } from '@shared/presentation/decorators/conditional-get.decorator';
 import { GetProgressQuery } from '../../application/queries/get-progress.query';
+import { GetCategoryStatsQuery } from '../../application/queries/get-category-stats.query';
+import { SetTimeZoneCommand } from '../../application/commands/set-time-zone.command';
+import { SetTimeZoneDto } from '../dtos/set-time-zone.dto';
 
 @ApiTags('gamification')
 @ApiBearerAuth()
 @Controller('gamification')
 @UseGuards(JwtAuthGuard)
 export class GamificationController {
-  constructor(private readonly queryBus: QueryBus) {}
+  constructor(
+    private readonly commandBus: CommandBus,
+    private readonly queryBus: QueryBus,
+  ) {}
 
+  // Streak resets by StreakSettlement publish player.streak_updated too.
+  // Events only invalidate the node that publishes them: other nodes may
+  // serve the previous copy for up to RESPONSE_CACHE_ETAG_TTL_MS.
   @Get('progress')
+  @ConditionalGet({
+    resource: 'progress',
+    invalidatedBy: ['player.progress_updated', 'player.level_up', 'player.streak_updated'],
+  })
   @ApiOperation({ summary: 'Get player progress' })
   @ApiResponse({ status: 200, description: 'Progress retrieved' })
   @ApiResponse({ status: 401, description: 'Unauthorized' })
   async getProgress(@CurrentUser() user: any) {
     return this.queryBus.execute(new GetProgressQuery(user.userId));
   }
+
+  @Get('categories')
+  @ApiOperation({ summary: 'Get player stats per category' })
+  @ApiResponse({ status: 200, description: 'Category stats retrieved' })
+  @ApiResponse({ status: 401, description: 'Unauthorized' })
+  async getCategoryStats(@CurrentUser() user: any) {
+    return this.queryBus.execute(new GetCategoryStatsQuery(user.userId));
+  }
+
+  @Put('time-zone')
+  @ApiOperation({ summary: 'Set the time zone used for daily streaks' })
+  @ApiResponse({ status: 200, description: 'Time zone updated' })
+  @ApiResponse({ status: 400, description: 'Unknown time zone' })
+  @ApiResponse({ status: 401, description: 'Unauthorized' })
+  async setTimeZone(@CurrentUser() user: any, @Body() dto: SetTimeZoneDto) {
+    return this.commandBus.execute(new SetTimeZoneCommand(user.userId, dto.timeZone));
+  }
 }
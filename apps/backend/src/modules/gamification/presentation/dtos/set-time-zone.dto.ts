@@ -0,0 +1,8 @@
+import { ApiProperty } from '@nestjs/swagger';
+import { IsTimeZone } from 'class-validator';
+
+export class SetTimeZoneDto {
+  @ApiProperty({ example: 'Europe/Paris', description: 'IANA time zone used for daily streaks' })
+  @IsTimeZone()
+  timeZone!: string;
+}
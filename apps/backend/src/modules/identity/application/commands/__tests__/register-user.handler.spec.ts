@@ -3,6 +3,7 @@ import { RegisterUserHandler } from '../register-user.handler';
 import { RegisterUserCommand } from '../register-user.command';
 import { IUserRepository } from '../../../domain/repositories/user.repository.interface';
 import { EventBusService } from '@shared/infrastructure/events/event-bus.service';
+import { PrismaService } from '@shared/infrastructure/database/prisma.service';
 import { User } from '../../../domain/aggregates/user.aggregate';
 import { Email } from '../../../domain/value-objects/email.vo';
 import { Username } from '../../../domain/value-objects/username.vo';
@@ -39,6 +40,10 @@ describe('RegisterUserHandler', () => {
           provide: EventBusService,
           useValue: mockEventBus,
         },
+        {
+          provide: PrismaService,
+          useValue: { runInTransaction: (work: () => Promise<unknown>) => work() },
+        },
       ],
     }).compile();
 
@@ -5,6 +5,7 @@ import { IUserRepository } from '../../domain/repositories/user.repository.inter
 import { Email } from '../../domain/value-objects/email.vo';
 import { Username } from '../../domain/value-objects/username.vo';
 import { User } from '../../domain/aggregates/user.aggregate';
+import { PrismaService } from '@shared/infrastructure/database/prisma.service';
 import { EventBusService } from '@shared/infrastructure/events/event-bus.service';
 import { EntityAlreadyExistsException } from '@shared/domain/exceptions';
 import { v4 as uuidv4 } from 'uuid';
@@ -30,6 +31,7 @@ export interface RegisterUserResult {
 export class RegisterUserHandler implements ICommandHandler<RegisterUserCommand, RegisterUserResult> {
   constructor(
     @Inject('IUserRepository') private readonly userRepository: IUserRepository,
+    private readonly prisma: PrismaService,
     private readonly eventBus: EventBusService,
   ) {}
 
@@ -48,11 +50,11 @@ export class RegisterUserHandler implements ICommandHandler<RegisterUserCommand,
     const userId = uuidv4();
     const user = User.create(userId, email, username, command.name, command.password);
 
-    // Save user
-    await this.userRepository.save(user);
-
-    // Publish domain events
-    await this.eventBus.publishAll([...user.domainEvents]);
+    // Save user and its domain events (outbox) in one transaction
+    await this.prisma.runInTransaction(async () => {
+      await this.userRepository.save(user);
+      await this.eventBus.publishAll([...user.domainEvents]);
+    });
     user.clearEvents();
 
     return {
@@ -11,6 +11,7 @@ import { LoginUserHandler } from './application/commands/login-user.handler';
 import { UserRepository } from './infrastructure/repositories/user.repository';
 import { PasswordService } from './infrastructure/services/password.service';
 import { JwtTokenService } from './infrastructure/services/jwt.service';
+import { TokenRevocationService } from './infrastructure/services/token-revocation.service';
 import { JwtStrategy } from './infrastructure/strategies/jwt.strategy';
 
 // Presentation
@@ -32,7 +33,7 @@ const Repositories = [
   // },
 ];
 
-const Services = [PasswordService, JwtTokenService];
+const Services = [PasswordService, JwtTokenService, TokenRevocationService];
 
 const Strategies = [JwtStrategy];
 
@@ -0,0 +1,31 @@
+import { FairQueue } from '../fair-queue';
+
+describe('FairQueue', () => {
+  it('should serve clients round-robin', () => {
+    const queue = new FairQueue<string>(10);
+
+    queue.push('ip-a', 'a1');
+    queue.push('ip-a', 'a2');
+    queue.push('ip-a', 'a3');
+    queue.push('ip-b', 'b1');
+
+    expect(queue.drain()).toEqual(['a1', 'b1', 'a2', 'a3']);
+  });
+
+  it('should refuse work beyond the total capacity', () => {
+    const queue = new FairQueue<number>(2);
+
+    expect(queue.push('a', 1)).toBe(true);
+    expect(queue.push('b', 2)).toBe(true);
+    expect(queue.push('c', 3)).toBe(false);
+    expect(queue.size).toBe(2);
+  });
+
+  it('should refuse work beyond the per-client capacity', () => {
+    const queue = new FairQueue<number>(10, 1);
+
+    expect(queue.push('a', 1)).toBe(true);
+    expect(queue.push('a', 2)).toBe(false);
+    expect(queue.push('b', 3)).toBe(true);
+  });
+});
@@ -0,0 +1,45 @@
+import { PasswordHashPool, PasswordHashPoolFullError } from '../password-hash.pool';
+import { MetricsService } from '@shared/infrastructure/metrics/metrics.service';
+
+describe('PasswordHashPool', () => {
+  let metrics: MetricsService;
+
+  beforeEach(() => {
+    metrics = new MetricsService();
+  });
+
+  it('should hash and compare passwords', async () => {
+    const pool = new PasswordHashPool({ size: 1, maxQueue: 4, maxQueuePerClient: 4 }, metrics);
+
+    const hash = (await pool.run('ip', { op: 'hash', password: 'secret', rounds: 4 })) as string;
+
+    expect(await pool.run('ip', { op: 'compare', password: 'secret', hash })).toBe(true);
+    expect(await pool.run('ip', { op: 'compare', password: 'other', hash })).toBe(false);
+    await pool.close();
+  });
+
+  it('should reject immediately once the queue is full', async () => {
+    const pool = new PasswordHashPool({ size: 1, maxQueue: 1, maxQueuePerClient: 1 }, metrics);
+    const request = { op: 'hash' as const, password: 'secret', rounds: 4 };
+
+    const running = pool.run('ip', request);
+    const queued = pool.run('ip', request);
+    const rejected = pool.run('ip', request);
+
+    await expect(rejected).rejects.toBeInstanceOf(PasswordHashPoolFullError);
+    await Promise.all([running, queued]);
+    expect(metrics.snapshot().counters['password_hash.rejected']).toBe(1);
+    await pool.close();
+  });
+
+  it('should record queue depth and latency metrics', async () => {
+    const pool = new PasswordHashPool({ size: 1, maxQueue: 4, maxQueuePerClient: 4 }, metrics);
+
+    await pool.run('ip', { op: 'hash', password: 'secret', rounds: 4 });
+
+    const snapshot = metrics.snapshot();
+    expect(snapshot.gauges['password_hash.queue_depth']).toBe(0);
+    expect(snapshot.histograms['password_hash.latency_ms'].count).toBe(1);
+    await pool.close();
+  });
+});
@@ -0,0 +1,68 @@
+/**
+ * Fair Queue
+ *
+ * Bounded FIFO queue per client key, served round-robin across keys, so a
+ * single client flooding the queue cannot delay everyone else. `push`
+ * refuses work once the total or per-key capacity is reached.
+ */
+export class FairQueue<T> {
+  // Map iteration order doubles as the round-robin ring
+  private readonly queues = new Map<string, T[]>();
+  private total = 0;
+
+  constructor(
+    private readonly capacity: number,
+    private readonly perKeyCapacity: number = capacity,
+  ) {}
+
+  get size(): number {
+    return this.total;
+  }
+
+  push(key: string, item: T): boolean {
+    if (this.total >= this.capacity) {
+      return false;
+    }
+
+    let queue = this.queues.get(key);
+    if (!queue) {
+      queue = [];
+      this.queues.set(key, queue);
+    } else if (queue.length >= this.perKeyCapacity) {
+      return false;
+    }
+
+    queue.push(item);
+    this.total += 1;
+    return true;
+  }
+
+  shift(): T | undefined {
+    const next = this.queues.entries().next();
+    if (next.done) {
+      return undefined;
+    }
+
+    const [key, queue] = next.value;
+    const item = queue.shift()!;
+
+    // Move the key to the back of the ring
+    this.queues.delete(key);
+    if (queue.length > 0) {
+      this.queues.set(key, queue);
+    }
+
+    this.total -= 1;
+    return item;
+  }
+
+  drain(): T[] {
+    const items: T[] = [];
+    let item = this.shift();
+    while (item !== undefined) {
+      items.push(item);
+      item = this.shift();
+    }
+    return items;
+  }
+}
@@ -0,0 +1,210 @@
+import { Worker } from 'worker_threads';
+import * as fs from 'fs';
+import * as path from 'path';
+import * as bcrypt from 'bcrypt';
+import { MetricsService } from '@shared/infrastructure/metrics/metrics.service';
+import { FairQueue } from './fair-queue';
+
+export type PasswordHashRequest =
+  | { op: 'hash'; password: string; rounds: number }
+  | { op: 'compare'; password: string; hash: string };
+
+export type PasswordHashResponse = { result: string | boolean } | { error: string };
+
+export interface PasswordHashPoolOptions {
+  size: number;
+  maxQueue: number;
+  maxQueuePerClient: number;
+}
+
+export class PasswordHashPoolFullError extends Error {
+  constructor() {
+    super('Password hashing queue is full');
+    this.name = 'PasswordHashPoolFullError';
+  }
+}
+
+interface QueuedTask {
+  request: PasswordHashRequest;
+  enqueuedAt: number;
+  resolve: (result: string | boolean) => void;
+  reject: (error: Error) => void;
+}
+
+interface RunningTask extends QueuedTask {
+  id: number;
+  startedAt: number;
+}
+
+interface PoolWorker {
+  worker: Worker;
+  task: RunningTask | null;
+}
+
+/**
+ * Password Hash Pool
+ *
+ * Runs bcrypt on dedicated worker threads so hashing bursts do not hold the
+ * libuv threadpool used by fs, dns and crypto. Waiting work sits in a
+ * bounded FairQueue keyed by client; once it is full, `run` rejects
+ * immediately with PasswordHashPoolFullError.
+ *
+ * When the compiled worker script is missing (ts-node, jest) or size is 0,
+ * tasks run inline through the async bcrypt API with the same admission
+ * control.
+ */
+export class PasswordHashPool {
+  private static readonly WORKER_PATH = path.join(__dirname, 'password-hash.worker.js');
+
+  private readonly queue: FairQueue<QueuedTask>;
+  private readonly workers: PoolWorker[] = [];
+  private readonly idle: PoolWorker[] = [];
+  private readonly inline: boolean;
+  private readonly concurrency: number;
+  private inlineActive = 0;
+  private nextId = 1;
+  private closed = false;
+
+  constructor(
+    options: PasswordHashPoolOptions,
+    private readonly metrics: MetricsService,
+  ) {
+    this.queue = new FairQueue(options.maxQueue, options.maxQueuePerClient);
+    this.inline = options.size <= 0 || !fs.existsSync(PasswordHashPool.WORKER_PATH);
+    this.concurrency = Math.max(1, options.size);
+
+    if (!this.inline) {
+      for (let i = 0; i < this.concurrency; i++) {
+        this.spawn();
+      }
+    }
+
+    metrics.gauge('password_hash.queue_depth', () => this.queue.size);
+    metrics.gauge('password_hash.busy', () =>
+      this.inline ? this.inlineActive : this.workers.length - this.idle.length,
+    );
+  }
+
+  run(clientKey: string, request: PasswordHashRequest): Promise<string | boolean> {
+    if (this.closed) {
+      return Promise.reject(new Error('Password hash pool is closed'));
+    }
+
+    return new Promise((resolve, reject) => {
+      const task: QueuedTask = { request, enqueuedAt: performance.now(), resolve, reject };
+
+      if (!this.queue.push(clientKey, task)) {
+        this.metrics.increment('password_hash.rejected');
+        reject(new PasswordHashPoolFullError());
+        return;
+      }
+
+      this.pump();
+    });
+  }
+
+  async close(): Promise<void> {
+    this.closed = true;
+
+    for (const task of this.queue.drain()) {
+      task.reject(new Error('Password hash pool is closed'));
+    }
+
+    await Promise.all(this.workers.map(({ worker }) => worker.terminate()));
+  }
+
+  private pump(): void {
+    while (this.queue.size > 0) {
+      if (this.inline) {
+        if (this.inlineActive >= this.concurrency) {
+          return;
+        }
+        this.runInline(this.queue.shift()!);
+      } else {
+        const poolWorker = this.idle.pop();
+        if (!poolWorker) {
+          return;
+        }
+        this.dispatch(poolWorker, this.queue.shift()!);
+      }
+    }
+  }
+
+  private runInline(task: QueuedTask): void {
+    const startedAt = performance.now();
+    const { request } = task;
+    const work: Promise<string | boolean> =
+      request.op === 'hash'
+        ? bcrypt.hash(request.password, request.rounds)
+        : bcrypt.compare(request.password, request.hash);
+
+    this.inlineActive += 1;
+    work
+      .then(
+        (result) => this.settle({ ...task, id: 0, startedAt }, { result }),
+        (error: Error) => this.settle({ ...task, id: 0, startedAt }, { error: error.message }),
+      )
+      .finally(() => {
+        this.inlineActive -= 1;
+        this.pump();
+      });
+  }
+
+  private dispatch(poolWorker: PoolWorker, task: QueuedTask): void {
+    const running: RunningTask = { ...task, id: this.nextId++, startedAt: performance.now() };
+    poolWorker.task = running;
+    poolWorker.worker.postMessage({ ...task.request, id: running.id });
+  }
+
+  private spawn(): void {
+    const poolWorker: PoolWorker = { worker: new Worker(PasswordHashPool.WORKER_PATH), task: null };
+    const { worker } = poolWorker;
+    worker.unref();
+
+    worker.on('message', (response: PasswordHashResponse & { id: number }) => {
+      const task = poolWorker.task;
+      poolWorker.task = null;
+      if (task && task.id === response.id) {
+        this.settle(task, response);
+      }
+      this.idle.push(poolWorker);
+      this.pump();
+    });
+
+    worker.on('error', (error) => {
+      const task = poolWorker.task;
+      poolWorker.task = null;
+      task?.reject(error);
+    });
+
+    worker.on('exit', () => {
+      this.workers.splice(this.workers.indexOf(poolWorker), 1);
+      const idleIndex = this.idle.indexOf(poolWorker);
+      if (idleIndex >= 0) {
+        this.idle.splice(idleIndex, 1);
+      }
+      poolWorker.task?.reject(new Error('Password hash worker exited'));
+
+      if (!this.closed) {
+        this.spawn();
+        this.pump();
+      }
+    });
+
+    this.workers.push(poolWorker);
+    this.idle.push(poolWorker);
+  }
+
+  private settle(task: RunningTask, response: PasswordHashResponse): void {
+    const finishedAt = performance.now();
+    this.metrics.observe('password_hash.wait_ms', task.startedAt - task.enqueuedAt);
+    this.metrics.observe('password_hash.latency_ms', finishedAt - task.enqueuedAt);
+
+    if ('error' in response) {
+      this.metrics.increment('password_hash.failed');
+      task.reject(new Error(response.error));
+    } else {
+      task.resolve(response.result);
+    }
+  }
+}
@@ -0,0 +1,25 @@
+import { parentPort } from 'worker_threads';
+import * as bcrypt from 'bcrypt';
+import { PasswordHashRequest, PasswordHashResponse } from './password-hash.pool';
+
+/**
+ * Password Hash Worker
+ *
+ * Runs one bcrypt operation at a time with the synchronous API: the work
+ * stays on this worker thread instead of the main libuv threadpool.
+ */
+parentPort!.on('message', (request: PasswordHashRequest & { id: number }) => {
+  let response: PasswordHashResponse & { id: number };
+
+  try {
+    const result =
+      request.op === 'hash'
+        ? bcrypt.hashSync(request.password, request.rounds)
+        : bcrypt.compareSync(request.password, request.hash);
+    response = { id: request.id, result };
+  } catch (error) {
+    response = { id: request.id, error: (error as Error).message };
+  }
+
+  parentPort!.postMessage(response);
+});
@@ -1,5 +1,6 @@
 import { Injectable } from '@nestjs/common';
 import { PrismaService } from '@shared/infrastructure/database/prisma.service';
+import { UserLoader } from '@shared/infrastructure/cache/user-loader.service';
 import { IUserRepository } from '../../domain/repositories/user.repository.interface';
 import { User, UserRole } from '../../domain/aggregates/user.aggregate';
 import { Email } from '../../domain/value-objects/email.vo';
@@ -9,13 +10,17 @@ import { Username } from '../../domain/value-objects/username.vo';
  * User Repository Implementation
  *
  * Implements persistence for User aggregate using Prisma.
+ * Writes invalidate the shared UserLoader cache once they commit.
  */
 @Injectable()
 export class UserRepository implements IUserRepository {
-  constructor(private readonly prisma: PrismaService) {}
+  constructor(
+    private readonly prisma: PrismaService,
+    private readonly userLoader: UserLoader,
+  ) {}
 
   async findById(id: string): Promise<User | null> {
-    const userModel = await this.prisma.user.findUnique({
+    const userModel = await this.prisma.client.user.findUnique({
       where: { id },
     });
 
@@ -27,7 +32,7 @@ export class UserRepository implements IUserRepository {
   }
 
   async findByEmail(email: Email): Promise<User | null> {
-    const userModel = await this.prisma.user.findUnique({
+    const userModel = await this.prisma.client.user.findUnique({
       where: { email: email.value },
     });
 
@@ -39,7 +44,7 @@ export class UserRepository implements IUserRepository {
   }
 
   async findByUsername(username: Username): Promise<User | null> {
-    const userModel = await this.prisma.user.findUnique({
+    const userModel = await this.prisma.client.user.findUnique({
       where: { username: username.value },
     });
 
@@ -51,7 +56,7 @@ export class UserRepository implements IUserRepository {
   }
 
   async exists(email: Email, username: Username): Promise<boolean> {
-    const count = await this.prisma.user.count({
+    const count = await this.prisma.client.user.count({
       where: {
         OR: [{ email: email.value }, { username: username.value }],
       },
@@ -61,7 +66,7 @@ export class UserRepository implements IUserRepository {
   }
 
   async save(user: User): Promise<void> {
-    await this.prisma.user.upsert({
+    await this.prisma.client.user.upsert({
       where: { id: user.id },
       create: {
         id: user.id,
@@ -82,12 +87,16 @@ export class UserRepository implements IUserRepository {
         updatedAt: user.getUpdatedAt(),
       },
     });
+
+    this.prisma.afterCommit(() => this.userLoader.invalidate(user.id));
   }
 
   async delete(id: string): Promise<void> {
-    await this.prisma.user.delete({
+    await this.prisma.client.user.delete({
       where: { id },
     });
+
+    this.prisma.afterCommit(() => this.userLoader.invalidate(id));
   }
 
   private toDomain(userModel: any): User {
@@ -2,11 +2,15 @@ import { Test, TestingModule } from '@nestjs/testing';
 import { JwtService } from '@nestjs/jwt';
 import { JwtTokenService } from '../jwt.service';
 import { PrismaService } from '@shared/infrastructure/database/prisma.service';
+import { TokenRevocationService } from '../token-revocation.service';
 
 describe('JwtTokenService', () => {
   let service: JwtTokenService;
   let jwtService: jest.Mocked<JwtService>;
   let prismaService: any;
+  let tokenRevocation: jest.Mocked<
+    Pick<TokenRevocationService, 'revokeToken' | 'revokeUser' | 'issuedAt'>
+  >;
 
   beforeEach(async () => {
     const mockJwtService = {
@@ -34,12 +38,21 @@ describe('JwtTokenService', () => {
           provide: PrismaService,
           useValue: mockPrismaService,
         },
+        {
+          provide: TokenRevocationService,
+          useValue: {
+            revokeToken: jest.fn(),
+            revokeUser: jest.fn(),
+            issuedAt: jest.fn().mockReturnValue(1_792_000_000),
+          },
+        },
       ],
     }).compile();
 
     service = module.get<JwtTokenService>(JwtTokenService);
     jwtService = module.get(JwtService);
     prismaService = module.get(PrismaService);
+    tokenRevocation = module.get(TokenRevocationService);
   });
 
   describe('generateTokenPair', () => {
@@ -83,11 +96,33 @@ describe('JwtTokenService', () => {
           email,
           username,
           role,
+          iat: 1_792_000_000,
         },
         expect.any(Object),
       );
     });
 
+    it('should issue the access token after the user revocation watermark', async () => {
+      jwtService.sign.mockReturnValue('mock-access-token');
+      prismaService.refreshToken.create.mockResolvedValue({});
+
+      await service.generateTokenPair(userId, email, username, role);
+
+      expect(tokenRevocation.issuedAt).toHaveBeenCalledWith(userId);
+    });
+
+    it('should use the refresh token id as the access token jti', async () => {
+      jwtService.sign.mockReturnValue('mock-access-token');
+      prismaService.refreshToken.create.mockResolvedValue({});
+
+      await service.generateTokenPair(userId, email, username, role);
+
+      const { jwtid } = jwtService.sign.mock.calls[0][1] as { jwtid: string };
+      expect(prismaService.refreshToken.create).toHaveBeenCalledWith({
+        data: expect.objectContaining({ id: jwtid }),
+      });
+    });
+
     it('should store refresh token in database', async () => {
       jwtService.sign.mockReturnValue('mock-access-token');
       prismaService.refreshToken.create.mockResolvedValue({
@@ -227,6 +262,19 @@ describe('JwtTokenService', () => {
         where: { token: 'token-to-revoke' },
       });
     });
+
+    it('should revoke access tokens issued with the refresh token', async () => {
+      prismaService.refreshToken.findUnique.mockResolvedValue({
+        id: 'refresh-token-id',
+        token: 'token-to-revoke',
+        userId: 'user-id-123',
+      });
+      prismaService.refreshToken.deleteMany.mockResolvedValue({ count: 1 });
+
+      await service.revokeRefreshToken('token-to-revoke');
+
+      expect(tokenRevocation.revokeToken).toHaveBeenCalledWith('user-id-123', 'refresh-token-id');
+    });
   });
 
   describe('revokeAllUserTokens', () => {
@@ -238,6 +286,7 @@ describe('JwtTokenService', () => {
       expect(prismaService.refreshToken.deleteMany).toHaveBeenCalledWith({
         where: { userId: 'user-id-123' },
       });
+      expect(tokenRevocation.revokeUser).toHaveBeenCalledWith('user-id-123');
     });
   });
 });
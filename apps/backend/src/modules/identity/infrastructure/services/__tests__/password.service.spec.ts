@@ -1,12 +1,13 @@
 import { Test, TestingModule } from '@nestjs/testing';
 import { PasswordService } from '../password.service';
+import { MetricsService } from '@shared/infrastructure/metrics/metrics.service';
 
 describe('PasswordService', () => {
   let service: PasswordService;
 
   beforeEach(async () => {
     const module: TestingModule = await Test.createTestingModule({
-      providers: [PasswordService],
+      providers: [PasswordService, MetricsService],
     }).compile();
 
     service = module.get<PasswordService>(PasswordService);
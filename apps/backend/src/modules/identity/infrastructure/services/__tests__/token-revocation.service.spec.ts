@@ -0,0 +1,104 @@
+import { TokenRevocationService, parseTokenLifetime } from '../token-revocation.service';
+import { PrismaService } from '@shared/infrastructure/database/prisma.service';
+
+describe('TokenRevocationService', () => {
+  let prisma: any;
+  let service: TokenRevocationService;
+
+  const payload = (overrides: Record<string, unknown> = {}) => ({
+    sub: 'user-1',
+    email: 'user@example.com',
+    username: 'user_1',
+    role: 'PLAYER',
+    jti: 'token-1',
+    iat: Math.floor(Date.now() / 1000) - 60,
+    ...overrides,
+  });
+
+  beforeEach(() => {
+    prisma = {
+      tokenRevocation: {
+        create: jest.fn(),
+        findMany: jest.fn().mockResolvedValue([]),
+        deleteMany: jest.fn(),
+      },
+    };
+    service = new TokenRevocationService(prisma as PrismaService);
+  });
+
+  it('should accept tokens that were never revoked', () => {
+    expect(service.isRevoked(payload())).toBe(false);
+  });
+
+  it('should reject a revoked token id', async () => {
+    await service.revokeToken('user-1', 'token-1');
+
+    expect(service.isRevoked(payload())).toBe(true);
+    expect(service.isRevoked(payload({ jti: 'token-2' }))).toBe(false);
+    expect(prisma.tokenRevocation.create).toHaveBeenCalledWith({
+      data: expect.objectContaining({ userId: 'user-1', tokenId: 'token-1' }),
+    });
+  });
+
+  it('should reject tokens issued before a user revocation', async () => {
+    await service.revokeUser('user-1');
+
+    expect(service.isRevoked(payload())).toBe(true);
+    expect(service.isRevoked(payload({ iat: Math.floor(Date.now() / 1000) + 2 }))).toBe(false);
+    expect(service.isRevoked(payload({ sub: 'user-2' }))).toBe(false);
+  });
+
+  it('should reject tokens from the revocation second and accept those issued after it', async () => {
+    jest.useFakeTimers({ now: new Date('2026-10-18T09:00:00.400Z') });
+    await service.revokeUser('user-1');
+    const revokedSecond = Math.floor(Date.parse('2026-10-18T09:00:00Z') / 1000);
+
+    expect(service.isRevoked(payload({ iat: revokedSecond }))).toBe(true);
+    expect(service.issuedAt('user-1')).toBe(revokedSecond + 1);
+    expect(service.isRevoked(payload({ iat: service.issuedAt('user-1') }))).toBe(false);
+    expect(service.issuedAt('user-2')).toBe(revokedSecond);
+    jest.useRealTimers();
+  });
+
+  it('should pick up revocations recorded by other nodes', async () => {
+    prisma.tokenRevocation.findMany.mockResolvedValue([
+      {
+        userId: 'user-1',
+        tokenId: 'token-1',
+        revokedAt: new Date(),
+        expiresAt: new Date(Date.now() + 60_000),
+      },
+    ]);
+
+    await service.sync();
+
+    expect(service.isRevoked(payload())).toBe(true);
+  });
+
+  it('should forget revocations once access tokens have expired', async () => {
+    prisma.tokenRevocation.findMany.mockResolvedValue([
+      {
+        userId: 'user-1',
+        tokenId: 'token-1',
+        revokedAt: new Date(),
+        expiresAt: new Date(Date.now() + 1_000),
+      },
+    ]);
+    await service.sync();
+
+    jest.useFakeTimers({ now: Date.now() + 2_000 });
+    prisma.tokenRevocation.findMany.mockResolvedValue([]);
+    await service.sync();
+    jest.useRealTimers();
+
+    expect(service.isRevoked(payload())).toBe(false);
+  });
+});
+
+describe('parseTokenLifetime', () => {
+  it('should parse JWT lifetime strings', () => {
+    expect(parseTokenLifetime('15m')).toBe(900_000);
+    expect(parseTokenLifetime('1h')).toBe(3_600_000);
+    expect(parseTokenLifetime('900')).toBe(900_000);
+  });
+});
@@ -2,12 +2,15 @@ import { Injectable } from '@nestjs/common';
 import { JwtService as NestJwtService } from '@nestjs/jwt';
 import { PrismaService } from '@shared/infrastructure/database/prisma.service';
 import { v4 as uuidv4 } from 'uuid';
+import { TokenRevocationService } from './token-revocation.service';
 
 export interface JwtPayload {
   sub: string; // user id
   email: string;
   username: string;
   role: string;
+  jti?: string; // id of the refresh token issued alongside
+  iat?: number;
 }
 
 export interface TokenPair {
@@ -19,12 +22,15 @@ export interface TokenPair {
  * JWT Token Service
  *
  * Handles generation and management of access and refresh tokens.
+ * Each access token carries the id of its refresh token as `jti`, so
+ * revoking the refresh token also revokes the access token.
  */
 @Injectable()
 export class JwtTokenService {
   constructor(
     private readonly jwtService: NestJwtService,
     private readonly prisma: PrismaService,
+    private readonly tokenRevocation: TokenRevocationService,
   ) {}
 
   async generateTokenPair(userId: string, email: string, username: string, role: string): Promise<TokenPair> {
@@ -33,14 +39,18 @@ export class JwtTokenService {
       email,
       username,
       role,
+      iat: this.tokenRevocation.issuedAt(userId),
     };
 
+    const refreshTokenId = uuidv4();
+
     const accessToken = this.jwtService.sign(payload, {
       secret: process.env.JWT_SECRET,
       expiresIn: process.env.JWT_EXPIRES_IN || '15m',
+      jwtid: refreshTokenId,
     });
 
-    const refreshToken = await this.generateRefreshToken(userId);
+    const refreshToken = await this.generateRefreshToken(refreshTokenId, userId);
 
     return {
       accessToken,
@@ -48,13 +58,14 @@ export class JwtTokenService {
     };
   }
 
-  private async generateRefreshToken(userId: string): Promise<string> {
+  private async generateRefreshToken(id: string, userId: string): Promise<string> {
     const token = uuidv4();
     const expiresAt = new Date();
     expiresAt.setDate(expiresAt.getDate() + 7); // 7 days
 
     await this.prisma.refreshToken.create({
       data: {
+        id,
         token,
         userId,
         expiresAt,
@@ -89,14 +100,24 @@ export class JwtTokenService {
   }
 
   async revokeRefreshToken(token: string): Promise<void> {
+    const storedToken = await this.prisma.refreshToken.findUnique({
+      where: { token },
+    });
+
     await this.prisma.refreshToken.deleteMany({
       where: { token },
     });
+
+    if (storedToken) {
+      await this.tokenRevocation.revokeToken(storedToken.userId, storedToken.id);
+    }
   }
 
   async revokeAllUserTokens(userId: string): Promise<void> {
     await this.prisma.refreshToken.deleteMany({
       where: { userId },
     });
+
+    await this.tokenRevocation.revokeUser(userId);
   }
 }
@@ -1,20 +1,82 @@
-import { Injectable } from '@nestjs/common';
+import { Injectable, OnModuleDestroy, ServiceUnavailableException } from '@nestjs/common';
 import * as bcrypt from 'bcrypt';
+import * as os from 'os';
+import { MetricsService } from '@shared/infrastructure/metrics/metrics.service';
+import {
+  PasswordHashPool,
+  PasswordHashPoolFullError,
+  PasswordHashRequest,
+} from '../hashing/password-hash.pool';
 
 /**
  * Password Service
  *
- * Handles password hashing and verification using bcrypt.
+ * Handles password hashing and verification using bcrypt. Work runs on a
+ * PasswordHashPool of worker threads; callers pass a client key (the IP)
+ * so one client cannot monopolize the queue. When the queue is full the
+ * request fails fast with 503 instead of waiting.
  */
 @Injectable()
-export class PasswordService {
+export class PasswordService implements OnModuleDestroy {
   private readonly saltRounds = parseInt(process.env.BCRYPT_SALT_ROUNDS || '12', 10);
+  private readonly pool: PasswordHashPool;
 
-  async hash(plainPassword: string): Promise<string> {
-    return bcrypt.hash(plainPassword, this.saltRounds);
+  constructor(metrics: MetricsService) {
+    const defaultWorkers = Math.max(1, Math.min(4, os.cpus().length - 1));
+
+    this.pool = new PasswordHashPool(
+      {
+        size: parseInt(process.env.PASSWORD_HASH_WORKERS || String(defaultWorkers), 10),
+        maxQueue: parseInt(process.env.PASSWORD_HASH_MAX_QUEUE || '64', 10),
+        maxQueuePerClient: parseInt(process.env.PASSWORD_HASH_MAX_QUEUE_PER_CLIENT || '8', 10),
+      },
+      metrics,
+    );
+  }
+
+  async onModuleDestroy() {
+    await this.pool.close();
+  }
+
+  async hash(plainPassword: string, clientKey: string = 'anonymous'): Promise<string> {
+    return (await this.run(clientKey, {
+      op: 'hash',
+      password: plainPassword,
+      rounds: this.saltRounds,
+    })) as string;
+  }
+
+  async compare(
+    plainPassword: string,
+    hashedPassword: string,
+    clientKey: string = 'anonymous',
+  ): Promise<boolean> {
+    return (await this.run(clientKey, {
+      op: 'compare',
+      password: plainPassword,
+      hash: hashedPassword,
+    })) as boolean;
+  }
+
+  /**
+   * Whether a stored hash was made with a different cost than configured
+   */
+  needsRehash(hashedPassword: string): boolean {
+    try {
+      return bcrypt.getRounds(hashedPassword) !== this.saltRounds;
+    } catch {
+      return false;
+    }
   }
 
-  async compare(plainPassword: string, hashedPassword: string): Promise<boolean> {
-    return bcrypt.compare(plainPassword, hashedPassword);
+  private async run(clientKey: string, request: PasswordHashRequest): Promise<string | boolean> {
+    try {
+      return await this.pool.run(clientKey, request);
+    } catch (error) {
+      if (error instanceof PasswordHashPoolFullError) {
+        throw new ServiceUnavailableException('Too many authentication requests, please retry');
+      }
+      throw error;
+    }
   }
 }
@@ -0,0 +1,210 @@
+import { Injectable, Logger, OnModuleInit, OnModuleDestroy } from '@nestjs/common';
+import { PrismaService } from '@shared/infrastructure/database/prisma.service';
+import { BloomFilter } from '@shared/infrastructure/cache/bloom-filter';
+import { JwtPayload } from './jwt.service';
+
+/**
+ * Parse a JWT lifetime such as "15m", "1h" or "900" (seconds) to milliseconds
+ */
+export function parseTokenLifetime(value: string): number {
+  const match = /^(\d+)\s*(ms|s|m|h|d)?$/.exec(value.trim());
+  if (!match) {
+    throw new Error(`Invalid token lifetime: ${value}`);
+  }
+
+  const amount = parseInt(match[1], 10);
+  const unit = match[2] ?? 's';
+  const factors: Record<string, number> = {
+    ms: 1,
+    s: 1000,
+    m: 60_000,
+    h: 3_600_000,
+    d: 86_400_000,
+  };
+
+  return amount * factors[unit];
+}
+
+/**
+ * Token Revocation Service
+ *
+ * In-memory view of revoked access tokens, so JwtStrategy can check
+ * revocation without a database query.
+ *
+ * - Token revocations (`jti`) go into a bloom filter; positives are
+ *   confirmed against an exact map, so there are no false rejections.
+ * - User revocations keep a watermark: tokens issued up to and including
+ *   its second are rejected.
+ *
+ * Entries only live as long as an access token can, and every node
+ * reconciles against token_revocations every JWT_REVOCATION_SYNC_MS.
+ */
+@Injectable()
+export class TokenRevocationService implements OnModuleInit, OnModuleDestroy {
+  private static readonly FILTER_CAPACITY = 100_000;
+  private static readonly CLOCK_SKEW_MS = 5_000;
+  private static readonly DB_PRUNE_INTERVAL_MS = 60 * 60 * 1000;
+
+  private readonly logger = new Logger(TokenRevocationService.name);
+  private readonly accessTokenTtlMs = parseTokenLifetime(process.env.JWT_EXPIRES_IN || '15m');
+  private readonly syncIntervalMs = parseInt(process.env.JWT_REVOCATION_SYNC_MS || '10000', 10);
+
+  private tokenFilter = new BloomFilter(TokenRevocationService.FILTER_CAPACITY);
+  private readonly revokedTokens = new Map<string, number>();
+  private readonly userWatermarks = new Map<string, { revokedAt: number; expiresAt: number }>();
+  private lastRevokedAt = new Date(0);
+  private lastDbPruneAt = 0;
+  private timer: NodeJS.Timeout | null = null;
+
+  constructor(private readonly prisma: PrismaService) {}
+
+  async onModuleInit(): Promise<void> {
+    await this.sync();
+
+    this.timer = setInterval(() => {
+      this.sync().catch((error) => this.logger.error('Revocation sync failed', error));
+    }, this.syncIntervalMs);
+    this.timer.unref();
+  }
+
+  onModuleDestroy(): void {
+    if (this.timer) {
+      clearInterval(this.timer);
+      this.timer = null;
+    }
+  }
+
+  isRevoked(payload: JwtPayload): boolean {
+    const watermark = this.userWatermarks.get(payload.sub);
+    // iat is in whole seconds: a token from the revocation second cannot be
+    // ordered against it, so it is rejected (issuedAt moves new ones past it)
+    if (watermark && (payload.iat ?? 0) <= Math.floor(watermark.revokedAt / 1000)) {
+      return true;
+    }
+
+    if (!payload.jti || !this.tokenFilter.mightContain(payload.jti)) {
+      return false;
+    }
+
+    return this.revokedTokens.has(payload.jti);
+  }
+
+  /**
+   * The `iat` for a new access token: now, or the second after the user's
+   * revocation watermark when that is still the current second
+   */
+  issuedAt(userId: string): number {
+    const now = Math.floor(Date.now() / 1000);
+    const watermark = this.userWatermarks.get(userId);
+    return watermark ? Math.max(now, Math.floor(watermark.revokedAt / 1000) + 1) : now;
+  }
+
+  /**
+   * Revoke access tokens issued for one refresh token
+   */
+  async revokeToken(userId: string, tokenId: string): Promise<void> {
+    const revokedAt = new Date();
+    const expiresAt = new Date(revokedAt.getTime() + this.accessTokenTtlMs);
+
+    await this.prisma.tokenRevocation.create({
+      data: { userId, tokenId, revokedAt, expiresAt },
+    });
+    this.applyToken(tokenId, expiresAt.getTime());
+  }
+
+  /**
+   * Revoke every access token issued to a user so far
+   */
+  async revokeUser(userId: string): Promise<void> {
+    const revokedAt = new Date();
+    const expiresAt = new Date(revokedAt.getTime() + this.accessTokenTtlMs);
+
+    await this.prisma.tokenRevocation.create({
+      data: { userId, tokenId: null, revokedAt, expiresAt },
+    });
+    this.applyUser(userId, revokedAt.getTime(), expiresAt.getTime());
+  }
+
+  /**
+   * Pull revocations recorded by other nodes and drop expired entries
+   */
+  async sync(): Promise<void> {
+    const now = new Date();
+    const since = new Date(this.lastRevokedAt.getTime() - TokenRevocationService.CLOCK_SKEW_MS);
+
+    const rows = await this.prisma.tokenRevocation.findMany({
+      where: { revokedAt: { gt: since }, expiresAt: { gt: now } },
+      orderBy: { revokedAt: 'asc' },
+    });
+
+    for (const row of rows) {
+      if (row.tokenId) {
+        this.applyToken(row.tokenId, row.expiresAt.getTime());
+      } else {
+        this.applyUser(row.userId, row.revokedAt.getTime(), row.expiresAt.getTime());
+      }
+      if (row.revokedAt > this.lastRevokedAt) {
+        this.lastRevokedAt = row.revokedAt;
+      }
+    }
+
+    this.pruneExpired(now.getTime());
+
+    if (now.getTime() - this.lastDbPruneAt > TokenRevocationService.DB_PRUNE_INTERVAL_MS) {
+      this.lastDbPruneAt = now.getTime();
+      await this.prisma.tokenRevocation.deleteMany({ where: { expiresAt: { lt: now } } });
+    }
+  }
+
+  private applyToken(tokenId: string, expiresAt: number): void {
+    if (this.revokedTokens.has(tokenId)) {
+      return;
+    }
+
+    this.revokedTokens.set(tokenId, expiresAt);
+    if (this.tokenFilter.size >= this.tokenFilter.expectedItems) {
+      this.rebuildFilter();
+    } else {
+      this.tokenFilter.add(tokenId);
+    }
+  }
+
+  private applyUser(userId: string, revokedAt: number, expiresAt: number): void {
+    const current = this.userWatermarks.get(userId);
+    if (!current || current.revokedAt < revokedAt) {
+      this.userWatermarks.set(userId, { revokedAt, expiresAt });
+    }
+  }
+
+  private pruneExpired(now: number): void {
+    let prunedTokens = 0;
+    for (const [tokenId, expiresAt] of this.revokedTokens) {
+      if (expiresAt <= now) {
+        this.revokedTokens.delete(tokenId);
+        prunedTokens += 1;
+      }
+    }
+
+    for (const [userId, watermark] of this.userWatermarks) {
+      if (watermark.expiresAt <= now) {
+        this.userWatermarks.delete(userId);
+      }
+    }
+
+    // Bloom filters cannot delete, so rebuild once enough entries expired
+    if (prunedTokens > 0 && this.tokenFilter.size > this.revokedTokens.size * 2) {
+      this.rebuildFilter();
+    }
+  }
+
+  private rebuildFilter(): void {
+    const capacity = Math.max(
+      TokenRevocationService.FILTER_CAPACITY,
+      this.revokedTokens.size * 2,
+    );
+    this.tokenFilter = new BloomFilter(capacity);
+    for (const tokenId of this.revokedTokens.keys()) {
+      this.tokenFilter.add(tokenId);
+    }
+  }
+}
@@ -1,17 +1,30 @@
-import { Injectable, UnauthorizedException, Inject } from '@nestjs/common';
+import { Injectable, UnauthorizedException } from '@nestjs/common';
 import { PassportStrategy } from '@nestjs/passport';
 import { ExtractJwt, Strategy } from 'passport-jwt';
+import { UserLoader } from '@shared/infrastructure/cache/user-loader.service';
 import { JwtPayload } from '../services/jwt.service';
-import { IUserRepository } from '../../domain/repositories/user.repository.interface';
+import { TokenRevocationService } from '../services/token-revocation.service';
+
+export type JwtValidationMode = 'database' | 'stateless';
 
 /**
  * JWT Strategy
  *
- * Validates JWT tokens and attaches user to request.
+ * Validates JWT tokens and attaches user to request. Revoked tokens are
+ * rejected in both modes (JWT_VALIDATION_MODE):
+ * - database (default): the user is resolved through the shared
+ *   UserLoader, so deleted users and role changes apply within its TTL.
+ * - stateless: the signed claims are trusted as-is; no database access.
  */
 @Injectable()
 export class JwtStrategy extends PassportStrategy(Strategy) {
-  constructor(@Inject('IUserRepository') private readonly userRepository: IUserRepository) {
+  private readonly validationMode: JwtValidationMode =
+    process.env.JWT_VALIDATION_MODE === 'stateless' ? 'stateless' : 'database';
+
+  constructor(
+    private readonly userLoader: UserLoader,
+    private readonly tokenRevocation: TokenRevocationService,
+  ) {
     super({
       jwtFromRequest: ExtractJwt.fromAuthHeaderAsBearerToken(),
       ignoreExpiration: false,
@@ -20,7 +33,20 @@ export class JwtStrategy extends PassportStrategy(Strategy) {
   }
 
   async validate(payload: JwtPayload) {
-    const user = await this.userRepository.findById(payload.sub);
+    if (this.tokenRevocation.isRevoked(payload)) {
+      throw new UnauthorizedException();
+    }
+
+    if (this.validationMode === 'stateless') {
+      return {
+        userId: payload.sub,
+        email: payload.email,
+        username: payload.username,
+        role: payload.role,
+      };
+    }
+
+    const user = await this.userLoader.load(payload.sub);
 
     if (!user) {
       throw new UnauthorizedException();
@@ -28,9 +54,9 @@ export class JwtStrategy extends PassportStrategy(Strategy) {
 
     return {
       userId: user.id,
-      email: user.getEmail().value,
-      username: user.getUsername().value,
-      role: user.getRole(),
+      email: user.email,
+      username: user.username,
+      role: user.role,
     };
   }
 }
@@ -1,4 +1,14 @@
-import { Controller, Post, Body, UnauthorizedException, HttpCode, HttpStatus, Inject } from '@nestjs/common';
+import {
+  Controller,
+  Post,
+  Body,
+  UnauthorizedException,
+  HttpCode,
+  HttpStatus,
+  Inject,
+  Ip,
+  Logger,
+} from '@nestjs/common';
 import { ApiTags, ApiOperation, ApiResponse } from '@nestjs/swagger';
 import { CommandBus } from '@nestjs/cqrs';
 import { RegisterDto } from '../dtos/register.dto';
@@ -10,15 +20,18 @@ import { PasswordService } from '../../infrastructure/services/password.service'
 import { JwtTokenService } from '../../infrastructure/services/jwt.service';
 import { IUserRepository } from '../../domain/repositories/user.repository.interface';
 import { Email } from '../../domain/value-objects/email.vo';
+import { User } from '../../domain/aggregates/user.aggregate';
 
 /**
  * Auth Controller
  *
- * Handles authentication endpoints: register, login, refresh.
+ * Handles authentication endpoints: register, login, refresh, logout.
  */
 @ApiTags('Auth')
 @Controller('auth')
 export class AuthController {
+  private readonly logger = new Logger(AuthController.name);
+
   constructor(
     private readonly commandBus: CommandBus,
     private readonly passwordService: PasswordService,
@@ -29,9 +42,10 @@ export class AuthController {
   @Post('register')
   @ApiOperation({ summary: 'Register a new user' })
   @ApiResponse({ status: 201, type: AuthResponseDto })
-  async register(@Body() dto: RegisterDto): Promise<AuthResponseDto> {
+  @ApiResponse({ status: 503, description: 'Too many concurrent authentication requests' })
+  async register(@Body() dto: RegisterDto, @Ip() ip: string): Promise<AuthResponseDto> {
     // Hash password before sending to command
-    const hashedPassword = await this.passwordService.hash(dto.password);
+    const hashedPassword = await this.passwordService.hash(dto.password, ip);
 
     const result = await this.commandBus.execute(
       new RegisterUserCommand(dto.email, dto.username, dto.username, hashedPassword),
@@ -61,7 +75,8 @@ export class AuthController {
   @HttpCode(HttpStatus.OK)
   @ApiOperation({ summary: 'Login with email and password' })
   @ApiResponse({ status: 200, type: AuthResponseDto })
-  async login(@Body() dto: LoginDto): Promise<AuthResponseDto> {
+  @ApiResponse({ status: 503, description: 'Too many concurrent authentication requests' })
+  async login(@Body() dto: LoginDto, @Ip() ip: string): Promise<AuthResponseDto> {
     // Find user and verify password
     const email = Email.create(dto.email);
     const user = await this.userRepository.findByEmail(email);
@@ -73,12 +88,18 @@ export class AuthController {
     const isPasswordValid = await this.passwordService.compare(
       dto.password,
       user.getPasswordHash(),
+      ip,
     );
 
     if (!isPasswordValid) {
       throw new UnauthorizedException('Invalid credentials');
     }
 
+    if (this.passwordService.needsRehash(user.getPasswordHash())) {
+      // Upgrade to the configured cost without delaying the login
+      void this.rehashPassword(user, dto.password, ip);
+    }
+
     // Execute login command
     const result = await this.commandBus.execute(new LoginUserCommand(dto.email, dto.password));
 
@@ -133,4 +154,21 @@ export class AuthController {
       },
     };
   }
+
+  @Post('logout')
+  @HttpCode(HttpStatus.NO_CONTENT)
+  @ApiOperation({ summary: 'Revoke a refresh token and the access tokens issued with it' })
+  @ApiResponse({ status: 204 })
+  async logout(@Body() dto: RefreshTokenDto): Promise<void> {
+    await this.jwtTokenService.revokeRefreshToken(dto.refreshToken);
+  }
+
+  private async rehashPassword(user: User, plainPassword: string, ip: string): Promise<void> {
+    try {
+      user.updatePassword(await this.passwordService.hash(plainPassword, ip));
+      await this.userRepository.save(user);
+    } catch (error) {
+      this.logger.warn(`Password rehash deferred for user ${user.id}: ${(error as Error).message}`);
+    }
+  }
 }
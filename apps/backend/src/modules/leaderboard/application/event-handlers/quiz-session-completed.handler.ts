@@ -1,11 +1,14 @@
 import { Inject, Logger } from '@nestjs/common';
-import { OnEvent } from '@nestjs/event-emitter';
+import { OnDomainEvent } from '@shared/infrastructure/events/on-domain-event.decorator';
+import { DeliveredDomainEvent } from '@shared/infrastructure/events/outbox-dispatcher.service';
 import { IPlayerRankingRepository } from '../../domain/repositories/player-ranking.repository.interface';
 
 /**
  * Quiz Session Completed Event Handler (Leaderboard Context)
  *
- * Updates player ranking scores based on quiz score.
+ * Updates player ranking scores based on quiz score. Completions are
+ * received in batches, summed per player and applied with a single bulk
+ * increment, which also moves the players in the ranking engine.
  */
 export class QuizSessionCompletedLeaderboardHandler {
   private readonly logger = new Logger(QuizSessionCompletedLeaderboardHandler.name);
@@ -15,25 +18,24 @@ export class QuizSessionCompletedLeaderboardHandler {
     private readonly rankingRepository: IPlayerRankingRepository,
   ) {}
 
-  @OnEvent('quiz.session.completed')
-  async handle(event: any) {
-    const { userId, totalPoints } = event.props;
+  @OnDomainEvent('quiz.session.completed', { batch: true })
+  async handle(events: DeliveredDomainEvent[]) {
+    const points = new Map<string, number>();
+    for (const event of events) {
+      const { userId, totalPoints } = event.props as { userId: string; totalPoints: number };
+      points.set(userId, (points.get(userId) ?? 0) + totalPoints);
+    }
 
-    this.logger.log(`Updating leaderboard score for user: ${userId} (+${totalPoints} points)`);
+    this.logger.log(
+      `Updating leaderboard scores for ${points.size} players (${events.length} sessions)`,
+    );
 
     try {
-      const ranking = await this.rankingRepository.getOrCreate(userId);
-
-      // Add score to both global and weekly leaderboards
-      ranking.addScore(totalPoints);
-
-      await this.rankingRepository.save(ranking);
-
-      this.logger.log(
-        `Leaderboard updated for user ${userId}: Global ${ranking.globalScore}, Weekly ${ranking.weeklyScore}`,
+      await this.rankingRepository.addScores(
+        [...points].map(([userId, score]) => ({ userId, score })),
       );
     } catch (error) {
-      this.logger.error(`Failed to update leaderboard for user: ${userId}`, error);
+      this.logger.error(`Failed to update leaderboard for ${points.size} players`, error);
       throw error;
     }
   }
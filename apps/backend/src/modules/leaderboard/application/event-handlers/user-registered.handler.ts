@@ -1,5 +1,5 @@
 import { Inject, Logger } from '@nestjs/common';
-import { OnEvent } from '@nestjs/event-emitter';
+import { OnDomainEvent } from '@shared/infrastructure/events/on-domain-event.decorator';
 import { IPlayerRankingRepository } from '../../domain/repositories/player-ranking.repository.interface';
 
 /**
@@ -15,7 +15,7 @@ export class UserRegisteredLeaderboardHandler {
     private readonly rankingRepository: IPlayerRankingRepository,
   ) {}
 
-  @OnEvent('user.registered')
+  @OnDomainEvent('user.registered')
   async handle(event: any) {
     this.logger.log(`Creating player ranking for user: ${event.props.userId}`);
 
@@ -2,7 +2,7 @@ import { QueryHandler, IQueryHandler } from '@nestjs/cqrs';
 import { Injectable, Inject } from '@nestjs/common';
 import { GetLeaderboardQuery } from './get-leaderboard.query';
 import { IPlayerRankingRepository } from '../../domain/repositories/player-ranking.repository.interface';
-import { PrismaService } from '@shared/infrastructure/database/prisma.service';
+import { UserLoader } from '@shared/infrastructure/cache/user-loader.service';
 
 export interface LeaderboardEntry {
   userId: string;
@@ -19,29 +19,20 @@ export class GetLeaderboardHandler
   constructor(
     @Inject('IPlayerRankingRepository')
     private readonly rankingRepository: IPlayerRankingRepository,
-    private readonly prisma: PrismaService,
+    private readonly userLoader: UserLoader,
   ) {}
 
   async execute(query: GetLeaderboardQuery): Promise<LeaderboardEntry[]> {
-    const rankings =
-      query.type === 'global'
-        ? await this.rankingRepository.getTopGlobal(query.limit)
-        : await this.rankingRepository.getTopWeekly(query.limit);
+    const rankings = await this.rankingRepository.getTopRanked(query.type, query.limit);
 
-    // Fetch usernames
-    const userIds = rankings.map((r) => r.userId);
-    const users = await this.prisma.user.findMany({
-      where: { id: { in: userIds } },
-      select: { id: true, username: true },
-    });
+    // Fetch usernames (batched and cached)
+    const users = await this.userLoader.loadMany(rankings.map((r) => r.userId));
 
-    const userMap = new Map(users.map((u) => [u.id, u.username]));
-
-    return rankings.map((ranking) => ({
+    return rankings.map((ranking, index) => ({
       userId: ranking.userId,
-      username: userMap.get(ranking.userId) || 'Unknown',
-      score: query.type === 'global' ? ranking.globalScore : ranking.weeklyScore,
-      rank: query.type === 'global' ? ranking.globalRank : ranking.weeklyRank,
+      username: users[index]?.username || 'Unknown',
+      score: ranking.score,
+      rank: ranking.rank,
     }));
   }
 }
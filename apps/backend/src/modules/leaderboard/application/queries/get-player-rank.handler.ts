@@ -0,0 +1,52 @@
+import { QueryHandler, IQueryHandler } from '@nestjs/cqrs';
+import { Injectable, Inject } from '@nestjs/common';
+import { GetPlayerRankQuery } from './get-player-rank.query';
+import { LeaderboardEntry } from './get-leaderboard.handler';
+import { IPlayerRankingRepository } from '../../domain/repositories/player-ranking.repository.interface';
+import { UserLoader } from '@shared/infrastructure/cache/user-loader.service';
+
+export interface PlayerRankResult {
+  player: LeaderboardEntry | null;
+  around: LeaderboardEntry[];
+}
+
+/**
+ * Get Player Rank Query Handler
+ *
+ * Returns the player's own rank and the players directly above and below.
+ */
+@Injectable()
+@QueryHandler(GetPlayerRankQuery)
+export class GetPlayerRankHandler implements IQueryHandler<GetPlayerRankQuery, PlayerRankResult> {
+  private static readonly MAX_RADIUS = 50;
+
+  constructor(
+    @Inject('IPlayerRankingRepository')
+    private readonly rankingRepository: IPlayerRankingRepository,
+    private readonly userLoader: UserLoader,
+  ) {}
+
+  async execute(query: GetPlayerRankQuery): Promise<PlayerRankResult> {
+    const radius = Math.min(Math.max(query.radius, 0), GetPlayerRankHandler.MAX_RADIUS);
+    const around = await this.rankingRepository.getPlayersAround(query.type, query.userId, radius);
+
+    if (around.length === 0) {
+      return { player: null, around: [] };
+    }
+
+    // Fetch usernames (batched and cached)
+    const users = await this.userLoader.loadMany(around.map((r) => r.userId));
+
+    const entries = around.map((ranking, index) => ({
+      userId: ranking.userId,
+      username: users[index]?.username || 'Unknown',
+      score: ranking.score,
+      rank: ranking.rank,
+    }));
+
+    return {
+      player: entries.find((e) => e.userId === query.userId) ?? null,
+      around: entries,
+    };
+  }
+}
@@ -0,0 +1,7 @@
+export class GetPlayerRankQuery {
+  constructor(
+    public readonly userId: string,
+    public readonly type: 'global' | 'weekly',
+    public readonly radius: number = 5,
+  ) {}
+}
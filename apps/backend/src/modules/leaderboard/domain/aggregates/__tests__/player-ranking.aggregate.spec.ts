@@ -1,4 +1,5 @@
 import { PlayerRanking } from '../player-ranking.aggregate';
+import { weekEpoch } from '../../services/week-epoch';
 
 describe('PlayerRanking Aggregate', () => {
   const rankingId = 'ranking-123';
@@ -51,6 +52,40 @@ describe('PlayerRanking Aggregate', () => {
     });
   });
 
+  describe('weekly epoch', () => {
+    const fromLastWeek = () =>
+      PlayerRanking.fromPersistence({
+        id: rankingId,
+        userId,
+        globalScore: 500,
+        weeklyScore: 120,
+        weeklyEpoch: weekEpoch() - 1,
+        globalRank: 3,
+        weeklyRank: 7,
+        createdAt: new Date(),
+        updatedAt: new Date(),
+      });
+
+    it('should read a score from an earlier week as zero', () => {
+      const ranking = fromLastWeek();
+
+      expect(ranking.weeklyScore).toBe(0);
+      expect(ranking.weeklyRank).toBeNull();
+      expect(ranking.globalScore).toBe(500);
+    });
+
+    it('should start the current week on the first score', () => {
+      const ranking = fromLastWeek();
+
+      ranking.addScore(40);
+
+      expect(ranking.weeklyScore).toBe(40);
+      expect(ranking.weeklyEpoch).toBe(weekEpoch());
+      expect(ranking.globalScore).toBe(540);
+      expect(ranking.scoreChange).toMatchObject({ weeklyFrom: 0, weeklyTo: 40 });
+    });
+  });
+
   describe('updateRank', () => {
     it('should update both ranks', () => {
       const ranking = PlayerRanking.create(rankingId, userId);
@@ -79,4 +114,57 @@ describe('PlayerRanking Aggregate', () => {
       expect(ranking.weeklyRank).toBeNull();
     });
   });
+
+  describe('scoreChange', () => {
+    const persisted = () =>
+      PlayerRanking.fromPersistence({
+        id: rankingId,
+        userId,
+        globalScore: 500,
+        weeklyScore: 120,
+        weeklyEpoch: weekEpoch(),
+        globalRank: 3,
+        weeklyRank: 7,
+        createdAt: new Date(),
+        updatedAt: new Date(),
+      });
+
+    it('should be null for an unchanged ranking', () => {
+      expect(persisted().scoreChange).toBeNull();
+    });
+
+    it('should span all score changes since load', () => {
+      const ranking = persisted();
+
+      ranking.addScore(100);
+      ranking.addScore(30);
+
+      expect(ranking.scoreChange).toEqual({
+        globalFrom: 500,
+        globalTo: 630,
+        weeklyFrom: 120,
+        weeklyTo: 250,
+      });
+    });
+
+    it('should start from zero for a new ranking', () => {
+      const ranking = PlayerRanking.create(rankingId, userId);
+
+      expect(ranking.scoreChange).toEqual({
+        globalFrom: 0,
+        globalTo: 0,
+        weeklyFrom: 0,
+        weeklyTo: 0,
+      });
+    });
+
+    it('should be cleared once persisted', () => {
+      const ranking = persisted();
+      ranking.addScore(10);
+
+      ranking.clearScoreChange();
+
+      expect(ranking.scoreChange).toBeNull();
+    });
+  });
 });
@@ -1,17 +1,31 @@
 import { AggregateRoot } from '@shared/domain/base/aggregate-root.base';
+import { weekEpoch } from '../services/week-epoch';
 
 export interface PlayerRankingProps {
   id: string;
   userId: string;
   globalScore: number;
   weeklyScore: number;
+  weeklyEpoch: number;
   globalRank: number | null;
   weeklyRank: number | null;
   createdAt: Date;
   updatedAt: Date;
 }
 
+/**
+ * Scores before and after the changes made since the aggregate was loaded
+ */
+export interface ScoreChange {
+  globalFrom: number;
+  globalTo: number;
+  weeklyFrom: number;
+  weeklyTo: number;
+}
+
 export class PlayerRanking extends AggregateRoot<string> {
+  private scoresBefore: { global: number; weekly: number } | null = null;
+
   private constructor(private props: PlayerRankingProps) {
     super(props.id);
   }
@@ -24,8 +38,15 @@ export class PlayerRanking extends AggregateRoot<string> {
     return this.props.globalScore;
   }
 
+  /**
+   * Score for the current week; a score from an earlier week counts as 0
+   */
   get weeklyScore(): number {
-    return this.props.weeklyScore;
+    return this.isCurrentWeek() ? this.props.weeklyScore : 0;
+  }
+
+  get weeklyEpoch(): number {
+    return this.props.weeklyEpoch;
   }
 
   get globalRank(): number | null {
@@ -33,30 +54,58 @@ export class PlayerRanking extends AggregateRoot<string> {
   }
 
   get weeklyRank(): number | null {
-    return this.props.weeklyRank;
+    return this.isCurrentWeek() ? this.props.weeklyRank : null;
+  }
+
+  /**
+   * Score change to feed the rank recalculator, or null if scores are unchanged
+   */
+  get scoreChange(): ScoreChange | null {
+    if (!this.scoresBefore) {
+      return null;
+    }
+
+    return {
+      globalFrom: this.scoresBefore.global,
+      globalTo: this.props.globalScore,
+      weeklyFrom: this.scoresBefore.weekly,
+      weeklyTo: this.props.weeklyScore,
+    };
+  }
+
+  clearScoreChange(): void {
+    this.scoresBefore = null;
   }
 
   static create(id: string, userId: string): PlayerRanking {
-    return new PlayerRanking({
+    // A new player enters the board at 0, shifting everyone below
+    const ranking = new PlayerRanking({
       id,
       userId,
       globalScore: 0,
       weeklyScore: 0,
+      weeklyEpoch: weekEpoch(),
       globalRank: null,
       weeklyRank: null,
       createdAt: new Date(),
       updatedAt: new Date(),
     });
+    ranking.scoresBefore = { global: 0, weekly: 0 };
+    return ranking;
   }
 
   addScore(points: number): void {
+    this.trackScores();
+    this.startCurrentWeek();
     this.props.globalScore += points;
     this.props.weeklyScore += points;
     this.props.updatedAt = new Date();
   }
 
   resetWeeklyScore(): void {
+    this.trackScores();
     this.props.weeklyScore = 0;
+    this.props.weeklyEpoch = weekEpoch();
     this.props.updatedAt = new Date();
   }
 
@@ -66,6 +115,22 @@ export class PlayerRanking extends AggregateRoot<string> {
     this.props.updatedAt = new Date();
   }
 
+  private trackScores(): void {
+    this.scoresBefore ??= { global: this.props.globalScore, weekly: this.weeklyScore };
+  }
+
+  private isCurrentWeek(): boolean {
+    return this.props.weeklyEpoch === weekEpoch();
+  }
+
+  private startCurrentWeek(): void {
+    if (!this.isCurrentWeek()) {
+      this.props.weeklyScore = 0;
+      this.props.weeklyRank = null;
+      this.props.weeklyEpoch = weekEpoch();
+    }
+  }
+
   static fromPersistence(props: PlayerRankingProps): PlayerRanking {
     return new PlayerRanking(props);
   }
@@ -1,9 +1,18 @@
 import { PlayerRanking } from '../aggregates/player-ranking.aggregate';
+import { LeaderboardType, PlayerScore, RankedPlayer } from '../services/ranking-engine.interface';
 
 export interface IPlayerRankingRepository {
   save(ranking: PlayerRanking): Promise<void>;
   findByUserId(userId: string): Promise<PlayerRanking | null>;
   getOrCreate(userId: string): Promise<PlayerRanking>;
+  /**
+   * Add points to the global and weekly scores of many players at once,
+   * creating missing rankings
+   */
+  addScores(scores: PlayerScore[]): Promise<void>;
   getTopGlobal(limit: number): Promise<PlayerRanking[]>;
   getTopWeekly(limit: number): Promise<PlayerRanking[]>;
+  getTopRanked(type: LeaderboardType, limit: number): Promise<RankedPlayer[]>;
+  getPlayerRank(type: LeaderboardType, userId: string): Promise<RankedPlayer | null>;
+  getPlayersAround(type: LeaderboardType, userId: string, radius: number): Promise<RankedPlayer[]>;
 }
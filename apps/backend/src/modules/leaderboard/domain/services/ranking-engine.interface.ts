@@ -0,0 +1,28 @@
+export type LeaderboardType = 'global' | 'weekly';
+
+export interface RankedPlayer {
+  userId: string;
+  score: number;
+  rank: number;
+}
+
+export interface PlayerScore {
+  userId: string;
+  score: number;
+}
+
+/**
+ * Ranking Engine Interface
+ *
+ * Ordered score index per leaderboard. Ranks are 1-based positions ordered
+ * by score descending. Implementations must answer rank lookups in O(log n).
+ */
+export interface IRankingEngine {
+  setScore(board: LeaderboardType, userId: string, score: number): Promise<void>;
+  load(board: LeaderboardType, scores: PlayerScore[]): Promise<void>;
+  clear(board: LeaderboardType): Promise<void>;
+  size(board: LeaderboardType): Promise<number>;
+  getTop(board: LeaderboardType, limit: number): Promise<RankedPlayer[]>;
+  getRank(board: LeaderboardType, userId: string): Promise<RankedPlayer | null>;
+  getAround(board: LeaderboardType, userId: string, radius: number): Promise<RankedPlayer[]>;
+}
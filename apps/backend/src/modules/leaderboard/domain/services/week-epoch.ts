@@ -0,0 +1,19 @@
+export const WEEK_MS = 7 * 24 * 60 * 60 * 1000;
+
+// 1970-01-05T00:00:00Z, the first Monday of the Unix epoch
+const FIRST_MONDAY_MS = 4 * 24 * 60 * 60 * 1000;
+
+/**
+ * Week Epoch
+ *
+ * Weekly leaderboard weeks run Monday 00:00 UTC to the next Monday. A
+ * weekly score only counts when its epoch is the current one, so the
+ * weekly reset is the clock moving into the next epoch: nothing is written.
+ */
+export function weekEpoch(now: Date = new Date()): number {
+  return Math.floor((now.getTime() - FIRST_MONDAY_MS) / WEEK_MS);
+}
+
+export function weekStart(epoch: number): Date {
+  return new Date(FIRST_MONDAY_MS + epoch * WEEK_MS);
+}
@@ -0,0 +1,67 @@
+import { RankRecalculator } from '../rank-recalculator.service';
+import { PrismaService } from '@shared/infrastructure/database/prisma.service';
+import { MetricsService } from '@shared/infrastructure/metrics/metrics.service';
+
+describe('RankRecalculator', () => {
+  let prisma: any;
+  let metrics: MetricsService;
+  let recalculator: RankRecalculator;
+
+  const bounds = (changes: number) => ({
+    changes,
+    globalLow: changes ? 100 : null,
+    globalHigh: changes ? 250 : null,
+    weeklyLow: changes ? 0 : null,
+    weeklyHigh: changes ? 150 : null,
+  });
+
+  beforeEach(() => {
+    prisma = {
+      $queryRaw: jest.fn(),
+      $executeRaw: jest.fn(),
+      runInTransaction: (work: () => Promise<unknown>) => work(),
+    };
+    prisma.client = prisma;
+    metrics = new MetricsService();
+    recalculator = new RankRecalculator(prisma as PrismaService, metrics);
+  });
+
+  it('should skip the run when another node holds the lock', async () => {
+    prisma.$queryRaw.mockResolvedValueOnce([{ locked: false }]);
+
+    await expect(recalculator.run()).resolves.toBeNull();
+    expect(prisma.$queryRaw).toHaveBeenCalledTimes(1);
+    expect(prisma.$executeRaw).not.toHaveBeenCalled();
+  });
+
+  it('should not re-rank when no scores changed', async () => {
+    prisma.$queryRaw.mockResolvedValueOnce([{ locked: true }]).mockResolvedValueOnce([bounds(0)]);
+
+    const report = await recalculator.run();
+
+    expect(report).toMatchObject({ changes: 0, globalRowsWritten: 0, weeklyRowsWritten: 0 });
+    expect(prisma.$executeRaw).not.toHaveBeenCalled();
+  });
+
+  it('should re-rank the changed range of each board and report rows written', async () => {
+    prisma.$queryRaw.mockResolvedValueOnce([{ locked: true }]).mockResolvedValueOnce([bounds(3)]);
+    prisma.$executeRaw.mockResolvedValueOnce(4).mockResolvedValueOnce(2);
+
+    const report = await recalculator.run();
+
+    expect(report).toMatchObject({ changes: 3, globalRowsWritten: 4, weeklyRowsWritten: 2 });
+    expect(prisma.$executeRaw.mock.calls[0].slice(1)).toEqual(expect.arrayContaining([100, 250]));
+    expect(prisma.$executeRaw.mock.calls[1].slice(1)).toEqual(expect.arrayContaining([0, 150]));
+    expect(metrics.snapshot().counters['leaderboard.rank_rows_written']).toBe(6);
+  });
+
+  it('should share an in-flight run instead of starting a second one', async () => {
+    prisma.$queryRaw.mockResolvedValue([{ locked: false }]);
+
+    const [first, second] = [recalculator.run(), recalculator.run()];
+
+    expect(first).toBe(second);
+    await first;
+    expect(prisma.$queryRaw).toHaveBeenCalledTimes(1);
+  });
+});
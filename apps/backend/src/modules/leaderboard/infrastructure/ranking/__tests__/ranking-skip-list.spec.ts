@@ -0,0 +1,75 @@
+import { RankingSkipList } from '../ranking-skip-list';
+
+describe('RankingSkipList', () => {
+  const sortedReference = (scores: Map<string, number>) =>
+    [...scores.entries()]
+      .sort(([idA, a], [idB, b]) => b - a || (idA < idB ? -1 : idA > idB ? 1 : 0))
+      .map(([userId, score], index) => ({ userId, score, rank: index + 1 }));
+
+  it('should order players by score descending', () => {
+    const list = new RankingSkipList();
+
+    list.set('alice', 100);
+    list.set('bob', 300);
+    list.set('carol', 200);
+
+    expect(list.range(1, 10).map((p) => p.userId)).toEqual(['bob', 'carol', 'alice']);
+    expect(list.rankOf('alice')).toBe(3);
+    expect(list.rankOf('bob')).toBe(1);
+  });
+
+  it('should break ties by userId', () => {
+    const list = new RankingSkipList();
+
+    list.set('bob', 100);
+    list.set('alice', 100);
+
+    expect(list.rankOf('alice')).toBe(1);
+    expect(list.rankOf('bob')).toBe(2);
+  });
+
+  it('should move a player when their score changes', () => {
+    const list = new RankingSkipList();
+
+    list.set('alice', 100);
+    list.set('bob', 200);
+    list.set('alice', 500);
+
+    expect(list.size).toBe(2);
+    expect(list.rankOf('alice')).toBe(1);
+    expect(list.scoreOf('alice')).toBe(500);
+  });
+
+  it('should return null for unknown players', () => {
+    const list = new RankingSkipList();
+
+    expect(list.rankOf('nobody')).toBeNull();
+    expect(list.range(1, 5)).toEqual([]);
+  });
+
+  it('should match a sorted reference after random updates', () => {
+    const list = new RankingSkipList();
+    const reference = new Map<string, number>();
+
+    for (let i = 0; i < 2000; i++) {
+      const userId = `user-${Math.floor(Math.random() * 300)}`;
+      if (Math.random() < 0.1) {
+        list.remove(userId);
+        reference.delete(userId);
+      } else {
+        const score = Math.floor(Math.random() * 1000);
+        list.set(userId, score);
+        reference.set(userId, score);
+      }
+    }
+
+    const expected = sortedReference(reference);
+
+    expect(list.size).toBe(expected.length);
+    expect(list.range(1, expected.length)).toEqual(expected);
+    for (const entry of expected) {
+      expect(list.rankOf(entry.userId)).toBe(entry.rank);
+    }
+    expect(list.range(11, 5)).toEqual(expected.slice(10, 15));
+  });
+});
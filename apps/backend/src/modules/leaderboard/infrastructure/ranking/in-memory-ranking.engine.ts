@@ -0,0 +1,81 @@
+import { Injectable } from '@nestjs/common';
+import {
+  IRankingEngine,
+  LeaderboardType,
+  PlayerScore,
+  RankedPlayer,
+} from '../../domain/services/ranking-engine.interface';
+import { weekEpoch } from '../../domain/services/week-epoch';
+import { RankingSkipList } from './ranking-skip-list';
+
+/**
+ * In-Memory Ranking Engine
+ *
+ * One RankingSkipList per leaderboard, held in the API process. Suitable
+ * for a single node; use the Redis engine when rankings must be shared.
+ * The weekly list is replaced by an empty one when a new week epoch starts.
+ */
+@Injectable()
+export class InMemoryRankingEngine implements IRankingEngine {
+  private readonly boards: Record<LeaderboardType, RankingSkipList> = {
+    global: new RankingSkipList(),
+    weekly: new RankingSkipList(),
+  };
+  private weeklyEpoch = weekEpoch();
+
+  async setScore(board: LeaderboardType, userId: string, score: number): Promise<void> {
+    this.board(board).set(userId, score);
+  }
+
+  async load(board: LeaderboardType, scores: PlayerScore[]): Promise<void> {
+    const list = this.board(board);
+    for (const { userId, score } of scores) {
+      list.set(userId, score);
+    }
+  }
+
+  async clear(board: LeaderboardType): Promise<void> {
+    this.board(board).clear();
+  }
+
+  async size(board: LeaderboardType): Promise<number> {
+    return this.board(board).size;
+  }
+
+  async getTop(board: LeaderboardType, limit: number): Promise<RankedPlayer[]> {
+    return this.board(board).range(1, limit);
+  }
+
+  async getRank(board: LeaderboardType, userId: string): Promise<RankedPlayer | null> {
+    const list = this.board(board);
+    const rank = list.rankOf(userId);
+    if (rank === null) {
+      return null;
+    }
+
+    return { userId, score: list.scoreOf(userId)!, rank };
+  }
+
+  async getAround(
+    board: LeaderboardType,
+    userId: string,
+    radius: number,
+  ): Promise<RankedPlayer[]> {
+    const list = this.board(board);
+    const rank = list.rankOf(userId);
+    if (rank === null) {
+      return [];
+    }
+
+    const start = Math.max(1, rank - radius);
+    return list.range(start, rank - start + radius + 1);
+  }
+
+  private board(type: LeaderboardType): RankingSkipList {
+    if (type === 'weekly' && this.weeklyEpoch !== weekEpoch()) {
+      this.boards.weekly = new RankingSkipList();
+      this.weeklyEpoch = weekEpoch();
+    }
+    return this.boards[type];
+  }
+}
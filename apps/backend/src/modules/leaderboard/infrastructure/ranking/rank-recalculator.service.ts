@@ -0,0 +1,168 @@
+import { Injectable, Logger, OnApplicationBootstrap, OnModuleDestroy } from '@nestjs/common';
+import { Prisma } from '@generated/prisma/client';
+import { PrismaService } from '@shared/infrastructure/database/prisma.service';
+import { MetricsService } from '@shared/infrastructure/metrics/metrics.service';
+import { LeaderboardType } from '../../domain/services/ranking-engine.interface';
+import { weekEpoch } from '../../domain/services/week-epoch';
+
+interface ChangeBounds {
+  changes: number;
+  globalLow: number | null;
+  globalHigh: number | null;
+  weeklyLow: number | null;
+  weeklyHigh: number | null;
+}
+
+export interface RankRecalculationReport {
+  changes: number;
+  globalRowsWritten: number;
+  weeklyRowsWritten: number;
+  durationMs: number;
+}
+
+/**
+ * Rank Recalculator
+ *
+ * Keeps player_rankings.globalRank/weeklyRank up to date incrementally.
+ * When a score moves from `from` to `to`, only players whose score lies
+ * between the two can change position, so each run consumes the
+ * ranking_changes log, takes the score range it spans per board, and
+ * re-ranks that range with ROW_NUMBER() offset by the number of players
+ * above it. Only rows whose rank actually changed are written. The weekly
+ * board only ranks rows of the current week epoch.
+ *
+ * Runs every LEADERBOARD_RANK_INTERVAL_MS (0 disables it); a transaction
+ * advisory lock makes sure a single node works at a time.
+ */
+@Injectable()
+export class RankRecalculator implements OnApplicationBootstrap, OnModuleDestroy {
+  private static readonly LOCK_KEY = 'leaderboard.rank_recalculation';
+  private static readonly COLUMNS: Record<LeaderboardType, { score: Prisma.Sql; rank: Prisma.Sql }> = {
+    global: { score: Prisma.raw('"globalScore"'), rank: Prisma.raw('"globalRank"') },
+    weekly: { score: Prisma.raw('"weeklyScore"'), rank: Prisma.raw('"weeklyRank"') },
+  };
+
+  private readonly logger = new Logger(RankRecalculator.name);
+  private readonly intervalMs = parseInt(process.env.LEADERBOARD_RANK_INTERVAL_MS || '5000', 10);
+  private timer?: NodeJS.Timeout;
+  private running: Promise<RankRecalculationReport | null> | null = null;
+
+  constructor(
+    private readonly prisma: PrismaService,
+    private readonly metrics: MetricsService,
+  ) {}
+
+  onApplicationBootstrap(): void {
+    if (this.intervalMs <= 0) {
+      return;
+    }
+
+    this.timer = setInterval(() => void this.run(), this.intervalMs);
+    this.timer.unref();
+  }
+
+  async onModuleDestroy(): Promise<void> {
+    clearInterval(this.timer);
+    await this.running;
+  }
+
+  /**
+   * Apply pending score changes to the persisted ranks. Resolves to null
+   * when another node holds the lock or the run failed.
+   */
+  run(): Promise<RankRecalculationReport | null> {
+    this.running ??= this.recalculate().finally(() => {
+      this.running = null;
+    });
+    return this.running;
+  }
+
+  private async recalculate(): Promise<RankRecalculationReport | null> {
+    const startedAt = performance.now();
+
+    try {
+      const report = await this.prisma.runInTransaction(async () => {
+        const [{ locked }] = await this.prisma.client.$queryRaw<{ locked: boolean }[]>`
+          SELECT pg_try_advisory_xact_lock(hashtext(${RankRecalculator.LOCK_KEY})) AS locked
+        `;
+        if (!locked) {
+          return null;
+        }
+
+        // Rows logged by transactions that have not committed yet stay for the next run
+        const [bounds] = await this.prisma.client.$queryRaw<ChangeBounds[]>`
+          WITH taken AS (DELETE FROM ranking_changes RETURNING *)
+          SELECT
+            COUNT(*)::int AS changes,
+            MIN(LEAST("globalFrom", "globalTo")) AS "globalLow",
+            MAX(GREATEST("globalFrom", "globalTo")) AS "globalHigh",
+            MIN(LEAST("weeklyFrom", "weeklyTo")) AS "weeklyLow",
+            MAX(GREATEST("weeklyFrom", "weeklyTo")) AS "weeklyHigh"
+          FROM taken
+        `;
+
+        if (bounds.changes === 0) {
+          return { changes: 0, globalRowsWritten: 0, weeklyRowsWritten: 0, durationMs: 0 };
+        }
+
+        return {
+          changes: bounds.changes,
+          globalRowsWritten: await this.rerank('global', bounds.globalLow!, bounds.globalHigh!),
+          weeklyRowsWritten: await this.rerank('weekly', bounds.weeklyLow!, bounds.weeklyHigh!),
+          durationMs: 0,
+        };
+      });
+
+      if (!report) {
+        return null;
+      }
+
+      report.durationMs = Math.round(performance.now() - startedAt);
+      this.report(report);
+      return report;
+    } catch (error) {
+      this.metrics.increment('leaderboard.rank_recalc_failures');
+      this.logger.error('Rank recalculation failed', error);
+      return null;
+    }
+  }
+
+  /**
+   * Re-rank every player whose score is within [low, high]
+   */
+  private rerank(board: LeaderboardType, low: number, high: number): Promise<number> {
+    const { score, rank } = RankRecalculator.COLUMNS[board];
+    const scope =
+      board === 'weekly' ? Prisma.sql`"weeklyEpoch" = ${weekEpoch()}` : Prisma.sql`TRUE`;
+
+    return this.prisma.client.$executeRaw`
+      UPDATE player_rankings AS p
+      SET ${rank} = r.rank
+      FROM (
+        SELECT
+          id,
+          (SELECT COUNT(*) FROM player_rankings WHERE ${scope} AND ${score} > ${high})
+            + ROW_NUMBER() OVER (ORDER BY ${score} DESC, "userId" ASC) AS rank
+        FROM player_rankings
+        WHERE ${scope} AND ${score} BETWEEN ${low} AND ${high}
+      ) AS r
+      WHERE p.id = r.id
+        AND p.${rank} IS DISTINCT FROM r.rank
+    `;
+  }
+
+  private report(report: RankRecalculationReport): void {
+    const written = report.globalRowsWritten + report.weeklyRowsWritten;
+
+    this.metrics.observe('leaderboard.rank_recalc_ms', report.durationMs);
+    this.metrics.increment('leaderboard.rank_changes_applied', report.changes);
+    this.metrics.increment('leaderboard.rank_rows_written', written);
+
+    if (report.changes > 0) {
+      this.logger.log(
+        `Applied ${report.changes} score changes in ${report.durationMs}ms ` +
+          `(rows written: global ${report.globalRowsWritten}, weekly ${report.weeklyRowsWritten})`,
+      );
+    }
+  }
+}
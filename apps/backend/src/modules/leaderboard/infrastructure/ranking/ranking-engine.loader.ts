@@ -0,0 +1,81 @@
+import { Inject, Injectable, Logger, OnApplicationBootstrap } from '@nestjs/common';
+import { PrismaService } from '@shared/infrastructure/database/prisma.service';
+import { IRankingEngine } from '../../domain/services/ranking-engine.interface';
+import { weekEpoch } from '../../domain/services/week-epoch';
+
+/**
+ * Ranking Engine Loader
+ *
+ * Rebuilds the ranking engine from player_rankings at startup. Postgres
+ * remains the durable store; the engine is only an index over it. A shared
+ * (Redis) engine that is already populated is left as is; only empty
+ * boards are loaded, e.g. the weekly board early in a new week.
+ */
+@Injectable()
+export class RankingEngineLoader implements OnApplicationBootstrap {
+  private static readonly PAGE_SIZE = 5000;
+
+  private readonly logger = new Logger(RankingEngineLoader.name);
+
+  constructor(
+    private readonly prisma: PrismaService,
+    @Inject('IRankingEngine')
+    private readonly rankingEngine: IRankingEngine,
+  ) {}
+
+  async onApplicationBootstrap(): Promise<void> {
+    const [globalSize, weeklySize] = await Promise.all([
+      this.rankingEngine.size('global'),
+      this.rankingEngine.size('weekly'),
+    ]);
+
+    if (globalSize > 0 && weeklySize > 0) {
+      this.logger.log(`Ranking engine already holds ${globalSize} players, skipping rebuild`);
+      return;
+    }
+
+    const startedAt = Date.now();
+    const epoch = weekEpoch();
+    let loaded = 0;
+    let cursor: string | undefined;
+
+    // Keyset pagination over the unique userId index
+    for (;;) {
+      const page = await this.prisma.playerRanking.findMany({
+        select: { userId: true, globalScore: true, weeklyScore: true, weeklyEpoch: true },
+        orderBy: { userId: 'asc' },
+        take: RankingEngineLoader.PAGE_SIZE,
+        ...(cursor ? { cursor: { userId: cursor }, skip: 1 } : {}),
+      });
+
+      if (page.length === 0) {
+        break;
+      }
+
+      if (globalSize === 0) {
+        await this.rankingEngine.load(
+          'global',
+          page.map((r) => ({ userId: r.userId, score: r.globalScore })),
+        );
+      }
+      if (weeklySize === 0) {
+        // Only scores of the current week are on the weekly board
+        await this.rankingEngine.load(
+          'weekly',
+          page
+            .filter((r) => r.weeklyEpoch === epoch)
+            .map((r) => ({ userId: r.userId, score: r.weeklyScore })),
+        );
+      }
+
+      loaded += page.length;
+      cursor = page[page.length - 1].userId;
+
+      if (page.length < RankingEngineLoader.PAGE_SIZE) {
+        break;
+      }
+    }
+
+    this.logger.log(`Ranking engine rebuilt with ${loaded} players in ${Date.now() - startedAt}ms`);
+  }
+}
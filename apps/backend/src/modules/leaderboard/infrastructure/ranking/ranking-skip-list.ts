@@ -0,0 +1,237 @@
+import { RankedPlayer } from '../../domain/services/ranking-engine.interface';
+
+class SkipListNode {
+  readonly next: (SkipListNode | null)[];
+  readonly span: number[];
+
+  constructor(
+    readonly userId: string,
+    readonly score: number,
+    level: number,
+  ) {
+    this.next = new Array(level).fill(null);
+    this.span = new Array(level).fill(0);
+  }
+}
+
+/**
+ * Ranking Skip List
+ *
+ * Indexable skip list ordered by score descending, then userId ascending.
+ * Each forward pointer stores the number of nodes it skips (its span), so
+ * rank-of and node-at-rank are O(log n) like a Redis sorted set.
+ */
+export class RankingSkipList {
+  private static readonly MAX_LEVEL = 32;
+  private static readonly LEVEL_PROBABILITY = 0.25;
+
+  private readonly head = new SkipListNode('', Number.POSITIVE_INFINITY, RankingSkipList.MAX_LEVEL);
+  private readonly scores = new Map<string, number>();
+  private level = 1;
+  private length = 0;
+
+  get size(): number {
+    return this.length;
+  }
+
+  scoreOf(userId: string): number | undefined {
+    return this.scores.get(userId);
+  }
+
+  set(userId: string, score: number): void {
+    const current = this.scores.get(userId);
+    if (current === score) {
+      return;
+    }
+
+    if (current !== undefined) {
+      this.delete(userId, current);
+    }
+
+    this.insert(userId, score);
+    this.scores.set(userId, score);
+  }
+
+  remove(userId: string): boolean {
+    const current = this.scores.get(userId);
+    if (current === undefined) {
+      return false;
+    }
+
+    this.delete(userId, current);
+    this.scores.delete(userId);
+    return true;
+  }
+
+  clear(): void {
+    for (let i = 0; i < RankingSkipList.MAX_LEVEL; i++) {
+      this.head.next[i] = null;
+      this.head.span[i] = 0;
+    }
+    this.scores.clear();
+    this.level = 1;
+    this.length = 0;
+  }
+
+  /**
+   * 1-based rank of a player, or null if absent
+   */
+  rankOf(userId: string): number | null {
+    const score = this.scores.get(userId);
+    if (score === undefined) {
+      return null;
+    }
+
+    let rank = 0;
+    let x = this.head;
+
+    for (let i = this.level - 1; i >= 0; i--) {
+      let next = x.next[i];
+      while (next && (this.precedes(next, score, userId) || next.userId === userId)) {
+        rank += x.span[i];
+        x = next;
+        next = x.next[i];
+      }
+
+      if (x.userId === userId) {
+        return rank;
+      }
+    }
+
+    return null;
+  }
+
+  /**
+   * Up to `count` players starting at the given 1-based rank
+   */
+  range(startRank: number, count: number): RankedPlayer[] {
+    const result: RankedPlayer[] = [];
+    let node = this.nodeAt(Math.max(1, startRank));
+    let rank = Math.max(1, startRank);
+
+    while (node && result.length < count) {
+      result.push({ userId: node.userId, score: node.score, rank });
+      node = node.next[0];
+      rank += 1;
+    }
+
+    return result;
+  }
+
+  private nodeAt(rank: number): SkipListNode | null {
+    if (rank > this.length) {
+      return null;
+    }
+
+    let traversed = 0;
+    let x = this.head;
+
+    for (let i = this.level - 1; i >= 0; i--) {
+      let next = x.next[i];
+      while (next && traversed + x.span[i] <= rank) {
+        traversed += x.span[i];
+        x = next;
+        next = x.next[i];
+      }
+
+      if (traversed === rank) {
+        return x;
+      }
+    }
+
+    return null;
+  }
+
+  private insert(userId: string, score: number): void {
+    const update: SkipListNode[] = new Array(RankingSkipList.MAX_LEVEL);
+    const rank: number[] = new Array(RankingSkipList.MAX_LEVEL).fill(0);
+    let x = this.head;
+
+    for (let i = this.level - 1; i >= 0; i--) {
+      rank[i] = i === this.level - 1 ? 0 : rank[i + 1];
+      let next = x.next[i];
+      while (next && this.precedes(next, score, userId)) {
+        rank[i] += x.span[i];
+        x = next;
+        next = x.next[i];
+      }
+      update[i] = x;
+    }
+
+    const level = this.randomLevel();
+    if (level > this.level) {
+      for (let i = this.level; i < level; i++) {
+        rank[i] = 0;
+        update[i] = this.head;
+        this.head.span[i] = this.length;
+      }
+      this.level = level;
+    }
+
+    const node = new SkipListNode(userId, score, level);
+    for (let i = 0; i < level; i++) {
+      node.next[i] = update[i].next[i];
+      update[i].next[i] = node;
+      node.span[i] = update[i].span[i] - (rank[0] - rank[i]);
+      update[i].span[i] = rank[0] - rank[i] + 1;
+    }
+
+    for (let i = level; i < this.level; i++) {
+      update[i].span[i] += 1;
+    }
+
+    this.length += 1;
+  }
+
+  private delete(userId: string, score: number): void {
+    const update: SkipListNode[] = new Array(RankingSkipList.MAX_LEVEL);
+    let x = this.head;
+
+    for (let i = this.level - 1; i >= 0; i--) {
+      let next = x.next[i];
+      while (next && this.precedes(next, score, userId)) {
+        x = next;
+        next = x.next[i];
+      }
+      update[i] = x;
+    }
+
+    const target = x.next[0];
+    if (!target || target.userId !== userId) {
+      return;
+    }
+
+    for (let i = 0; i < this.level; i++) {
+      if (update[i].next[i] === target) {
+        update[i].span[i] += target.span[i] - 1;
+        update[i].next[i] = target.next[i];
+      } else {
+        update[i].span[i] -= 1;
+      }
+    }
+
+    while (this.level > 1 && this.head.next[this.level - 1] === null) {
+      this.level -= 1;
+    }
+
+    this.length -= 1;
+  }
+
+  /**
+   * Whether `node` sorts strictly before (score, userId)
+   */
+  private precedes(node: SkipListNode, score: number, userId: string): boolean {
+    return node.score > score || (node.score === score && node.userId < userId);
+  }
+
+  private randomLevel(): number {
+    let level = 1;
+    while (
+      level < RankingSkipList.MAX_LEVEL &&
+      Math.random() < RankingSkipList.LEVEL_PROBABILITY
+    ) {
+      level += 1;
+    }
+    return level;
+  }
+}
@@ -0,0 +1,168 @@
+import { Logger, OnModuleDestroy } from '@nestjs/common';
+import {
+  IRankingEngine,
+  LeaderboardType,
+  PlayerScore,
+  RankedPlayer,
+} from '../../domain/services/ranking-engine.interface';
+import { weekEpoch, weekStart } from '../../domain/services/week-epoch';
+
+export interface RedisRankingOptions {
+  host: string;
+  port: number;
+  password?: string;
+  keyPrefix?: string;
+}
+
+/**
+ * Subset of the ioredis client used by the engine
+ */
+interface RedisClient {
+  zadd(key: string, ...args: (string | number)[]): Promise<number>;
+  zrevrange(key: string, start: number, stop: number, withScores: 'WITHSCORES'): Promise<string[]>;
+  zrevrank(key: string, member: string): Promise<number | null>;
+  zscore(key: string, member: string): Promise<string | null>;
+  zcard(key: string): Promise<number>;
+  del(key: string): Promise<number>;
+  expireat(key: string, unixSeconds: number): Promise<number>;
+  quit(): Promise<string>;
+}
+
+/**
+ * Redis Ranking Engine
+ *
+ * Stores each leaderboard as a Redis sorted set so several API nodes share
+ * the same rankings. ZREVRANK/ZREVRANGE are O(log n) (+k for ranges).
+ * The weekly board uses one key per week epoch, so a new week starts on an
+ * empty set; each weekly key expires one week after its week ends.
+ *
+ * `ioredis` is loaded lazily, so it only needs to be installed when
+ * LEADERBOARD_ENGINE=redis.
+ */
+export class RedisRankingEngine implements IRankingEngine, OnModuleDestroy {
+  private static readonly LOAD_CHUNK_SIZE = 1000;
+
+  private readonly logger = new Logger(RedisRankingEngine.name);
+  private readonly client: RedisClient;
+  private readonly keyPrefix: string;
+  private expiringEpoch?: number;
+
+  constructor(options: RedisRankingOptions) {
+    let Redis: new (options: object) => RedisClient;
+    try {
+      // eslint-disable-next-line @typescript-eslint/no-require-imports
+      Redis = require('ioredis');
+    } catch {
+      throw new Error('LEADERBOARD_ENGINE=redis requires the "ioredis" package to be installed');
+    }
+
+    this.client = new Redis({
+      host: options.host,
+      port: options.port,
+      password: options.password || undefined,
+    });
+    this.keyPrefix = options.keyPrefix ?? 'leaderboard:';
+    this.logger.log(`Using Redis ranking engine at ${options.host}:${options.port}`);
+  }
+
+  async onModuleDestroy(): Promise<void> {
+    await this.client.quit();
+  }
+
+  async setScore(board: LeaderboardType, userId: string, score: number): Promise<void> {
+    await this.client.zadd(this.key(board), score, userId);
+    await this.scheduleExpiry(board);
+  }
+
+  async load(board: LeaderboardType, scores: PlayerScore[]): Promise<void> {
+    for (let i = 0; i < scores.length; i += RedisRankingEngine.LOAD_CHUNK_SIZE) {
+      const args = scores
+        .slice(i, i + RedisRankingEngine.LOAD_CHUNK_SIZE)
+        .flatMap(({ userId, score }) => [score, userId]);
+      if (args.length > 0) {
+        await this.client.zadd(this.key(board), ...args);
+      }
+    }
+    await this.scheduleExpiry(board);
+  }
+
+  async clear(board: LeaderboardType): Promise<void> {
+    await this.client.del(this.key(board));
+  }
+
+  async size(board: LeaderboardType): Promise<number> {
+    return this.client.zcard(this.key(board));
+  }
+
+  async getTop(board: LeaderboardType, limit: number): Promise<RankedPlayer[]> {
+    if (limit <= 0) {
+      return [];
+    }
+    return this.range(board, 0, limit - 1);
+  }
+
+  async getRank(board: LeaderboardType, userId: string): Promise<RankedPlayer | null> {
+    const [index, score] = await Promise.all([
+      this.client.zrevrank(this.key(board), userId),
+      this.client.zscore(this.key(board), userId),
+    ]);
+
+    if (index === null || score === null) {
+      return null;
+    }
+
+    return { userId, score: Number(score), rank: index + 1 };
+  }
+
+  async getAround(
+    board: LeaderboardType,
+    userId: string,
+    radius: number,
+  ): Promise<RankedPlayer[]> {
+    const index = await this.client.zrevrank(this.key(board), userId);
+    if (index === null) {
+      return [];
+    }
+
+    return this.range(board, Math.max(0, index - radius), index + radius);
+  }
+
+  private async range(board: LeaderboardType, start: number, stop: number): Promise<RankedPlayer[]> {
+    const reply = await this.client.zrevrange(this.key(board), start, stop, 'WITHSCORES');
+    const players: RankedPlayer[] = [];
+
+    for (let i = 0; i < reply.length; i += 2) {
+      players.push({
+        userId: reply[i],
+        score: Number(reply[i + 1]),
+        rank: start + i / 2 + 1,
+      });
+    }
+
+    return players;
+  }
+
+  private key(board: LeaderboardType): string {
+    return board === 'weekly'
+      ? `${this.keyPrefix}weekly:${weekEpoch()}`
+      : `${this.keyPrefix}${board}`;
+  }
+
+  /**
+   * Set the expiry of the current weekly key once per week and process
+   */
+  private async scheduleExpiry(board: LeaderboardType): Promise<void> {
+    const epoch = weekEpoch();
+    if (board !== 'weekly' || this.expiringEpoch === epoch) {
+      return;
+    }
+
+    const set = await this.client.expireat(
+      `${this.keyPrefix}weekly:${epoch}`,
+      Math.floor(weekStart(epoch + 2).getTime() / 1000),
+    );
+    if (set) {
+      this.expiringEpoch = epoch;
+    }
+  }
+}
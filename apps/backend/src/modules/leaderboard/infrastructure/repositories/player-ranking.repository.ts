@@ -1,36 +1,132 @@
-import { Injectable } from '@nestjs/common';
+import { Inject, Injectable, Logger } from '@nestjs/common';
+import { Prisma } from '@generated/prisma/client';
 import { PrismaService } from '@shared/infrastructure/database/prisma.service';
 import { IPlayerRankingRepository } from '../../domain/repositories/player-ranking.repository.interface';
 import { PlayerRanking } from '../../domain/aggregates/player-ranking.aggregate';
+import {
+  IRankingEngine,
+  LeaderboardType,
+  PlayerScore,
+  RankedPlayer,
+} from '../../domain/services/ranking-engine.interface';
+import { weekEpoch } from '../../domain/services/week-epoch';
 import { v4 as uuidv4 } from 'uuid';
 
+/**
+ * Player Ranking Repository
+ *
+ * Postgres is the durable store; every save is mirrored into the ranking
+ * engine once it commits, which answers rank queries without scanning
+ * player_rankings.
+ * Score changes are also logged to ranking_changes for the
+ * RankRecalculator, which owns the persisted globalRank/weeklyRank.
+ *
+ * weeklyScore is only current when weeklyEpoch is the current week epoch.
+ * The first write of a new week restarts it, so the weekly reset never
+ * touches the table.
+ */
 @Injectable()
 export class PlayerRankingRepository implements IPlayerRankingRepository {
-  constructor(private readonly prisma: PrismaService) {}
+  private readonly logger = new Logger(PlayerRankingRepository.name);
+
+  constructor(
+    private readonly prisma: PrismaService,
+    @Inject('IRankingEngine')
+    private readonly rankingEngine: IRankingEngine,
+  ) {}
 
   async save(ranking: PlayerRanking): Promise<void> {
-    await this.prisma.playerRanking.upsert({
+    await this.prisma.client.playerRanking.upsert({
       where: { userId: ranking.userId },
       create: {
         id: ranking.id,
         userId: ranking.userId,
         globalScore: ranking.globalScore,
         weeklyScore: ranking.weeklyScore,
+        weeklyEpoch: ranking.weeklyEpoch,
         globalRank: ranking.globalRank,
         weeklyRank: ranking.weeklyRank,
       },
       update: {
         globalScore: ranking.globalScore,
         weeklyScore: ranking.weeklyScore,
-        globalRank: ranking.globalRank,
-        weeklyRank: ranking.weeklyRank,
+        weeklyEpoch: ranking.weeklyEpoch,
         updatedAt: new Date(),
       },
     });
+
+    const change = ranking.scoreChange;
+    if (change) {
+      await this.prisma.client.rankingChange.create({
+        data: { userId: ranking.userId, ...change },
+      });
+      ranking.clearScoreChange();
+    }
+
+    const { userId, globalScore, weeklyScore, weeklyEpoch } = ranking;
+    this.prisma.afterCommit(() => {
+      Promise.all([
+        this.rankingEngine.setScore('global', userId, globalScore),
+        // A score from an earlier week is not on the current weekly board
+        weeklyEpoch === weekEpoch()
+          ? this.rankingEngine.setScore('weekly', userId, weeklyScore)
+          : undefined,
+      ]).catch((error) => this.logger.error('Failed to mirror scores into the ranking engine', error));
+    });
+  }
+
+  async addScores(scores: PlayerScore[]): Promise<void> {
+    if (scores.length === 0) {
+      return;
+    }
+
+    // Increments happen in the statement, so concurrent batches cannot lose updates
+    const epoch = weekEpoch();
+    const values = Prisma.join(
+      scores.map((s) => Prisma.sql`(${uuidv4()}, ${s.userId}, ${s.score}::int)`),
+    );
+    const rows = await this.prisma.client.$queryRaw<
+      { userId: string; globalScore: number; weeklyScore: number }[]
+    >`
+      INSERT INTO player_rankings (id, "userId", "globalScore", "weeklyScore", "weeklyEpoch", "updatedAt")
+      SELECT v.id, v."userId", v.points, v.points, ${epoch}::int, (NOW() AT TIME ZONE 'UTC')
+      FROM (VALUES ${values}) AS v(id, "userId", points)
+      ON CONFLICT ("userId") DO UPDATE SET
+        "globalScore" = player_rankings."globalScore" + EXCLUDED."globalScore",
+        "weeklyScore" = CASE
+          WHEN player_rankings."weeklyEpoch" = EXCLUDED."weeklyEpoch"
+            THEN player_rankings."weeklyScore" + EXCLUDED."weeklyScore"
+          ELSE EXCLUDED."weeklyScore"
+        END,
+        "weeklyEpoch" = EXCLUDED."weeklyEpoch",
+        "updatedAt" = (NOW() AT TIME ZONE 'UTC')
+      RETURNING "userId", "globalScore", "weeklyScore"
+    `;
+
+    const points = new Map(scores.map((s) => [s.userId, s.score]));
+    await this.prisma.client.rankingChange.createMany({
+      data: rows.map((row) => ({
+        userId: row.userId,
+        globalFrom: row.globalScore - points.get(row.userId)!,
+        globalTo: row.globalScore,
+        weeklyFrom: row.weeklyScore - points.get(row.userId)!,
+        weeklyTo: row.weeklyScore,
+      })),
+    });
+
+    this.prisma.afterCommit(() => {
+      const sameWeek = epoch === weekEpoch();
+      Promise.all(
+        rows.flatMap((row) => [
+          this.rankingEngine.setScore('global', row.userId, row.globalScore),
+          ...(sameWeek ? [this.rankingEngine.setScore('weekly', row.userId, row.weeklyScore)] : []),
+        ]),
+      ).catch((error) => this.logger.error('Failed to mirror scores into the ranking engine', error));
+    });
   }
 
   async findByUserId(userId: string): Promise<PlayerRanking | null> {
-    const data = await this.prisma.playerRanking.findUnique({
+    const data = await this.prisma.client.playerRanking.findUnique({
       where: { userId },
     });
 
@@ -41,6 +137,7 @@ export class PlayerRankingRepository implements IPlayerRankingRepository {
       userId: data.userId,
       globalScore: data.globalScore,
       weeklyScore: data.weeklyScore,
+      weeklyEpoch: data.weeklyEpoch,
       globalRank: data.globalRank,
       weeklyRank: data.weeklyRank,
       createdAt: data.createdAt,
@@ -52,6 +149,10 @@ export class PlayerRankingRepository implements IPlayerRankingRepository {
     let ranking = await this.findByUserId(userId);
 
     if (!ranking) {
+      if (this.prisma.onReplica) {
+        // Created on the primary, which may also have it already
+        return this.prisma.runOnPrimary(() => this.getOrCreate(userId));
+      }
       ranking = PlayerRanking.create(uuidv4(), userId);
       await this.save(ranking);
     }
@@ -60,7 +161,7 @@ export class PlayerRankingRepository implements IPlayerRankingRepository {
   }
 
   async getTopGlobal(limit: number): Promise<PlayerRanking[]> {
-    const data = await this.prisma.playerRanking.findMany({
+    const data = await this.prisma.client.playerRanking.findMany({
       orderBy: { globalScore: 'desc' },
       take: limit,
     });
@@ -71,6 +172,7 @@ export class PlayerRankingRepository implements IPlayerRankingRepository {
         userId: d.userId,
         globalScore: d.globalScore,
         weeklyScore: d.weeklyScore,
+        weeklyEpoch: d.weeklyEpoch,
         globalRank: d.globalRank,
         weeklyRank: d.weeklyRank,
         createdAt: d.createdAt,
@@ -80,7 +182,9 @@ export class PlayerRankingRepository implements IPlayerRankingRepository {
   }
 
   async getTopWeekly(limit: number): Promise<PlayerRanking[]> {
-    const data = await this.prisma.playerRanking.findMany({
+    // Served by the (weeklyEpoch, weeklyScore DESC) index
+    const data = await this.prisma.client.playerRanking.findMany({
+      where: { weeklyEpoch: weekEpoch() },
       orderBy: { weeklyScore: 'desc' },
       take: limit,
     });
@@ -91,6 +195,7 @@ export class PlayerRankingRepository implements IPlayerRankingRepository {
         userId: d.userId,
         globalScore: d.globalScore,
         weeklyScore: d.weeklyScore,
+        weeklyEpoch: d.weeklyEpoch,
         globalRank: d.globalRank,
         weeklyRank: d.weeklyRank,
         createdAt: d.createdAt,
@@ -98,4 +203,20 @@ export class PlayerRankingRepository implements IPlayerRankingRepository {
       }),
     );
   }
+
+  async getTopRanked(type: LeaderboardType, limit: number): Promise<RankedPlayer[]> {
+    return this.rankingEngine.getTop(type, limit);
+  }
+
+  async getPlayerRank(type: LeaderboardType, userId: string): Promise<RankedPlayer | null> {
+    return this.rankingEngine.getRank(type, userId);
+  }
+
+  async getPlayersAround(
+    type: LeaderboardType,
+    userId: string,
+    radius: number,
+  ): Promise<RankedPlayer[]> {
+    return this.rankingEngine.getAround(type, userId, radius);
+  }
 }
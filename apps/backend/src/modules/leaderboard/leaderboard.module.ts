@@ -7,15 +7,23 @@ import { LeaderboardController } from './presentation/controllers/leaderboard.co
 
 // Query Handlers
 import { GetLeaderboardHandler } from './application/queries/get-leaderboard.handler';
+import { GetPlayerRankHandler } from './application/queries/get-player-rank.handler';
 
 // Repositories
 import { PlayerRankingRepository } from './infrastructure/repositories/player-ranking.repository';
 
+// Ranking Engine
+import { redisConfig } from '@config/redis.config';
+import { InMemoryRankingEngine } from './infrastructure/ranking/in-memory-ranking.engine';
+import { RedisRankingEngine } from './infrastructure/ranking/redis-ranking.engine';
+import { RankingEngineLoader } from './infrastructure/ranking/ranking-engine.loader';
+import { RankRecalculator } from './infrastructure/ranking/rank-recalculator.service';
+
 // Event Handlers
 import { UserRegisteredLeaderboardHandler } from './application/event-handlers/user-registered.handler';
 import { QuizSessionCompletedLeaderboardHandler } from './application/event-handlers/quiz-session-completed.handler';
 
-const QueryHandlers = [GetLeaderboardHandler];
+const QueryHandlers = [GetLeaderboardHandler, GetPlayerRankHandler];
 const EventHandlers = [
   UserRegisteredLeaderboardHandler,
   QuizSessionCompletedLeaderboardHandler,
@@ -28,13 +36,27 @@ const Repositories = [
   },
 ];
 
+const RankingEngine = [
+  {
+    // LEADERBOARD_ENGINE=redis shares rankings across API nodes
+    provide: 'IRankingEngine',
+    useFactory: () =>
+      process.env.LEADERBOARD_ENGINE === 'redis'
+        ? new RedisRankingEngine(redisConfig())
+        : new InMemoryRankingEngine(),
+  },
+  RankingEngineLoader,
+  RankRecalculator,
+];
+
 /**
  * Leaderboard Bounded Context
  *
  * Responsibilities:
  * - Global leaderboard rankings
  * - Weekly leaderboard rankings
- * - Rank calculation
+ * - Rank calculation (in-memory skip list or Redis sorted sets)
+ * - Persisted ranks, recalculated incrementally from the score change log
  *
  * Domain Events Consumed:
  * - QuizSessionCompletedEvent -> Update player score and ranking
@@ -42,7 +64,7 @@ const Repositories = [
 @Module({
   imports: [CqrsModule, SharedModule],
   controllers: [LeaderboardController],
-  providers: [...QueryHandlers, ...EventHandlers, ...Repositories],
+  providers: [...QueryHandlers, ...EventHandlers, ...Repositories, ...RankingEngine],
   exports: [],
 })
 export class LeaderboardModule {}
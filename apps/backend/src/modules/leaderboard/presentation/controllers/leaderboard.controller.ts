@@ -2,7 +2,10 @@ import { Controller, Get, Query, UseGuards } from '@nestjs/common';
 import { QueryBus } from '@nestjs/cqrs';
 import { ApiTags, ApiOperation, ApiResponse, ApiBearerAuth, ApiQuery } from '@nestjs/swagger';
 import { JwtAuthGuard } from '@shared/presentation/guards/jwt-auth.guard';
+import { CurrentUser } from '@shared/presentation/decorators/current-user.decorator';
+import { ConditionalGet } from '@shared/presentation/decorators/conditional-get.decorator';
 import { GetLeaderboardQuery } from '../../application/queries/get-leaderboard.query';
+import { GetPlayerRankQuery } from '../../application/queries/get-player-rank.query';
 
 @ApiTags('leaderboard')
 @ApiBearerAuth()
@@ -12,6 +15,7 @@ export class LeaderboardController {
   constructor(private readonly queryBus: QueryBus) {}
 
   @Get()
+  @ConditionalGet({ resource: 'leaderboard', shared: true })
   @ApiOperation({ summary: 'Get leaderboard' })
   @ApiQuery({ name: 'type', enum: ['global', 'weekly'], required: false })
   @ApiQuery({ name: 'limit', type: Number, required: false })
@@ -23,4 +27,18 @@ export class LeaderboardController {
   ) {
     return this.queryBus.execute(new GetLeaderboardQuery(type, limit));
   }
+
+  @Get('me')
+  @ApiOperation({ summary: 'Get current player rank and the players around them' })
+  @ApiQuery({ name: 'type', enum: ['global', 'weekly'], required: false })
+  @ApiQuery({ name: 'radius', type: Number, required: false })
+  @ApiResponse({ status: 200, description: 'Player rank retrieved' })
+  @ApiResponse({ status: 401, description: 'Unauthorized' })
+  async getMyRank(
+    @CurrentUser() user: any,
+    @Query('type') type: 'global' | 'weekly' = 'global',
+    @Query('radius') radius: number = 5,
+  ) {
+    return this.queryBus.execute(new GetPlayerRankQuery(user.userId, type, radius));
+  }
 }
@@ -0,0 +1,80 @@
+import { BadRequestException } from '@nestjs/common';
+import { CompleteQuizSessionHandler } from '../complete-quiz-session.handler';
+import { CompleteQuizSessionCommand } from '../complete-quiz-session.command';
+import { QuizSession, SessionStatus } from '../../../domain/aggregates/quiz-session.aggregate';
+import { IQuizSessionRepository } from '../../../domain/repositories/quiz-session.repository.interface';
+import { IQuizSessionStore } from '../../../domain/repositories/quiz-session-store.interface';
+import { SessionExpiryScheduler } from '../../../infrastructure/expiry/session-expiry.scheduler';
+import { EventBusService } from '@shared/infrastructure/events/event-bus.service';
+import { PrismaService } from '@shared/infrastructure/database/prisma.service';
+
+describe('CompleteQuizSessionHandler', () => {
+  let handler: CompleteQuizSessionHandler;
+  let session: QuizSession;
+  let sessionRepository: { findById: jest.Mock; saveWithAnswers: jest.Mock };
+  let sessionStore: { get: jest.Mock; delete: jest.Mock };
+  let eventBus: { publishAll: jest.Mock };
+
+  beforeEach(() => {
+    session = QuizSession.create('session-1', 'user-1', null, 'diff-1', 30);
+    session.clearEvents();
+    session.submitAnswer({
+      questionId: 'q1',
+      answerId: 'q1-a',
+      isCorrect: true,
+      timeSpent: 1000,
+      pointsEarned: 100,
+      timeBonus: 40,
+    });
+
+    sessionRepository = { findById: jest.fn(), saveWithAnswers: jest.fn().mockResolvedValue(true) };
+    sessionStore = { get: jest.fn().mockResolvedValue(session), delete: jest.fn() };
+    eventBus = { publishAll: jest.fn() };
+
+    handler = new CompleteQuizSessionHandler(
+      sessionRepository as unknown as IQuizSessionRepository,
+      sessionStore as unknown as IQuizSessionStore,
+      { untrack: jest.fn() } as unknown as SessionExpiryScheduler,
+      { runInTransaction: (work: () => Promise<unknown>) => work() } as unknown as PrismaService,
+      eventBus as unknown as EventBusService,
+    );
+  });
+
+  it('should flush the completed session, then drop it from the store', async () => {
+    const result = await handler.execute(new CompleteQuizSessionCommand('session-1'));
+
+    const [saved] = sessionRepository.saveWithAnswers.mock.calls[0];
+    expect(saved.status).toBe(SessionStatus.COMPLETED);
+    expect(eventBus.publishAll.mock.calls[0][0].map((e: any) => e.eventName)).toEqual([
+      'quiz.session.completed',
+    ]);
+    expect(sessionStore.delete).toHaveBeenCalledWith('session-1');
+    expect(result).toMatchObject({ score: 140, correctAnswers: 1, totalQuestions: 1 });
+  });
+
+  it('should keep the stored session in progress when the flush fails', async () => {
+    sessionRepository.saveWithAnswers.mockRejectedValueOnce(new Error('connection reset'));
+
+    await expect(handler.execute(new CompleteQuizSessionCommand('session-1'))).rejects.toThrow(
+      'connection reset',
+    );
+    expect(session.status).toBe(SessionStatus.IN_PROGRESS);
+    expect(sessionStore.delete).not.toHaveBeenCalled();
+
+    const result = await handler.execute(new CompleteQuizSessionCommand('session-1'));
+
+    expect(sessionRepository.saveWithAnswers).toHaveBeenCalledTimes(2);
+    expect(eventBus.publishAll).toHaveBeenCalledTimes(1);
+    expect(result.score).toBe(140);
+  });
+
+  it('should drop the stored copy of a session closed meanwhile', async () => {
+    sessionRepository.saveWithAnswers.mockResolvedValue(false);
+
+    await expect(
+      handler.execute(new CompleteQuizSessionCommand('session-1')),
+    ).rejects.toBeInstanceOf(BadRequestException);
+    expect(eventBus.publishAll).not.toHaveBeenCalled();
+    expect(sessionStore.delete).toHaveBeenCalledWith('session-1');
+  });
+});
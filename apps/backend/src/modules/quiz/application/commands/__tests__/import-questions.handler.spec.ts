@@ -0,0 +1,160 @@
+import { ImportQuestionsHandler } from '../import-questions.handler';
+import {
+  ImportedQuestion,
+  ImportQuestionsCommand,
+  QuestionImportRow,
+} from '../import-questions.command';
+import { IQuestionRepository } from '../../../domain/repositories/question.repository.interface';
+import { ReferenceCatalog } from '@shared/infrastructure/cache/reference-catalog.service';
+import { EventBusService } from '@shared/infrastructure/events/event-bus.service';
+import { PrismaService } from '@shared/infrastructure/database/prisma.service';
+
+describe('ImportQuestionsHandler', () => {
+  let handler: ImportQuestionsHandler;
+  let questionRepository: jest.Mocked<
+    Pick<IQuestionRepository, 'saveMany' | 'findNearDuplicates'>
+  >;
+  let eventBus: { publishAll: jest.Mock };
+
+  const question = (overrides: Partial<ImportedQuestion> = {}): ImportedQuestion => ({
+    text: 'Quelle température pour tempérer le chocolat noir ?',
+    explanation: 'Le chocolat noir se tempère autour de 31 à 32 °C.',
+    categoryId: 'cat-1',
+    difficultyId: 'diff-1',
+    answers: [
+      { text: '31 °C', isCorrect: true },
+      { text: '45 °C', isCorrect: false },
+    ],
+    ...overrides,
+  });
+
+  async function* rows(...items: QuestionImportRow[]) {
+    yield* items;
+  }
+
+  beforeEach(() => {
+    process.env.QUESTION_IMPORT_CHUNK_SIZE = '2';
+    questionRepository = {
+      saveMany: jest.fn(),
+      findNearDuplicates: jest.fn().mockResolvedValue([]),
+    };
+    eventBus = { publishAll: jest.fn() };
+
+    handler = new ImportQuestionsHandler(
+      questionRepository as unknown as IQuestionRepository,
+      {
+        get: async () => ({ version: 'v1', byId: new Map([['cat-1', {}], ['diff-1', {}]]) }),
+      } as unknown as ReferenceCatalog,
+      eventBus as unknown as EventBusService,
+      { runInTransaction: (work: () => Promise<unknown>) => work() } as unknown as PrismaService,
+    );
+  });
+
+  afterEach(() => {
+    delete process.env.QUESTION_IMPORT_CHUNK_SIZE;
+  });
+
+  it('should write valid questions in chunks with one event per chunk', async () => {
+    const progress = jest.fn();
+
+    const result = await handler.execute(
+      new ImportQuestionsCommand(
+        rows(
+          { line: 1, question: question() },
+          { line: 2, question: question({ text: 'Quel est le point de fusion du beurre ?' }) },
+          { line: 3, question: question({ text: 'Combien de jaunes dans une crème anglaise ?' }) },
+        ),
+        'admin-1',
+        { onProgress: progress },
+      ),
+    );
+
+    expect(result).toMatchObject({ processed: 3, imported: 3, failed: 0 });
+    expect(questionRepository.saveMany.mock.calls.map(([chunk]) => chunk.length)).toEqual([2, 1]);
+    expect(eventBus.publishAll).toHaveBeenCalledTimes(2);
+
+    const [[event]] = eventBus.publishAll.mock.calls[0];
+    expect(event.eventName).toBe('questions.imported');
+    expect(event.questionIds).toHaveLength(2);
+    expect(progress).toHaveBeenLastCalledWith({ processed: 3, imported: 3, failed: 0 });
+  });
+
+  it('should report invalid rows and keep importing', async () => {
+    const rowError = jest.fn();
+
+    const result = await handler.execute(
+      new ImportQuestionsCommand(
+        rows(
+          { line: 1, question: question({ text: 'Short' }) },
+          { line: 2, question: question({ categoryId: 'unknown' }) },
+          { line: 3, error: 'Malformed JSON' },
+          { line: 4, question: question() },
+        ),
+        'admin-1',
+        { onRowError: rowError },
+      ),
+    );
+
+    expect(result).toMatchObject({ processed: 4, imported: 1, failed: 3 });
+    expect(rowError.mock.calls.map(([error]) => error)).toEqual([
+      { line: 1, message: 'Question text must be at least 10 characters' },
+      { line: 2, message: 'Unknown category: unknown' },
+      { line: 3, message: 'Malformed JSON' },
+    ]);
+  });
+
+  it('should reject near-duplicates of existing questions', async () => {
+    const rowError = jest.fn();
+    questionRepository.findNearDuplicates.mockResolvedValue([
+      { index: 0, questionId: 'question-9', candidateIndex: null, similarity: 0.91 },
+    ]);
+
+    const result = await handler.execute(
+      new ImportQuestionsCommand(
+        rows(
+          { line: 1, question: question() },
+          { line: 2, question: question({ text: 'Quel est le point de fusion du beurre ?' }) },
+        ),
+        'admin-1',
+        { onRowError: rowError },
+      ),
+    );
+
+    expect(result).toMatchObject({ processed: 2, imported: 1, failed: 1 });
+    expect(rowError).toHaveBeenCalledWith({
+      line: 1,
+      message: 'Near-duplicate of question question-9 (similarity 0.91)',
+    });
+    expect(questionRepository.saveMany.mock.calls[0][0]).toHaveLength(1);
+  });
+
+  it('should reject near-duplicates of earlier rows of the same file', async () => {
+    const rowError = jest.fn();
+    const reworded = 'Quelle température pour tempérer le chocolat noir?';
+    questionRepository.findNearDuplicates.mockResolvedValue([
+      { index: 1, questionId: null, candidateIndex: 0, similarity: 0.95 },
+    ]);
+
+    const result = await handler.execute(
+      new ImportQuestionsCommand(
+        rows(
+          { line: 1, question: question() },
+          { line: 2, question: question({ text: reworded }) },
+        ),
+        'admin-1',
+        { onRowError: rowError },
+      ),
+    );
+
+    expect(questionRepository.findNearDuplicates).toHaveBeenCalledWith(
+      [question().text, reworded],
+      0.8,
+    );
+    expect(result).toMatchObject({ processed: 2, imported: 1, failed: 1 });
+    expect(rowError).toHaveBeenCalledWith({
+      line: 2,
+      message: 'Near-duplicate of line 1 (similarity 0.95)',
+    });
+    expect(questionRepository.saveMany.mock.calls[0][0]).toHaveLength(1);
+  });
+});
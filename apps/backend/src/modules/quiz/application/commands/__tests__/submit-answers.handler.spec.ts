@@ -0,0 +1,146 @@
+import { BadRequestException, NotFoundException } from '@nestjs/common';
+import { SubmitAnswersHandler } from '../submit-answers.handler';
+import { SubmitAnswersCommand } from '../submit-answers.command';
+import { QuizSession, SessionStatus } from '../../../domain/aggregates/quiz-session.aggregate';
+import { IQuizSessionRepository } from '../../../domain/repositories/quiz-session.repository.interface';
+import { IQuestionRepository } from '../../../domain/repositories/question.repository.interface';
+import { IQuizSessionStore } from '../../../domain/repositories/quiz-session-store.interface';
+import { SessionExpiryScheduler } from '../../../infrastructure/expiry/session-expiry.scheduler';
+import { EventBusService } from '@shared/infrastructure/events/event-bus.service';
+import { PrismaService } from '@shared/infrastructure/database/prisma.service';
+
+describe('SubmitAnswersHandler', () => {
+  let handler: SubmitAnswersHandler;
+  let session: QuizSession;
+  let sessionRepository: { findById: jest.Mock; saveWithAnswers: jest.Mock };
+  let sessionStore: { get: jest.Mock; appendAnswer: jest.Mock; delete: jest.Mock };
+  let findAnswerKeys: jest.Mock;
+  let eventBus: { publishAll: jest.Mock };
+
+  beforeEach(() => {
+    session = QuizSession.create('session-1', 'user-1', null, 'diff-1', 30);
+    session.clearEvents();
+
+    sessionRepository = { findById: jest.fn(), saveWithAnswers: jest.fn().mockResolvedValue(true) };
+    sessionStore = {
+      get: jest.fn().mockResolvedValue(session),
+      appendAnswer: jest.fn(),
+      delete: jest.fn(),
+    };
+    findAnswerKeys = jest.fn().mockResolvedValue(
+      new Map([
+        ['q1', { answerIds: new Set(['q1-a', 'q1-b']), correctAnswerId: 'q1-a' }],
+        ['q2', { answerIds: new Set(['q2-a', 'q2-b']), correctAnswerId: 'q2-a' }],
+      ]),
+    );
+    eventBus = { publishAll: jest.fn() };
+
+    handler = new SubmitAnswersHandler(
+      sessionRepository as unknown as IQuizSessionRepository,
+      sessionStore as unknown as IQuizSessionStore,
+      { findAnswerKeys } as unknown as IQuestionRepository,
+      { untrack: jest.fn() } as unknown as SessionExpiryScheduler,
+      { runInTransaction: (work: () => Promise<unknown>) => work() } as unknown as PrismaService,
+      eventBus as unknown as EventBusService,
+    );
+  });
+
+  it('should score the batch with one answer key lookup', async () => {
+    const result = await handler.execute(
+      new SubmitAnswersCommand('session-1', [
+        { questionId: 'q1', answerId: 'q1-a', timeSpent: 1000 },
+        { questionId: 'q2', answerId: 'q2-b', timeSpent: 1000 },
+      ]),
+    );
+
+    expect(findAnswerKeys).toHaveBeenCalledTimes(1);
+    expect(findAnswerKeys).toHaveBeenCalledWith(['q1', 'q2']);
+    expect(result.answers).toEqual([
+      expect.objectContaining({ isCorrect: true, pointsEarned: 100, timeBonus: 40 }),
+      expect.objectContaining({ isCorrect: false, pointsEarned: 0, correctAnswerId: 'q2-a' }),
+    ]);
+    expect(result.score).toBe(140);
+    expect(result.completion).toBeNull();
+    expect(sessionStore.appendAnswer).toHaveBeenCalledTimes(2);
+  });
+
+  it('should complete the session in the same transaction when asked', async () => {
+    const result = await handler.execute(
+      new SubmitAnswersCommand(
+        'session-1',
+        [{ questionId: 'q1', answerId: 'q1-a', timeSpent: 6000 }],
+        true,
+      ),
+    );
+
+    const [saved] = sessionRepository.saveWithAnswers.mock.calls[0];
+    expect(saved.status).toBe(SessionStatus.COMPLETED);
+    expect(saved.answers).toHaveLength(1);
+    expect(eventBus.publishAll.mock.calls[0][0][0].eventName).toBe('quiz.session.completed');
+    expect(result.completion).toMatchObject({ score: 100, correctAnswers: 1, totalQuestions: 1 });
+    expect(sessionStore.appendAnswer).not.toHaveBeenCalled();
+  });
+
+  it('should leave the stored session untouched when the completion fails', async () => {
+    sessionRepository.saveWithAnswers.mockRejectedValueOnce(new Error('connection reset'));
+    const command = new SubmitAnswersCommand(
+      'session-1',
+      [{ questionId: 'q1', answerId: 'q1-a', timeSpent: 6000 }],
+      true,
+    );
+
+    await expect(handler.execute(command)).rejects.toThrow('connection reset');
+    expect(session.status).toBe(SessionStatus.IN_PROGRESS);
+    expect(session.answers).toHaveLength(0);
+    expect(sessionStore.delete).not.toHaveBeenCalled();
+
+    const result = await handler.execute(command);
+
+    expect(result.completion).toMatchObject({ score: 100, totalQuestions: 1 });
+  });
+
+  it('should reject answers for an expired session as a bad request', async () => {
+    jest.useFakeTimers({ now: Date.now() + 31 * 60 * 1000 });
+
+    await expect(
+      handler.execute(
+        new SubmitAnswersCommand('session-1', [
+          { questionId: 'q1', answerId: 'q1-a', timeSpent: 1000 },
+        ]),
+      ),
+    ).rejects.toBeInstanceOf(BadRequestException);
+    jest.useRealTimers();
+  });
+
+  it('should reject the whole batch when one answer is invalid', async () => {
+    await expect(
+      handler.execute(
+        new SubmitAnswersCommand('session-1', [
+          { questionId: 'q1', answerId: 'q1-a', timeSpent: 1000 },
+          { questionId: 'q2', answerId: 'q1-b', timeSpent: 1000 },
+        ]),
+      ),
+    ).rejects.toBeInstanceOf(BadRequestException);
+
+    expect(session.answers).toHaveLength(0);
+  });
+
+  it('should reject unknown questions and repeated questions', async () => {
+    await expect(
+      handler.execute(
+        new SubmitAnswersCommand('session-1', [
+          { questionId: 'q3', answerId: 'q3-a', timeSpent: 1000 },
+        ]),
+      ),
+    ).rejects.toBeInstanceOf(NotFoundException);
+
+    await expect(
+      handler.execute(
+        new SubmitAnswersCommand('session-1', [
+          { questionId: 'q1', answerId: 'q1-a', timeSpent: 1000 },
+          { questionId: 'q1', answerId: 'q1-b', timeSpent: 1000 },
+        ]),
+      ),
+    ).rejects.toBeInstanceOf(BadRequestException);
+  });
+});
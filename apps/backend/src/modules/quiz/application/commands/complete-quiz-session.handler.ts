@@ -1,7 +1,11 @@
 import { CommandHandler, ICommandHandler } from '@nestjs/cqrs';
-import { Injectable, Inject, NotFoundException } from '@nestjs/common';
+import { Injectable, Inject, NotFoundException, BadRequestException } from '@nestjs/common';
 import { CompleteQuizSessionCommand } from './complete-quiz-session.command';
 import { IQuizSessionRepository } from '../../domain/repositories/quiz-session.repository.interface';
+import { IQuizSessionStore } from '../../domain/repositories/quiz-session-store.interface';
+import { SessionStatus } from '../../domain/aggregates/quiz-session.aggregate';
+import { SessionExpiryScheduler } from '../../infrastructure/expiry/session-expiry.scheduler';
+import { PrismaService } from '@shared/infrastructure/database/prisma.service';
 import { EventBusService } from '@shared/infrastructure/events/event-bus.service';
 
 export interface CompleteQuizSessionResult {
@@ -18,8 +22,8 @@ export interface CompleteQuizSessionResult {
  *
  * Handles quiz session completion:
  * 1. Validate session exists and is in progress
- * 2. Complete session (triggers business logic)
- * 3. Persist updated session
+ * 2. Complete a copy of the session (triggers business logic)
+ * 3. Flush session and buffered answers to the database
  * 4. Publish QuizSessionCompletedEvent
  * 5. Return summary
  */
@@ -31,25 +35,47 @@ export class CompleteQuizSessionHandler
   constructor(
     @Inject('IQuizSessionRepository')
     private readonly sessionRepository: IQuizSessionRepository,
+    @Inject('IQuizSessionStore')
+    private readonly sessionStore: IQuizSessionStore,
+    private readonly sessionExpiry: SessionExpiryScheduler,
+    private readonly prisma: PrismaService,
     private readonly eventBus: EventBusService,
   ) {}
 
   async execute(command: CompleteQuizSessionCommand): Promise<CompleteQuizSessionResult> {
-    // Get session
-    const session = await this.sessionRepository.findById(command.sessionId);
+    // Get session (buffered copy first, database on a miss). The stored
+    // session is only replaced once the completion commits, so a failed
+    // flush can be retried
+    const session =
+      (await this.sessionStore.get(command.sessionId))?.copy() ??
+      (await this.sessionRepository.findById(command.sessionId));
     if (!session) {
       throw new NotFoundException('Quiz session not found');
     }
 
     // Complete session (triggers domain event)
+    if (session.status !== SessionStatus.IN_PROGRESS) {
+      throw new BadRequestException('Session is not in progress');
+    }
     session.complete();
 
-    // Save updated session
-    await this.sessionRepository.save(session);
-
-    // Publish domain events
-    await this.eventBus.publishAll([...session.domainEvents]);
+    // Flush session, buffered answers and domain events in one transaction
+    const saved = await this.prisma.runInTransaction(async () => {
+      if (!(await this.sessionRepository.saveWithAnswers(session))) {
+        return false;
+      }
+      await this.eventBus.publishAll([...session.domainEvents]);
+      return true;
+    });
+    if (!saved) {
+      // Closed meanwhile, e.g. abandoned by the expiry sweep: drop the stale copy
+      await this.sessionStore.delete(session.id);
+      this.sessionExpiry.untrack(session.id);
+      throw new BadRequestException('Session is not in progress');
+    }
     session.clearEvents();
+    await this.sessionStore.delete(session.id);
+    this.sessionExpiry.untrack(session.id);
 
     // Calculate results
     const correctAnswers = session.answers.filter((a) => a.isCorrect).length;
@@ -0,0 +1,42 @@
+import { CreateQuestionAnswerDto } from './create-question.command';
+
+export interface ImportedQuestion {
+  text: string;
+  explanation: string;
+  categoryId: string;
+  difficultyId: string;
+  answers: CreateQuestionAnswerDto[];
+  imageUrl?: string;
+}
+
+/**
+ * One parsed row of an import source. `line` is where the row starts in the
+ * source; rows the parser could not read carry an error instead.
+ */
+export type QuestionImportRow =
+  | { line: number; question: ImportedQuestion }
+  | { line: number; error: string };
+
+export interface QuestionImportRowError {
+  line: number;
+  message: string;
+}
+
+export interface QuestionImportProgress {
+  processed: number;
+  imported: number;
+  failed: number;
+}
+
+export interface QuestionImportListener {
+  onProgress?(progress: QuestionImportProgress): void;
+  onRowError?(error: QuestionImportRowError): void;
+}
+
+export class ImportQuestionsCommand {
+  constructor(
+    public readonly rows: AsyncIterable<QuestionImportRow>,
+    public readonly createdById: string,
+    public readonly listener: QuestionImportListener = {},
+  ) {}
+}
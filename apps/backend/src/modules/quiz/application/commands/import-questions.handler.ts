@@ -0,0 +1,211 @@
+import { CommandHandler, ICommandHandler } from '@nestjs/cqrs';
+import { Injectable, Inject, Logger } from '@nestjs/common';
+import {
+  ImportedQuestion,
+  ImportQuestionsCommand,
+  QuestionImportProgress,
+} from './import-questions.command';
+import { IQuestionRepository } from '../../domain/repositories/question.repository.interface';
+import { QuestionText } from '../../domain/value-objects/question-text.vo';
+import { Explanation } from '../../domain/value-objects/explanation.vo';
+import { Question } from '../../domain/aggregates/question.aggregate';
+import { Answer } from '../../domain/entities/answer.entity';
+import { QuestionsImportedEvent } from '../../domain/events/questions-imported.event';
+import {
+  ReferenceCatalog,
+  ReferenceData,
+} from '@shared/infrastructure/cache/reference-catalog.service';
+import { EventBusService } from '@shared/infrastructure/events/event-bus.service';
+import { PrismaService } from '@shared/infrastructure/database/prisma.service';
+import { v4 as uuidv4 } from 'uuid';
+
+export interface ImportQuestionsResult extends QuestionImportProgress {
+  importId: string;
+}
+
+type QuestionReferences = Pick<ReferenceData, 'categories' | 'difficulties'>;
+
+interface PendingQuestion {
+  line: number;
+  question: Question;
+}
+
+/**
+ * Import Questions Command Handler
+ *
+ * Bulk import of draft questions from a stream of parsed rows:
+ * 1. Validate each row with the same value objects and aggregate rules as
+ *    CreateQuestionHandler; invalid rows are reported and skipped
+ * 2. Buffer valid questions into chunks of QUESTION_IMPORT_CHUNK_SIZE
+ * 3. Reject near-duplicates of existing questions and of earlier rows of
+ *    the chunk (trigram similarity of the text of at least
+ *    QUESTION_DUPLICATE_THRESHOLD, 0 disables it); earlier chunks are
+ *    already committed, so they count as existing questions
+ * 4. Write each chunk with multi-row inserts in one transaction, together
+ *    with a single QuestionsImportedEvent
+ *
+ * Rows are pulled from the source only as chunks are written, so memory
+ * stays bounded by the chunk size. Chunks committed before a failure stay.
+ */
+@Injectable()
+@CommandHandler(ImportQuestionsCommand)
+export class ImportQuestionsHandler
+  implements ICommandHandler<ImportQuestionsCommand, ImportQuestionsResult>
+{
+  private readonly logger = new Logger(ImportQuestionsHandler.name);
+  private readonly chunkSize = parseInt(process.env.QUESTION_IMPORT_CHUNK_SIZE || '500', 10);
+  private readonly duplicateThreshold = parseFloat(
+    process.env.QUESTION_DUPLICATE_THRESHOLD || '0.8',
+  );
+
+  constructor(
+    @Inject('IQuestionRepository')
+    private readonly questionRepository: IQuestionRepository,
+    private readonly catalog: ReferenceCatalog,
+    private readonly eventBus: EventBusService,
+    private readonly prisma: PrismaService,
+  ) {}
+
+  async execute(command: ImportQuestionsCommand): Promise<ImportQuestionsResult> {
+    const { listener } = command;
+    const result: ImportQuestionsResult = {
+      importId: uuidv4(),
+      processed: 0,
+      imported: 0,
+      failed: 0,
+    };
+    const references: QuestionReferences = {
+      categories: await this.catalog.get('categories'),
+      difficulties: await this.catalog.get('difficulties'),
+    };
+    let chunk: PendingQuestion[] = [];
+
+    const flush = async () => {
+      const written = await this.writeChunk(result, chunk, command);
+      result.imported += written;
+      result.failed += chunk.length - written;
+      chunk = [];
+    };
+
+    for await (const row of command.rows) {
+      result.processed++;
+
+      try {
+        if ('error' in row) {
+          throw new Error(row.error);
+        }
+        chunk.push({
+          line: row.line,
+          question: this.toQuestion(row.question, references, command.createdById),
+        });
+      } catch (error) {
+        result.failed++;
+        listener.onRowError?.({ line: row.line, message: (error as Error).message });
+      }
+
+      if (chunk.length >= this.chunkSize) {
+        await flush();
+        listener.onProgress?.(this.progress(result));
+      }
+    }
+
+    if (chunk.length > 0) {
+      await flush();
+    }
+    listener.onProgress?.(this.progress(result));
+
+    this.logger.log(
+      `Import ${result.importId}: ${result.imported} questions imported, ` +
+        `${result.failed} rows rejected out of ${result.processed}`,
+    );
+
+    return result;
+  }
+
+  private toQuestion(
+    row: ImportedQuestion,
+    references: QuestionReferences,
+    createdById: string,
+  ): Question {
+    if (!references.categories.byId.has(row.categoryId)) {
+      throw new Error(`Unknown category: ${row.categoryId}`);
+    }
+    if (!references.difficulties.byId.has(row.difficultyId)) {
+      throw new Error(`Unknown difficulty: ${row.difficultyId}`);
+    }
+
+    const question = Question.create(
+      uuidv4(),
+      QuestionText.create(row.text),
+      Explanation.create(row.explanation),
+      row.categoryId,
+      row.difficultyId,
+      createdById,
+      row.answers.map((answer) => Answer.create(uuidv4(), answer.text, answer.isCorrect)),
+      row.imageUrl || null,
+    );
+
+    // Replaced by one QuestionsImportedEvent per chunk
+    question.clearEvents();
+    return question;
+  }
+
+  /**
+   * Write the chunk minus its near-duplicates; returns how many were written
+   */
+  private async writeChunk(
+    result: ImportQuestionsResult,
+    chunk: PendingQuestion[],
+    command: ImportQuestionsCommand,
+  ): Promise<number> {
+    const duplicates =
+      this.duplicateThreshold > 0
+        ? await this.questionRepository.findNearDuplicates(
+            chunk.map(({ question }) => question.text.value),
+            this.duplicateThreshold,
+          )
+        : [];
+
+    for (const duplicate of duplicates) {
+      command.listener.onRowError?.({
+        line: chunk[duplicate.index].line,
+        message:
+          (duplicate.questionId !== null
+            ? `Near-duplicate of question ${duplicate.questionId} `
+            : `Near-duplicate of line ${chunk[duplicate.candidateIndex!].line} `) +
+          `(similarity ${duplicate.similarity.toFixed(2)})`,
+      });
+    }
+
+    const rejected = new Set(duplicates.map((duplicate) => duplicate.index));
+    const questions = chunk
+      .filter((_, index) => !rejected.has(index))
+      .map(({ question }) => question);
+    if (questions.length === 0) {
+      return 0;
+    }
+
+    await this.prisma.runInTransaction(
+      async () => {
+        await this.questionRepository.saveMany(questions);
+        await this.eventBus.publishAll([
+          new QuestionsImportedEvent({
+            importId: result.importId,
+            questionIds: questions.map((q) => q.id),
+            categoryIds: [...new Set(questions.map((q) => q.categoryId))],
+            difficultyIds: [...new Set(questions.map((q) => q.difficultyId))],
+            createdById: command.createdById,
+            occurredAt: new Date(),
+          }),
+        ]);
+      },
+      { bulk: true },
+    );
+
+    return questions.length;
+  }
+
+  private progress({ processed, imported, failed }: ImportQuestionsResult): QuestionImportProgress {
+    return { processed, imported, failed };
+  }
+}
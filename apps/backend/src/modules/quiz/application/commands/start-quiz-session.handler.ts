@@ -2,8 +2,11 @@ import { CommandHandler, ICommandHandler } from '@nestjs/cqrs';
 import { Injectable, Inject, BadRequestException } from '@nestjs/common';
 import { StartQuizSessionCommand } from './start-quiz-session.command';
 import { IQuizSessionRepository } from '../../domain/repositories/quiz-session.repository.interface';
-import { IQuestionRepository } from '../../domain/repositories/question.repository.interface';
+import { IQuizSessionStore } from '../../domain/repositories/quiz-session-store.interface';
+import { QuestionPoolService } from '../../infrastructure/cache/question-pool.service';
+import { SessionExpiryScheduler } from '../../infrastructure/expiry/session-expiry.scheduler';
 import { QuizSession } from '../../domain/aggregates/quiz-session.aggregate';
+import { PrismaService } from '@shared/infrastructure/database/prisma.service';
 import { EventBusService } from '@shared/infrastructure/events/event-bus.service';
 import { v4 as uuidv4 } from 'uuid';
 
@@ -32,10 +35,10 @@ export interface AnswerData {
  * Start Quiz Session Command Handler
  *
  * Handles starting a new quiz session:
- * 1. Check if user has active session
- * 2. Fetch random questions for difficulty/category
+ * 1. Check if user has active session (abandoning it if it has just expired)
+ * 2. Draw random questions for difficulty/category from the question pool
  * 3. Create QuizSession aggregate
- * 4. Persist to database
+ * 4. Persist to database, buffer in the session store and schedule its expiry
  * 5. Publish QuizSessionStartedEvent
  * 6. Return questions (without correct answers)
  */
@@ -50,8 +53,11 @@ export class StartQuizSessionHandler
   constructor(
     @Inject('IQuizSessionRepository')
     private readonly sessionRepository: IQuizSessionRepository,
-    @Inject('IQuestionRepository')
-    private readonly questionRepository: IQuestionRepository,
+    @Inject('IQuizSessionStore')
+    private readonly sessionStore: IQuizSessionStore,
+    private readonly questionPool: QuestionPoolService,
+    private readonly sessionExpiry: SessionExpiryScheduler,
+    private readonly prisma: PrismaService,
     private readonly eventBus: EventBusService,
   ) {}
 
@@ -61,11 +67,17 @@ export class StartQuizSessionHandler
       command.userId,
     );
     if (activeSession) {
-      throw new BadRequestException('User already has an active quiz session');
+      // Expired sessions are swept at their deadline; close one the sweep has not reached yet
+      const abandoned =
+        activeSession.isExpired() &&
+        (await this.sessionExpiry.expire([activeSession.id])).length > 0;
+      if (!abandoned) {
+        throw new BadRequestException('User already has an active quiz session');
+      }
     }
 
-    // Fetch random questions
-    const questions = await this.questionRepository.findRandomQuestions(
+    // Draw random questions from the in-process pool
+    const questions = await this.questionPool.sample(
       command.difficultyId,
       command.categoryId || null,
       StartQuizSessionHandler.QUESTIONS_PER_SESSION,
@@ -87,13 +99,17 @@ export class StartQuizSessionHandler
       StartQuizSessionHandler.SESSION_DURATION_MINUTES,
     );
 
-    // Save session
-    await this.sessionRepository.save(session);
-
-    // Publish domain events
-    await this.eventBus.publishAll([...session.domainEvents]);
+    // Save session and its events (outbox) in one transaction
+    await this.prisma.runInTransaction(async () => {
+      await this.sessionRepository.save(session);
+      await this.eventBus.publishAll([...session.domainEvents]);
+    });
     session.clearEvents();
 
+    // Buffer it for answer submission, and abandon it once it expires
+    await this.sessionStore.put(session);
+    this.sessionExpiry.track(session);
+
     // Return questions without correct answer indicators
     const questionData: QuestionData[] = questions.map((q) => ({
       id: q.id,
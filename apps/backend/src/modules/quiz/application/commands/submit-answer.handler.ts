@@ -3,7 +3,9 @@ import { Injectable, Inject, NotFoundException, BadRequestException } from '@nes
 import { SubmitAnswerCommand } from './submit-answer.command';
 import { IQuizSessionRepository } from '../../domain/repositories/quiz-session.repository.interface';
 import { IQuestionRepository } from '../../domain/repositories/question.repository.interface';
+import { IQuizSessionStore } from '../../domain/repositories/quiz-session-store.interface';
 import { SessionAnswerData } from '../../domain/aggregates/quiz-session.aggregate';
+import { scoreAnswer } from '../../domain/services/answer-scoring';
 
 export interface SubmitAnswerResult {
   sessionId: string;
@@ -23,7 +25,7 @@ export interface SubmitAnswerResult {
  * 2. Validate question and answer exist
  * 3. Calculate points and time bonus
  * 4. Submit answer to session aggregate
- * 5. Persist updated session
+ * 5. Buffer the answer in the session store
  * 6. Return result with correct answer
  */
 @Injectable()
@@ -31,20 +33,20 @@ export interface SubmitAnswerResult {
 export class SubmitAnswerHandler
   implements ICommandHandler<SubmitAnswerCommand, SubmitAnswerResult>
 {
-  private static readonly BASE_POINTS = 100;
-  private static readonly MAX_TIME_BONUS = 50;
-  private static readonly TIME_BONUS_THRESHOLD_MS = 5000; // 5 seconds
-
   constructor(
     @Inject('IQuizSessionRepository')
     private readonly sessionRepository: IQuizSessionRepository,
+    @Inject('IQuizSessionStore')
+    private readonly sessionStore: IQuizSessionStore,
     @Inject('IQuestionRepository')
     private readonly questionRepository: IQuestionRepository,
   ) {}
 
   async execute(command: SubmitAnswerCommand): Promise<SubmitAnswerResult> {
-    // Get session
-    const session = await this.sessionRepository.findById(command.sessionId);
+    // Get session (buffered copy first, database on a miss)
+    const session =
+      (await this.sessionStore.get(command.sessionId)) ??
+      (await this.sessionRepository.findById(command.sessionId));
     if (!session) {
       throw new NotFoundException('Quiz session not found');
     }
@@ -61,21 +63,9 @@ export class SubmitAnswerHandler
       throw new BadRequestException('Invalid answer for question');
     }
 
-    // Calculate points
+    // Calculate points and time bonus
     const isCorrect = answer.isCorrect;
-    let pointsEarned = 0;
-    let timeBonus = 0;
-
-    if (isCorrect) {
-      pointsEarned = SubmitAnswerHandler.BASE_POINTS;
-
-      // Calculate time bonus (faster = more bonus)
-      if (command.timeSpent < SubmitAnswerHandler.TIME_BONUS_THRESHOLD_MS) {
-        const timeFactor =
-          1 - command.timeSpent / SubmitAnswerHandler.TIME_BONUS_THRESHOLD_MS;
-        timeBonus = Math.floor(SubmitAnswerHandler.MAX_TIME_BONUS * timeFactor);
-      }
-    }
+    const { pointsEarned, timeBonus } = scoreAnswer(isCorrect, command.timeSpent);
 
     // Create session answer data
     const sessionAnswer: SessionAnswerData = {
@@ -90,8 +80,8 @@ export class SubmitAnswerHandler
     // Submit answer to session
     session.submitAnswer(sessionAnswer);
 
-    // Save updated session
-    await this.sessionRepository.save(session);
+    // Buffer the answer; it is flushed to the database on completion
+    await this.sessionStore.appendAnswer(session, sessionAnswer);
 
     // Find correct answer
     const correctAnswer = question.answers.find((a) => a.isCorrect);
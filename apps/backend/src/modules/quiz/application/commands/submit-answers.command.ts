@@ -0,0 +1,16 @@
+export interface SubmittedAnswer {
+  questionId: string;
+  answerId: string;
+  timeSpent: number; // milliseconds
+}
+
+export class SubmitAnswersCommand {
+  constructor(
+    public readonly sessionId: string,
+    public readonly answers: SubmittedAnswer[],
+    /**
+     * Complete the session in the same transaction as the answers
+     */
+    public readonly complete: boolean = false,
+  ) {}
+}
@@ -0,0 +1,155 @@
+import { CommandHandler, ICommandHandler } from '@nestjs/cqrs';
+import { Injectable, Inject, NotFoundException, BadRequestException } from '@nestjs/common';
+import { SubmitAnswersCommand } from './submit-answers.command';
+import { SubmitAnswerResult } from './submit-answer.handler';
+import { CompleteQuizSessionResult } from './complete-quiz-session.handler';
+import { IQuizSessionRepository } from '../../domain/repositories/quiz-session.repository.interface';
+import { IQuestionRepository } from '../../domain/repositories/question.repository.interface';
+import { IQuizSessionStore } from '../../domain/repositories/quiz-session-store.interface';
+import { SessionAnswerData } from '../../domain/aggregates/quiz-session.aggregate';
+import { scoreAnswers } from '../../domain/services/answer-scoring';
+import { SessionExpiryScheduler } from '../../infrastructure/expiry/session-expiry.scheduler';
+import { PrismaService } from '@shared/infrastructure/database/prisma.service';
+import { EventBusService } from '@shared/infrastructure/events/event-bus.service';
+
+export interface SubmitAnswersResult {
+  sessionId: string;
+  answers: SubmitAnswerResult[];
+  score: number;
+  /**
+   * Completion summary when the session was completed with the answers
+   */
+  completion: CompleteQuizSessionResult | null;
+}
+
+/**
+ * Submit Answers Command Handler
+ *
+ * Handles a whole batch of answers in one request:
+ * 1. Load the session once
+ * 2. Load the answer keys of every referenced question in one query
+ * 3. Score the batch and submit it to the session aggregate (all or nothing)
+ * 4. Either buffer the answers in the session store, or complete a copy of
+ *    the session and flush it, its answers and QuizSessionCompletedEvent in
+ *    one transaction
+ * 5. Return per-answer results with the correct answers
+ */
+@Injectable()
+@CommandHandler(SubmitAnswersCommand)
+export class SubmitAnswersHandler
+  implements ICommandHandler<SubmitAnswersCommand, SubmitAnswersResult>
+{
+  constructor(
+    @Inject('IQuizSessionRepository')
+    private readonly sessionRepository: IQuizSessionRepository,
+    @Inject('IQuizSessionStore')
+    private readonly sessionStore: IQuizSessionStore,
+    @Inject('IQuestionRepository')
+    private readonly questionRepository: IQuestionRepository,
+    private readonly sessionExpiry: SessionExpiryScheduler,
+    private readonly prisma: PrismaService,
+    private readonly eventBus: EventBusService,
+  ) {}
+
+  async execute(command: SubmitAnswersCommand): Promise<SubmitAnswersResult> {
+    const questionIds = command.answers.map((a) => a.questionId);
+    if (new Set(questionIds).size !== questionIds.length) {
+      throw new BadRequestException('Each question can only be answered once');
+    }
+
+    // Get session (buffered copy first, database on a miss)
+    const current =
+      (await this.sessionStore.get(command.sessionId)) ??
+      (await this.sessionRepository.findById(command.sessionId));
+    if (!current) {
+      throw new NotFoundException('Quiz session not found');
+    }
+    // A completing batch works on a copy: the stored session is only
+    // replaced once the completion commits, so a failed flush can be retried
+    const session = command.complete ? current.copy() : current;
+
+    // Validate every answer against its question's answer key
+    const keys = await this.questionRepository.findAnswerKeys(questionIds);
+    const isCorrect = command.answers.map(({ questionId, answerId }) => {
+      const key = keys.get(questionId);
+      if (!key) {
+        throw new NotFoundException(`Question not found: ${questionId}`);
+      }
+      if (!key.answerIds.has(answerId)) {
+        throw new BadRequestException(`Invalid answer for question: ${questionId}`);
+      }
+      return answerId === key.correctAnswerId;
+    });
+
+    const scores = scoreAnswers(
+      command.answers.map(({ timeSpent }, i) => ({ isCorrect: isCorrect[i], timeSpent })),
+    );
+    const sessionAnswers: SessionAnswerData[] = command.answers.map((answer, i) => ({
+      questionId: answer.questionId,
+      answerId: answer.answerId,
+      isCorrect: isCorrect[i],
+      timeSpent: answer.timeSpent,
+      pointsEarned: scores[i].pointsEarned,
+      timeBonus: scores[i].timeBonus,
+    }));
+
+    try {
+      session.submitAnswers(sessionAnswers);
+    } catch (error) {
+      // Session already closed, expired, or a question answered before
+      throw new BadRequestException((error as Error).message);
+    }
+
+    let completion: CompleteQuizSessionResult | null = null;
+    if (command.complete) {
+      session.complete();
+
+      // Flush session, all answers and domain events in one transaction
+      const saved = await this.prisma.runInTransaction(async () => {
+        if (!(await this.sessionRepository.saveWithAnswers(session))) {
+          return false;
+        }
+        await this.eventBus.publishAll([...session.domainEvents]);
+        return true;
+      });
+      if (!saved) {
+        // Closed meanwhile, e.g. abandoned by the expiry sweep: drop the stale copy
+        await this.sessionStore.delete(session.id);
+        this.sessionExpiry.untrack(session.id);
+        throw new BadRequestException('Session is not in progress');
+      }
+      session.clearEvents();
+      await this.sessionStore.delete(session.id);
+      this.sessionExpiry.untrack(session.id);
+
+      completion = {
+        sessionId: session.id,
+        userId: session.userId,
+        score: session.score,
+        totalQuestions: session.totalQuestions,
+        correctAnswers: session.correctAnswers,
+        completedAt: session.completedAt!,
+      };
+    } else {
+      // Buffer the answers; they are flushed to the database on completion
+      for (const answer of sessionAnswers) {
+        await this.sessionStore.appendAnswer(session, answer);
+      }
+    }
+
+    return {
+      sessionId: session.id,
+      answers: sessionAnswers.map((answer) => ({
+        sessionId: session.id,
+        questionId: answer.questionId,
+        answerId: answer.answerId,
+        isCorrect: answer.isCorrect,
+        pointsEarned: answer.pointsEarned,
+        timeBonus: answer.timeBonus,
+        correctAnswerId: keys.get(answer.questionId)!.correctAnswerId,
+      })),
+      score: session.score,
+      completion,
+    };
+  }
+}
@@ -0,0 +1,42 @@
+import { Inject, Injectable, Logger } from '@nestjs/common';
+import { OnEvent } from '@nestjs/event-emitter';
+import { IQuestionRepository } from '../../domain/repositories/question.repository.interface';
+import { QuestionPoolService } from '../../infrastructure/cache/question-pool.service';
+
+/**
+ * Question Pool Refresh Handler (Quiz Context)
+ *
+ * Keeps the in-process question pools in sync when a question is created
+ * or its status changes (published / archived). The publisher does not wait
+ * for it, so a refresh never delays the admin request.
+ */
+@Injectable()
+export class QuestionPoolRefreshHandler {
+  private readonly logger = new Logger(QuestionPoolRefreshHandler.name);
+
+  constructor(
+    @Inject('IQuestionRepository')
+    private readonly questionRepository: IQuestionRepository,
+    private readonly questionPool: QuestionPoolService,
+  ) {}
+
+  @OnEvent('question.created', { async: true })
+  @OnEvent('question.status_changed', { async: true })
+  async handle(event: any) {
+    const { questionId } = event.props;
+
+    try {
+      const question = await this.questionRepository.findById(questionId);
+
+      if (!question) {
+        this.questionPool.remove(questionId);
+        return;
+      }
+
+      this.questionPool.refresh(question);
+    } catch (error) {
+      this.logger.error(`Failed to refresh question pool for question: ${questionId}`, error);
+      this.questionPool.invalidate(event.props.difficultyId, event.props.categoryId);
+    }
+  }
+}
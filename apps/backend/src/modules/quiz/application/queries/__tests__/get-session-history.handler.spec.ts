@@ -0,0 +1,76 @@
+import { BadRequestException } from '@nestjs/common';
+import { GetSessionHistoryHandler } from '../get-session-history.handler';
+import { GetSessionHistoryQuery } from '../get-session-history.query';
+import {
+  IQuizSessionRepository,
+  QuizSessionSummary,
+} from '../../../domain/repositories/quiz-session.repository.interface';
+import { SessionStatus } from '../../../domain/aggregates/quiz-session.aggregate';
+
+describe('GetSessionHistoryHandler', () => {
+  let findHistory: jest.Mock;
+  let handler: GetSessionHistoryHandler;
+
+  const summary = (id: string, startedAt: string): QuizSessionSummary => ({
+    id,
+    categoryId: null,
+    difficultyId: 'diff-1',
+    status: SessionStatus.COMPLETED,
+    score: 120,
+    correctAnswers: 7,
+    totalQuestions: 10,
+    startedAt: new Date(startedAt),
+    completedAt: new Date(startedAt),
+  });
+
+  beforeEach(() => {
+    findHistory = jest.fn();
+    handler = new GetSessionHistoryHandler({ findHistory } as unknown as IQuizSessionRepository);
+  });
+
+  it('should return a page and a cursor when more sessions follow', async () => {
+    findHistory.mockResolvedValue([
+      summary('s3', '2026-10-03T10:00:00Z'),
+      summary('s2', '2026-10-02T10:00:00Z'),
+      summary('s1', '2026-10-01T10:00:00Z'),
+    ]);
+
+    const page = await handler.execute(new GetSessionHistoryQuery('user-1', 2));
+
+    expect(findHistory).toHaveBeenCalledWith({
+      userId: 'user-1',
+      status: undefined,
+      limit: 3,
+      before: undefined,
+    });
+    expect(page.items.map((item) => item.id)).toEqual(['s3', 's2']);
+    expect(page.nextCursor).not.toBeNull();
+  });
+
+  it('should continue before the cursor position', async () => {
+    findHistory.mockResolvedValueOnce([
+      summary('s3', '2026-10-03T10:00:00Z'),
+      summary('s2', '2026-10-02T10:00:00Z'),
+      summary('s1', '2026-10-01T10:00:00Z'),
+    ]);
+    const first = await handler.execute(new GetSessionHistoryQuery('user-1', 2));
+
+    findHistory.mockResolvedValueOnce([summary('s1', '2026-10-01T10:00:00Z')]);
+    const second = await handler.execute(
+      new GetSessionHistoryQuery('user-1', 2, first.nextCursor!),
+    );
+
+    expect(findHistory).toHaveBeenLastCalledWith(
+      expect.objectContaining({
+        before: { startedAt: new Date('2026-10-02T10:00:00Z'), id: 's2' },
+      }),
+    );
+    expect(second.nextCursor).toBeNull();
+  });
+
+  it('should reject a malformed cursor', async () => {
+    await expect(
+      handler.execute(new GetSessionHistoryQuery('user-1', 2, 'not-a-cursor')),
+    ).rejects.toBeInstanceOf(BadRequestException);
+  });
+});
@@ -0,0 +1,56 @@
+import { BadRequestException } from '@nestjs/common';
+import { SearchQuestionsHandler } from '../search-questions.handler';
+import { SearchQuestionsQuery } from '../search-questions.query';
+import {
+  IQuestionRepository,
+  QuestionSearchHit,
+} from '../../../domain/repositories/question.repository.interface';
+import { QuestionStatus } from '../../../domain/aggregates/question.aggregate';
+
+describe('SearchQuestionsHandler', () => {
+  let search: jest.Mock;
+  let handler: SearchQuestionsHandler;
+
+  const hit = (id: string, rank: number): QuestionSearchHit => ({
+    id,
+    text: `Question ${id}`,
+    categoryId: 'cat-1',
+    difficultyId: 'diff-1',
+    status: QuestionStatus.PUBLISHED,
+    rank,
+  });
+
+  beforeEach(() => {
+    search = jest.fn();
+    handler = new SearchQuestionsHandler({ search } as unknown as IQuestionRepository);
+  });
+
+  it('should return a page and a cursor when more hits follow', async () => {
+    search.mockResolvedValue([hit('q1', 0.9), hit('q2', 0.5), hit('q3', 0.4)]);
+
+    const page = await handler.execute(new SearchQuestionsQuery('ganache', 2));
+
+    expect(search).toHaveBeenCalledWith(expect.objectContaining({ text: 'ganache', limit: 3 }));
+    expect(page.items.map((item) => item.id)).toEqual(['q1', 'q2']);
+    expect(page.nextCursor).not.toBeNull();
+  });
+
+  it('should continue after the cursor position', async () => {
+    search.mockResolvedValueOnce([hit('q1', 0.9), hit('q2', 0.5), hit('q3', 0.4)]);
+    const first = await handler.execute(new SearchQuestionsQuery('ganache', 2));
+
+    search.mockResolvedValueOnce([hit('q3', 0.4)]);
+    const second = await handler.execute(new SearchQuestionsQuery('ganache', 2, first.nextCursor!));
+
+    expect(search).toHaveBeenLastCalledWith(
+      expect.objectContaining({ after: { rank: 0.5, id: 'q2' } }),
+    );
+    expect(second.nextCursor).toBeNull();
+  });
+
+  it('should reject a malformed cursor', async () => {
+    await expect(
+      handler.execute(new SearchQuestionsQuery('ganache', 2, 'not-a-cursor')),
+    ).rejects.toBeInstanceOf(BadRequestException);
+  });
+});
@@ -0,0 +1,60 @@
+import { QueryHandler, IQueryHandler } from '@nestjs/cqrs';
+import { BadRequestException, Inject, Injectable } from '@nestjs/common';
+import { GetSessionHistoryQuery } from './get-session-history.query';
+import {
+  IQuizSessionRepository,
+  QuizSessionSummary,
+} from '../../domain/repositories/quiz-session.repository.interface';
+import { decodeCursor, encodeCursor } from '@shared/infrastructure/pagination/keyset-cursor';
+
+export interface SessionHistoryResult {
+  items: QuizSessionSummary[];
+  nextCursor: string | null;
+}
+
+/**
+ * Get Session History Query Handler
+ *
+ * A player's sessions, most recent first. Reads the summary columns of
+ * quiz_sessions only (score and answer counts are written at completion),
+ * keyset-paginated on (startedAt, id).
+ */
+@Injectable()
+@QueryHandler(GetSessionHistoryQuery)
+export class GetSessionHistoryHandler
+  implements IQueryHandler<GetSessionHistoryQuery, SessionHistoryResult>
+{
+  constructor(
+    @Inject('IQuizSessionRepository')
+    private readonly sessionRepository: IQuizSessionRepository,
+  ) {}
+
+  async execute(query: GetSessionHistoryQuery): Promise<SessionHistoryResult> {
+    const sessions = await this.sessionRepository.findHistory({
+      userId: query.userId,
+      status: query.status,
+      limit: query.limit + 1,
+      before: query.cursor ? this.parseCursor(query.cursor) : undefined,
+    });
+
+    const items = sessions.slice(0, query.limit);
+    const last = items[items.length - 1];
+
+    return {
+      items,
+      nextCursor:
+        sessions.length > query.limit
+          ? encodeCursor([last.startedAt.toISOString(), last.id])
+          : null,
+    };
+  }
+
+  private parseCursor(cursor: string): { startedAt: Date; id: string } {
+    const [startedAt, id] = decodeCursor(cursor) ?? [];
+    const date = typeof startedAt === 'string' ? new Date(startedAt) : null;
+    if (!date || isNaN(date.getTime()) || typeof id !== 'string') {
+      throw new BadRequestException('Invalid cursor');
+    }
+    return { startedAt: date, id };
+  }
+}
@@ -0,0 +1,10 @@
+import { SessionStatus } from '../../domain/aggregates/quiz-session.aggregate';
+
+export class GetSessionHistoryQuery {
+  constructor(
+    public readonly userId: string,
+    public readonly limit: number = 20,
+    public readonly cursor?: string,
+    public readonly status?: SessionStatus,
+  ) {}
+}
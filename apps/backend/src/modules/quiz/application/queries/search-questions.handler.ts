@@ -0,0 +1,59 @@
+import { QueryHandler, IQueryHandler } from '@nestjs/cqrs';
+import { BadRequestException, Inject, Injectable } from '@nestjs/common';
+import { SearchQuestionsQuery } from './search-questions.query';
+import {
+  IQuestionRepository,
+  QuestionSearchHit,
+} from '../../domain/repositories/question.repository.interface';
+import { decodeCursor, encodeCursor } from '@shared/infrastructure/pagination/keyset-cursor';
+
+export interface SearchQuestionsResult {
+  items: QuestionSearchHit[];
+  nextCursor: string | null;
+}
+
+/**
+ * Search Questions Query Handler
+ *
+ * Ranked search for admin content tooling. Pages are keyset-paginated on
+ * (rank, id): the cursor is the last hit of the previous page, so deep
+ * pages cost the same as the first one and nothing beyond a page is
+ * loaded into memory.
+ */
+@Injectable()
+@QueryHandler(SearchQuestionsQuery)
+export class SearchQuestionsHandler
+  implements IQueryHandler<SearchQuestionsQuery, SearchQuestionsResult>
+{
+  constructor(
+    @Inject('IQuestionRepository')
+    private readonly questionRepository: IQuestionRepository,
+  ) {}
+
+  async execute(query: SearchQuestionsQuery): Promise<SearchQuestionsResult> {
+    const hits = await this.questionRepository.search({
+      text: query.text,
+      categoryId: query.categoryId,
+      difficultyId: query.difficultyId,
+      status: query.status,
+      limit: query.limit + 1,
+      after: query.cursor ? this.parseCursor(query.cursor) : undefined,
+    });
+
+    const items = hits.slice(0, query.limit);
+    const last = items[items.length - 1];
+
+    return {
+      items,
+      nextCursor: hits.length > query.limit ? encodeCursor([last.rank, last.id]) : null,
+    };
+  }
+
+  private parseCursor(cursor: string): { rank: number; id: string } {
+    const [rank, id] = decodeCursor(cursor) ?? [];
+    if (typeof rank !== 'number' || typeof id !== 'string') {
+      throw new BadRequestException('Invalid cursor');
+    }
+    return { rank, id };
+  }
+}
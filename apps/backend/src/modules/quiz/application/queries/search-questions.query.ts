@@ -0,0 +1,12 @@
+import { QuestionStatus } from '../../domain/aggregates/question.aggregate';
+
+export class SearchQuestionsQuery {
+  constructor(
+    public readonly text: string,
+    public readonly limit: number = 20,
+    public readonly cursor?: string,
+    public readonly categoryId?: string,
+    public readonly difficultyId?: string,
+    public readonly status?: QuestionStatus,
+  ) {}
+}
@@ -137,6 +137,25 @@ describe('Question Aggregate', () => {
       expect(question.status).toBe(QuestionStatus.PUBLISHED);
     });
 
+    it('should emit QuestionStatusChangedEvent', () => {
+      const answers = createValidAnswers();
+      const question = Question.create(
+        'q-123',
+        validText,
+        validExplanation,
+        categoryId,
+        difficultyId,
+        userId,
+        answers,
+      );
+      question.clearEvents();
+
+      question.publish();
+
+      expect(question.domainEvents).toHaveLength(1);
+      expect(question.domainEvents[0].eventName).toBe('question.status_changed');
+    });
+
     it('should throw error if already published', () => {
       const answers = createValidAnswers();
       const question = Question.create(
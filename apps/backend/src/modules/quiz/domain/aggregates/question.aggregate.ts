@@ -3,6 +3,7 @@ import { QuestionText } from '../value-objects/question-text.vo';
 import { Explanation } from '../value-objects/explanation.vo';
 import { Answer } from '../entities/answer.entity';
 import { QuestionCreatedEvent } from '../events/question-created.event';
+import { QuestionStatusChangedEvent } from '../events/question-status-changed.event';
 
 export enum QuestionStatus {
   DRAFT = 'DRAFT',
@@ -139,8 +140,7 @@ export class Question extends AggregateRoot<string> {
       throw new Error('Cannot publish archived question');
     }
 
-    this.props.status = QuestionStatus.PUBLISHED;
-    this.props.updatedAt = new Date();
+    this.changeStatus(QuestionStatus.PUBLISHED);
   }
 
   archive(): void {
@@ -148,8 +148,26 @@ export class Question extends AggregateRoot<string> {
       throw new Error('Question is already archived');
     }
 
-    this.props.status = QuestionStatus.ARCHIVED;
-    this.props.updatedAt = new Date();
+    this.changeStatus(QuestionStatus.ARCHIVED);
+  }
+
+  private changeStatus(newStatus: QuestionStatus): void {
+    const previousStatus = this.props.status;
+    const now = new Date();
+
+    this.props.status = newStatus;
+    this.props.updatedAt = now;
+
+    this.addDomainEvent(
+      new QuestionStatusChangedEvent({
+        questionId: this.props.id,
+        categoryId: this.props.categoryId,
+        difficultyId: this.props.difficultyId,
+        previousStatus,
+        newStatus,
+        occurredAt: now,
+      }),
+    );
   }
 
   isPublished(): boolean {
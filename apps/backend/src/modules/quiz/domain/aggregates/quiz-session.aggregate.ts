@@ -70,6 +70,14 @@ export class QuizSession extends AggregateRoot<string> {
     return this.props.answers;
   }
 
+  get correctAnswers(): number {
+    return this.props.answers.filter((a) => a.isCorrect).length;
+  }
+
+  get totalQuestions(): number {
+    return this.props.answers.length;
+  }
+
   get startedAt(): Date {
     return this.props.startedAt;
   }
@@ -129,6 +137,14 @@ export class QuizSession extends AggregateRoot<string> {
   }
 
   submitAnswer(answer: SessionAnswerData): void {
+    this.submitAnswers([answer]);
+  }
+
+  /**
+   * Record several answers at once: either all of them are accepted or,
+   * if one is rejected, none is
+   */
+  submitAnswers(answers: readonly SessionAnswerData[]): void {
     if (this.props.status !== SessionStatus.IN_PROGRESS) {
       throw new Error('Cannot submit answer for completed or abandoned session');
     }
@@ -139,15 +155,18 @@ export class QuizSession extends AggregateRoot<string> {
     }
 
     // Check if answer already submitted for this question
-    const existingAnswer = this.props.answers.find(
-      (a) => a.questionId === answer.questionId,
-    );
-    if (existingAnswer) {
-      throw new Error('Answer already submitted for this question');
+    const answered = new Set(this.props.answers.map((a) => a.questionId));
+    for (const answer of answers) {
+      if (answered.has(answer.questionId)) {
+        throw new Error('Answer already submitted for this question');
+      }
+      answered.add(answer.questionId);
     }
 
-    this.props.answers.push(answer);
-    this.props.score += answer.pointsEarned + answer.timeBonus;
+    for (const answer of answers) {
+      this.props.answers.push(answer);
+      this.props.score += answer.pointsEarned + answer.timeBonus;
+    }
     this.props.updatedAt = new Date();
   }
 
@@ -161,11 +180,14 @@ export class QuizSession extends AggregateRoot<string> {
     this.props.completedAt = now;
     this.props.updatedAt = now;
 
-    const correctAnswers = this.props.answers.filter((a) => a.isCorrect).length;
     const totalPoints = this.props.answers.reduce(
       (sum, a) => sum + a.pointsEarned + a.timeBonus,
       0,
     );
+    const averageTimeSpent =
+      this.totalQuestions > 0
+        ? this.props.answers.reduce((sum, a) => sum + a.timeSpent, 0) / this.totalQuestions
+        : 0;
 
     this.addDomainEvent(
       new QuizSessionCompletedEvent({
@@ -174,9 +196,10 @@ export class QuizSession extends AggregateRoot<string> {
         categoryId: this.props.categoryId,
         difficultyId: this.props.difficultyId,
         score: this.props.score,
-        totalQuestions: this.props.answers.length,
-        correctAnswers,
+        totalQuestions: this.totalQuestions,
+        correctAnswers: this.correctAnswers,
         totalPoints,
+        averageTimeSpent,
         occurredAt: now,
       }),
     );
@@ -200,6 +223,14 @@ export class QuizSession extends AggregateRoot<string> {
     return this.props.status === SessionStatus.IN_PROGRESS && !this.isExpired();
   }
 
+  /**
+   * A detached copy without pending events: changes to it leave this
+   * session untouched until the copy replaces it
+   */
+  copy(): QuizSession {
+    return new QuizSession({ ...this.props, answers: [...this.props.answers] });
+  }
+
   static fromPersistence(props: QuizSessionProps): QuizSession {
     return new QuizSession(props);
   }
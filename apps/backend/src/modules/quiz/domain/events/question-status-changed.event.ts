@@ -0,0 +1,46 @@
+import { DomainEvent } from '@shared/domain/base/domain-event.base';
+
+export interface QuestionStatusChangedEventProps {
+  questionId: string;
+  categoryId: string;
+  difficultyId: string;
+  previousStatus: string;
+  newStatus: string;
+  occurredAt: Date;
+}
+
+/**
+ * Question Status Changed Domain Event
+ *
+ * Published when a question is published or archived.
+ * Used to keep the in-process question pools in sync with the database.
+ */
+export class QuestionStatusChangedEvent extends DomainEvent {
+  constructor(public readonly props: QuestionStatusChangedEventProps) {
+    super('question.status_changed');
+  }
+
+  getAggregateId(): string {
+    return this.props.questionId;
+  }
+
+  get questionId(): string {
+    return this.props.questionId;
+  }
+
+  get categoryId(): string {
+    return this.props.categoryId;
+  }
+
+  get difficultyId(): string {
+    return this.props.difficultyId;
+  }
+
+  get previousStatus(): string {
+    return this.props.previousStatus;
+  }
+
+  get newStatus(): string {
+    return this.props.newStatus;
+  }
+}
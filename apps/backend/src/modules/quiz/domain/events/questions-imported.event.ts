@@ -0,0 +1,34 @@
+import { DomainEvent } from '@shared/domain/base/domain-event.base';
+
+export interface QuestionsImportedEventProps {
+  importId: string;
+  questionIds: string[];
+  categoryIds: string[];
+  difficultyIds: string[];
+  createdById: string;
+  occurredAt: Date;
+}
+
+/**
+ * Questions Imported Domain Event
+ *
+ * Published once per chunk committed by a bulk import, in place of one
+ * QuestionCreatedEvent per question. Imported questions start as drafts.
+ */
+export class QuestionsImportedEvent extends DomainEvent {
+  constructor(public readonly props: QuestionsImportedEventProps) {
+    super('questions.imported');
+  }
+
+  getAggregateId(): string {
+    return this.props.importId;
+  }
+
+  get questionIds(): string[] {
+    return this.props.questionIds;
+  }
+
+  get createdById(): string {
+    return this.props.createdById;
+  }
+}
@@ -0,0 +1,36 @@
+import { DomainEvent } from '@shared/domain/base/domain-event.base';
+
+export interface QuizSessionAbandonedEventProps {
+  sessionId: string;
+  userId: string;
+  reason: 'expired';
+  occurredAt: Date;
+}
+
+/**
+ * Quiz Session Abandoned Domain Event
+ *
+ * Published when an in-progress session is closed without completion
+ * (it reached its expiry time).
+ */
+export class QuizSessionAbandonedEvent extends DomainEvent {
+  constructor(public readonly props: QuizSessionAbandonedEventProps) {
+    super('quiz.session.abandoned');
+  }
+
+  getAggregateId(): string {
+    return this.props.sessionId;
+  }
+
+  get sessionId(): string {
+    return this.props.sessionId;
+  }
+
+  get userId(): string {
+    return this.props.userId;
+  }
+
+  get reason(): string {
+    return this.props.reason;
+  }
+}
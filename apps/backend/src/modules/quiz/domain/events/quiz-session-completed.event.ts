@@ -9,6 +9,10 @@ export interface QuizSessionCompletedEventProps {
   totalQuestions: number;
   correctAnswers: number;
   totalPoints: number;
+  /**
+   * Average time per answer in milliseconds
+   */
+  averageTimeSpent: number;
   occurredAt: Date;
 }
 
@@ -1,5 +1,51 @@
 import { Question, QuestionStatus } from '../aggregates/question.aggregate';
 
+export interface QuestionSearchCriteria {
+  text: string;
+  categoryId?: string;
+  difficultyId?: string;
+  status?: QuestionStatus;
+  limit: number;
+  /**
+   * Keyset position: return hits ranked after this one
+   */
+  after?: { rank: number; id: string };
+}
+
+export interface QuestionSearchHit {
+  id: string;
+  text: string;
+  categoryId: string;
+  difficultyId: string;
+  status: QuestionStatus;
+  rank: number;
+}
+
+export interface NearDuplicate {
+  /**
+   * Position of the candidate text in the input
+   */
+  index: number;
+  /**
+   * Existing question it resembles; null when it resembles an earlier text
+   * of the input instead
+   */
+  questionId: string | null;
+  /**
+   * Position of the earlier input text it resembles, when questionId is null
+   */
+  candidateIndex: number | null;
+  similarity: number;
+}
+
+/**
+ * Answers of a question, for scoring without loading the question
+ */
+export interface QuestionAnswerKey {
+  answerIds: Set<string>;
+  correctAnswerId: string;
+}
+
 /**
  * Question Repository Interface
  *
@@ -7,13 +53,28 @@ import { Question, QuestionStatus } from '../aggregates/question.aggregate';
  */
 export interface IQuestionRepository {
   save(question: Question): Promise<void>;
+  /**
+   * Insert new questions and their answers with one multi-row insert each
+   */
+  saveMany(questions: Question[]): Promise<void>;
+  /**
+   * Ranked full-text and fuzzy search without loading answers, ordered by
+   * rank descending then id
+   */
+  search(criteria: QuestionSearchCriteria): Promise<QuestionSearchHit[]>;
+  /**
+   * For each candidate text, the most similar existing question or earlier
+   * candidate whose trigram similarity is at least `threshold`
+   */
+  findNearDuplicates(texts: string[], threshold: number): Promise<NearDuplicate[]>;
   findById(id: string): Promise<Question | null>;
+  /**
+   * Answer keys of the given questions, in one query; unknown questions
+   * (or questions without a correct answer) are absent from the map
+   */
+  findAnswerKeys(questionIds: string[]): Promise<Map<string, QuestionAnswerKey>>;
   findByCategory(categoryId: string, status?: QuestionStatus): Promise<Question[]>;
   findByDifficulty(difficultyId: string, status?: QuestionStatus): Promise<Question[]>;
-  findRandomQuestions(
-    difficultyId: string,
-    categoryId: string | null,
-    count: number,
-  ): Promise<Question[]>;
+  findPublished(difficultyId: string, categoryId: string | null): Promise<Question[]>;
   delete(id: string): Promise<void>;
 }
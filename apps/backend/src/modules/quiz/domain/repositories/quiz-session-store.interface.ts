@@ -0,0 +1,19 @@
+import { QuizSession, SessionAnswerData } from '../aggregates/quiz-session.aggregate';
+
+/**
+ * Quiz Session Store Interface
+ *
+ * Holds in-progress quiz sessions between start and completion so answers
+ * can be buffered without a database round trip per submission.
+ * Completed sessions are flushed through IQuizSessionRepository.
+ */
+export interface IQuizSessionStore {
+  get(sessionId: string): Promise<QuizSession | null>;
+  put(session: QuizSession): Promise<void>;
+  appendAnswer(session: QuizSession, answer: SessionAnswerData): Promise<void>;
+  delete(sessionId: string): Promise<void>;
+  /**
+   * Ids of every session held
+   */
+  ids(): Promise<string[]>;
+}
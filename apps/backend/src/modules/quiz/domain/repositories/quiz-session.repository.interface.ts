@@ -1,5 +1,39 @@
 import { QuizSession, SessionStatus } from '../aggregates/quiz-session.aggregate';
 
+/**
+ * Read model of a session for history screens (no answers)
+ */
+export interface QuizSessionSummary {
+  id: string;
+  categoryId: string | null;
+  difficultyId: string;
+  status: SessionStatus;
+  score: number;
+  correctAnswers: number;
+  totalQuestions: number;
+  startedAt: Date;
+  completedAt: Date | null;
+}
+
+export interface QuizSessionHistoryCriteria {
+  userId: string;
+  status?: SessionStatus;
+  limit: number;
+  /**
+   * Keyset position: return sessions started before this one
+   */
+  before?: { startedAt: Date; id: string };
+}
+
+/**
+ * Session closed by the expiry sweep
+ */
+export interface ExpiredSession {
+  id: string;
+  userId: string;
+  expiresAt: Date;
+}
+
 /**
  * Quiz Session Repository Interface
  *
@@ -7,8 +41,40 @@ import { QuizSession, SessionStatus } from '../aggregates/quiz-session.aggregate
  */
 export interface IQuizSessionRepository {
   save(session: QuizSession): Promise<void>;
+  /**
+   * Write a session closed from the buffered copy, with its answers, if it
+   * is still IN_PROGRESS in the database; false (and nothing written) when
+   * it was closed meanwhile, e.g. abandoned by the expiry sweep
+   */
+  saveWithAnswers(session: QuizSession): Promise<boolean>;
   findById(id: string): Promise<QuizSession | null>;
-  findByUserId(userId: string, status?: SessionStatus): Promise<QuizSession[]>;
+  /**
+   * Most recent sessions first, keyset-paginated on (startedAt, id)
+   */
+  findHistory(criteria: QuizSessionHistoryCriteria): Promise<QuizSessionSummary[]>;
+  /**
+   * The user's IN_PROGRESS session. Expired sessions are abandoned by the
+   * expiry sweep, so the status alone is checked.
+   */
   findActiveByUserId(userId: string): Promise<QuizSession | null>;
+  /**
+   * Deadlines of every IN_PROGRESS session that has not expired yet
+   */
+  findPendingExpiries(): Promise<{ id: string; expiresAt: Date }[]>;
+  /**
+   * Mark expired IN_PROGRESS sessions as ABANDONED, either the given ones
+   * or up to `limit` of any, in one statement; returns the sessions closed.
+   * Sessions that were completed or have not expired yet are left as is.
+   */
+  abandonExpired(sessionIds: string[] | null, limit: number): Promise<ExpiredSession[]>;
+  /**
+   * Write the buffered answers and score of sessions without changing their
+   * status, in one transaction
+   */
+  saveAnswers(sessions: QuizSession[]): Promise<void>;
+  /**
+   * Of the given sessions, those no longer IN_PROGRESS (or deleted)
+   */
+  findClosedIds(sessionIds: string[]): Promise<string[]>;
   delete(id: string): Promise<void>;
 }
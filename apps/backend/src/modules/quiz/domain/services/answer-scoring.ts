@@ -0,0 +1,37 @@
+/**
+ * Answer Scoring
+ *
+ * Points of an answer: BASE_POINTS when correct, plus a time bonus that
+ * decreases linearly from MAX_TIME_BONUS (instant answer) to 0 at
+ * TIME_BONUS_THRESHOLD_MS. Wrong answers score nothing.
+ */
+export const BASE_POINTS = 100;
+export const MAX_TIME_BONUS = 50;
+export const TIME_BONUS_THRESHOLD_MS = 5000;
+
+export interface AnswerScore {
+  pointsEarned: number;
+  timeBonus: number;
+}
+
+export function scoreAnswer(isCorrect: boolean, timeSpent: number): AnswerScore {
+  if (!isCorrect) {
+    return { pointsEarned: 0, timeBonus: 0 };
+  }
+
+  const timeBonus =
+    timeSpent < TIME_BONUS_THRESHOLD_MS
+      ? Math.floor(MAX_TIME_BONUS * (1 - timeSpent / TIME_BONUS_THRESHOLD_MS))
+      : 0;
+
+  return { pointsEarned: BASE_POINTS, timeBonus };
+}
+
+/**
+ * Score a batch of answers, in order
+ */
+export function scoreAnswers(
+  answers: readonly { isCorrect: boolean; timeSpent: number }[],
+): AnswerScore[] {
+  return answers.map(({ isCorrect, timeSpent }) => scoreAnswer(isCorrect, timeSpent));
+}
@@ -0,0 +1,110 @@
+import { QuestionPoolService } from '../question-pool.service';
+import { IQuestionRepository } from '../../../domain/repositories/question.repository.interface';
+import { Question, QuestionStatus } from '../../../domain/aggregates/question.aggregate';
+import { QuestionText } from '../../../domain/value-objects/question-text.vo';
+import { Explanation } from '../../../domain/value-objects/explanation.vo';
+import { Answer } from '../../../domain/entities/answer.entity';
+
+describe('QuestionPoolService', () => {
+  const difficultyId = 'diff-123';
+  const categoryId = 'cat-123';
+
+  const buildQuestion = (id: string, status = QuestionStatus.PUBLISHED, category = categoryId) =>
+    Question.fromPersistence({
+      id,
+      text: QuestionText.create(`Question number ${id}?`),
+      explanation: Explanation.create('An explanation that is long enough to be valid.'),
+      imageUrl: null,
+      categoryId: category,
+      difficultyId,
+      status,
+      createdById: 'user-123',
+      answers: [Answer.create(`${id}-a1`, 'Yes', true), Answer.create(`${id}-a2`, 'No', false)],
+      createdAt: new Date(),
+      updatedAt: new Date(),
+    });
+
+  let repository: jest.Mocked<IQuestionRepository>;
+  let service: QuestionPoolService;
+
+  beforeEach(() => {
+    repository = {
+      save: jest.fn(),
+      saveMany: jest.fn(),
+      search: jest.fn(),
+      findNearDuplicates: jest.fn(),
+      findById: jest.fn(),
+      findAnswerKeys: jest.fn(),
+      findByCategory: jest.fn(),
+      findByDifficulty: jest.fn(),
+      findPublished: jest.fn(),
+      delete: jest.fn(),
+    };
+    service = new QuestionPoolService(repository);
+  });
+
+  describe('sample', () => {
+    it('should return distinct questions from the pool', async () => {
+      repository.findPublished.mockResolvedValue(
+        Array.from({ length: 20 }, (_, i) => buildQuestion(`q-${i}`)),
+      );
+
+      const sample = await service.sample(difficultyId, categoryId, 10);
+
+      expect(sample).toHaveLength(10);
+      expect(new Set(sample.map((q) => q.id)).size).toBe(10);
+    });
+
+    it('should load each pool only once', async () => {
+      repository.findPublished.mockResolvedValue([buildQuestion('q-1'), buildQuestion('q-2')]);
+
+      await Promise.all([
+        service.sample(difficultyId, categoryId, 1),
+        service.sample(difficultyId, categoryId, 1),
+      ]);
+      await service.sample(difficultyId, categoryId, 1);
+
+      expect(repository.findPublished).toHaveBeenCalledTimes(1);
+    });
+
+    it('should return the whole pool when it is smaller than requested', async () => {
+      repository.findPublished.mockResolvedValue([buildQuestion('q-1'), buildQuestion('q-2')]);
+
+      const sample = await service.sample(difficultyId, categoryId, 10);
+
+      expect(sample).toHaveLength(2);
+    });
+  });
+
+  describe('refresh', () => {
+    it('should add newly published questions to loaded pools', async () => {
+      repository.findPublished.mockResolvedValue([buildQuestion('q-1')]);
+      await service.sample(difficultyId, categoryId, 1);
+
+      service.refresh(buildQuestion('q-2'));
+
+      const sample = await service.sample(difficultyId, categoryId, 10);
+      expect(sample.map((q) => q.id).sort()).toEqual(['q-1', 'q-2']);
+    });
+
+    it('should drop archived questions from loaded pools', async () => {
+      repository.findPublished.mockResolvedValue([buildQuestion('q-1'), buildQuestion('q-2')]);
+      await service.sample(difficultyId, categoryId, 1);
+
+      service.refresh(buildQuestion('q-1', QuestionStatus.ARCHIVED));
+
+      const sample = await service.sample(difficultyId, categoryId, 10);
+      expect(sample.map((q) => q.id)).toEqual(['q-2']);
+    });
+
+    it('should ignore pools of other categories', async () => {
+      repository.findPublished.mockResolvedValue([buildQuestion('q-1')]);
+      await service.sample(difficultyId, categoryId, 1);
+
+      service.refresh(buildQuestion('q-2', QuestionStatus.PUBLISHED, 'cat-other'));
+
+      const sample = await service.sample(difficultyId, categoryId, 10);
+      expect(sample.map((q) => q.id)).toEqual(['q-1']);
+    });
+  });
+});
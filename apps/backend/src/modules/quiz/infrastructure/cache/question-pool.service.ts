@@ -0,0 +1,169 @@
+import { Injectable, Inject, Logger } from '@nestjs/common';
+import { IQuestionRepository } from '../../domain/repositories/question.repository.interface';
+import { Question } from '../../domain/aggregates/question.aggregate';
+
+interface QuestionPool {
+  questions: Question[];
+  positions: Map<string, number>;
+  loadedAt: number;
+}
+
+/**
+ * Question Pool Service
+ *
+ * Keeps an in-process pool of published questions (with their answers)
+ * per (difficultyId, categoryId). A pool keyed without category holds every
+ * published question of the difficulty.
+ *
+ * Sampling is a partial Fisher-Yates shuffle over the pool array, so drawing
+ * k questions costs O(k) and never touches the database once the pool is warm.
+ * Pools are kept in sync by QuestionPoolRefreshHandler and reloaded in the
+ * background after POOL_TTL_MS to pick up changes made by other instances.
+ */
+@Injectable()
+export class QuestionPoolService {
+  private static readonly POOL_TTL_MS = 5 * 60 * 1000;
+  private static readonly ALL_CATEGORIES = '*';
+
+  private readonly logger = new Logger(QuestionPoolService.name);
+  private readonly pools = new Map<string, QuestionPool>();
+  private readonly loading = new Map<string, Promise<QuestionPool>>();
+
+  constructor(
+    @Inject('IQuestionRepository')
+    private readonly questionRepository: IQuestionRepository,
+  ) {}
+
+  /**
+   * Draw `count` distinct random questions (fewer if the pool is smaller)
+   */
+  async sample(
+    difficultyId: string,
+    categoryId: string | null,
+    count: number,
+  ): Promise<Question[]> {
+    const pool = await this.getPool(difficultyId, categoryId);
+    const size = pool.questions.length;
+    const picks = Math.min(count, size);
+
+    // Move `picks` random questions to the tail of the array
+    for (let i = 0; i < picks; i++) {
+      const last = size - 1 - i;
+      const j = Math.floor(Math.random() * (last + 1));
+      this.swap(pool, j, last);
+    }
+
+    return pool.questions.slice(size - picks);
+  }
+
+  /**
+   * Apply the current state of a question to every loaded pool it belongs to
+   */
+  refresh(question: Question): void {
+    this.remove(question.id);
+
+    if (!question.isPublished()) {
+      return;
+    }
+
+    const keys = [
+      this.key(question.difficultyId, question.categoryId),
+      this.key(question.difficultyId, null),
+    ];
+
+    for (const key of keys) {
+      const pool = this.pools.get(key);
+      if (pool) {
+        pool.positions.set(question.id, pool.questions.length);
+        pool.questions.push(question);
+      }
+    }
+  }
+
+  /**
+   * Drop a question from every loaded pool
+   */
+  remove(questionId: string): void {
+    for (const pool of this.pools.values()) {
+      const position = pool.positions.get(questionId);
+      if (position === undefined) {
+        continue;
+      }
+
+      this.swap(pool, position, pool.questions.length - 1);
+      pool.questions.pop();
+      pool.positions.delete(questionId);
+    }
+  }
+
+  /**
+   * Forget the pools for a difficulty/category so they are reloaded on next use
+   */
+  invalidate(difficultyId: string, categoryId: string | null): void {
+    this.pools.delete(this.key(difficultyId, categoryId));
+    this.pools.delete(this.key(difficultyId, null));
+  }
+
+  private async getPool(difficultyId: string, categoryId: string | null): Promise<QuestionPool> {
+    const key = this.key(difficultyId, categoryId);
+    const pool = this.pools.get(key);
+
+    if (!pool) {
+      return this.load(key, difficultyId, categoryId);
+    }
+
+    // Serve the current pool and refresh it in the background once stale
+    if (Date.now() - pool.loadedAt > QuestionPoolService.POOL_TTL_MS) {
+      this.load(key, difficultyId, categoryId).catch((error) =>
+        this.logger.error(`Failed to reload question pool ${key}`, error),
+      );
+    }
+
+    return pool;
+  }
+
+  private load(
+    key: string,
+    difficultyId: string,
+    categoryId: string | null,
+  ): Promise<QuestionPool> {
+    const inFlight = this.loading.get(key);
+    if (inFlight) {
+      return inFlight;
+    }
+
+    const promise = this.questionRepository
+      .findPublished(difficultyId, categoryId)
+      .then((questions) => {
+        const pool: QuestionPool = {
+          questions,
+          positions: new Map(questions.map((q, index) => [q.id, index])),
+          loadedAt: Date.now(),
+        };
+        this.pools.set(key, pool);
+        this.logger.log(`Loaded question pool ${key} (${questions.length} questions)`);
+        return pool;
+      })
+      .finally(() => this.loading.delete(key));
+
+    this.loading.set(key, promise);
+    return promise;
+  }
+
+  private swap(pool: QuestionPool, i: number, j: number): void {
+    if (i === j) {
+      return;
+    }
+
+    const a = pool.questions[i];
+    const b = pool.questions[j];
+    pool.questions[i] = b;
+    pool.questions[j] = a;
+    pool.positions.set(b.id, i);
+    pool.positions.set(a.id, j);
+  }
+
+  private key(difficultyId: string, categoryId: string | null): string {
+    return `${difficultyId}:${categoryId ?? QuestionPoolService.ALL_CATEGORIES}`;
+  }
+}
@@ -0,0 +1,139 @@
+import { SessionExpiryScheduler } from '../session-expiry.scheduler';
+import { IQuizSessionRepository } from '../../../domain/repositories/quiz-session.repository.interface';
+import { IQuizSessionStore } from '../../../domain/repositories/quiz-session-store.interface';
+import { QuizSession } from '../../../domain/aggregates/quiz-session.aggregate';
+import { EventBusService } from '@shared/infrastructure/events/event-bus.service';
+import { PrismaService } from '@shared/infrastructure/database/prisma.service';
+import { MetricsService } from '@shared/infrastructure/metrics/metrics.service';
+
+describe('SessionExpiryScheduler', () => {
+  let scheduler: SessionExpiryScheduler;
+  let sessionRepository: {
+    findPendingExpiries: jest.Mock;
+    abandonExpired: jest.Mock;
+    saveAnswers: jest.Mock;
+    findClosedIds: jest.Mock;
+  };
+  let sessionStore: { get: jest.Mock; delete: jest.Mock; ids: jest.Mock };
+  let eventBus: { publishAll: jest.Mock };
+
+  const expired = (id: string) => ({ id, userId: `user-${id}`, expiresAt: new Date() });
+
+  beforeEach(() => {
+    jest.useFakeTimers();
+    process.env.SESSION_EXPIRY_BATCH_SIZE = '2';
+    process.env.SESSION_EXPIRY_RESCAN_MS = '0';
+
+    sessionRepository = {
+      findPendingExpiries: jest.fn().mockResolvedValue([]),
+      abandonExpired: jest.fn().mockResolvedValue([]),
+      saveAnswers: jest.fn(),
+      findClosedIds: jest.fn().mockResolvedValue([]),
+    };
+    sessionStore = {
+      get: jest.fn().mockResolvedValue(null),
+      delete: jest.fn(),
+      ids: jest.fn().mockResolvedValue([]),
+    };
+    eventBus = { publishAll: jest.fn() };
+
+    scheduler = new SessionExpiryScheduler(
+      sessionRepository as unknown as IQuizSessionRepository,
+      sessionStore as unknown as IQuizSessionStore,
+      eventBus as unknown as EventBusService,
+      { runInTransaction: (work: () => Promise<unknown>) => work() } as unknown as PrismaService,
+      new MetricsService(),
+    );
+  });
+
+  afterEach(async () => {
+    await scheduler.onModuleDestroy();
+    jest.useRealTimers();
+    delete process.env.SESSION_EXPIRY_BATCH_SIZE;
+    delete process.env.SESSION_EXPIRY_RESCAN_MS;
+  });
+
+  it('should abandon sessions that expired while stopped, batch by batch', async () => {
+    sessionRepository.abandonExpired
+      .mockResolvedValueOnce([expired('s1'), expired('s2')])
+      .mockResolvedValueOnce([expired('s3')]);
+
+    await scheduler.onApplicationBootstrap();
+
+    expect(sessionRepository.abandonExpired.mock.calls).toEqual([
+      [null, 2],
+      [null, 2],
+    ]);
+    expect(sessionStore.delete).toHaveBeenCalledTimes(3);
+    const [events] = eventBus.publishAll.mock.calls[0];
+    expect(events.map((event: { eventName: string }) => event.eventName)).toEqual([
+      'quiz.session.abandoned',
+      'quiz.session.abandoned',
+    ]);
+  });
+
+  it('should abandon loaded and tracked sessions at their deadline', async () => {
+    const now = Date.now();
+    sessionRepository.findPendingExpiries.mockResolvedValue([
+      { id: 's1', expiresAt: new Date(now + 1_000) },
+    ]);
+    await scheduler.onApplicationBootstrap();
+    sessionRepository.abandonExpired.mockClear();
+
+    scheduler.track({ id: 's2', expiresAt: new Date(now + 500) } as QuizSession);
+    scheduler.track({ id: 's3', expiresAt: new Date(now + 5_000) } as QuizSession);
+
+    await jest.advanceTimersByTimeAsync(1_000);
+
+    expect(sessionRepository.abandonExpired).toHaveBeenCalledTimes(2);
+    expect(sessionRepository.abandonExpired).toHaveBeenNthCalledWith(1, ['s2'], 2);
+    expect(sessionRepository.abandonExpired).toHaveBeenNthCalledWith(2, ['s1'], 2);
+  });
+
+  it('should not abandon untracked sessions', async () => {
+    await scheduler.onApplicationBootstrap();
+    sessionRepository.abandonExpired.mockClear();
+
+    scheduler.track({ id: 's1', expiresAt: new Date(Date.now() + 500) } as QuizSession);
+    scheduler.untrack('s1');
+    await jest.advanceTimersByTimeAsync(1_000);
+
+    expect(sessionRepository.abandonExpired).not.toHaveBeenCalled();
+  });
+
+  it('should drop stored sessions that were closed elsewhere', async () => {
+    sessionStore.ids.mockResolvedValue(['s1', 's2']);
+    sessionRepository.findClosedIds.mockResolvedValueOnce(['s1']);
+
+    await scheduler.onApplicationBootstrap();
+
+    expect(sessionRepository.findClosedIds).toHaveBeenCalledWith(['s1', 's2']);
+    expect(sessionStore.delete.mock.calls).toEqual([['s1']]);
+
+    scheduler.track({ id: 's2', expiresAt: new Date(Date.now() + 500) } as QuizSession);
+    sessionRepository.findClosedIds.mockResolvedValueOnce(['s2']);
+    await jest.advanceTimersByTimeAsync(1_000);
+
+    expect(sessionRepository.findClosedIds).toHaveBeenLastCalledWith(['s2']);
+    expect(sessionStore.delete).toHaveBeenLastCalledWith('s2');
+  });
+
+  it('should keep the buffered answers of abandoned sessions', async () => {
+    const session = QuizSession.create('s1', 'user-s1', null, 'diff-1', 30);
+    session.submitAnswer({
+      questionId: 'q-1',
+      answerId: 'q-1-a',
+      isCorrect: true,
+      timeSpent: 2000,
+      pointsEarned: 100,
+      timeBonus: 30,
+    });
+    sessionStore.get.mockImplementation(async (id: string) => (id === 's1' ? session : null));
+    sessionRepository.abandonExpired.mockResolvedValueOnce([expired('s1'), expired('s2')]);
+
+    await scheduler.catchUp();
+
+    expect(sessionRepository.saveAnswers).toHaveBeenCalledWith([session]);
+    expect(sessionStore.delete).toHaveBeenCalledWith('s1');
+  });
+});
@@ -0,0 +1,235 @@
+import {
+  Inject,
+  Injectable,
+  Logger,
+  OnApplicationBootstrap,
+  OnModuleDestroy,
+} from '@nestjs/common';
+import { PrismaService } from '@shared/infrastructure/database/prisma.service';
+import { EventBusService } from '@shared/infrastructure/events/event-bus.service';
+import { MetricsService } from '@shared/infrastructure/metrics/metrics.service';
+import { DeadlineQueue } from '@shared/infrastructure/scheduling/deadline-queue';
+import {
+  ExpiredSession,
+  IQuizSessionRepository,
+} from '../../domain/repositories/quiz-session.repository.interface';
+import { IQuizSessionStore } from '../../domain/repositories/quiz-session-store.interface';
+import { QuizSession } from '../../domain/aggregates/quiz-session.aggregate';
+import { QuizSessionAbandonedEvent } from '../../domain/events/quiz-session-abandoned.event';
+
+/**
+ * Session Expiry Scheduler
+ *
+ * Abandons quiz sessions when they expire instead of scanning for them on
+ * a schedule. Deadlines of in-progress sessions are kept in a min-heap
+ * (DeadlineQueue) with a single timer armed on the earliest one; due
+ * sessions are abandoned in batches of SESSION_EXPIRY_BATCH_SIZE with one
+ * `UPDATE ... WHERE id = ANY($1)` each, and a QuizSessionAbandonedEvent is
+ * published per session. Answers of those sessions still buffered in the
+ * session store are written in the same transaction, so they are kept.
+ * Buffered sessions found closed elsewhere are dropped from the store.
+ *
+ * At startup, sessions that expired while no node was running are
+ * abandoned through the expiresAt index, then the deadlines of the others
+ * are loaded. Sessions started on other nodes are only known to this node
+ * after a restart, so the same catch-up pass also runs every
+ * SESSION_EXPIRY_RESCAN_MS (0 disables it).
+ */
+@Injectable()
+export class SessionExpiryScheduler implements OnApplicationBootstrap, OnModuleDestroy {
+  // setTimeout delays are capped to a signed 32-bit number of milliseconds
+  private static readonly MAX_DELAY_MS = 2 ** 31 - 1;
+  private static readonly RETRY_DELAY_MS = 30_000;
+
+  private readonly logger = new Logger(SessionExpiryScheduler.name);
+  private readonly batchSize = parseInt(process.env.SESSION_EXPIRY_BATCH_SIZE || '500', 10);
+  private readonly rescanMs = parseInt(process.env.SESSION_EXPIRY_RESCAN_MS || '600000', 10);
+  private readonly deadlines = new DeadlineQueue<string>();
+  private timer?: NodeJS.Timeout;
+  private timerAt = Infinity;
+  private rescanTimer?: NodeJS.Timeout;
+  private sweeping: Promise<void> | null = null;
+  private stopped = false;
+
+  constructor(
+    @Inject('IQuizSessionRepository')
+    private readonly sessionRepository: IQuizSessionRepository,
+    @Inject('IQuizSessionStore')
+    private readonly sessionStore: IQuizSessionStore,
+    private readonly eventBus: EventBusService,
+    private readonly prisma: PrismaService,
+    private readonly metrics: MetricsService,
+  ) {
+    metrics.gauge('quiz.session_expiries_pending', () => this.deadlines.size);
+  }
+
+  async onApplicationBootstrap(): Promise<void> {
+    await this.catchUp();
+    // Recovered sessions that another node closed while this one was down
+    await this.evictClosed(await this.sessionStore.ids());
+
+    for (const { id, expiresAt } of await this.sessionRepository.findPendingExpiries()) {
+      this.deadlines.schedule(id, expiresAt.getTime());
+    }
+    this.arm();
+
+    if (this.rescanMs > 0) {
+      this.rescanTimer = setInterval(
+        () =>
+          void this.catchUp().catch((error) =>
+            this.logger.error('Expired session rescan failed', error),
+          ),
+        this.rescanMs,
+      );
+      this.rescanTimer.unref();
+    }
+  }
+
+  async onModuleDestroy(): Promise<void> {
+    this.stopped = true;
+    clearTimeout(this.timer);
+    clearInterval(this.rescanTimer);
+    await this.sweeping;
+  }
+
+  /**
+   * Abandon `session` once it expires
+   */
+  track(session: QuizSession): void {
+    this.deadlines.schedule(session.id, session.expiresAt.getTime());
+    this.arm();
+  }
+
+  /**
+   * Forget a session that was closed
+   */
+  untrack(sessionId: string): void {
+    this.deadlines.cancel(sessionId);
+  }
+
+  /**
+   * Abandon the given sessions now if they have expired; returns those
+   * that were closed
+   */
+  async expire(sessionIds: string[]): Promise<ExpiredSession[]> {
+    for (const sessionId of sessionIds) {
+      this.deadlines.cancel(sessionId);
+    }
+    return this.abandon(sessionIds);
+  }
+
+  /**
+   * Abandon every expired session still in progress, whichever node
+   * started it
+   */
+  async catchUp(): Promise<number> {
+    let total = 0;
+    for (;;) {
+      const expired = await this.abandon(null);
+      total += expired.length;
+      if (expired.length < this.batchSize) {
+        break;
+      }
+    }
+
+    if (total > 0) {
+      this.logger.log(`Abandoned ${total} expired quiz sessions found by scan`);
+    }
+    return total;
+  }
+
+  private arm(): void {
+    const next = this.deadlines.peek();
+    if (this.stopped || this.sweeping || next === undefined || next >= this.timerAt) {
+      return;
+    }
+
+    clearTimeout(this.timer);
+    this.timerAt = next;
+    this.timer = setTimeout(
+      () => this.sweep(),
+      Math.min(Math.max(next - Date.now(), 0), SessionExpiryScheduler.MAX_DELAY_MS),
+    );
+    this.timer.unref();
+  }
+
+  private sweep(): void {
+    this.timerAt = Infinity;
+    this.sweeping = (async () => {
+      let due: string[];
+      while ((due = this.deadlines.popDue(Date.now(), this.batchSize)).length > 0) {
+        await this.abandon(due).catch((error) => {
+          this.metrics.increment('quiz.session_expiry_failures');
+          this.logger.error(`Failed to abandon ${due.length} expired quiz sessions`, error);
+          const retryAt = Date.now() + SessionExpiryScheduler.RETRY_DELAY_MS;
+          for (const sessionId of due) {
+            this.deadlines.schedule(sessionId, retryAt);
+          }
+        });
+      }
+    })().finally(() => {
+      this.sweeping = null;
+      this.arm();
+    });
+  }
+
+  private async abandon(sessionIds: string[] | null): Promise<ExpiredSession[]> {
+    if (sessionIds?.length === 0) {
+      return [];
+    }
+
+    const expired = await this.prisma.runInTransaction(async () => {
+      const expired = await this.sessionRepository.abandonExpired(sessionIds, this.batchSize);
+
+      // Answers still buffered in memory were submitted before the deadline
+      const buffered = await Promise.all(expired.map(({ id }) => this.sessionStore.get(id)));
+      await this.sessionRepository.saveAnswers(
+        buffered.filter((session): session is QuizSession => session !== null),
+      );
+
+      await this.eventBus.publishAll(
+        expired.map(
+          (session) =>
+            new QuizSessionAbandonedEvent({
+              sessionId: session.id,
+              userId: session.userId,
+              reason: 'expired',
+              occurredAt: session.expiresAt,
+            }),
+        ),
+      );
+      return expired;
+    });
+
+    for (const session of expired) {
+      await this.sessionStore.delete(session.id);
+    }
+    this.metrics.increment('quiz.sessions_expired', expired.length);
+
+    if (sessionIds) {
+      // Due sessions left alone were closed elsewhere (completed through
+      // another node, or abandoned by its rescan)
+      const abandoned = new Set(expired.map(({ id }) => id));
+      await this.evictClosed(sessionIds.filter((id) => !abandoned.has(id)));
+    }
+
+    return expired;
+  }
+
+  /**
+   * Drop buffered copies of sessions that are no longer in progress in the
+   * database, so they are not recovered again
+   */
+  private async evictClosed(sessionIds: string[]): Promise<void> {
+    const stored = new Set(await this.sessionStore.ids());
+    const candidates = sessionIds.filter((id) => stored.has(id));
+    if (candidates.length === 0) {
+      return;
+    }
+
+    for (const sessionId of await this.sessionRepository.findClosedIds(candidates)) {
+      await this.sessionStore.delete(sessionId);
+      this.deadlines.cancel(sessionId);
+    }
+  }
+}
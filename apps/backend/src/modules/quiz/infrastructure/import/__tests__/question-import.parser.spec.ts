@@ -0,0 +1,87 @@
+import { parseQuestionImport, questionImportFormat } from '../question-import.parser';
+import { QuestionImportRow } from '../../../application/commands/import-questions.command';
+
+describe('Question import parser', () => {
+  // Split the source at awkward places to exercise chunk boundaries
+  async function* chunks(text: string, size = 7) {
+    const bytes = Buffer.from(text);
+    for (let i = 0; i < bytes.length; i += size) {
+      yield bytes.subarray(i, i + size);
+    }
+  }
+
+  const collect = async (rows: AsyncIterable<QuestionImportRow>) => {
+    const result: QuestionImportRow[] = [];
+    for await (const row of rows) {
+      result.push(row);
+    }
+    return result;
+  };
+
+  it('should map content types to formats', () => {
+    expect(questionImportFormat('text/csv; charset=utf-8')).toBe('csv');
+    expect(questionImportFormat('application/x-ndjson')).toBe('jsonl');
+    expect(questionImportFormat('application/json')).toBeNull();
+  });
+
+  describe('jsonl', () => {
+    it('should parse one question per line and report malformed lines', async () => {
+      const source = [
+        JSON.stringify({
+          text: 'Quelle est la base de la pâte à choux ?',
+          explanation: 'Une panade de farine cuite dans eau et beurre.',
+          categoryId: 'cat-1',
+          difficultyId: 'diff-1',
+          answers: [
+            { text: 'Panade', isCorrect: true },
+            { text: 'Crème', isCorrect: false },
+          ],
+        }),
+        '',
+        '{not json',
+      ].join('\r\n');
+
+      const rows = await collect(parseQuestionImport(chunks(source), 'jsonl'));
+
+      expect(rows).toHaveLength(2);
+      expect(rows[0]).toMatchObject({
+        line: 1,
+        question: { categoryId: 'cat-1', answers: [{ text: 'Panade', isCorrect: true }, {}] },
+      });
+      expect(rows[1]).toEqual({ line: 3, error: 'Malformed JSON' });
+    });
+  });
+
+  describe('csv', () => {
+    it('should parse quoted fields and mark the correct answer', async () => {
+      const source =
+        'text,explanation,categoryId,difficultyId,answer1,answer2,answer3,correctAnswer\n' +
+        '"Qu\'est-ce qu\'une ""crème"", au juste ?","Sur deux\nlignes",cat-1,diff-1,A,B,,2\n';
+
+      const rows = await collect(parseQuestionImport(chunks(source), 'csv'));
+
+      expect(rows).toEqual([
+        {
+          line: 2,
+          question: {
+            text: 'Qu\'est-ce qu\'une "crème", au juste ?',
+            explanation: 'Sur deux\nlignes',
+            categoryId: 'cat-1',
+            difficultyId: 'diff-1',
+            imageUrl: undefined,
+            answers: [
+              { text: 'A', isCorrect: false },
+              { text: 'B', isCorrect: true },
+            ],
+          },
+        },
+      ]);
+    });
+
+    it('should reject a header without the required columns', async () => {
+      await expect(collect(parseQuestionImport(chunks('text,answer1\n'), 'csv'))).rejects.toThrow(
+        'CSV header is missing: explanation, categoryId, difficultyId, correctAnswer',
+      );
+    });
+  });
+});
@@ -0,0 +1,252 @@
+import { StringDecoder } from 'string_decoder';
+import { InvalidArgumentException } from '@shared/domain/exceptions';
+import {
+  ImportedQuestion,
+  QuestionImportRow,
+} from '../../application/commands/import-questions.command';
+
+export type QuestionImportFormat = 'csv' | 'jsonl';
+
+type ImportSource = AsyncIterable<Buffer | string>;
+
+const CSV_REQUIRED_COLUMNS = ['text', 'explanation', 'categoryId', 'difficultyId', 'correctAnswer'];
+const CSV_MAX_ANSWERS = 6;
+
+/**
+ * Map a request Content-Type to an import format
+ */
+export function questionImportFormat(
+  contentType: string | undefined,
+): QuestionImportFormat | null {
+  const mediaType = contentType?.split(';')[0].trim().toLowerCase();
+
+  switch (mediaType) {
+    case 'text/csv':
+      return 'csv';
+    case 'application/x-ndjson':
+    case 'application/jsonl':
+    case 'application/x-jsonlines':
+      return 'jsonl';
+    default:
+      return null;
+  }
+}
+
+/**
+ * Question Import Parser
+ *
+ * Turns a byte stream into import rows without buffering the whole source.
+ *
+ * - JSON Lines: one object per line with the CreateQuestionDto fields
+ * - CSV (RFC 4180, header row): text, explanation, categoryId,
+ *   difficultyId, imageUrl, answer1..answer6 and correctAnswer, the
+ *   1-based number of the correct answer column
+ *
+ * Rows that cannot be read are yielded with an error so the import can
+ * report them and continue.
+ */
+export function parseQuestionImport(
+  source: ImportSource,
+  format: QuestionImportFormat,
+): AsyncGenerator<QuestionImportRow> {
+  return format === 'csv' ? parseCsv(source) : parseJsonLines(source);
+}
+
+async function* parseJsonLines(source: ImportSource): AsyncGenerator<QuestionImportRow> {
+  let line = 0;
+
+  for await (const text of lines(source)) {
+    line++;
+    if (!text.trim()) {
+      continue;
+    }
+
+    let value: unknown;
+    try {
+      value = JSON.parse(text);
+    } catch {
+      yield { line, error: 'Malformed JSON' };
+      continue;
+    }
+
+    if (!value || typeof value !== 'object' || Array.isArray(value)) {
+      yield { line, error: 'Expected a JSON object' };
+      continue;
+    }
+
+    const row = value as Record<string, unknown>;
+    const answers = Array.isArray(row.answers) ? row.answers : [];
+    yield {
+      line,
+      question: {
+        text: asString(row.text),
+        explanation: asString(row.explanation),
+        categoryId: asString(row.categoryId),
+        difficultyId: asString(row.difficultyId),
+        imageUrl: asString(row.imageUrl) || undefined,
+        answers: answers.map((answer) => ({
+          text: asString(answer?.text),
+          isCorrect: answer?.isCorrect === true,
+        })),
+      },
+    };
+  }
+}
+
+async function* parseCsv(source: ImportSource): AsyncGenerator<QuestionImportRow> {
+  let columns: Map<string, number> | null = null;
+
+  for await (const { line, fields } of csvRecords(source)) {
+    if (!columns) {
+      columns = new Map(fields.map((name, index) => [name.trim(), index]));
+      const missing = CSV_REQUIRED_COLUMNS.filter((name) => !columns!.has(name));
+      if (missing.length > 0) {
+        throw new InvalidArgumentException(`CSV header is missing: ${missing.join(', ')}`);
+      }
+      continue;
+    }
+
+    const field = (name: string) => fields[columns!.get(name) ?? -1]?.trim() ?? '';
+    const correct = Number(field('correctAnswer'));
+    const answers: ImportedQuestion['answers'] = [];
+
+    for (let i = 1; i <= CSV_MAX_ANSWERS; i++) {
+      const text = field(`answer${i}`);
+      if (text) {
+        answers.push({ text, isCorrect: i === correct });
+      }
+    }
+
+    yield {
+      line,
+      question: {
+        text: field('text'),
+        explanation: field('explanation'),
+        categoryId: field('categoryId'),
+        difficultyId: field('difficultyId'),
+        imageUrl: field('imageUrl') || undefined,
+        answers,
+      },
+    };
+  }
+}
+
+/**
+ * Decode a byte stream into lines (without their line break)
+ */
+async function* lines(source: ImportSource): AsyncGenerator<string> {
+  const decoder = new StringDecoder('utf8');
+  let pending = '';
+  let first = true;
+
+  const clean = (text: string) => {
+    const line = text.endsWith('\r') ? text.slice(0, -1) : text;
+    if (first) {
+      first = false;
+      return stripBom(line);
+    }
+    return line;
+  };
+
+  for await (const chunk of source) {
+    pending += typeof chunk === 'string' ? chunk : decoder.write(chunk);
+
+    const parts = pending.split('\n');
+    pending = parts.pop()!;
+    for (const part of parts) {
+      yield clean(part);
+    }
+  }
+
+  pending += decoder.end();
+  if (pending) {
+    yield clean(pending);
+  }
+}
+
+/**
+ * Decode a byte stream into CSV records. Quoted fields may contain commas,
+ * line breaks and doubled quotes; `line` is where each record starts.
+ */
+async function* csvRecords(
+  source: ImportSource,
+): AsyncGenerator<{ line: number; fields: string[] }> {
+  const decoder = new StringDecoder('utf8');
+  let fields: string[] = [];
+  let field = '';
+  let quoted = false;
+  let quoteClosed = false;
+  let line = 1;
+  let recordLine = 1;
+  let started = false;
+
+  const endRecord = () => {
+    const record = { line: recordLine, fields: [...fields, field] };
+    fields = [];
+    field = '';
+    return record;
+  };
+
+  for await (const chunk of source) {
+    const text = typeof chunk === 'string' ? chunk : decoder.write(chunk);
+
+    for (const char of text) {
+      if (!started) {
+        started = true;
+        if (char === '\uFEFF') {
+          continue;
+        }
+      }
+
+      if (quoted) {
+        if (char === '"') {
+          quoted = false;
+          quoteClosed = true;
+        } else {
+          if (char === '\n') line++;
+          field += char;
+        }
+        continue;
+      }
+
+      if (char === '"') {
+        // A quote right after a closing quote is an escaped quote
+        if (quoteClosed || field === '') {
+          if (quoteClosed) field += '"';
+          quoted = true;
+        } else {
+          field += char;
+        }
+      } else if (char === ',') {
+        fields.push(field);
+        field = '';
+      } else if (char === '\n') {
+        const record = endRecord();
+        line++;
+        recordLine = line;
+        if (record.fields.length > 1 || record.fields[0] !== '') {
+          yield record;
+        }
+      } else if (char !== '\r') {
+        field += char;
+      }
+      quoteClosed = false;
+    }
+  }
+
+  const rest = decoder.end();
+  if (rest) {
+    field += rest;
+  }
+  if (fields.length > 0 || field !== '') {
+    yield endRecord();
+  }
+}
+
+function asString(value: unknown): string {
+  return typeof value === 'string' ? value : '';
+}
+
+function stripBom(text: string): string {
+  return text.charCodeAt(0) === 0xfeff ? text.slice(1) : text;
+}
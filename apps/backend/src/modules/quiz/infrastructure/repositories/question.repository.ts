@@ -1,6 +1,13 @@
 import { Injectable } from '@nestjs/common';
+import { Prisma } from '@generated/prisma/client';
 import { PrismaService } from '@shared/infrastructure/database/prisma.service';
-import { IQuestionRepository } from '../../domain/repositories/question.repository.interface';
+import {
+  IQuestionRepository,
+  NearDuplicate,
+  QuestionAnswerKey,
+  QuestionSearchCriteria,
+  QuestionSearchHit,
+} from '../../domain/repositories/question.repository.interface';
 import { Question, QuestionStatus } from '../../domain/aggregates/question.aggregate';
 import { QuestionText } from '../../domain/value-objects/question-text.vo';
 import { Explanation } from '../../domain/value-objects/explanation.vo';
@@ -10,13 +17,16 @@ import { Answer } from '../../domain/entities/answer.entity';
  * Question Repository Implementation
  *
  * Implements persistence for Question aggregate using Prisma.
+ * Search uses the trigger-maintained questions."searchVector" (French
+ * full-text over text, answers and explanation) and a pg_trgm index on
+ * questions.text, both GIN.
  */
 @Injectable()
 export class QuestionRepository implements IQuestionRepository {
   constructor(private readonly prisma: PrismaService) {}
 
   async save(question: Question): Promise<void> {
-    await this.prisma.question.upsert({
+    await this.prisma.client.question.upsert({
       where: { id: question.id },
       create: {
         id: question.id,
@@ -45,8 +55,108 @@ export class QuestionRepository implements IQuestionRepository {
     });
   }
 
+  async saveMany(questions: Question[]): Promise<void> {
+    if (questions.length === 0) {
+      return;
+    }
+
+    await this.prisma.client.question.createMany({
+      data: questions.map((question) => ({
+        id: question.id,
+        text: question.text.value,
+        explanation: question.explanation.value,
+        imageUrl: question.imageUrl,
+        categoryId: question.categoryId,
+        difficultyId: question.difficultyId,
+        status: question.status,
+        createdById: question.createdById,
+        createdAt: question.createdAt,
+        updatedAt: question.updatedAt,
+      })),
+    });
+
+    await this.prisma.client.answer.createMany({
+      data: questions.flatMap((question) =>
+        question.answers.map((answer) => ({
+          id: answer.id,
+          questionId: question.id,
+          text: answer.text,
+          isCorrect: answer.isCorrect,
+          createdAt: answer.createdAt,
+          updatedAt: answer.updatedAt,
+        })),
+      ),
+    });
+  }
+
+  async search(criteria: QuestionSearchCriteria): Promise<QuestionSearchHit[]> {
+    const { text, categoryId, difficultyId, status, limit, after } = criteria;
+
+    const filters = [
+      categoryId ? Prisma.sql`AND q."categoryId" = ${categoryId}` : Prisma.empty,
+      difficultyId ? Prisma.sql`AND q."difficultyId" = ${difficultyId}` : Prisma.empty,
+      status ? Prisma.sql`AND q.status = ${status}::"QuestionStatus"` : Prisma.empty,
+    ];
+    const position = after
+      ? Prisma.sql`WHERE hits.rank < ${after.rank}::real
+          OR (hits.rank = ${after.rank}::real AND hits.id > ${after.id})`
+      : Prisma.empty;
+
+    // Word similarity catches typos the stemmed full-text match misses
+    return this.prisma.client.$queryRaw<QuestionSearchHit[]>`
+      SELECT * FROM (
+        SELECT
+          q.id, q.text, q."categoryId", q."difficultyId", q.status,
+          (ts_rank_cd(q."searchVector", query.tsq) + word_similarity(${text}, q.text))::real AS rank
+        FROM questions q, websearch_to_tsquery('french', ${text}) AS query(tsq)
+        WHERE (q."searchVector" @@ query.tsq OR ${text} <% q.text)
+          ${Prisma.join(filters, ' ')}
+      ) AS hits
+      ${position}
+      ORDER BY hits.rank DESC, hits.id ASC
+      LIMIT ${limit}
+    `;
+  }
+
+  async findNearDuplicates(texts: string[], threshold: number): Promise<NearDuplicate[]> {
+    if (texts.length === 0) {
+      return [];
+    }
+
+    const candidates = Prisma.join(
+      texts.map((text, index) => Prisma.sql`(${index}::int, ${text}::text)`),
+    );
+
+    // The % operator (indexable) uses the transaction-local threshold
+    return this.prisma.runInTransaction(async () => {
+      await this.prisma.client.$queryRaw`
+        SELECT set_config('pg_trgm.similarity_threshold', ${String(threshold)}, true)
+      `;
+
+      return this.prisma.client.$queryRaw<NearDuplicate[]>`
+        WITH c AS (
+          SELECT * FROM (VALUES ${candidates}) AS v(idx, text)
+        )
+        SELECT c.idx AS "index", match."questionId", match."candidateIndex", match.similarity
+        FROM c
+        CROSS JOIN LATERAL (
+          SELECT q.id AS "questionId", NULL::int AS "candidateIndex",
+                 similarity(q.text, c.text)::float8 AS similarity
+          FROM questions q
+          WHERE q.text % c.text
+          UNION ALL
+          SELECT NULL, e.idx, similarity(e.text, c.text)::float8
+          FROM c AS e
+          WHERE e.idx < c.idx AND e.text % c.text
+          ORDER BY similarity DESC
+          LIMIT 1
+        ) AS match
+      `;
+    });
+  }
+
   async findById(id: string): Promise<Question | null> {
-    const questionData = await this.prisma.question.findUnique({
+    const questionData = await this.prisma.client.question.findUnique({
       where: { id },
       include: { answers: true },
     });
@@ -58,11 +168,35 @@ export class QuestionRepository implements IQuestionRepository {
     return this.toDomain(questionData);
   }
 
+  async findAnswerKeys(questionIds: string[]): Promise<Map<string, QuestionAnswerKey>> {
+    const answers = await this.prisma.client.answer.findMany({
+      where: { questionId: { in: questionIds } },
+      select: { id: true, questionId: true, isCorrect: true },
+    });
+
+    const answerIds = new Map<string, Set<string>>();
+    const correct = new Map<string, string>();
+    for (const answer of answers) {
+      const ids = answerIds.get(answer.questionId) ?? new Set<string>();
+      ids.add(answer.id);
+      answerIds.set(answer.questionId, ids);
+      if (answer.isCorrect) {
+        correct.set(answer.questionId, answer.id);
+      }
+    }
+
+    const keys = new Map<string, QuestionAnswerKey>();
+    for (const [questionId, correctAnswerId] of correct) {
+      keys.set(questionId, { answerIds: answerIds.get(questionId)!, correctAnswerId });
+    }
+    return keys;
+  }
+
   async findByCategory(
     categoryId: string,
     status?: QuestionStatus,
   ): Promise<Question[]> {
-    const questions = await this.prisma.question.findMany({
+    const questions = await this.prisma.client.question.findMany({
       where: {
         categoryId,
         ...(status && { status }),
@@ -77,7 +211,7 @@ export class QuestionRepository implements IQuestionRepository {
     difficultyId: string,
     status?: QuestionStatus,
   ): Promise<Question[]> {
-    const questions = await this.prisma.question.findMany({
+    const questions = await this.prisma.client.question.findMany({
       where: {
         difficultyId,
         ...(status && { status }),
@@ -88,37 +222,24 @@ export class QuestionRepository implements IQuestionRepository {
     return questions.map((q) => this.toDomain(q));
   }
 
-  async findRandomQuestions(
+  async findPublished(
     difficultyId: string,
     categoryId: string | null,
-    count: number,
   ): Promise<Question[]> {
-    // Use raw query for random sampling
-    const questions = await this.prisma.$queryRaw<any[]>`
-      SELECT q.*, json_agg(
-        json_build_object(
-          'id', a.id,
-          'text', a.text,
-          'isCorrect', a."isCorrect",
-          'createdAt', a."createdAt",
-          'updatedAt', a."updatedAt"
-        )
-      ) as answers
-      FROM questions q
-      LEFT JOIN answers a ON a."questionId" = q.id
-      WHERE q."difficultyId" = ${difficultyId}
-        AND q.status = 'PUBLISHED'
-        ${categoryId ? `AND q."categoryId" = ${categoryId}` : ''}
-      GROUP BY q.id
-      ORDER BY RANDOM()
-      LIMIT ${count}
-    `;
+    const questions = await this.prisma.client.question.findMany({
+      where: {
+        difficultyId,
+        status: QuestionStatus.PUBLISHED,
+        ...(categoryId && { categoryId }),
+      },
+      include: { answers: true },
+    });
 
     return questions.map((q) => this.toDomain(q));
   }
 
   async delete(id: string): Promise<void> {
-    await this.prisma.question.delete({ where: { id } });
+    await this.prisma.client.question.delete({ where: { id } });
   }
 
   private toDomain(data: any): Question {
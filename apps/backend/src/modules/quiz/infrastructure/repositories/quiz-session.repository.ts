@@ -1,6 +1,12 @@
 import { Injectable } from '@nestjs/common';
+import { Prisma } from '@generated/prisma/client';
 import { PrismaService } from '@shared/infrastructure/database/prisma.service';
-import { IQuizSessionRepository } from '../../domain/repositories/quiz-session.repository.interface';
+import {
+  ExpiredSession,
+  IQuizSessionRepository,
+  QuizSessionHistoryCriteria,
+  QuizSessionSummary,
+} from '../../domain/repositories/quiz-session.repository.interface';
 import { QuizSession, SessionStatus, SessionAnswerData } from '../../domain/aggregates/quiz-session.aggregate';
 
 /**
@@ -14,17 +20,19 @@ export class QuizSessionRepository implements IQuizSessionRepository {
 
   async save(session: QuizSession): Promise<void> {
     // Check if session exists
-    const existing = await this.prisma.quizSession.findUnique({
+    const existing = await this.prisma.client.quizSession.findUnique({
       where: { id: session.id },
     });
 
     if (existing) {
       // Update session and upsert answers
-      await this.prisma.quizSession.update({
+      await this.prisma.client.quizSession.update({
         where: { id: session.id },
         data: {
           status: session.status,
           score: session.score,
+          correctAnswers: session.correctAnswers,
+          totalQuestions: session.totalQuestions,
           completedAt: session.completedAt,
           updatedAt: new Date(),
         },
@@ -32,7 +40,7 @@ export class QuizSessionRepository implements IQuizSessionRepository {
 
       // Upsert session answers
       for (const answer of session.answers) {
-        await this.prisma.sessionAnswer.upsert({
+        await this.prisma.client.sessionAnswer.upsert({
           where: {
             sessionId_questionId: {
               sessionId: session.id,
@@ -59,7 +67,7 @@ export class QuizSessionRepository implements IQuizSessionRepository {
       }
     } else {
       // Create new session
-      await this.prisma.quizSession.create({
+      await this.prisma.client.quizSession.create({
         data: {
           id: session.id,
           userId: session.userId,
@@ -75,8 +83,81 @@ export class QuizSessionRepository implements IQuizSessionRepository {
     }
   }
 
+  /**
+   * Flush a buffered session: update the session row, unless it was closed
+   * meanwhile, and insert all of its answers in a single transaction
+   */
+  async saveWithAnswers(session: QuizSession): Promise<boolean> {
+    return this.prisma.runInTransaction(async () => {
+      const { count } = await this.prisma.client.quizSession.updateMany({
+        where: { id: session.id, status: SessionStatus.IN_PROGRESS },
+        data: {
+          status: session.status,
+          score: session.score,
+          correctAnswers: session.correctAnswers,
+          totalQuestions: session.totalQuestions,
+          completedAt: session.completedAt,
+          updatedAt: new Date(),
+        },
+      });
+      if (count === 0) {
+        return false;
+      }
+
+      await this.prisma.client.sessionAnswer.createMany({
+        data: this.toAnswerRows(session),
+        skipDuplicates: true,
+      });
+      return true;
+    });
+  }
+
+  async saveAnswers(sessions: QuizSession[]): Promise<void> {
+    if (sessions.length === 0) {
+      return;
+    }
+
+    const totals = Prisma.join(
+      sessions.map(
+        (session) => Prisma.sql`(
+          ${session.id}, ${session.score}::int,
+          ${session.correctAnswers}::int, ${session.totalQuestions}::int
+        )`,
+      ),
+    );
+
+    await this.prisma.runInTransaction(async () => {
+      await this.prisma.client.$executeRaw`
+        UPDATE quiz_sessions q
+        SET score = v.score,
+            "correctAnswers" = v."correctAnswers",
+            "totalQuestions" = v."totalQuestions",
+            "updatedAt" = (NOW() AT TIME ZONE 'UTC')
+        FROM (VALUES ${totals}) AS v(id, score, "correctAnswers", "totalQuestions")
+        WHERE q.id = v.id
+      `;
+      await this.prisma.client.sessionAnswer.createMany({
+        data: sessions.flatMap((session) => this.toAnswerRows(session)),
+        skipDuplicates: true,
+      });
+    });
+  }
+
+  async findClosedIds(sessionIds: string[]): Promise<string[]> {
+    if (sessionIds.length === 0) {
+      return [];
+    }
+
+    const open = await this.prisma.client.quizSession.findMany({
+      where: { id: { in: sessionIds }, status: SessionStatus.IN_PROGRESS },
+      select: { id: true },
+    });
+    const openIds = new Set(open.map(({ id }) => id));
+    return sessionIds.filter((id) => !openIds.has(id));
+  }
+
   async findById(id: string): Promise<QuizSession | null> {
-    const sessionData = await this.prisma.quizSession.findUnique({
+    const sessionData = await this.prisma.client.quizSession.findUnique({
       where: { id },
       include: { answers: true },
     });
@@ -88,27 +169,44 @@ export class QuizSessionRepository implements IQuizSessionRepository {
     return this.toDomain(sessionData);
   }
 
-  async findByUserId(userId: string, status?: SessionStatus): Promise<QuizSession[]> {
-    const sessions = await this.prisma.quizSession.findMany({
+  async findHistory(criteria: QuizSessionHistoryCriteria): Promise<QuizSessionSummary[]> {
+    const { userId, status, limit, before } = criteria;
+
+    // Served by the (userId, startedAt DESC, id DESC) index
+    const sessions = await this.prisma.client.quizSession.findMany({
       where: {
         userId,
         ...(status && { status }),
+        ...(before && {
+          OR: [
+            { startedAt: { lt: before.startedAt } },
+            { startedAt: before.startedAt, id: { lt: before.id } },
+          ],
+        }),
       },
-      include: { answers: true },
-      orderBy: { startedAt: 'desc' },
+      select: {
+        id: true,
+        categoryId: true,
+        difficultyId: true,
+        status: true,
+        score: true,
+        correctAnswers: true,
+        totalQuestions: true,
+        startedAt: true,
+        completedAt: true,
+      },
+      orderBy: [{ startedAt: 'desc' }, { id: 'desc' }],
+      take: limit,
     });
 
-    return sessions.map((s) => this.toDomain(s));
+    return sessions.map((s) => ({ ...s, status: s.status as SessionStatus }));
   }
 
   async findActiveByUserId(userId: string): Promise<QuizSession | null> {
-    const sessionData = await this.prisma.quizSession.findFirst({
+    const sessionData = await this.prisma.client.quizSession.findFirst({
       where: {
         userId,
         status: SessionStatus.IN_PROGRESS,
-        expiresAt: {
-          gt: new Date(),
-        },
       },
       include: { answers: true },
     });
@@ -120,8 +218,39 @@ export class QuizSessionRepository implements IQuizSessionRepository {
     return this.toDomain(sessionData);
   }
 
+  async findPendingExpiries(): Promise<{ id: string; expiresAt: Date }[]> {
+    return this.prisma.client.quizSession.findMany({
+      where: { status: SessionStatus.IN_PROGRESS, expiresAt: { gt: new Date() } },
+      select: { id: true, expiresAt: true },
+    });
+  }
+
+  async abandonExpired(sessionIds: string[] | null, limit: number): Promise<ExpiredSession[]> {
+    // Without ids, candidates come from the expiresAt index
+    const target = sessionIds
+      ? Prisma.sql`id = ANY(${sessionIds})`
+      : Prisma.sql`id IN (
+          SELECT id FROM quiz_sessions
+          WHERE status = 'IN_PROGRESS' AND "expiresAt" <= (NOW() AT TIME ZONE 'UTC')
+          ORDER BY "expiresAt"
+          LIMIT ${limit}
+          FOR UPDATE SKIP LOCKED
+        )`;
+
+    return this.prisma.client.$queryRaw<ExpiredSession[]>`
+      UPDATE quiz_sessions
+      SET status = 'ABANDONED',
+          "completedAt" = "expiresAt",
+          "updatedAt" = (NOW() AT TIME ZONE 'UTC')
+      WHERE ${target}
+        AND status = 'IN_PROGRESS'
+        AND "expiresAt" <= (NOW() AT TIME ZONE 'UTC')
+      RETURNING id, "userId", "expiresAt"
+    `;
+  }
+
   async delete(id: string): Promise<void> {
-    await this.prisma.quizSession.delete({ where: { id } });
+    await this.prisma.client.quizSession.delete({ where: { id } });
   }
 
   private toDomain(data: any): QuizSession {
@@ -149,4 +278,17 @@ export class QuizSessionRepository implements IQuizSessionRepository {
       updatedAt: new Date(data.updatedAt),
     });
   }
+
+  private toAnswerRows(session: QuizSession) {
+    return session.answers.map((answer) => ({
+      id: `${session.id}-${answer.questionId}`,
+      sessionId: session.id,
+      questionId: answer.questionId,
+      answerId: answer.answerId,
+      isCorrect: answer.isCorrect,
+      timeSpent: answer.timeSpent,
+      pointsEarned: answer.pointsEarned,
+      timeBonus: answer.timeBonus,
+    }));
+  }
 }
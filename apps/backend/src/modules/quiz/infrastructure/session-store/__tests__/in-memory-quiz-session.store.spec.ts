@@ -0,0 +1,97 @@
+import * as fs from 'fs';
+import * as os from 'os';
+import * as path from 'path';
+import { InMemoryQuizSessionStore } from '../in-memory-quiz-session.store';
+import { QuizSession } from '../../../domain/aggregates/quiz-session.aggregate';
+
+describe('InMemoryQuizSessionStore', () => {
+  let tmpDir: string;
+
+  const answer = (questionId: string) => ({
+    questionId,
+    answerId: `${questionId}-a`,
+    isCorrect: true,
+    timeSpent: 2000,
+    pointsEarned: 100,
+    timeBonus: 30,
+  });
+
+  const createStore = async () => {
+    const store = new InMemoryQuizSessionStore();
+    await store.onModuleInit();
+    return store;
+  };
+
+  beforeEach(() => {
+    tmpDir = fs.mkdtempSync(path.join(os.tmpdir(), 'quiz-sessions-'));
+    process.env.QUIZ_SESSION_LOG_PATH = path.join(tmpDir, 'sessions.log');
+  });
+
+  afterEach(() => {
+    delete process.env.QUIZ_SESSION_LOG_PATH;
+    delete process.env.QUIZ_SESSION_COMPACT_AFTER_CLOSED;
+    fs.rmSync(tmpDir, { recursive: true, force: true });
+  });
+
+  it('should return the live aggregate that was put', async () => {
+    const store = await createStore();
+    const session = QuizSession.create('session-1', 'user-1', null, 'diff-1', 30);
+
+    await store.put(session);
+
+    expect(await store.get('session-1')).toBe(session);
+    await store.onModuleDestroy();
+  });
+
+  it('should recover buffered answers after a restart', async () => {
+    const store = await createStore();
+    const session = QuizSession.create('session-1', 'user-1', null, 'diff-1', 30);
+    await store.put(session);
+
+    session.submitAnswer(answer('q-1'));
+    await store.appendAnswer(session, answer('q-1'));
+    session.submitAnswer(answer('q-2'));
+    await store.appendAnswer(session, answer('q-2'));
+    await store.onModuleDestroy();
+
+    const restarted = await createStore();
+    const recovered = await restarted.get('session-1');
+
+    expect(recovered).not.toBeNull();
+    expect(recovered!.answers).toHaveLength(2);
+    expect(recovered!.score).toBe(260);
+    await restarted.onModuleDestroy();
+  });
+
+  it('should not recover deleted sessions', async () => {
+    const store = await createStore();
+    await store.put(QuizSession.create('session-1', 'user-1', null, 'diff-1', 30));
+    await store.delete('session-1');
+    await store.onModuleDestroy();
+
+    const restarted = await createStore();
+
+    expect(await restarted.get('session-1')).toBeNull();
+    await restarted.onModuleDestroy();
+  });
+
+  it('should keep a session opened while the log is compacted', async () => {
+    process.env.QUIZ_SESSION_COMPACT_AFTER_CLOSED = '1';
+    const store = await createStore();
+    await store.put(QuizSession.create('session-1', 'user-1', null, 'diff-1', 30));
+
+    // The delete compacts the log once its close record lands, while the
+    // open record of session-2 is still queued
+    await Promise.all([
+      store.delete('session-1'),
+      store.put(QuizSession.create('session-2', 'user-2', null, 'diff-1', 30)),
+    ]);
+    await store.onModuleDestroy();
+
+    const restarted = await createStore();
+
+    expect(await restarted.get('session-2')).not.toBeNull();
+    expect(await restarted.get('session-1')).toBeNull();
+    await restarted.onModuleDestroy();
+  });
+});
@@ -0,0 +1,147 @@
+import { Injectable, Logger, OnModuleInit, OnModuleDestroy } from '@nestjs/common';
+import * as path from 'path';
+import { IQuizSessionStore } from '../../domain/repositories/quiz-session-store.interface';
+import { QuizSession, SessionAnswerData } from '../../domain/aggregates/quiz-session.aggregate';
+import { SessionRecoveryLog, SessionSnapshot } from './session-recovery-log';
+
+/**
+ * In-Memory Quiz Session Store
+ *
+ * Keeps live QuizSession aggregates keyed by sessionId. Every change is
+ * appended to a SessionRecoveryLog first, so buffered answers survive a
+ * process restart. The log is compacted once QUIZ_SESSION_COMPACT_AFTER_CLOSED
+ * sessions have closed.
+ *
+ * Sessions are local to the process: deployments with several API nodes
+ * need sticky routing per session, otherwise a miss falls back to the
+ * database copy.
+ */
+@Injectable()
+export class InMemoryQuizSessionStore implements IQuizSessionStore, OnModuleInit, OnModuleDestroy {
+  private readonly logger = new Logger(InMemoryQuizSessionStore.name);
+  private readonly sessions = new Map<string, QuizSession>();
+  private readonly recoveryLog = new SessionRecoveryLog(
+    process.env.QUIZ_SESSION_LOG_PATH ||
+      path.join(process.cwd(), 'data', 'quiz-sessions.log'),
+  );
+  private readonly compactAfterClosed = parseInt(
+    process.env.QUIZ_SESSION_COMPACT_AFTER_CLOSED || '1000',
+    10,
+  );
+  private closedSinceCompaction = 0;
+
+  async onModuleInit(): Promise<void> {
+    const records = await this.recoveryLog.replay();
+    const recovered = new Map<string, SessionSnapshot>();
+
+    for (const record of records) {
+      switch (record.op) {
+        case 'open':
+          recovered.set(record.session.id, record.session);
+          break;
+        case 'answer': {
+          const snapshot = recovered.get(record.sessionId);
+          if (snapshot && !snapshot.answers.some((a) => a.questionId === record.answer.questionId)) {
+            snapshot.answers.push(record.answer);
+            snapshot.score += record.answer.pointsEarned + record.answer.timeBonus;
+          }
+          break;
+        }
+        case 'close':
+          recovered.delete(record.sessionId);
+          break;
+      }
+    }
+
+    for (const snapshot of recovered.values()) {
+      this.sessions.set(snapshot.id, this.fromSnapshot(snapshot));
+    }
+
+    await this.recoveryLog.open();
+    await this.recoveryLog.compact(() => this.snapshots());
+
+    if (this.sessions.size > 0) {
+      this.logger.log(`Recovered ${this.sessions.size} in-progress quiz sessions`);
+    }
+  }
+
+  async onModuleDestroy(): Promise<void> {
+    await this.recoveryLog.close();
+  }
+
+  async get(sessionId: string): Promise<QuizSession | null> {
+    return this.sessions.get(sessionId) ?? null;
+  }
+
+  async put(session: QuizSession): Promise<void> {
+    // Live before the record lands, so a compaction queued meanwhile keeps it
+    this.sessions.set(session.id, session);
+    await this.recoveryLog.append({ op: 'open', session: this.toSnapshot(session) });
+  }
+
+  async appendAnswer(session: QuizSession, answer: SessionAnswerData): Promise<void> {
+    if (!this.sessions.has(session.id)) {
+      // Session was loaded from the database: its snapshot already holds the answer
+      await this.put(session);
+      return;
+    }
+
+    await this.recoveryLog.append({ op: 'answer', sessionId: session.id, answer });
+  }
+
+  async delete(sessionId: string): Promise<void> {
+    if (!this.sessions.delete(sessionId)) {
+      return;
+    }
+
+    await this.recoveryLog.append({ op: 'close', sessionId });
+
+    this.closedSinceCompaction += 1;
+    if (this.closedSinceCompaction >= this.compactAfterClosed) {
+      this.closedSinceCompaction = 0;
+      await this.recoveryLog.compact(() => this.snapshots());
+    }
+  }
+
+  async ids(): Promise<string[]> {
+    return [...this.sessions.keys()];
+  }
+
+  private snapshots(): SessionSnapshot[] {
+    return [...this.sessions.values()].map((session) => this.toSnapshot(session));
+  }
+
+  private toSnapshot(session: QuizSession): SessionSnapshot {
+    return {
+      id: session.id,
+      userId: session.userId,
+      categoryId: session.categoryId,
+      difficultyId: session.difficultyId,
+      status: session.status,
+      score: session.score,
+      answers: [...session.answers],
+      startedAt: session.startedAt.toISOString(),
+      completedAt: session.completedAt ? session.completedAt.toISOString() : null,
+      expiresAt: session.expiresAt.toISOString(),
+      createdAt: session.createdAt.toISOString(),
+      updatedAt: session.updatedAt.toISOString(),
+    };
+  }
+
+  private fromSnapshot(snapshot: SessionSnapshot): QuizSession {
+    return QuizSession.fromPersistence({
+      id: snapshot.id,
+      userId: snapshot.userId,
+      categoryId: snapshot.categoryId,
+      difficultyId: snapshot.difficultyId,
+      status: snapshot.status,
+      score: snapshot.score,
+      answers: [...snapshot.answers],
+      startedAt: new Date(snapshot.startedAt),
+      completedAt: snapshot.completedAt ? new Date(snapshot.completedAt) : null,
+      expiresAt: new Date(snapshot.expiresAt),
+      createdAt: new Date(snapshot.createdAt),
+      updatedAt: new Date(snapshot.updatedAt),
+    });
+  }
+}
@@ -0,0 +1,111 @@
+import * as fs from 'fs/promises';
+import * as path from 'path';
+import { SessionAnswerData, SessionStatus } from '../../domain/aggregates/quiz-session.aggregate';
+
+export interface SessionSnapshot {
+  id: string;
+  userId: string;
+  categoryId: string | null;
+  difficultyId: string;
+  status: SessionStatus;
+  score: number;
+  answers: SessionAnswerData[];
+  startedAt: string;
+  completedAt: string | null;
+  expiresAt: string;
+  createdAt: string;
+  updatedAt: string;
+}
+
+export type SessionLogRecord =
+  | { op: 'open'; session: SessionSnapshot }
+  | { op: 'answer'; sessionId: string; answer: SessionAnswerData }
+  | { op: 'close'; sessionId: string };
+
+/**
+ * Session Recovery Log
+ *
+ * Append-only JSON-lines file recording every change made to buffered quiz
+ * sessions. Replaying it after a restart rebuilds the sessions that were
+ * still in progress. Writes are serialized so records land in order.
+ */
+export class SessionRecoveryLog {
+  private handle: fs.FileHandle | null = null;
+  private writeChain: Promise<void> = Promise.resolve();
+
+  constructor(private readonly filePath: string) {}
+
+  async open(): Promise<void> {
+    await fs.mkdir(path.dirname(this.filePath), { recursive: true });
+    this.handle = await fs.open(this.filePath, 'a');
+  }
+
+  async close(): Promise<void> {
+    await this.writeChain.catch(() => undefined);
+    await this.handle?.close();
+    this.handle = null;
+  }
+
+  append(record: SessionLogRecord): Promise<void> {
+    const line = `${JSON.stringify(record)}\n`;
+    return this.enqueue(async () => {
+      await this.handle?.appendFile(line, 'utf8');
+    });
+  }
+
+  /**
+   * Read back all records, skipping a torn trailing line left by a crash
+   */
+  async replay(): Promise<SessionLogRecord[]> {
+    let content: string;
+    try {
+      content = await fs.readFile(this.filePath, 'utf8');
+    } catch (error: any) {
+      if (error.code === 'ENOENT') {
+        return [];
+      }
+      throw error;
+    }
+
+    const records: SessionLogRecord[] = [];
+    for (const line of content.split('\n')) {
+      if (!line.trim()) {
+        continue;
+      }
+      try {
+        records.push(JSON.parse(line));
+      } catch {
+        // Partial write from an interrupted process
+      }
+    }
+    return records;
+  }
+
+  /**
+   * Replace the log with one `open` record per live session. The sessions
+   * are read once the writes queued before have landed, so none of them is
+   * overwritten by an older state.
+   */
+  async compact(sessions: () => SessionSnapshot[]): Promise<void> {
+    const run = async () => {
+      const tmpPath = `${this.filePath}.tmp`;
+      const content = sessions()
+        .map((session) => `${JSON.stringify({ op: 'open', session })}\n`)
+        .join('');
+
+      await fs.writeFile(tmpPath, content, 'utf8');
+      await this.handle?.close();
+      await fs.rename(tmpPath, this.filePath);
+      this.handle = await fs.open(this.filePath, 'a');
+    };
+
+    return this.enqueue(run);
+  }
+
+  private enqueue(write: () => Promise<void>): Promise<void> {
+    // A failed write must not block the ones queued after it
+    const next = this.writeChain.catch(() => undefined).then(write);
+    this.writeChain = next;
+    return next;
+  }
+}
@@ -1,32 +1,70 @@
 import {
   Controller,
+  Get,
   Post,
   Body,
+  Query,
+  Req,
+  Res,
   UseGuards,
   HttpCode,
   HttpStatus,
+  BadRequestException,
 } from '@nestjs/common';
-import { CommandBus } from '@nestjs/cqrs';
-import { ApiTags, ApiOperation, ApiResponse, ApiBearerAuth } from '@nestjs/swagger';
+import { CommandBus, QueryBus } from '@nestjs/cqrs';
+import { ApiTags, ApiOperation, ApiResponse, ApiBearerAuth, ApiConsumes } from '@nestjs/swagger';
+import { Request, Response } from 'express';
 import { JwtAuthGuard } from '@shared/presentation/guards/jwt-auth.guard';
 import { Roles } from '@shared/presentation/decorators/roles.decorator';
 import { RolesGuard } from '@shared/presentation/guards/roles.guard';
 import { CurrentUser } from '@shared/presentation/decorators/current-user.decorator';
-import { CreateQuestionDto, CreateQuestionResponseDto } from '../dtos';
+import { CreateQuestionDto, CreateQuestionResponseDto, SearchQuestionsDto } from '../dtos';
 import { CreateQuestionCommand } from '../../application/commands/create-question.command';
+import { ImportQuestionsCommand } from '../../application/commands/import-questions.command';
+import { ImportQuestionsResult } from '../../application/commands/import-questions.handler';
+import { SearchQuestionsQuery } from '../../application/queries/search-questions.query';
+import { SearchQuestionsResult } from '../../application/queries/search-questions.handler';
+import {
+  parseQuestionImport,
+  questionImportFormat,
+} from '../../infrastructure/import/question-import.parser';
 
 /**
  * Question Controller
  *
  * Handles question management operations.
- * Admin-only endpoints for creating quiz questions.
+ * Admin-only endpoints for creating, bulk importing and searching quiz
+ * questions.
  */
 @ApiTags('questions')
 @ApiBearerAuth()
 @Controller('questions')
 @UseGuards(JwtAuthGuard, RolesGuard)
 export class QuestionController {
-  constructor(private readonly commandBus: CommandBus) {}
+  constructor(
+    private readonly commandBus: CommandBus,
+    private readonly queryBus: QueryBus,
+  ) {}
+
+  @Get('search')
+  @Roles('ADMIN', 'SUPER_ADMIN')
+  @ApiOperation({ summary: 'Search questions by text, answers and explanation (Admin only)' })
+  @ApiResponse({ status: 200, description: 'Ranked page of matching questions' })
+  @ApiResponse({ status: 400, description: 'Invalid search parameters or cursor' })
+  @ApiResponse({ status: 401, description: 'Unauthorized' })
+  @ApiResponse({ status: 403, description: 'Forbidden - Admin access required' })
+  async searchQuestions(@Query() dto: SearchQuestionsDto): Promise<SearchQuestionsResult> {
+    return this.queryBus.execute(
+      new SearchQuestionsQuery(
+        dto.q,
+        dto.limit,
+        dto.cursor,
+        dto.categoryId,
+        dto.difficultyId,
+        dto.status,
+      ),
+    );
+  }
 
   @Post()
   @Roles('ADMIN', 'SUPER_ADMIN')
@@ -58,4 +96,49 @@ export class QuestionController {
 
     return result;
   }
+
+  /**
+   * Streams the request body into the import and streams back one JSON
+   * line per progress update or rejected row, then a summary line
+   */
+  @Post('import')
+  @Roles('ADMIN', 'SUPER_ADMIN')
+  @HttpCode(HttpStatus.OK)
+  @ApiOperation({ summary: 'Bulk import questions from CSV or JSON Lines (Admin only)' })
+  @ApiConsumes('text/csv', 'application/x-ndjson')
+  @ApiResponse({
+    status: 200,
+    description: 'NDJSON stream of progress, row errors and a final summary',
+  })
+  @ApiResponse({ status: 400, description: 'Unsupported Content-Type' })
+  @ApiResponse({ status: 401, description: 'Unauthorized' })
+  @ApiResponse({ status: 403, description: 'Forbidden - Admin access required' })
+  async importQuestions(
+    @CurrentUser() user: any,
+    @Req() req: Request,
+    @Res() res: Response,
+  ): Promise<void> {
+    const format = questionImportFormat(req.headers['content-type']);
+    if (!format) {
+      throw new BadRequestException('Content-Type must be text/csv or application/x-ndjson');
+    }
+
+    res.status(HttpStatus.OK).type('application/x-ndjson');
+    const write = (line: object) => res.write(`${JSON.stringify(line)}\n`);
+
+    try {
+      const result: ImportQuestionsResult = await this.commandBus.execute(
+        new ImportQuestionsCommand(parseQuestionImport(req, format), user.userId, {
+          onProgress: (progress) => write({ type: 'progress', ...progress }),
+          onRowError: (error) => write({ type: 'error', ...error }),
+        }),
+      );
+      write({ type: 'summary', ...result });
+    } catch (error) {
+      // Headers are already sent; chunks reported as imported are committed
+      write({ type: 'failed', message: (error as Error).message });
+    }
+
+    res.end();
+  }
 }
@@ -1,41 +1,67 @@
 import {
   Controller,
+  Get,
   Post,
   Body,
+  Query,
   Param,
   UseGuards,
   HttpCode,
   HttpStatus,
 } from '@nestjs/common';
-import { CommandBus } from '@nestjs/cqrs';
+import { CommandBus, QueryBus } from '@nestjs/cqrs';
 import { ApiTags, ApiOperation, ApiResponse, ApiBearerAuth } from '@nestjs/swagger';
 import { JwtAuthGuard } from '@shared/presentation/guards/jwt-auth.guard';
 import { CurrentUser } from '@shared/presentation/decorators/current-user.decorator';
 import {
   StartQuizDto,
   SubmitAnswerDto,
+  SubmitAnswersDto,
   StartQuizResponseDto,
   SubmitAnswerResponseDto,
+  SubmitAnswersResponseDto,
   CompleteQuizResponseDto,
+  SessionHistoryDto,
 } from '../dtos';
 import { StartQuizSessionCommand } from '../../application/commands/start-quiz-session.command';
 import { SubmitAnswerCommand } from '../../application/commands/submit-answer.command';
+import { SubmitAnswersCommand } from '../../application/commands/submit-answers.command';
 import { CompleteQuizSessionCommand } from '../../application/commands/complete-quiz-session.command';
+import { GetSessionHistoryQuery } from '../../application/queries/get-session-history.query';
+import { SessionHistoryResult } from '../../application/queries/get-session-history.handler';
 
 /**
  * Quiz Controller
  *
  * Handles quiz session operations:
  * - Starting a new quiz
- * - Submitting answers
+ * - Submitting answers, one by one (live mode) or as a batch
  * - Completing quiz
+ * - Session history
  */
 @ApiTags('quiz')
 @ApiBearerAuth()
 @Controller('quiz')
 @UseGuards(JwtAuthGuard)
 export class QuizController {
-  constructor(private readonly commandBus: CommandBus) {}
+  constructor(
+    private readonly commandBus: CommandBus,
+    private readonly queryBus: QueryBus,
+  ) {}
+
+  @Get('sessions')
+  @ApiOperation({ summary: 'List my quiz sessions, most recent first' })
+  @ApiResponse({ status: 200, description: 'Page of session summaries' })
+  @ApiResponse({ status: 400, description: 'Invalid parameters or cursor' })
+  @ApiResponse({ status: 401, description: 'Unauthorized' })
+  async getSessionHistory(
+    @CurrentUser() user: any,
+    @Query() dto: SessionHistoryDto,
+  ): Promise<SessionHistoryResult> {
+    return this.queryBus.execute(
+      new GetSessionHistoryQuery(user.userId, dto.limit, dto.cursor, dto.status),
+    );
+  }
 
   @Post('start')
   @HttpCode(HttpStatus.OK)
@@ -85,6 +111,26 @@ export class QuizController {
     return result;
   }
 
+  @Post('sessions/:sessionId/answers')
+  @HttpCode(HttpStatus.OK)
+  @ApiOperation({ summary: 'Submit several answers at once, optionally completing the quiz' })
+  @ApiResponse({
+    status: 200,
+    description: 'Answers submitted successfully',
+    type: SubmitAnswersResponseDto,
+  })
+  @ApiResponse({ status: 400, description: 'Invalid or repeated answer, or session expired or closed' })
+  @ApiResponse({ status: 404, description: 'Session or question not found' })
+  @ApiResponse({ status: 401, description: 'Unauthorized' })
+  async submitAnswers(
+    @Param('sessionId') sessionId: string,
+    @Body() dto: SubmitAnswersDto,
+  ): Promise<SubmitAnswersResponseDto> {
+    return this.commandBus.execute(
+      new SubmitAnswersCommand(sessionId, dto.answers, dto.complete ?? false),
+    );
+  }
+
   @Post('sessions/:sessionId/complete')
   @HttpCode(HttpStatus.OK)
   @ApiOperation({ summary: 'Complete a quiz session' })
@@ -1,4 +1,7 @@
 export * from './create-question.dto';
 export * from './start-quiz.dto';
 export * from './submit-answer.dto';
+export * from './submit-answers.dto';
 export * from './quiz-response.dto';
+export * from './search-questions.dto';
+export * from './session-history.dto';
@@ -93,6 +93,24 @@ export class CompleteQuizResponseDto {
   completedAt!: Date;
 }
 
+export class SubmitAnswersResponseDto {
+  @ApiProperty({ example: 'session-uuid', description: 'Session ID' })
+  sessionId!: string;
+
+  @ApiProperty({ type: [SubmitAnswerResponseDto], description: 'Result of each answer, in order' })
+  answers!: SubmitAnswerResponseDto[];
+
+  @ApiProperty({ example: 850, description: 'Session score after the answers' })
+  score!: number;
+
+  @ApiProperty({
+    type: CompleteQuizResponseDto,
+    nullable: true,
+    description: 'Completion summary, when the session was completed',
+  })
+  completion!: CompleteQuizResponseDto | null;
+}
+
 export class CreateQuestionResponseDto {
   @ApiProperty({ example: 'question-uuid', description: 'Question ID' })
   questionId!: string;
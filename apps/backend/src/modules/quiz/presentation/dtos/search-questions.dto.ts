@@ -0,0 +1,47 @@
+import { ApiProperty } from '@nestjs/swagger';
+import {
+  IsString,
+  IsOptional,
+  IsEnum,
+  IsInt,
+  Min,
+  Max,
+  MinLength,
+  MaxLength,
+} from 'class-validator';
+import { QuestionStatus } from '../../domain/aggregates/question.aggregate';
+
+export class SearchQuestionsDto {
+  @ApiProperty({ example: 'pâte à choux', description: 'Search text (web search syntax)' })
+  @IsString()
+  @MinLength(2)
+  @MaxLength(200)
+  q!: string;
+
+  @ApiProperty({ required: false, description: 'Filter by category ID' })
+  @IsOptional()
+  @IsString()
+  categoryId?: string;
+
+  @ApiProperty({ required: false, description: 'Filter by difficulty ID' })
+  @IsOptional()
+  @IsString()
+  difficultyId?: string;
+
+  @ApiProperty({ required: false, enum: QuestionStatus, description: 'Filter by status' })
+  @IsOptional()
+  @IsEnum(QuestionStatus)
+  status?: QuestionStatus;
+
+  @ApiProperty({ required: false, default: 20, minimum: 1, maximum: 100 })
+  @IsOptional()
+  @IsInt()
+  @Min(1)
+  @Max(100)
+  limit?: number;
+
+  @ApiProperty({ required: false, description: 'nextCursor of the previous page' })
+  @IsOptional()
+  @IsString()
+  cursor?: string;
+}
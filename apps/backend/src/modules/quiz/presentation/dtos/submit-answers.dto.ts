@@ -0,0 +1,31 @@
+import { ApiProperty } from '@nestjs/swagger';
+import { Type } from 'class-transformer';
+import {
+  IsArray,
+  ArrayMinSize,
+  ArrayMaxSize,
+  ValidateNested,
+  IsBoolean,
+  IsOptional,
+} from 'class-validator';
+import { SubmitAnswerDto } from './submit-answer.dto';
+
+export class SubmitAnswersDto {
+  @ApiProperty({ type: [SubmitAnswerDto], description: 'Answers of the session (1-50)' })
+  @IsArray()
+  @ArrayMinSize(1)
+  @ArrayMaxSize(50)
+  @ValidateNested({ each: true })
+  @Type(() => SubmitAnswerDto)
+  answers!: SubmitAnswerDto[];
+
+  @ApiProperty({
+    example: true,
+    description: 'Complete the session together with the answers',
+    required: false,
+    default: false,
+  })
+  @IsOptional()
+  @IsBoolean()
+  complete?: boolean;
+}
@@ -8,21 +8,43 @@ import { QuestionController } from './presentation/controllers/question.controll
 
 // Command Handlers
 import { CreateQuestionHandler } from './application/commands/create-question.handler';
+import { ImportQuestionsHandler } from './application/commands/import-questions.handler';
 import { StartQuizSessionHandler } from './application/commands/start-quiz-session.handler';
 import { SubmitAnswerHandler } from './application/commands/submit-answer.handler';
+import { SubmitAnswersHandler } from './application/commands/submit-answers.handler';
 import { CompleteQuizSessionHandler } from './application/commands/complete-quiz-session.handler';
 
+// Query Handlers
+import { SearchQuestionsHandler } from './application/queries/search-questions.handler';
+import { GetSessionHistoryHandler } from './application/queries/get-session-history.handler';
+
+// Event Handlers
+import { QuestionPoolRefreshHandler } from './application/event-handlers/question-pool-refresh.handler';
+
 // Repositories
 import { QuestionRepository } from './infrastructure/repositories/question.repository';
 import { QuizSessionRepository } from './infrastructure/repositories/quiz-session.repository';
 
+// Caches
+import { QuestionPoolService } from './infrastructure/cache/question-pool.service';
+import { InMemoryQuizSessionStore } from './infrastructure/session-store/in-memory-quiz-session.store';
+
+// Schedulers
+import { SessionExpiryScheduler } from './infrastructure/expiry/session-expiry.scheduler';
+
 const CommandHandlers = [
   CreateQuestionHandler,
+  ImportQuestionsHandler,
   StartQuizSessionHandler,
   SubmitAnswerHandler,
+  SubmitAnswersHandler,
   CompleteQuizSessionHandler,
 ];
 
+const QueryHandlers = [SearchQuestionsHandler, GetSessionHistoryHandler];
+
+const EventHandlers = [QuestionPoolRefreshHandler];
+
 const Repositories = [
   {
     provide: 'IQuestionRepository',
@@ -32,27 +54,50 @@ const Repositories = [
     provide: 'IQuizSessionRepository',
     useClass: QuizSessionRepository,
   },
+  {
+    provide: 'IQuizSessionStore',
+    useClass: InMemoryQuizSessionStore,
+  },
 ];
 
+const Caches = [QuestionPoolService];
+
+const Schedulers = [SessionExpiryScheduler];
+
 /**
  * Quiz Bounded Context
  *
  * Responsibilities:
  * - Quiz session management
  * - Question selection and delivery
+ * - Question search and bulk import (admin)
  * - Answer submission and validation
  * - Score calculation
  * - Time tracking and anti-cheat
+ * - Session expiry (abandoned at their deadline)
  *
  * Domain Events Emitted:
  * - QuizSessionStartedEvent
  * - QuizSessionCompletedEvent
+ * - QuizSessionAbandonedEvent (on expiry)
  * - QuestionCreatedEvent
+ * - QuestionsImportedEvent
+ * - QuestionStatusChangedEvent
+ *
+ * Domain Events Consumed:
+ * - QuestionCreatedEvent / QuestionStatusChangedEvent -> Refresh question pools
  */
 @Module({
   imports: [CqrsModule, SharedModule],
   controllers: [QuizController, QuestionController],
-  providers: [...CommandHandlers, ...Repositories],
+  providers: [
+    ...CommandHandlers,
+    ...QueryHandlers,
+    ...EventHandlers,
+    ...Repositories,
+    ...Caches,
+    ...Schedulers,
+  ],
   exports: [],
 })
 export class QuizModule {}
@@ -0,0 +1,29 @@
+import { BloomFilter } from '../bloom-filter';
+
+describe('BloomFilter', () => {
+  it('should never report an added value as absent', () => {
+    const filter = new BloomFilter(1000);
+    const values = Array.from({ length: 1000 }, (_, i) => `token-${i}`);
+
+    values.forEach((value) => filter.add(value));
+
+    expect(values.every((value) => filter.mightContain(value))).toBe(true);
+    expect(filter.size).toBe(1000);
+  });
+
+  it('should keep false positives near the configured rate', () => {
+    const filter = new BloomFilter(1000, 0.01);
+    for (let i = 0; i < 1000; i++) {
+      filter.add(`token-${i}`);
+    }
+
+    let falsePositives = 0;
+    for (let i = 0; i < 10000; i++) {
+      if (filter.mightContain(`other-${i}`)) {
+        falsePositives += 1;
+      }
+    }
+
+    expect(falsePositives / 10000).toBeLessThan(0.03);
+  });
+});
@@ -0,0 +1,41 @@
+import { LruCache } from '../lru-cache';
+
+describe('LruCache', () => {
+  afterEach(() => {
+    jest.useRealTimers();
+  });
+
+  it('should return stored values', () => {
+    const cache = new LruCache<string, number>({ maxSize: 2, ttlMs: 1000 });
+
+    cache.set('a', 1);
+
+    expect(cache.get('a')).toBe(1);
+    expect(cache.get('b')).toBeUndefined();
+  });
+
+  it('should evict the least recently used entry when full', () => {
+    const cache = new LruCache<string, number>({ maxSize: 2, ttlMs: 1000 });
+
+    cache.set('a', 1);
+    cache.set('b', 2);
+    cache.get('a');
+    cache.set('c', 3);
+
+    expect(cache.get('a')).toBe(1);
+    expect(cache.get('b')).toBeUndefined();
+    expect(cache.get('c')).toBe(3);
+    expect(cache.size).toBe(2);
+  });
+
+  it('should expire entries after their TTL', () => {
+    jest.useFakeTimers();
+    const cache = new LruCache<string, number>({ maxSize: 2, ttlMs: 1000 });
+
+    cache.set('a', 1);
+    jest.advanceTimersByTime(1001);
+
+    expect(cache.get('a')).toBeUndefined();
+    expect(cache.size).toBe(0);
+  });
+});
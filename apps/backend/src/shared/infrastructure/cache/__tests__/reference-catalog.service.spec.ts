@@ -0,0 +1,93 @@
+import { ReferenceCatalog } from '../reference-catalog.service';
+import { PrismaService } from '../../database/prisma.service';
+
+describe('ReferenceCatalog', () => {
+  let findMany: Record<string, jest.Mock>;
+  let stamps: Record<string, number>;
+  let catalog: ReferenceCatalog;
+
+  const shopItem = (price: number) => ({
+    id: 'item-1',
+    type: 'LIFE',
+    name: 'Extra Life',
+    description: 'Restore one life',
+    price,
+    available: true,
+  });
+
+  beforeEach(() => {
+    findMany = {
+      category: jest.fn().mockResolvedValue([{ id: 'cat-1', name: 'Pâtisserie', slug: 'patisserie' }]),
+      difficulty: jest.fn().mockResolvedValue([{ id: 'diff-1', level: 'apprenti' }]),
+      shopItem: jest.fn().mockResolvedValue([shopItem(50)]),
+      badge: jest.fn().mockResolvedValue([
+        { id: 'badge-1', conditionData: { type: 'streak', days: 7 } },
+      ]),
+    };
+    stamps = { categories: 0, difficulties: 0, shopItems: 0, badges: 0 };
+    const client = {
+      ...Object.fromEntries(
+        Object.entries(findMany).map(([model, mock]) => [model, { findMany: mock }]),
+      ),
+      $queryRaw: async () =>
+        Object.entries(stamps).map(([table, time]) => ({
+          table,
+          rows: 1,
+          updatedAt: new Date(time),
+        })),
+    };
+
+    catalog = new ReferenceCatalog({
+      client,
+      runOnPrimary: (work: () => Promise<unknown>) => work(),
+    } as unknown as PrismaService);
+  });
+
+  it('should load every table once at startup and serve frozen rows', async () => {
+    await catalog.onModuleInit();
+
+    const badges = await catalog.get('badges');
+    await catalog.get('badges');
+    await catalog.get('shopItems');
+
+    for (const mock of Object.values(findMany)) {
+      expect(mock).toHaveBeenCalledTimes(1);
+    }
+    const badge = badges.byId.get('badge-1') as any;
+    expect(Object.isFrozen(badge)).toBe(true);
+    expect(Object.isFrozen(badge.conditionData)).toBe(true);
+  });
+
+  it('should version tables by content', async () => {
+    const before = await catalog.get('shopItems');
+
+    await catalog.invalidate('shopItems');
+    expect((await catalog.get('shopItems')).version).toBe(before.version);
+
+    findMany.shopItem.mockResolvedValue([shopItem(80)]);
+    await catalog.invalidate('shopItems');
+    const after = await catalog.get('shopItems');
+
+    expect(after.version).not.toBe(before.version);
+    expect(after.byId.get('item-1')!.price).toBe(80);
+  });
+
+  it('should reload only the tables changed since the last check', async () => {
+    await catalog.onModuleInit();
+    expect(await catalog.checkForChanges()).toEqual([]);
+
+    stamps.categories = 1000;
+    expect(await catalog.checkForChanges()).toEqual(['categories']);
+    expect(await catalog.checkForChanges()).toEqual([]);
+
+    expect(findMany.category).toHaveBeenCalledTimes(2);
+    expect(findMany.badge).toHaveBeenCalledTimes(1);
+  });
+
+  it('should query again after a failed load', async () => {
+    findMany.difficulty.mockRejectedValueOnce(new Error('connection reset'));
+
+    await expect(catalog.get('difficulties')).rejects.toThrow('connection reset');
+    expect((await catalog.get('difficulties')).byId.has('diff-1')).toBe(true);
+  });
+});
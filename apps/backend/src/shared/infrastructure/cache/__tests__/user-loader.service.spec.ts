@@ -0,0 +1,64 @@
+import { UserLoader } from '../user-loader.service';
+import { PrismaService } from '../../database/prisma.service';
+
+describe('UserLoader', () => {
+  const user = (id: string) => ({
+    id,
+    email: `${id}@example.com`,
+    username: `name-${id}`,
+    role: 'PLAYER',
+  });
+
+  let findMany: jest.Mock;
+  let loader: UserLoader;
+
+  beforeEach(() => {
+    findMany = jest.fn(async ({ where }) =>
+      where.id.in.filter((id: string) => id !== 'missing').map(user),
+    );
+    loader = new UserLoader({ user: { findMany } } as unknown as PrismaService);
+  });
+
+  it('should coalesce lookups from the same tick into one query', async () => {
+    const [a, b, again] = await Promise.all([
+      loader.load('a'),
+      loader.load('b'),
+      loader.load('a'),
+    ]);
+
+    expect(findMany).toHaveBeenCalledTimes(1);
+    expect(findMany.mock.calls[0][0].where.id.in).toEqual(['a', 'b']);
+    expect(a?.username).toBe('name-a');
+    expect(b?.username).toBe('name-b');
+    expect(again).toBe(a);
+  });
+
+  it('should serve repeat lookups from the cache', async () => {
+    await loader.load('a');
+    await loader.load('a');
+
+    expect(findMany).toHaveBeenCalledTimes(1);
+  });
+
+  it('should resolve unknown users to null without caching them', async () => {
+    expect(await loader.loadMany(['missing', 'a'])).toEqual([null, user('a')]);
+    await loader.load('missing');
+
+    expect(findMany).toHaveBeenCalledTimes(2);
+  });
+
+  it('should refetch after invalidation', async () => {
+    await loader.load('a');
+    loader.invalidate('a');
+    await loader.load('a');
+
+    expect(findMany).toHaveBeenCalledTimes(2);
+  });
+
+  it('should reject every lookup in a failed batch', async () => {
+    findMany.mockRejectedValueOnce(new Error('db down'));
+
+    await expect(Promise.all([loader.load('a'), loader.load('b')])).rejects.toThrow('db down');
+    expect(await loader.load('a')).toEqual(user('a'));
+  });
+});
@@ -0,0 +1,62 @@
+/**
+ * Bloom Filter
+ *
+ * Fixed-size probabilistic set of strings. `mightContain` never returns a
+ * false negative; false positives occur at roughly the configured rate
+ * while the filter holds no more than `expectedItems` values. Callers that
+ * need an exact answer confirm positives against an exact set.
+ */
+export class BloomFilter {
+  private readonly bits: Uint32Array;
+  private readonly bitCount: number;
+  private readonly hashCount: number;
+  private count = 0;
+
+  constructor(
+    readonly expectedItems: number,
+    falsePositiveRate: number = 0.01,
+  ) {
+    const items = Math.max(1, expectedItems);
+    this.bitCount = Math.max(64, Math.ceil((-items * Math.log(falsePositiveRate)) / Math.LN2 ** 2));
+    this.hashCount = Math.max(1, Math.round((this.bitCount / items) * Math.LN2));
+    this.bits = new Uint32Array(Math.ceil(this.bitCount / 32));
+  }
+
+  get size(): number {
+    return this.count;
+  }
+
+  add(value: string): void {
+    const [h1, h2] = this.hash(value);
+    for (let i = 0; i < this.hashCount; i++) {
+      const bit = ((h1 + Math.imul(i, h2)) >>> 0) % this.bitCount;
+      this.bits[bit >>> 5] |= 1 << (bit & 31);
+    }
+    this.count += 1;
+  }
+
+  mightContain(value: string): boolean {
+    const [h1, h2] = this.hash(value);
+    for (let i = 0; i < this.hashCount; i++) {
+      const bit = ((h1 + Math.imul(i, h2)) >>> 0) % this.bitCount;
+      if ((this.bits[bit >>> 5] & (1 << (bit & 31))) === 0) {
+        return false;
+      }
+    }
+    return true;
+  }
+
+  /**
+   * Two independent FNV-1a hashes, combined by double hashing
+   */
+  private hash(value: string): [number, number] {
+    let h1 = 0x811c9dc5;
+    let h2 = 0x01000193;
+    for (let i = 0; i < value.length; i++) {
+      const c = value.charCodeAt(i);
+      h1 = Math.imul(h1 ^ c, 0x01000193);
+      h2 = Math.imul(h2 ^ c, 0x5bd1e995);
+    }
+    return [h1 >>> 0, (h2 >>> 0) | 1];
+  }
+}
@@ -0,0 +1,60 @@
+export interface LruCacheOptions {
+  maxSize: number;
+  ttlMs: number;
+}
+
+interface LruEntry<V> {
+  value: V;
+  expiresAt: number;
+}
+
+/**
+ * LRU Cache
+ *
+ * Bounded in-process cache with per-entry TTL. Relies on Map insertion
+ * order: reads move an entry to the end, so the first key is always the
+ * least recently used one and is evicted when the cache is full.
+ */
+export class LruCache<K, V> {
+  private readonly entries = new Map<K, LruEntry<V>>();
+
+  constructor(private readonly options: LruCacheOptions) {}
+
+  get size(): number {
+    return this.entries.size;
+  }
+
+  get(key: K): V | undefined {
+    const entry = this.entries.get(key);
+    if (!entry) {
+      return undefined;
+    }
+
+    if (entry.expiresAt <= Date.now()) {
+      this.entries.delete(key);
+      return undefined;
+    }
+
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    return entry.value;
+  }
+
+  set(key: K, value: V, ttlMs: number = this.options.ttlMs): void {
+    this.entries.delete(key);
+    this.entries.set(key, { value, expiresAt: Date.now() + ttlMs });
+
+    while (this.entries.size > this.options.maxSize) {
+      const oldest = this.entries.keys().next().value as K;
+      this.entries.delete(oldest);
+    }
+  }
+
+  delete(key: K): boolean {
+    return this.entries.delete(key);
+  }
+
+  clear(): void {
+    this.entries.clear();
+  }
+}
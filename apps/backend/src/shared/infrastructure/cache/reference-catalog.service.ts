@@ -0,0 +1,270 @@
+import {
+  Injectable,
+  Logger,
+  OnApplicationBootstrap,
+  OnModuleDestroy,
+  OnModuleInit,
+} from '@nestjs/common';
+import { createHash } from 'crypto';
+import { PrismaService } from '../database/prisma.service';
+
+export type ReferenceTable = 'categories' | 'difficulties' | 'shopItems' | 'badges';
+
+export interface CategoryRef {
+  id: string;
+  name: string;
+  slug: string;
+  icon: string | null;
+  description: string | null;
+}
+
+export interface DifficultyRef {
+  id: string;
+  level: string;
+  name: string;
+  /** Seconds */
+  timePerQuestion: number;
+  xpMultiplier: number;
+}
+
+export interface ShopItemRef {
+  id: string;
+  type: string;
+  name: string;
+  description: string;
+  price: number;
+  available: boolean;
+}
+
+export interface BadgeRef {
+  id: string;
+  name: string;
+  description: string;
+  imageUrl: string;
+  rarity: string;
+  condition: string;
+  coinReward: number;
+  conditionData: unknown;
+}
+
+export interface CatalogTable<T> {
+  /**
+   * Hash of the table's content: equal on every node serving the same rows
+   */
+  readonly version: string;
+  /**
+   * Rows by id, in the table's catalog order
+   */
+  readonly byId: ReadonlyMap<string, Readonly<T>>;
+}
+
+export interface ReferenceData {
+  /** By name */
+  categories: CatalogTable<CategoryRef>;
+  /** Easiest first */
+  difficulties: CatalogTable<DifficultyRef>;
+  /** Cheapest first */
+  shopItems: CatalogTable<ShopItemRef>;
+  /** Oldest first */
+  badges: CatalogTable<BadgeRef>;
+}
+
+interface TableStamp {
+  table: ReferenceTable;
+  rows: number;
+  updatedAt: Date | null;
+}
+
+const TABLES: ReferenceTable[] = ['categories', 'difficulties', 'shopItems', 'badges'];
+
+/**
+ * Reference Catalog
+ *
+ * In-process copy of the reference tables (categories, difficulties, shop
+ * items, badges), which only change on deploy or admin edit. Every table is
+ * loaded once at startup and served as frozen maps. Reloads read the
+ * primary, so a lagging replica cannot pin old rows.
+ *
+ * Every REFERENCE_CATALOG_CHECK_MS (0 disables it), each node reads the
+ * row count and latest updatedAt of every table in one query and reloads
+ * the tables whose values changed, whoever wrote them (seed, SQL, another
+ * node). `invalidate` reloads a table right away.
+ *
+ * Each table carries a content hash as its version, usable as an ETag.
+ * Writers that depend on a row being current must check it in their own
+ * statement (see ShopRepository).
+ */
+@Injectable()
+export class ReferenceCatalog implements OnModuleInit, OnApplicationBootstrap, OnModuleDestroy {
+  private readonly logger = new Logger(ReferenceCatalog.name);
+  private readonly checkMs = parseInt(process.env.REFERENCE_CATALOG_CHECK_MS || '60000', 10);
+  private readonly tables = new Map<ReferenceTable, Promise<CatalogTable<unknown>>>();
+  private stamps = new Map<ReferenceTable, string>();
+  private timer?: NodeJS.Timeout;
+
+  constructor(private readonly prisma: PrismaService) {}
+
+  async onModuleInit(): Promise<void> {
+    // Read before loading, so a change made meanwhile is seen by the next check
+    const stamps = await this.readStamps();
+    await Promise.all(TABLES.map((table) => this.get(table)));
+    this.stamps = stamps;
+  }
+
+  onApplicationBootstrap(): void {
+    if (this.checkMs <= 0) {
+      return;
+    }
+
+    this.timer = setInterval(
+      () =>
+        void this.checkForChanges().catch((error) =>
+          this.logger.error('Reference data check failed', error),
+        ),
+      this.checkMs,
+    );
+    this.timer.unref();
+  }
+
+  onModuleDestroy(): void {
+    clearInterval(this.timer);
+  }
+
+  get<K extends ReferenceTable>(table: K): Promise<ReferenceData[K]> {
+    let loaded = this.tables.get(table);
+    if (!loaded) {
+      loaded = this.load(table).catch((error) => {
+        this.tables.delete(table);
+        throw error;
+      });
+      this.tables.set(table, loaded);
+    }
+    return loaded as Promise<ReferenceData[K]>;
+  }
+
+  /**
+   * Reload a table; reads are served the previous copy until it is loaded
+   */
+  async invalidate(table: ReferenceTable): Promise<void> {
+    const reloaded = await this.load(table);
+    this.tables.set(table, Promise.resolve(reloaded));
+  }
+
+  /**
+   * Reload the tables changed since the last check; returns their names
+   */
+  async checkForChanges(): Promise<ReferenceTable[]> {
+    const stamps = await this.readStamps();
+    const changed = TABLES.filter((table) => stamps.get(table) !== this.stamps.get(table));
+
+    for (const table of changed) {
+      try {
+        await this.invalidate(table);
+        this.stamps.set(table, stamps.get(table)!);
+      } catch (error) {
+        // Drop the outdated copy: the next read loads the table again
+        this.logger.error(`Failed to reload reference table ${table}`, error);
+        this.tables.delete(table);
+      }
+    }
+    return changed;
+  }
+
+  private async load(table: ReferenceTable): Promise<CatalogTable<unknown>> {
+    const rows = await this.prisma.runOnPrimary(() => this.query(table));
+    const version = createHash('sha1')
+      .update(JSON.stringify(rows))
+      .digest('base64url')
+      .slice(0, 16);
+    this.logger.log(`Loaded ${rows.length} ${table} (version ${version})`);
+
+    return Object.freeze({
+      version,
+      byId: new Map(rows.map((row) => [row.id, deepFreeze(row)])),
+    });
+  }
+
+  /**
+   * Row count and latest updatedAt of every table, in one query
+   */
+  private async readStamps(): Promise<Map<ReferenceTable, string>> {
+    const rows = await this.prisma.runOnPrimary(
+      () => this.prisma.client.$queryRaw<TableStamp[]>`
+        SELECT 'categories' AS "table", COUNT(*)::int AS rows, MAX("updatedAt") AS "updatedAt"
+        FROM categories
+        UNION ALL
+        SELECT 'difficulties', COUNT(*)::int, MAX("updatedAt") FROM difficulties
+        UNION ALL
+        SELECT 'shopItems', COUNT(*)::int, MAX("updatedAt") FROM shop_items
+        UNION ALL
+        SELECT 'badges', COUNT(*)::int, MAX("updatedAt") FROM badges
+      `,
+    );
+
+    return new Map(
+      rows.map(({ table, rows, updatedAt }) => [
+        table,
+        `${rows}:${updatedAt?.toISOString() ?? ''}`,
+      ]),
+    );
+  }
+
+  private query(table: ReferenceTable): Promise<{ id: string }[]> {
+    const db = this.prisma.client;
+
+    switch (table) {
+      case 'categories':
+        return db.category.findMany({
+          select: { id: true, name: true, slug: true, icon: true, description: true },
+          orderBy: { name: 'asc' },
+        });
+      case 'difficulties':
+        return db.difficulty.findMany({
+          select: {
+            id: true,
+            level: true,
+            name: true,
+            timePerQuestion: true,
+            xpMultiplier: true,
+          },
+          orderBy: { xpMultiplier: 'asc' },
+        });
+      case 'shopItems':
+        return db.shopItem.findMany({
+          select: {
+            id: true,
+            type: true,
+            name: true,
+            description: true,
+            price: true,
+            available: true,
+          },
+          orderBy: [{ price: 'asc' }, { id: 'asc' }],
+        });
+      case 'badges':
+        return db.badge.findMany({
+          select: {
+            id: true,
+            name: true,
+            description: true,
+            imageUrl: true,
+            rarity: true,
+            condition: true,
+            coinReward: true,
+            conditionData: true,
+          },
+          orderBy: [{ createdAt: 'asc' }, { id: 'asc' }],
+        });
+    }
+  }
+}
+
+function deepFreeze<T>(value: T): T {
+  if (value !== null && typeof value === 'object' && !Object.isFrozen(value)) {
+    Object.freeze(value);
+    for (const nested of Object.values(value)) {
+      deepFreeze(nested);
+    }
+  }
+  return value;
+}
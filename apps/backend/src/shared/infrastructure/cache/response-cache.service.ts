@@ -0,0 +1,190 @@
+import { Injectable, Logger, OnModuleInit } from '@nestjs/common';
+import { DiscoveryService, MetadataScanner } from '@nestjs/core';
+import { EventEmitter2 } from '@nestjs/event-emitter';
+import { createHash } from 'crypto';
+import { DomainEvent } from '../../domain/base/domain-event.base';
+import { MetricsService } from '../metrics/metrics.service';
+import { LruCache } from './lru-cache';
+
+export const CONDITIONAL_GET_METADATA = 'CONDITIONAL_GET_METADATA';
+
+export interface ConditionalGetOptions {
+  /**
+   * Name of the resource, unique across routes
+   */
+  resource: string;
+  /**
+   * Events that change a player's copy of the resource; their aggregate id
+   * must be the player's user id
+   */
+  invalidatedBy?: string[];
+  /**
+   * Time at which a response goes stale without any event (e.g. when the
+   * next life regenerates); null when only events change it
+   */
+  validUntil?: (body: any) => Date | null;
+  /**
+   * The response is the same for every player: one copy per URL is served
+   * to everyone for RESPONSE_CACHE_SHARED_TTL_MS without running the handler
+   */
+  shared?: boolean;
+}
+
+interface VersionEntry {
+  /** Changes on every invalidation */
+  stamp: number;
+  /** ETag of the player's current copy, once a response has been built */
+  etag: string | null;
+}
+
+interface SharedEntry {
+  etag: string;
+  body: unknown;
+}
+
+/**
+ * Response Cache
+ *
+ * Keeps, per (player, resource), the ETag of the last response built for
+ * the player, so a conditional GET whose If-None-Match still matches is
+ * answered 304 without running the query. The ETag is forgotten when one of
+ * the resource's `invalidatedBy` events is published for that player (see
+ * `@ConditionalGet`). A response built while an event arrived is not
+ * remembered, and responses are read from the primary rather than a
+ * replica that may not have the event's write yet, so neither can pin
+ * stale data.
+ *
+ * ETags are content hashes, so every API node computes the same one. Events
+ * are only seen by the node that publishes them: other nodes forget their
+ * entry after RESPONSE_CACHE_ETAG_TTL_MS.
+ *
+ * Shared resources (same response for everyone) are cached whole for
+ * RESPONSE_CACHE_SHARED_TTL_MS instead.
+ */
+@Injectable()
+export class ResponseCache implements OnModuleInit {
+  private readonly logger = new Logger(ResponseCache.name);
+  private readonly etagTtlMs = parseInt(process.env.RESPONSE_CACHE_ETAG_TTL_MS || '60000', 10);
+  private readonly versions = new LruCache<string, VersionEntry>({
+    maxSize: parseInt(process.env.RESPONSE_CACHE_MAX_ENTRIES || '50000', 10),
+    ttlMs: this.etagTtlMs,
+  });
+  private readonly shared = new LruCache<string, SharedEntry>({
+    maxSize: 1000,
+    ttlMs: parseInt(process.env.RESPONSE_CACHE_SHARED_TTL_MS || '2000', 10),
+  });
+  private clock = 0;
+
+  constructor(
+    private readonly eventEmitter: EventEmitter2,
+    private readonly discovery: DiscoveryService,
+    private readonly metadataScanner: MetadataScanner,
+    private readonly metrics: MetricsService,
+  ) {}
+
+  onModuleInit(): void {
+    const resourcesByEvent = new Map<string, Set<string>>();
+
+    for (const wrapper of this.discovery.getControllers()) {
+      const { instance } = wrapper;
+      if (!instance || typeof instance !== 'object') {
+        continue;
+      }
+
+      const prototype = Object.getPrototypeOf(instance);
+      for (const method of this.metadataScanner.getAllMethodNames(prototype)) {
+        const options: ConditionalGetOptions | undefined = Reflect.getMetadata(
+          CONDITIONAL_GET_METADATA,
+          prototype[method],
+        );
+
+        for (const eventName of options?.invalidatedBy ?? []) {
+          const resources = resourcesByEvent.get(eventName) ?? new Set<string>();
+          resources.add(options!.resource);
+          resourcesByEvent.set(eventName, resources);
+        }
+      }
+    }
+
+    for (const [eventName, resources] of resourcesByEvent) {
+      this.eventEmitter.on(eventName, (event: DomainEvent) => {
+        for (const resource of resources) {
+          this.invalidate(resource, event.getAggregateId());
+        }
+      });
+    }
+    this.logger.log(`Invalidating cached responses on ${resourcesByEvent.size} events`);
+  }
+
+  /**
+   * ETag of the player's current copy of the resource, if known
+   */
+  etagOf(resource: string, userId: string): string | null {
+    return this.versions.get(this.key(resource, userId))?.etag ?? null;
+  }
+
+  /**
+   * Call before building a response; pass the result to `remember`
+   */
+  stamp(resource: string, userId: string): number {
+    const key = this.key(resource, userId);
+    let entry = this.versions.get(key);
+    if (!entry) {
+      entry = { stamp: ++this.clock, etag: null };
+      this.versions.set(key, entry);
+    }
+    return entry.stamp;
+  }
+
+  /**
+   * Record the response built for the player and return its ETag. It is
+   * not recorded if the resource was invalidated since `stamp`.
+   */
+  remember(
+    resource: string,
+    userId: string,
+    stamp: number,
+    body: unknown,
+    validUntil: Date | null = null,
+  ): string {
+    const key = this.key(resource, userId);
+    const etag = ResponseCache.etag(body);
+
+    const ttlMs = Math.min(this.etagTtlMs, (validUntil?.getTime() ?? Infinity) - Date.now());
+    if (this.versions.get(key)?.stamp === stamp && ttlMs > 0) {
+      this.versions.set(key, { stamp, etag }, ttlMs);
+    }
+
+    return etag;
+  }
+
+  invalidate(resource: string, userId: string): void {
+    const key = this.key(resource, userId);
+    if (this.versions.get(key)) {
+      this.versions.set(key, { stamp: ++this.clock, etag: null });
+    }
+  }
+
+  getShared(key: string): SharedEntry | undefined {
+    const entry = this.shared.get(key);
+    this.metrics.increment(entry ? 'response_cache.shared_hits' : 'response_cache.shared_misses');
+    return entry;
+  }
+
+  setShared(key: string, body: unknown): SharedEntry {
+    const entry = { etag: ResponseCache.etag(body), body };
+    this.shared.set(key, entry);
+    return entry;
+  }
+
+  static etag(body: unknown): string {
+    const hash = createHash('sha1')
+      .update(JSON.stringify(body) ?? '')
+      .digest('base64url');
+    return `W/"${hash}"`;
+  }
+
+  private key(resource: string, userId: string): string {
+    return `${resource}:${userId}`;
+  }
+}
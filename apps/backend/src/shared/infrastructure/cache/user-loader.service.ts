@@ -0,0 +1,118 @@
+import { Injectable } from '@nestjs/common';
+import { PrismaService } from '../database/prisma.service';
+import { LruCache } from './lru-cache';
+
+interface PendingLoad {
+  resolve: (user: UserSummary | null) => void;
+  reject: (error: unknown) => void;
+}
+
+export interface UserSummary {
+  id: string;
+  email: string;
+  username: string;
+  role: string;
+}
+
+/**
+ * User Loader
+ *
+ * DataLoader-style user-by-id lookups. Every id requested during one turn
+ * of the event loop is collected and fetched with a single
+ * `WHERE id IN (...)` query; concurrent requests for the same id share one
+ * promise. Results are kept in a bounded LRU with TTL.
+ *
+ * Writers must call `invalidate` when a user changes. Other API nodes only
+ * see the change once their entry expires (USER_CACHE_TTL_MS).
+ */
+@Injectable()
+export class UserLoader {
+  private static readonly MAX_BATCH_SIZE = 500;
+
+  private readonly cache = new LruCache<string, UserSummary>({
+    maxSize: parseInt(process.env.USER_CACHE_MAX_ENTRIES || '10000', 10),
+    ttlMs: parseInt(process.env.USER_CACHE_TTL_MS || '60000', 10),
+  });
+  private readonly pending = new Map<string, Promise<UserSummary | null>>();
+  private queue = new Map<string, PendingLoad>();
+  private dispatchScheduled = false;
+  private version = 0;
+
+  constructor(private readonly prisma: PrismaService) {}
+
+  load(id: string): Promise<UserSummary | null> {
+    const cached = this.cache.get(id);
+    if (cached) {
+      return Promise.resolve(cached);
+    }
+
+    const inFlight = this.pending.get(id);
+    if (inFlight) {
+      return inFlight;
+    }
+
+    const promise = new Promise<UserSummary | null>((resolve, reject) => {
+      this.queue.set(id, { resolve, reject });
+    });
+    this.pending.set(id, promise);
+    this.scheduleDispatch();
+
+    return promise;
+  }
+
+  loadMany(ids: string[]): Promise<(UserSummary | null)[]> {
+    return Promise.all(ids.map((id) => this.load(id)));
+  }
+
+  invalidate(id: string): void {
+    this.version += 1;
+    this.cache.delete(id);
+  }
+
+  private scheduleDispatch(): void {
+    if (this.dispatchScheduled) {
+      return;
+    }
+
+    this.dispatchScheduled = true;
+    setImmediate(() => {
+      this.dispatchScheduled = false;
+      void this.dispatch();
+    });
+  }
+
+  private async dispatch(): Promise<void> {
+    const queue = this.queue;
+    this.queue = new Map();
+
+    const ids = [...queue.keys()];
+    const version = this.version;
+
+    for (let i = 0; i < ids.length; i += UserLoader.MAX_BATCH_SIZE) {
+      const batch = ids.slice(i, i + UserLoader.MAX_BATCH_SIZE);
+
+      try {
+        const users = await this.prisma.user.findMany({
+          where: { id: { in: batch } },
+          select: { id: true, email: true, username: true, role: true },
+        });
+        const byId = new Map(users.map((u) => [u.id, u]));
+
+        for (const id of batch) {
+          const user = byId.get(id) ?? null;
+          // Skip caching if a write happened while the query was running
+          if (user && version === this.version) {
+            this.cache.set(id, user);
+          }
+          this.pending.delete(id);
+          queue.get(id)!.resolve(user);
+        }
+      } catch (error) {
+        for (const id of batch) {
+          this.pending.delete(id);
+          queue.get(id)!.reject(error);
+        }
+      }
+    }
+  }
+}
@@ -0,0 +1,29 @@
+import { Semaphore } from '../semaphore';
+
+describe('Semaphore', () => {
+  it('should never run more tasks than the limit', async () => {
+    const semaphore = new Semaphore(2);
+    let running = 0;
+    let peak = 0;
+
+    const task = async () => {
+      running += 1;
+      peak = Math.max(peak, running);
+      await new Promise((resolve) => setTimeout(resolve, 5));
+      running -= 1;
+    };
+
+    await Promise.all(Array.from({ length: 6 }, () => semaphore.run(task)));
+
+    expect(peak).toBe(2);
+    expect(semaphore.inUse).toBe(0);
+  });
+
+  it('should release the permit when a task fails', async () => {
+    const semaphore = new Semaphore(1);
+
+    await expect(semaphore.run(async () => Promise.reject(new Error('boom')))).rejects.toThrow('boom');
+
+    expect(await semaphore.run(async () => 'ok')).toBe('ok');
+  });
+});
@@ -0,0 +1,43 @@
+import { QueryBus } from '@nestjs/cqrs';
+import { ReplicaRouting } from '../replica-routing.service';
+import { PrismaService } from '../prisma.service';
+
+class ReadQuery {}
+
+describe('ReplicaRouting', () => {
+  let prisma: { hasReplica: boolean; runOnReplica: jest.Mock };
+  let queryBus: { execute: jest.Mock };
+
+  const route = () =>
+    new ReplicaRouting(
+      prisma as unknown as PrismaService,
+      queryBus as unknown as QueryBus,
+    ).onModuleInit();
+
+  beforeEach(() => {
+    prisma = {
+      hasReplica: true,
+      runOnReplica: jest.fn((work: () => Promise<unknown>) => work()),
+    };
+    queryBus = { execute: jest.fn().mockResolvedValue('read') };
+  });
+
+  it('should run queries on the replica', async () => {
+    const execute = queryBus.execute;
+    route();
+
+    const query = new ReadQuery();
+    expect(await queryBus.execute(query)).toBe('read');
+    expect(prisma.runOnReplica).toHaveBeenCalledTimes(1);
+    expect(execute).toHaveBeenCalledWith(query);
+  });
+
+  it('should not wrap anything without a replica', () => {
+    prisma.hasReplica = false;
+    const execute = queryBus.execute;
+
+    route();
+
+    expect(queryBus.execute).toBe(execute);
+  });
+});
@@ -0,0 +1,82 @@
+import { Pool, PoolClient, PoolConfig } from 'pg';
+import { MetricsService } from '../metrics/metrics.service';
+
+type ConnectCallback = (
+  err: Error | undefined,
+  client: PoolClient | undefined,
+  done: (release?: any) => void,
+) => void;
+
+/**
+ * Pool settings read from the environment, `prefix` being DATABASE or
+ * DATABASE_REPLICA
+ */
+export function poolConfigFromEnv(prefix: string, connectionString: string): PoolConfig {
+  const setting = (name: string, fallback: string) =>
+    parseInt(process.env[`${prefix}_${name}`] || process.env[`DATABASE_${name}`] || fallback, 10);
+  const statementTimeoutMs = setting('STATEMENT_TIMEOUT_MS', '30000');
+
+  return {
+    connectionString,
+    max: setting('POOL_MAX', '10'),
+    idleTimeoutMillis: setting('POOL_IDLE_TIMEOUT_MS', '10000'),
+    // Also bounds the wait for a free connection once the pool is full
+    connectionTimeoutMillis: setting('POOL_ACQUIRE_TIMEOUT_MS', '5000'),
+    ...(statementTimeoutMs > 0 && { statement_timeout: statementTimeoutMs }),
+  };
+}
+
+/**
+ * Instrumented Pool
+ *
+ * pg.Pool that reports, under `db.<name>.*`, how long callers wait for a
+ * connection (`pool_wait_ms`), failed acquisitions, and gauges of its
+ * size, idle and waiting clients and saturation (share of `max` in use).
+ */
+export class InstrumentedPool extends Pool {
+  constructor(
+    private readonly name: string,
+    config: PoolConfig,
+    private readonly metrics: MetricsService,
+  ) {
+    super(config);
+
+    const max = config.max ?? 10;
+    metrics.gauge(`db.${name}.pool_total`, () => this.totalCount);
+    metrics.gauge(`db.${name}.pool_idle`, () => this.idleCount);
+    metrics.gauge(`db.${name}.pool_waiting`, () => this.waitingCount);
+    metrics.gauge(`db.${name}.pool_saturation`, () => (this.totalCount - this.idleCount) / max);
+  }
+
+  connect(): Promise<PoolClient>;
+  connect(callback: ConnectCallback): void;
+  connect(callback?: ConnectCallback): Promise<PoolClient> | void {
+    const startedAt = performance.now();
+    const acquired = (error: Error | undefined) => {
+      if (error) {
+        this.metrics.increment(`db.${this.name}.pool_acquire_failures`);
+      } else {
+        this.metrics.observe(`db.${this.name}.pool_wait_ms`, performance.now() - startedAt);
+      }
+    };
+
+    // Pool.query goes through the callback form
+    if (callback) {
+      return super.connect((error, client, done) => {
+        acquired(error);
+        callback(error, client, done);
+      });
+    }
+
+    return super.connect().then(
+      (client) => {
+        acquired(undefined);
+        return client;
+      },
+      (error: Error) => {
+        acquired(error);
+        throw error;
+      },
+    );
+  }
+}
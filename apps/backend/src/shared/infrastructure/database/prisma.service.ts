@@ -1,31 +1,180 @@
 import { Injectable, OnModuleInit, OnModuleDestroy } from '@nestjs/common';
-import { PrismaClient } from '@generated/prisma/client';
+import { Prisma, PrismaClient } from '@generated/prisma/client';
 import { PrismaPg } from '@prisma/adapter-pg';
-import { Pool } from 'pg';
+import { AsyncLocalStorage } from 'async_hooks';
+import { MetricsService } from '../metrics/metrics.service';
+import { InstrumentedPool, poolConfigFromEnv } from './instrumented-pool';
+
+interface TransactionContext {
+  tx: Prisma.TransactionClient;
+  afterCommit: (() => void)[];
+}
+
+export interface TransactionOptions {
+  bulk?: boolean;
+}
 
 /**
  * Prisma Service
  *
  * Provides database connection using Prisma with PostgreSQL adapter.
  * Automatically connects on module init and disconnects on module destroy.
+ *
+ * `runInTransaction` opens an interactive transaction that is carried by
+ * async context: repositories that go through `client` join it without the
+ * transaction being passed around, and nested calls reuse the outer one.
+ *
+ * Pools are sized and timed out through DATABASE_POOL_* and
+ * DATABASE_STATEMENT_TIMEOUT_MS (see `poolConfigFromEnv`); bulk
+ * transactions opt out of the statement timeout. When
+ * DATABASE_REPLICA_URL is set, work run with `runOnReplica` (every query,
+ * see ReplicaRouting) reads through a second pool on the replica;
+ * transactions always run on the primary, and writes that a read path may
+ * need, or reads that must not lag, go through `runOnPrimary`.
  */
 @Injectable()
 export class PrismaService extends PrismaClient implements OnModuleInit, OnModuleDestroy {
-  private pool: Pool;
+  private static readonly TRANSACTION_TIMEOUT_MS = 15000;
+
+  private readonly bulkTransactionTimeoutMs = parseInt(
+    process.env.DATABASE_BULK_TRANSACTION_TIMEOUT_MS || '300000',
+    10,
+  );
+
+  private pool: InstrumentedPool;
+  private readonly replica: { client: PrismaClient; pool: InstrumentedPool } | null;
+  private readonly transactionContext = new AsyncLocalStorage<TransactionContext>();
+  // true within runOnReplica, false within runOnPrimary
+  private readonly replicaScope = new AsyncLocalStorage<boolean>();
 
-  constructor() {
-    const pool = new Pool({ connectionString: process.env.DATABASE_URL });
-    const adapter = new PrismaPg(pool);
-    super({ adapter });
+  constructor(metrics: MetricsService) {
+    const pool = new InstrumentedPool(
+      'primary',
+      poolConfigFromEnv('DATABASE', process.env.DATABASE_URL!),
+      metrics,
+    );
+    super({ adapter: new PrismaPg(pool) });
     this.pool = pool;
+
+    const replicaUrl = process.env.DATABASE_REPLICA_URL;
+    if (replicaUrl) {
+      const replicaPool = new InstrumentedPool(
+        'replica',
+        poolConfigFromEnv('DATABASE_REPLICA', replicaUrl),
+        metrics,
+      );
+      this.replica = {
+        client: new PrismaClient({ adapter: new PrismaPg(replicaPool) }),
+        pool: replicaPool,
+      };
+    } else {
+      this.replica = null;
+    }
   }
 
   async onModuleInit() {
     await this.$connect();
+    await this.replica?.client.$connect();
   }
 
   async onModuleDestroy() {
     await this.$disconnect();
     await this.pool.end();
+    if (this.replica) {
+      await this.replica.client.$disconnect();
+      await this.replica.pool.end();
+    }
+  }
+
+  /**
+   * The current transaction client; outside one, the replica within
+   * `runOnReplica` and the service itself otherwise
+   */
+  get client(): Prisma.TransactionClient {
+    const tx = this.transactionContext.getStore()?.tx;
+    if (tx) {
+      return tx;
+    }
+
+    return this.replica && this.replicaScope.getStore() ? this.replica.client : this;
+  }
+
+  get hasReplica(): boolean {
+    return this.replica !== null;
+  }
+
+  /**
+   * Whether `client` currently reads from the replica
+   */
+  get onReplica(): boolean {
+    return this.replica !== null && !this.inTransaction && this.replicaScope.getStore() === true;
+  }
+
+  /**
+   * Run read-only `work` against the replica, if one is configured
+   */
+  runOnReplica<T>(work: () => Promise<T>): Promise<T> {
+    if (!this.replica || this.inTransaction || this.replicaScope.getStore() === false) {
+      return work();
+    }
+
+    return this.replicaScope.run(true, work);
+  }
+
+  /**
+   * Run `work` against the primary, leaving a `runOnReplica` scope; reads
+   * it starts with `runOnReplica` stay on the primary too
+   */
+  runOnPrimary<T>(work: () => T): T {
+    return this.replicaScope.run(false, work);
+  }
+
+  get inTransaction(): boolean {
+    return this.transactionContext.getStore() !== undefined;
+  }
+
+  /**
+   * Run `work` in a transaction, joining the current one if any. A `bulk`
+   * transaction (imports, settlement passes) has no statement timeout and
+   * is bounded by DATABASE_BULK_TRANSACTION_TIMEOUT_MS instead
+   */
+  async runInTransaction<T>(
+    work: () => Promise<T>,
+    { bulk = false }: TransactionOptions = {},
+  ): Promise<T> {
+    if (this.inTransaction) {
+      return work();
+    }
+
+    const context: TransactionContext = { tx: this, afterCommit: [] };
+    const result = await this.$transaction(
+      async (tx) => {
+        context.tx = tx;
+        if (bulk) {
+          await tx.$executeRaw`SET LOCAL statement_timeout = 0`;
+        }
+        return this.transactionContext.run(context, work);
+      },
+      { timeout: bulk ? this.bulkTransactionTimeoutMs : PrismaService.TRANSACTION_TIMEOUT_MS },
+    );
+
+    for (const hook of context.afterCommit) {
+      hook();
+    }
+
+    return result;
+  }
+
+  /**
+   * Run `hook` once the current transaction commits, or right away outside one
+   */
+  afterCommit(hook: () => void): void {
+    const context = this.transactionContext.getStore();
+    if (context) {
+      context.afterCommit.push(hook);
+      return;
+    }
+
+    hook();
   }
 }
@@ -0,0 +1,36 @@
+import { Injectable, Logger, OnModuleInit } from '@nestjs/common';
+import { QueryBus } from '@nestjs/cqrs';
+import { PrismaService } from './prisma.service';
+
+/**
+ * Replica Routing
+ *
+ * Runs every query executed through the QueryBus in
+ * `PrismaService.runOnReplica`, so reads such as leaderboards, progress,
+ * wallet and lives no longer compete with answer writes for primary
+ * connections. Command handlers, event handlers and jobs keep using the
+ * primary. Nothing is wrapped when no replica is configured.
+ *
+ * Replica reads may lag the primary by the replication delay.
+ */
+@Injectable()
+export class ReplicaRouting implements OnModuleInit {
+  private readonly logger = new Logger(ReplicaRouting.name);
+
+  constructor(
+    private readonly prisma: PrismaService,
+    private readonly queryBus: QueryBus,
+  ) {}
+
+  onModuleInit(): void {
+    if (!this.prisma.hasReplica) {
+      return;
+    }
+
+    const execute = this.queryBus.execute.bind(this.queryBus);
+    this.queryBus.execute = ((query) =>
+      this.prisma.runOnReplica(() => execute(query))) as QueryBus['execute'];
+
+    this.logger.log('Routing queries to the read replica');
+  }
+}
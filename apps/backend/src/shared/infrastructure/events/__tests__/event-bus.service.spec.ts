@@ -0,0 +1,98 @@
+import { EventEmitter2 } from '@nestjs/event-emitter';
+import { DomainEvent } from '../../../domain/base/domain-event.base';
+import { EventBusService } from '../event-bus.service';
+import { OutboxDispatcher } from '../outbox-dispatcher.service';
+import { PrismaService } from '../../database/prisma.service';
+import { MetricsService } from '../../metrics/metrics.service';
+
+class QuizCompletedEvent extends DomainEvent {
+  constructor(private readonly sessionId: string) {
+    super('quiz.session.completed');
+  }
+
+  getAggregateId(): string {
+    return this.sessionId;
+  }
+}
+
+describe('EventBusService', () => {
+  const env = { ...process.env };
+  let emitter: EventEmitter2;
+  let metrics: MetricsService;
+
+  afterEach(() => {
+    process.env = { ...env };
+  });
+
+  const create = (mode: string, vars: Record<string, string> = {}) => {
+    Object.assign(process.env, {
+      EVENT_BUS_MODE: mode,
+      EVENT_BUS_HANDLER_TIMEOUT_MS: '60000',
+      ...vars,
+    });
+    emitter = new EventEmitter2();
+    const prisma = { inTransaction: false, afterCommit: jest.fn() };
+    const outbox = { handles: () => false, enqueue: jest.fn() };
+    metrics = new MetricsService();
+    return new EventBusService(
+      emitter,
+      metrics,
+      prisma as unknown as PrismaService,
+      outbox as unknown as OutboxDispatcher,
+    );
+  };
+
+  it('should dispatch the events of one publishAll concurrently in parallel mode', async () => {
+    const bus = create('parallel');
+    const started: string[] = [];
+    let release!: () => void;
+    const gate = new Promise<void>((resolve) => (release = resolve));
+
+    emitter.on('quiz.session.completed', async (event: QuizCompletedEvent) => {
+      started.push(event.getAggregateId());
+      await gate;
+    });
+
+    const publishing = bus.publishAll([
+      new QuizCompletedEvent('session-1'),
+      new QuizCompletedEvent('session-2'),
+    ]);
+    await new Promise((resolve) => setImmediate(resolve));
+
+    expect(started).toEqual(['session-1', 'session-2']);
+    release();
+    await publishing;
+  });
+
+  it('should not count the wait for a permit against the handler timeout', async () => {
+    const bus = create('parallel', {
+      EVENT_BUS_MAX_CONCURRENCY: '1',
+      EVENT_BUS_HANDLER_TIMEOUT_MS: '50',
+    });
+    const increment = jest.spyOn(metrics, 'increment');
+    const handler = () => new Promise((resolve) => setTimeout(resolve, 30));
+    emitter.on('quiz.session.completed', handler);
+    emitter.on('quiz.session.completed', handler);
+
+    await bus.publish(new QuizCompletedEvent('session-1'));
+
+    expect(increment).not.toHaveBeenCalledWith('event_bus.handler_timeouts');
+  });
+
+  it.each(['serial', 'parallel'])(
+    'should not wait for subscribers registered with async in %s mode',
+    async (mode) => {
+      const bus = create(mode);
+      const detached = jest.fn(() => new Promise<void>(() => undefined));
+      const awaited = jest.fn();
+      emitter.on('quiz.session.completed', detached, { async: true });
+      emitter.on('quiz.session.completed', awaited);
+
+      await bus.publish(new QuizCompletedEvent('session-1'));
+      await new Promise((resolve) => setImmediate(resolve));
+
+      expect(awaited).toHaveBeenCalled();
+      expect(detached).toHaveBeenCalled();
+    },
+  );
+});
@@ -0,0 +1,196 @@
+import { DiscoveryService, MetadataScanner } from '@nestjs/core';
+import { OutboxDispatcher, DeliveredDomainEvent } from '../outbox-dispatcher.service';
+import { OnDomainEvent } from '../on-domain-event.decorator';
+import { PrismaService } from '../../database/prisma.service';
+import { MetricsService } from '../../metrics/metrics.service';
+
+class CoinsHandler {
+  received: DeliveredDomainEvent[] = [];
+  failWith?: Error;
+
+  @OnDomainEvent('quiz.session.completed')
+  async handle(event: DeliveredDomainEvent) {
+    if (this.failWith) {
+      throw this.failWith;
+    }
+    this.received.push(event);
+  }
+}
+
+class XpHandler {
+  calls = 0;
+
+  @OnDomainEvent('quiz.session.completed')
+  async handle() {
+    this.calls += 1;
+  }
+}
+
+class ScoresHandler {
+  batches: DeliveredDomainEvent[][] = [];
+  failFor?: string;
+
+  @OnDomainEvent('quiz.session.completed', { batch: true })
+  async handle(events: DeliveredDomainEvent[]) {
+    if (events.some((event) => event.eventId === this.failFor)) {
+      throw new Error('bad event');
+    }
+    this.batches.push(events);
+  }
+}
+
+describe('OutboxDispatcher', () => {
+  const row = (attempts = 0, id = 'event-1') => ({
+    id,
+    eventName: 'quiz.session.completed',
+    aggregateId: 'session-1',
+    payload: { userId: 'user-1', occurredAt: '2026-10-18T09:00:00.000Z' },
+    occurredAt: new Date('2026-10-18T09:00:00.000Z'),
+    attempts,
+  });
+
+  let prisma: any;
+  let coins: CoinsHandler;
+  let xp: XpHandler;
+  let scores: ScoresHandler;
+  let dispatcher: OutboxDispatcher;
+
+  const createDispatcher = (claimed: ReturnType<typeof row>[]) => {
+    prisma = {
+      $queryRaw: jest.fn().mockResolvedValueOnce(claimed).mockResolvedValue([]),
+      processedEvent: { findMany: jest.fn().mockResolvedValue([]), createMany: jest.fn() },
+      outboxEvent: {
+        delete: jest.fn(),
+        deleteMany: jest.fn(),
+        update: jest.fn(),
+        createMany: jest.fn(),
+      },
+      outboxDeadLetter: { create: jest.fn() },
+      runInTransaction: (work: () => Promise<unknown>) => work(),
+      afterCommit: jest.fn(),
+    };
+    prisma.client = prisma;
+
+    const discovery = {
+      getProviders: () =>
+        [coins, xp, scores].map((instance) => ({ instance, isDependencyTreeStatic: () => true })),
+    };
+
+    dispatcher = new OutboxDispatcher(
+      prisma as PrismaService,
+      new MetricsService(),
+      discovery as unknown as DiscoveryService,
+      new MetadataScanner(),
+    );
+    dispatcher.onModuleInit();
+  };
+
+  beforeEach(() => {
+    coins = new CoinsHandler();
+    xp = new XpHandler();
+    scores = new ScoresHandler();
+  });
+
+  it('should only handle events with durable subscribers', () => {
+    createDispatcher([]);
+
+    expect(dispatcher.handles('quiz.session.completed')).toBe(true);
+    expect(dispatcher.handles('question.created')).toBe(false);
+  });
+
+  it('should deliver to every handler, record idempotency keys and delete the row', async () => {
+    createDispatcher([row()]);
+
+    await dispatcher.kick();
+
+    expect(coins.received).toHaveLength(1);
+    expect(coins.received[0].props.occurredAt).toEqual(new Date('2026-10-18T09:00:00.000Z'));
+    expect(coins.received[0].getAggregateId()).toBe('session-1');
+    expect(xp.calls).toBe(1);
+    expect(prisma.processedEvent.createMany).toHaveBeenCalledWith({
+      data: [{ eventId: 'event-1', handler: 'CoinsHandler.handle' }],
+    });
+    expect(prisma.outboxEvent.deleteMany).toHaveBeenCalledWith({
+      where: { id: { in: ['event-1'] } },
+    });
+  });
+
+  it('should skip handlers that already processed the event', async () => {
+    createDispatcher([row()]);
+    prisma.processedEvent.findMany.mockResolvedValue([
+      { eventId: 'event-1', handler: 'XpHandler.handle' },
+    ]);
+
+    await dispatcher.kick();
+
+    expect(xp.calls).toBe(0);
+    expect(coins.received).toHaveLength(1);
+  });
+
+  it('should reschedule a failed event with backoff', async () => {
+    createDispatcher([row(2)]);
+    coins.failWith = new Error('wallet locked');
+
+    await dispatcher.kick();
+
+    expect(prisma.outboxEvent.deleteMany).not.toHaveBeenCalled();
+    const { data } = prisma.outboxEvent.update.mock.calls[0][0];
+    expect(data.attempts).toBe(3);
+    expect(data.lastError).toContain('wallet locked');
+    expect(data.availableAt.getTime()).toBeGreaterThan(Date.now() + 3000);
+  });
+
+  it('should dead-letter an event after the last attempt', async () => {
+    createDispatcher([row(9)]);
+    coins.failWith = new Error('wallet locked');
+
+    await dispatcher.kick();
+
+    expect(prisma.outboxDeadLetter.create).toHaveBeenCalledWith({
+      data: expect.objectContaining({ id: 'event-1', attempts: 10 }),
+    });
+    expect(prisma.outboxEvent.delete).toHaveBeenCalledWith({ where: { id: 'event-1' } });
+  });
+
+  it("should leave an aggregate's later events for retry after one fails", async () => {
+    createDispatcher([row(0, 'event-1'), row(0, 'event-2')]);
+    coins.failWith = new Error('wallet locked');
+
+    await dispatcher.kick();
+
+    expect(xp.calls).toBe(1);
+    expect(prisma.outboxEvent.deleteMany).not.toHaveBeenCalled();
+    const [[failed], [held]] = prisma.outboxEvent.update.mock.calls;
+    expect(failed.where).toEqual({ id: 'event-1' });
+    expect(failed.data.attempts).toBe(1);
+    expect(held).toEqual({
+      where: { id: 'event-2' },
+      data: { availableAt: failed.data.availableAt, lockedUntil: null },
+    });
+  });
+
+  it('should hand all claimed events to a batch handler in one call', async () => {
+    createDispatcher([row(0, 'event-1'), row(0, 'event-2'), row(0, 'event-3')]);
+
+    await dispatcher.kick();
+
+    expect(scores.batches).toHaveLength(1);
+    expect(scores.batches[0].map((event) => event.eventId)).toEqual(['event-1', 'event-2', 'event-3']);
+    expect(coins.received).toHaveLength(3);
+  });
+
+  it('should retry a failed batch event by event and only reschedule the bad one', async () => {
+    createDispatcher([row(0, 'event-1'), row(0, 'event-2')]);
+    scores.failFor = 'event-2';
+
+    await dispatcher.kick();
+
+    expect(scores.batches.map((batch) => batch.map((event) => event.eventId))).toEqual([['event-1']]);
+    expect(prisma.outboxEvent.deleteMany).toHaveBeenCalledWith({
+      where: { id: { in: ['event-1'] } },
+    });
+    expect(prisma.outboxEvent.update).toHaveBeenCalledWith(
+      expect.objectContaining({ where: { id: 'event-2' } }),
+    );
+  });
+});
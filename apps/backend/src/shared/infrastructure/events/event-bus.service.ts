@@ -1,31 +1,161 @@
-import { Injectable } from '@nestjs/common';
+import { Injectable, Logger } from '@nestjs/common';
 import { EventEmitter2 } from '@nestjs/event-emitter';
+import { AsyncLocalStorage } from 'async_hooks';
 import { DomainEvent } from '../../domain/base/domain-event.base';
+import { MetricsService } from '../metrics/metrics.service';
+import { Semaphore } from '../concurrency/semaphore';
+import { PrismaService } from '../database/prisma.service';
+import { OutboxDispatcher } from './outbox-dispatcher.service';
+
+export type EventDispatchMode = 'serial' | 'parallel';
+
+class EventHandlerTimeoutError extends Error {
+  constructor(eventName: string, timeoutMs: number) {
+    super(`Handler for ${eventName} did not finish within ${timeoutMs}ms`);
+    this.name = 'EventHandlerTimeoutError';
+  }
+}
 
 /**
  * Event Bus Service
  *
  * Wrapper around NestJS EventEmitter for publishing domain events.
  * Provides type-safe event publishing and ensures events are properly logged.
+ *
+ * Events that have `@OnDomainEvent` handlers are also written to the outbox
+ * through the current transaction; the OutboxDispatcher delivers them once
+ * it commits. `@OnEvent` subscribers are in-process only: inside a
+ * transaction they are notified after commit, otherwise right away.
+ *
+ * EVENT_BUS_MODE selects how `@OnEvent` subscribers run:
+ * - serial (default): emitAsync, one event after another.
+ * - parallel: the events of one publishAll and their subscribers run
+ *   concurrently, bounded by EVENT_BUS_MAX_CONCURRENCY across the process.
+ *   Once running, each one is awaited for at most
+ *   EVENT_BUS_HANDLER_TIMEOUT_MS, and a failing or slow subscriber does not
+ *   affect the others.
+ *
+ * In either mode a subscriber registered with `@OnEvent(name, { async: true })`
+ * is off the publisher's path: the emitter starts it on a later tick and
+ * publish does not wait for it.
  */
 @Injectable()
 export class EventBusService {
-  constructor(private readonly eventEmitter: EventEmitter2) {}
+  private readonly logger = new Logger(EventBusService.name);
+  private readonly mode: EventDispatchMode =
+    process.env.EVENT_BUS_MODE === 'parallel' ? 'parallel' : 'serial';
+  private readonly handlerTimeoutMs = parseInt(
+    process.env.EVENT_BUS_HANDLER_TIMEOUT_MS || '5000',
+    10,
+  );
+  private readonly semaphore = new Semaphore(
+    parseInt(process.env.EVENT_BUS_MAX_CONCURRENCY || '32', 10),
+  );
+  // Set while a subscriber runs: nested publishes reuse its permit instead
+  // of waiting for one, which could deadlock once every permit is held
+  private readonly handlerScope = new AsyncLocalStorage<true>();
+
+  constructor(
+    private readonly eventEmitter: EventEmitter2,
+    private readonly metrics: MetricsService,
+    private readonly prisma: PrismaService,
+    private readonly outbox: OutboxDispatcher,
+  ) {
+    metrics.gauge('event_bus.handlers_in_flight', () => this.semaphore.inUse);
+    metrics.gauge('event_bus.handlers_waiting', () => this.semaphore.waiting);
+  }
 
   /**
    * Publish a single domain event
    */
   async publish(event: DomainEvent): Promise<void> {
-    console.log(`[EventBus] Publishing event: ${event.eventName}`);
-    await this.eventEmitter.emitAsync(event.eventName, event);
+    await this.publishAll([event]);
   }
 
   /**
    * Publish multiple domain events
    */
   async publishAll(events: DomainEvent[]): Promise<void> {
+    await this.outbox.enqueue(events.filter((event) => this.outbox.handles(event.eventName)));
+
     for (const event of events) {
-      await this.publish(event);
+      this.logger.debug(`Publishing event: ${event.eventName}`);
     }
+
+    if (this.prisma.inTransaction) {
+      for (const event of events) {
+        this.prisma.afterCommit(() => void this.emitLocal(event));
+      }
+    } else if (this.mode === 'parallel') {
+      await Promise.all(events.map((event) => this.emitLocal(event)));
+    } else {
+      for (const event of events) {
+        await this.emitLocal(event);
+      }
+    }
+  }
+
+  private async emitLocal(event: DomainEvent): Promise<void> {
+    try {
+      if (this.mode === 'parallel') {
+        await this.dispatch(event);
+        return;
+      }
+
+      await this.eventEmitter.emitAsync(event.eventName, event);
+    } catch (error) {
+      this.logger.error(`Failed to notify subscribers of ${event.eventName}`, error);
+    }
+  }
+
+  private async dispatch(event: DomainEvent): Promise<void> {
+    const listeners = this.eventEmitter.listeners(event.eventName);
+    if (listeners.length === 0) {
+      return;
+    }
+
+    const startedAt = performance.now();
+    const nested = this.handlerScope.getStore() === true;
+
+    const results = await Promise.allSettled(
+      listeners.map((listener) => {
+        // Timed once running, so the wait for a permit is not counted
+        const invoke = () =>
+          this.withTimeout(
+            this.handlerScope.run(true, async () => {
+              await listener.call(this.eventEmitter, event);
+            }),
+            event.eventName,
+          );
+        return nested ? invoke() : this.semaphore.run(invoke);
+      }),
+    );
+
+    for (const result of results) {
+      if (result.status === 'rejected') {
+        const reason = result.reason as Error;
+        if (reason instanceof EventHandlerTimeoutError) {
+          this.metrics.increment('event_bus.handler_timeouts');
+          this.logger.warn(reason.message);
+        } else {
+          this.metrics.increment('event_bus.handler_failures');
+          this.logger.error(`Handler for ${event.eventName} failed: ${reason?.message}`, reason?.stack);
+        }
+      }
+    }
+
+    this.metrics.observe('event_bus.dispatch_ms', performance.now() - startedAt);
+  }
+
+  private withTimeout(task: Promise<void>, eventName: string): Promise<void> {
+    let timer: NodeJS.Timeout | undefined;
+    const timeout = new Promise<never>((_, reject) => {
+      timer = setTimeout(
+        () => reject(new EventHandlerTimeoutError(eventName, this.handlerTimeoutMs)),
+        this.handlerTimeoutMs,
+      );
+    });
+
+    return Promise.race([task, timeout]).finally(() => clearTimeout(timer));
   }
 }
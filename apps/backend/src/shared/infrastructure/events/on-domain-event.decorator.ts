@@ -0,0 +1,37 @@
+export const DOMAIN_EVENT_HANDLER_METADATA = 'DOMAIN_EVENT_HANDLER_METADATA';
+
+export interface OnDomainEventOptions {
+  /**
+   * Receive every pending event of this name from a dispatch round as one
+   * array instead of one call per event
+   */
+  batch?: boolean;
+}
+
+export interface DomainEventSubscription extends OnDomainEventOptions {
+  eventName: string;
+}
+
+/**
+ * On Domain Event Decorator
+ *
+ * Registers a method as a durable handler for a domain event. Events with at
+ * least one durable handler are written to the outbox in the publisher's
+ * transaction and delivered by the OutboxDispatcher after commit, at least
+ * once, with retries. Each handler runs in its own transaction together
+ * with its idempotency key, so a redelivery never applies it twice.
+ *
+ * Use `@OnEvent` instead for process-local reactions such as cache refreshes.
+ */
+export const OnDomainEvent =
+  (eventName: string, options: OnDomainEventOptions = {}): MethodDecorator =>
+  (_target, _key, descriptor: PropertyDescriptor) => {
+    const subscriptions: DomainEventSubscription[] =
+      Reflect.getMetadata(DOMAIN_EVENT_HANDLER_METADATA, descriptor.value) ?? [];
+    Reflect.defineMetadata(
+      DOMAIN_EVENT_HANDLER_METADATA,
+      [...subscriptions, { eventName, ...options }],
+      descriptor.value,
+    );
+    return descriptor;
+  };
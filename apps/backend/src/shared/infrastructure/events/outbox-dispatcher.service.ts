@@ -0,0 +1,501 @@
+import {
+  Injectable,
+  Logger,
+  OnApplicationBootstrap,
+  OnModuleDestroy,
+  OnModuleInit,
+} from '@nestjs/common';
+import { DiscoveryService, MetadataScanner } from '@nestjs/core';
+import { Prisma } from '@generated/prisma/client';
+import { v4 as uuidv4 } from 'uuid';
+import { DomainEvent } from '../../domain/base/domain-event.base';
+import { PrismaService } from '../database/prisma.service';
+import { MetricsService } from '../metrics/metrics.service';
+import { Semaphore } from '../concurrency/semaphore';
+import { DOMAIN_EVENT_HANDLER_METADATA, DomainEventSubscription } from './on-domain-event.decorator';
+
+interface OutboxRow {
+  id: string;
+  eventName: string;
+  aggregateId: string;
+  payload: Record<string, unknown>;
+  occurredAt: Date;
+  attempts: number;
+}
+
+interface DomainEventHandler {
+  key: string;
+  batch: boolean;
+  invoke: (payload: DeliveredDomainEvent | DeliveredDomainEvent[]) => Promise<unknown>;
+}
+
+/**
+ * Domain event as seen by durable handlers: the publisher's props, with
+ * ISO date strings turned back into Dates
+ */
+export interface DeliveredDomainEvent {
+  eventId: string;
+  eventName: string;
+  occurredOn: Date;
+  props: Record<string, unknown>;
+  getAggregateId(): string;
+}
+
+const ISO_DATE = /^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?Z$/;
+
+/**
+ * Outbox Dispatcher
+ *
+ * Delivers the domain events stored in outbox_events to the `@OnDomainEvent`
+ * handlers. Rows are claimed in batches with FOR UPDATE SKIP LOCKED and a
+ * short lease, so several API nodes can drain the same table. Delivery is
+ * at least once; processed_events records which handler already applied
+ * which event, in the same transaction as the handler's own writes.
+ *
+ * A failed row is retried with exponential backoff and moved to
+ * outbox_dead_letters after OUTBOX_MAX_ATTEMPTS. Events of one aggregate
+ * are delivered in order within a batch.
+ *
+ * Batch handlers (`{ batch: true }`) get all claimed events of their name
+ * in one call. A drain waits OUTBOX_LINGER_MS before its first claim so
+ * commits arriving together share a round, and under load the rounds grow
+ * up to OUTBOX_BATCH_SIZE on their own. When a batch fails, its events are
+ * retried one by one so a single bad event cannot hold back the others.
+ */
+@Injectable()
+export class OutboxDispatcher implements OnModuleInit, OnApplicationBootstrap, OnModuleDestroy {
+  private static readonly LEASE_MS = 60000;
+  private static readonly BASE_BACKOFF_MS = 1000;
+  private static readonly MAX_BACKOFF_MS = 5 * 60 * 1000;
+  private static readonly PRUNE_INTERVAL_MS = 60 * 60 * 1000;
+  private static readonly PROCESSED_RETENTION_MS = 7 * 24 * 60 * 60 * 1000;
+
+  private readonly logger = new Logger(OutboxDispatcher.name);
+  private readonly pollIntervalMs = parseInt(process.env.OUTBOX_POLL_INTERVAL_MS || '1000', 10);
+  private readonly batchSize = parseInt(process.env.OUTBOX_BATCH_SIZE || '50', 10);
+  private readonly lingerMs = parseInt(process.env.OUTBOX_LINGER_MS || '20', 10);
+  private readonly maxAttempts = parseInt(process.env.OUTBOX_MAX_ATTEMPTS || '10', 10);
+  private readonly semaphore = new Semaphore(
+    parseInt(process.env.OUTBOX_MAX_CONCURRENCY || '8', 10),
+  );
+  private readonly handlers = new Map<string, DomainEventHandler[]>();
+  private pollTimer?: NodeJS.Timeout;
+  private pruneTimer?: NodeJS.Timeout;
+  private draining: Promise<void> | null = null;
+  private pending = false;
+  private stopped = false;
+
+  constructor(
+    private readonly prisma: PrismaService,
+    private readonly metrics: MetricsService,
+    private readonly discovery: DiscoveryService,
+    private readonly metadataScanner: MetadataScanner,
+  ) {}
+
+  onModuleInit(): void {
+    this.discoverHandlers();
+  }
+
+  onApplicationBootstrap(): void {
+    this.pollTimer = setInterval(() => void this.kick(), this.pollIntervalMs);
+    this.pollTimer.unref();
+    this.pruneTimer = setInterval(() => void this.pruneProcessed(), OutboxDispatcher.PRUNE_INTERVAL_MS);
+    this.pruneTimer.unref();
+    void this.kick();
+  }
+
+  async onModuleDestroy(): Promise<void> {
+    this.stopped = true;
+    clearInterval(this.pollTimer);
+    clearInterval(this.pruneTimer);
+    await this.draining;
+  }
+
+  /**
+   * Whether any durable handler subscribes to the event
+   */
+  handles(eventName: string): boolean {
+    return this.handlers.has(eventName);
+  }
+
+  /**
+   * Store events in the outbox using the current transaction, and start a
+   * drain once it commits
+   */
+  async enqueue(events: DomainEvent[]): Promise<void> {
+    if (events.length === 0) {
+      return;
+    }
+
+    const now = new Date();
+    await this.prisma.client.outboxEvent.createMany({
+      data: events.map((event) => ({
+        id: uuidv4(),
+        eventName: event.eventName,
+        aggregateId: event.getAggregateId(),
+        payload: this.serialize(event),
+        occurredAt: event.occurredOn,
+        availableAt: now,
+      })),
+    });
+    this.metrics.increment('outbox.enqueued', events.length);
+
+    this.prisma.afterCommit(() => void this.kick());
+  }
+
+  /**
+   * Drain the outbox now; calls made while a drain runs schedule one more pass
+   */
+  kick(): Promise<void> {
+    if (this.stopped) {
+      return Promise.resolve();
+    }
+
+    if (this.draining) {
+      this.pending = true;
+      return this.draining;
+    }
+
+    this.draining = this.drain().finally(() => {
+      this.draining = null;
+      if (this.pending) {
+        this.pending = false;
+        void this.kick();
+      }
+    });
+    return this.draining;
+  }
+
+  private async drain(): Promise<void> {
+    try {
+      if (this.lingerMs > 0) {
+        await new Promise((resolve) => setTimeout(resolve, this.lingerMs));
+      }
+
+      let claimed: number;
+      do {
+        const batch = await this.claim();
+        claimed = batch.length;
+        await this.processBatch(batch);
+      } while (claimed === this.batchSize && !this.stopped);
+    } catch (error) {
+      this.logger.error('Failed to drain the outbox', error);
+    }
+  }
+
+  private claim(): Promise<OutboxRow[]> {
+    return this.prisma.$queryRaw<OutboxRow[]>`
+      UPDATE outbox_events
+      SET "lockedUntil" = (NOW() AT TIME ZONE 'UTC')
+        + (${OutboxDispatcher.LEASE_MS}::int * INTERVAL '1 millisecond')
+      WHERE id IN (
+        SELECT id FROM outbox_events
+        WHERE "availableAt" <= (NOW() AT TIME ZONE 'UTC')
+          AND ("lockedUntil" IS NULL OR "lockedUntil" < (NOW() AT TIME ZONE 'UTC'))
+        ORDER BY "createdAt"
+        LIMIT ${this.batchSize}
+        FOR UPDATE SKIP LOCKED
+      )
+      RETURNING id, "eventName", "aggregateId", payload, "occurredAt", attempts
+    `;
+  }
+
+  private async processBatch(batch: OutboxRow[]): Promise<void> {
+    if (batch.length === 0) {
+      return;
+    }
+
+    const rows = [...batch].sort((a, b) => a.occurredAt.getTime() - b.occurredAt.getTime());
+    const failures = new Map<string, string[]>();
+    const deferred = new Map<string, string>();
+
+    try {
+      const processed = await this.prisma.processedEvent.findMany({
+        where: { eventId: { in: rows.map((row) => row.id) } },
+        select: { eventId: true, handler: true },
+      });
+      const done = new Set(processed.map((p) => `${p.eventId}|${p.handler}`));
+      const events = new Map(rows.map((row) => [row.id, this.rehydrate(row)]));
+      const pendingFor = (handler: DomainEventHandler, candidates: OutboxRow[]) =>
+        candidates.filter((row) => !done.has(`${row.id}|${handler.key}`));
+
+      await Promise.all([
+        this.deliverBatches(rows, events, pendingFor, failures),
+        this.deliverEach(rows, events, pendingFor, failures, deferred),
+      ]);
+    } catch (error) {
+      // Rows stay leased and are claimed again once the lease expires
+      this.logger.error(`Failed to deliver ${rows.length} outbox events`, error);
+      return;
+    }
+
+    await this.settle(rows, failures, deferred);
+  }
+
+  private async deliverBatches(
+    rows: OutboxRow[],
+    events: Map<string, DeliveredDomainEvent>,
+    pendingFor: (handler: DomainEventHandler, rows: OutboxRow[]) => OutboxRow[],
+    failures: Map<string, string[]>,
+  ): Promise<void> {
+    const tasks: Promise<void>[] = [];
+
+    for (const [eventName, handlers] of this.handlers) {
+      const named = rows.filter((row) => row.eventName === eventName);
+
+      for (const handler of handlers.filter((h) => h.batch)) {
+        const pending = pendingFor(handler, named);
+        if (pending.length === 0) {
+          continue;
+        }
+
+        tasks.push(
+          this.runHandler(handler, pending, events).catch(async (error) => {
+            if (pending.length === 1) {
+              this.recordFailure(failures, pending[0], handler, error);
+              return;
+            }
+
+            for (const row of pending) {
+              await this.runHandler(handler, [row], events).catch((retryError) =>
+                this.recordFailure(failures, row, handler, retryError),
+              );
+            }
+          }),
+        );
+      }
+    }
+
+    await Promise.all(tasks);
+  }
+
+  /**
+   * Deliver to per-event handlers, each aggregate's events in order. After
+   * an event fails, the aggregate's later events are deferred (by id, to
+   * the failed event's id) and delivered once it has been
+   */
+  private async deliverEach(
+    rows: OutboxRow[],
+    events: Map<string, DeliveredDomainEvent>,
+    pendingFor: (handler: DomainEventHandler, rows: OutboxRow[]) => OutboxRow[],
+    failures: Map<string, string[]>,
+    deferred: Map<string, string>,
+  ): Promise<void> {
+    const byAggregate = new Map<string, OutboxRow[]>();
+    for (const row of rows) {
+      const group = byAggregate.get(row.aggregateId) ?? [];
+      group.push(row);
+      byAggregate.set(row.aggregateId, group);
+    }
+
+    await Promise.all(
+      [...byAggregate.values()].map(async (group) => {
+        for (const [index, row] of group.entries()) {
+          const handlers = (this.handlers.get(row.eventName) ?? []).filter(
+            (h) => !h.batch && pendingFor(h, [row]).length > 0,
+          );
+
+          let failed = false;
+          await Promise.all(
+            handlers.map((handler) =>
+              this.runHandler(handler, [row], events).catch((error) => {
+                failed = true;
+                this.recordFailure(failures, row, handler, error);
+              }),
+            ),
+          );
+
+          if (failed) {
+            for (const later of group.slice(index + 1)) {
+              deferred.set(later.id, row.id);
+            }
+            return;
+          }
+        }
+      }),
+    );
+  }
+
+  /**
+   * Run a handler and record its idempotency keys in one transaction
+   */
+  private runHandler(
+    handler: DomainEventHandler,
+    rows: OutboxRow[],
+    events: Map<string, DeliveredDomainEvent>,
+  ): Promise<void> {
+    const delivered = rows.map((row) => events.get(row.id)!);
+
+    return this.semaphore.run(() =>
+      this.prisma.runInTransaction(async () => {
+        await handler.invoke(handler.batch ? delivered : delivered[0]);
+        await this.prisma.client.processedEvent.createMany({
+          data: rows.map((row) => ({ eventId: row.id, handler: handler.key })),
+        });
+      }),
+    );
+  }
+
+  private recordFailure(
+    failures: Map<string, string[]>,
+    row: OutboxRow,
+    handler: DomainEventHandler,
+    error: unknown,
+  ): void {
+    const errors = failures.get(row.id) ?? [];
+    errors.push(`${handler.key}: ${(error as Error)?.message ?? error}`);
+    failures.set(row.id, errors);
+  }
+
+  private async settle(
+    rows: OutboxRow[],
+    failures: Map<string, string[]>,
+    deferred: Map<string, string>,
+  ): Promise<void> {
+    const delivered = rows.filter((row) => !failures.has(row.id) && !deferred.has(row.id));
+    const held = rows.filter((row) => !failures.has(row.id) && deferred.has(row.id));
+
+    try {
+      if (delivered.length > 0) {
+        await this.prisma.outboxEvent.deleteMany({
+          where: { id: { in: delivered.map((row) => row.id) } },
+        });
+        this.metrics.increment('outbox.delivered', delivered.length);
+        for (const row of delivered) {
+          this.metrics.observe('outbox.lag_ms', Date.now() - row.occurredAt.getTime());
+        }
+      }
+
+      const retryAt = new Map<string, Date>();
+      for (const row of rows) {
+        const errors = failures.get(row.id);
+        if (errors) {
+          retryAt.set(row.id, await this.retryLater(row, errors.join('; ')));
+        }
+      }
+
+      // Not an attempt: released to become available with the event before them
+      for (const row of held) {
+        const availableAt = retryAt.get(deferred.get(row.id)!) ?? new Date();
+        await this.prisma.outboxEvent.update({
+          where: { id: row.id },
+          data: { availableAt, lockedUntil: null },
+        });
+      }
+      if (held.length > 0) {
+        this.metrics.increment('outbox.deferred', held.length);
+      }
+    } catch (error) {
+      this.logger.error(`Failed to settle ${rows.length} outbox events`, error);
+    }
+  }
+
+  /**
+   * Reschedule a failed event, or dead-letter it after the last attempt;
+   * resolves to when it becomes available again
+   */
+  private async retryLater(row: OutboxRow, lastError: string): Promise<Date> {
+    const attempts = row.attempts + 1;
+
+    if (attempts >= this.maxAttempts) {
+      await this.prisma.runInTransaction(async () => {
+        await this.prisma.client.outboxDeadLetter.create({
+          data: {
+            id: row.id,
+            eventName: row.eventName,
+            aggregateId: row.aggregateId,
+            payload: row.payload as Prisma.InputJsonObject,
+            occurredAt: row.occurredAt,
+            attempts,
+            lastError,
+          },
+        });
+        await this.prisma.client.outboxEvent.delete({ where: { id: row.id } });
+      });
+      this.metrics.increment('outbox.dead_lettered');
+      this.logger.error(
+        `Outbox event ${row.id} (${row.eventName}) dead-lettered after ${attempts} attempts: ${lastError}`,
+      );
+      return new Date();
+    }
+
+    const backoffMs = Math.min(
+      OutboxDispatcher.MAX_BACKOFF_MS,
+      OutboxDispatcher.BASE_BACKOFF_MS * 2 ** (attempts - 1),
+    );
+    const availableAt = new Date(Date.now() + backoffMs);
+    await this.prisma.outboxEvent.update({
+      where: { id: row.id },
+      data: {
+        attempts,
+        availableAt,
+        lockedUntil: null,
+        lastError,
+      },
+    });
+    this.metrics.increment('outbox.retried');
+    this.logger.warn(
+      `Outbox event ${row.id} (${row.eventName}) failed, retrying in ${backoffMs}ms: ${lastError}`,
+    );
+    return availableAt;
+  }
+
+  private async pruneProcessed(): Promise<void> {
+    try {
+      await this.prisma.processedEvent.deleteMany({
+        where: {
+          processedAt: { lt: new Date(Date.now() - OutboxDispatcher.PROCESSED_RETENTION_MS) },
+        },
+      });
+    } catch (error) {
+      this.logger.warn(`Failed to prune processed events: ${(error as Error).message}`);
+    }
+  }
+
+  private discoverHandlers(): void {
+    for (const wrapper of this.discovery.getProviders()) {
+      const { instance } = wrapper;
+      if (!instance || typeof instance !== 'object' || !wrapper.isDependencyTreeStatic()) {
+        continue;
+      }
+
+      const prototype = Object.getPrototypeOf(instance);
+      for (const method of this.metadataScanner.getAllMethodNames(prototype)) {
+        const subscriptions: DomainEventSubscription[] | undefined = Reflect.getMetadata(
+          DOMAIN_EVENT_HANDLER_METADATA,
+          prototype[method],
+        );
+
+        for (const { eventName, batch } of subscriptions ?? []) {
+          const handlers = this.handlers.get(eventName) ?? [];
+          handlers.push({
+            key: `${instance.constructor.name}.${method}`,
+            batch: batch === true,
+            invoke: (payload) => instance[method](payload),
+          });
+          this.handlers.set(eventName, handlers);
+        }
+      }
+    }
+  }
+
+  private serialize(event: DomainEvent): Prisma.InputJsonObject {
+    const props = (event as DomainEvent & { props?: object }).props ?? {};
+    return JSON.parse(JSON.stringify(props));
+  }
+
+  private rehydrate(row: OutboxRow): DeliveredDomainEvent {
+    const props: Record<string, unknown> = {};
+    for (const [key, value] of Object.entries(row.payload ?? {})) {
+      props[key] = typeof value === 'string' && ISO_DATE.test(value) ? new Date(value) : value;
+    }
+
+    return {
+      eventId: row.id,
+      eventName: row.eventName,
+      occurredOn: row.occurredAt,
+      props,
+      getAggregateId: () => row.aggregateId,
+    };
+  }
+}
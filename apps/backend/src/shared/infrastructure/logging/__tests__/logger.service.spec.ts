@@ -0,0 +1,144 @@
+import { closeSync, mkdtempSync, openSync, readFileSync } from 'fs';
+import { tmpdir } from 'os';
+import { join } from 'path';
+import { AsyncLogSink } from '../async-log-sink';
+import { LoggerService } from '../logger.service';
+import { MetricsService } from '../../metrics/metrics.service';
+
+describe('AsyncLogSink', () => {
+  let path: string;
+  let fd: number;
+
+  beforeEach(() => {
+    path = join(mkdtempSync(join(tmpdir(), 'log-sink-')), 'out.log');
+    fd = openSync(path, 'w');
+  });
+
+  afterEach(() => closeSync(fd));
+
+  const drain = () => new Promise((resolve) => setTimeout(resolve, 50));
+  const lines = () => readFileSync(path, 'utf8').split('\n').filter(Boolean);
+
+  it('should write buffered lines in order, off the calling tick', async () => {
+    const sink = new AsyncLogSink(fd, 100, 2);
+
+    sink.write('a');
+    sink.write('b');
+    sink.write('c');
+    expect(lines()).toEqual([]);
+    expect(sink.buffered).toBe(3);
+
+    await drain();
+
+    expect(lines()).toEqual(['a', 'b', 'c']);
+    expect(sink.buffered).toBe(0);
+  });
+
+  it('should drop and count lines when the ring is full, then report them', async () => {
+    const sink = new AsyncLogSink(fd, 2);
+
+    expect(sink.write('a')).toBe(true);
+    expect(sink.write('b')).toBe(true);
+    expect(sink.write('c')).toBe(false);
+    expect(sink.dropped).toBe(1);
+
+    await drain();
+
+    const [notice, ...rest] = lines();
+    expect(JSON.parse(notice).message).toBe('Dropped 1 log lines');
+    expect(rest).toEqual(['a', 'b']);
+  });
+
+  it('should write everything buffered on shutdown', async () => {
+    const sink = new AsyncLogSink(fd, 100);
+
+    sink.write('last words');
+    await sink.end();
+
+    expect(lines()).toEqual(['last words']);
+  });
+
+  it('should finish the write in flight before the rest on shutdown', async () => {
+    const sink = new AsyncLogSink(fd, 100, 1);
+
+    sink.write('first');
+    sink.write('second');
+    // Let the first batch start, then shut down while it is in flight
+    await new Promise((resolve) => setImmediate(resolve));
+    sink.write('third');
+    await sink.end();
+
+    expect(lines()).toEqual(['first', 'second', 'third']);
+  });
+});
+
+describe('LoggerService', () => {
+  const env = { ...process.env };
+  let write: jest.SpyInstance;
+
+  beforeEach(() => {
+    write = jest.spyOn(AsyncLogSink.prototype, 'write').mockReturnValue(true);
+  });
+
+  afterEach(() => {
+    process.env = { ...env };
+    write.mockRestore();
+  });
+
+  const create = (vars: Record<string, string>) => {
+    Object.assign(process.env, vars);
+    return new LoggerService(new MetricsService());
+  };
+  const written = () => write.mock.calls.map(([line]) => JSON.parse(line));
+
+  it('should write one JSON line per entry with its context', () => {
+    const logger = create({ LOG_LEVEL: 'log' });
+
+    logger.log('Quiz started', 'QuizController');
+    logger.warn({ message: 'Slow query', durationMs: 820 }, 'PrismaService');
+
+    expect(written()).toEqual([
+      expect.objectContaining({ level: 'log', context: 'QuizController', message: 'Quiz started' }),
+      expect.objectContaining({
+        level: 'warn',
+        context: 'PrismaService',
+        message: 'Slow query',
+        durationMs: 820,
+      }),
+    ]);
+  });
+
+  it('should record the stack of a logged error', () => {
+    const logger = create({ LOG_LEVEL: 'log' });
+
+    logger.error('Failed to notify subscribers', new Error('boom'), 'EventBusService');
+
+    const [entry] = written();
+    expect(entry.context).toBe('EventBusService');
+    expect(entry.stack).toContain('Error: boom');
+  });
+
+  it('should discard entries below LOG_LEVEL before formatting them', () => {
+    const logger = create({ LOG_LEVEL: 'warn' });
+    const message = { toJSON: jest.fn() };
+
+    logger.log(message);
+    logger.debug(message);
+    logger.error('kept');
+
+    expect(message.toJSON).not.toHaveBeenCalled();
+    expect(written().map((entry) => entry.level)).toEqual(['error']);
+  });
+
+  it('should sample debug entries only', () => {
+    const logger = create({ LOG_LEVEL: 'debug', LOG_DEBUG_SAMPLE_RATE: '0.25' });
+    const random = jest.spyOn(Math, 'random').mockReturnValueOnce(0.1).mockReturnValueOnce(0.9);
+
+    logger.debug('kept');
+    logger.debug('sampled out');
+    logger.log('always kept');
+
+    expect(written().map((entry) => entry.message)).toEqual(['kept', 'always kept']);
+    random.mockRestore();
+  });
+});
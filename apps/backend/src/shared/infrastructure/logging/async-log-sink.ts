@@ -0,0 +1,178 @@
+import { write, writeSync } from 'fs';
+
+const RETRY_DELAY_MS = 10;
+
+/**
+ * Async Log Sink
+ *
+ * Buffers formatted log lines in a fixed-size ring and writes them to a file
+ * descriptor in batches, off the event loop (fs.write runs on the libuv
+ * thread pool). One write is in flight at a time; lines logged meanwhile
+ * are joined into the next batch.
+ *
+ * Logging never blocks: when the ring is full because the descriptor cannot
+ * keep up (a slow pipe, a stalled collector), new lines are dropped and
+ * counted, and the next batch starts with a line saying how many were lost.
+ */
+export class AsyncLogSink {
+  private readonly ring: (string | undefined)[];
+  private head = 0;
+  private count = 0;
+  private droppedCount = 0;
+  private unreported = 0;
+  private writing = false;
+  private scheduled = false;
+  private ending = false;
+  /** Settles when the write in flight completes */
+  private inFlight: Promise<void> = Promise.resolve();
+  /** Part of the last batch the descriptor has not accepted yet */
+  private pending: Buffer | null = null;
+  private pendingLines = 0;
+
+  constructor(
+    private readonly fd: number,
+    capacity: number,
+    private readonly batchSize = 512,
+  ) {
+    this.ring = new Array(Math.max(1, capacity));
+  }
+
+  /**
+   * Lines waiting to be written
+   */
+  get buffered(): number {
+    return this.count;
+  }
+
+  /**
+   * Lines lost since startup, because the ring was full or a write failed
+   */
+  get dropped(): number {
+    return this.droppedCount;
+  }
+
+  /**
+   * Queue a line (without its trailing newline); false if it was dropped
+   */
+  write(line: string): boolean {
+    if (this.count === this.ring.length) {
+      this.droppedCount++;
+      this.unreported++;
+      return false;
+    }
+
+    this.ring[(this.head + this.count) % this.ring.length] = line;
+    this.count++;
+    this.schedule();
+    return true;
+  }
+
+  /**
+   * Write everything still buffered, for shutdown: waits for the write in
+   * flight, then writes the rest synchronously and in order
+   */
+  async end(): Promise<void> {
+    this.ending = true;
+    await this.inFlight;
+
+    try {
+      if (this.pending) {
+        this.writeFully(this.pending);
+        this.pending = null;
+      }
+      while (this.count > 0 || this.unreported > 0) {
+        this.writeFully(this.take());
+      }
+    } catch {
+      // Nowhere left to report it
+    }
+  }
+
+  private schedule(): void {
+    if (this.writing || this.scheduled || this.ending) {
+      return;
+    }
+    this.scheduled = true;
+    setImmediate(() => {
+      this.scheduled = false;
+      this.flush();
+    });
+  }
+
+  private flush(): void {
+    if (this.writing || this.ending) {
+      return;
+    }
+    if (!this.pending) {
+      if (this.count === 0 && this.unreported === 0) {
+        return;
+      }
+      this.pendingLines = Math.min(this.count, this.batchSize);
+      this.pending = this.take();
+    }
+
+    const chunk = this.pending;
+    let settle!: () => void;
+    this.inFlight = new Promise((resolve) => (settle = resolve));
+    this.writing = true;
+    write(this.fd, chunk, 0, chunk.length, null, (error, written) => {
+      this.writing = false;
+      settle();
+
+      if (error?.code === 'EAGAIN') {
+        setTimeout(() => this.flush(), RETRY_DELAY_MS).unref();
+        return;
+      }
+      if (error) {
+        this.droppedCount += this.pendingLines;
+        this.unreported += this.pendingLines;
+        this.pending = null;
+        // Report the loss once the descriptor may have recovered
+        setTimeout(() => this.flush(), RETRY_DELAY_MS).unref();
+        return;
+      }
+
+      this.pending = written < chunk.length ? chunk.subarray(written) : null;
+      if (this.pending || this.count > 0 || this.unreported > 0) {
+        this.flush();
+      }
+    });
+  }
+
+  /**
+   * Remove the next batch from the ring, preceded by the drop notice if
+   * lines were lost since the last one
+   */
+  private take(): Buffer {
+    const lines: string[] = [];
+
+    if (this.unreported > 0) {
+      lines.push(
+        JSON.stringify({
+          time: new Date().toISOString(),
+          level: 'warn',
+          context: AsyncLogSink.name,
+          message: `Dropped ${this.unreported} log lines`,
+        }),
+      );
+      this.unreported = 0;
+    }
+
+    const size = Math.min(this.count, this.batchSize);
+    for (let i = 0; i < size; i++) {
+      lines.push(this.ring[this.head]!);
+      this.ring[this.head] = undefined;
+      this.head = (this.head + 1) % this.ring.length;
+    }
+    this.count -= size;
+
+    return Buffer.from(lines.join('\n') + '\n');
+  }
+
+  private writeFully(chunk: Buffer): void {
+    let offset = 0;
+    while (offset < chunk.length) {
+      offset += writeSync(this.fd, chunk, offset, chunk.length - offset);
+    }
+  }
+}
@@ -1,48 +1,159 @@
-import { Injectable, LoggerService as NestLoggerService } from '@nestjs/common';
+import {
+  Injectable,
+  LoggerService as NestLoggerService,
+  LogLevel,
+  OnApplicationShutdown,
+} from '@nestjs/common';
+import { MetricsService } from '../metrics/metrics.service';
+import { AsyncLogSink } from './async-log-sink';
+
+/** Most severe first */
+const LEVELS: LogLevel[] = ['fatal', 'error', 'warn', 'log', 'debug', 'verbose'];
+
+const STACK_FORMAT = /^(.)+\n\s+at .+:\d+:\d+/;
 
 /**
  * Logger Service
  *
- * Provides structured logging for the application.
- * Can be extended to integrate with external logging services.
+ * Structured logging for the application, installed as Nest's logger in
+ * main.ts so `new Logger(Context)` instances write through it. Each entry is
+ * one JSON line ({ time, level, context, message, stack?, ...fields }) on
+ * stdout, written asynchronously through an AsyncLogSink: a slow stdout
+ * drops and counts lines instead of blocking requests.
+ *
+ * LOG_LEVEL is the least severe level written (default: debug in
+ * development, log otherwise); entries below it are discarded before they
+ * are formatted. LOG_DEBUG_SAMPLE_RATE (0-1) keeps that fraction of debug
+ * and verbose entries.
  */
 @Injectable()
-export class LoggerService implements NestLoggerService {
+export class LoggerService implements NestLoggerService, OnApplicationShutdown {
   private context?: string;
+  private readonly threshold = LEVELS.indexOf(
+    LEVELS.includes(process.env.LOG_LEVEL as LogLevel)
+      ? (process.env.LOG_LEVEL as LogLevel)
+      : process.env.NODE_ENV === 'development'
+        ? 'debug'
+        : 'log',
+  );
+  private readonly debugSampleRate = parseFloat(process.env.LOG_DEBUG_SAMPLE_RATE || '1');
+  private readonly sink = new AsyncLogSink(
+    process.stdout.fd,
+    parseInt(process.env.LOG_BUFFER_MAX_LINES || '10000', 10),
+  );
+
+  constructor(metrics: MetricsService) {
+    metrics.gauge('log.buffered', () => this.sink.buffered);
+    metrics.gauge('log.dropped', () => this.sink.dropped);
+  }
 
   setContext(context: string): void {
     this.context = context;
   }
 
-  log(message: string, context?: string): void {
-    const ctx = context || this.context || 'Application';
-    console.log(`[${ctx}] ${message}`);
+  isLevelEnabled(level: LogLevel): boolean {
+    const rank = LEVELS.indexOf(level);
+    return rank !== -1 && rank <= this.threshold;
   }
 
-  error(message: string, trace?: string, context?: string): void {
-    const ctx = context || this.context || 'Application';
-    console.error(`[${ctx}] ERROR: ${message}`);
-    if (trace) {
-      console.error(trace);
-    }
+  fatal(message: unknown, ...optionalParams: unknown[]): void {
+    this.write('fatal', message, optionalParams);
+  }
+
+  error(message: unknown, ...optionalParams: unknown[]): void {
+    this.write('error', message, optionalParams);
+  }
+
+  warn(message: unknown, ...optionalParams: unknown[]): void {
+    this.write('warn', message, optionalParams);
+  }
+
+  log(message: unknown, ...optionalParams: unknown[]): void {
+    this.write('log', message, optionalParams);
+  }
+
+  debug(message: unknown, ...optionalParams: unknown[]): void {
+    this.write('debug', message, optionalParams);
   }
 
-  warn(message: string, context?: string): void {
-    const ctx = context || this.context || 'Application';
-    console.warn(`[${ctx}] WARN: ${message}`);
+  verbose(message: unknown, ...optionalParams: unknown[]): void {
+    this.write('verbose', message, optionalParams);
   }
 
-  debug(message: string, context?: string): void {
-    if (process.env.NODE_ENV === 'development') {
-      const ctx = context || this.context || 'Application';
-      console.debug(`[${ctx}] DEBUG: ${message}`);
+  onApplicationShutdown(): Promise<void> {
+    return this.sink.end();
+  }
+
+  private write(level: LogLevel, message: unknown, params: unknown[]): void {
+    if (!this.isLevelEnabled(level)) {
+      return;
     }
+    if (
+      (level === 'debug' || level === 'verbose') &&
+      this.debugSampleRate < 1 &&
+      Math.random() >= this.debugSampleRate
+    ) {
+      return;
+    }
+
+    this.sink.write(this.format(level, message, params));
   }
 
-  verbose(message: string, context?: string): void {
-    if (process.env.NODE_ENV === 'development') {
-      const ctx = context || this.context || 'Application';
-      console.log(`[${ctx}] VERBOSE: ${message}`);
+  /**
+   * Follows Nest's calling convention: a trailing string is the context,
+   * and for errors a stack trace or Error may precede it
+   */
+  private format(level: LogLevel, message: unknown, params: unknown[]): string {
+    const rest = [...params];
+    let context = this.context || 'Application';
+    let stack: string | undefined;
+
+    const last = rest[rest.length - 1];
+    const lastIsStack = typeof last === 'string' && STACK_FORMAT.test(last);
+    if (typeof last === 'string' && !lastIsStack && (rest.length > 1 || level !== 'error')) {
+      context = last;
+      rest.pop();
+    }
+
+    const entry: Record<string, unknown> = {
+      time: new Date().toISOString(),
+      level,
+      context,
+      message,
+    };
+
+    if (message instanceof Error) {
+      entry.message = message.message;
+      stack = message.stack;
+    } else if (message !== null && typeof message === 'object') {
+      entry.message = undefined;
+      Object.assign(entry, message);
+    }
+
+    const extra: unknown[] = [];
+    for (const param of rest) {
+      if (param instanceof Error) {
+        stack ??= param.stack ?? String(param);
+      } else if (typeof param === 'string' && level === 'error') {
+        stack ??= param;
+      } else if (param !== null && typeof param === 'object') {
+        Object.assign(entry, param);
+      } else if (param !== undefined) {
+        extra.push(param);
+      }
+    }
+    if (stack) {
+      entry.stack = stack;
+    }
+    if (extra.length > 0) {
+      entry.params = extra;
+    }
+
+    try {
+      return JSON.stringify(entry);
+    } catch {
+      // Circular or BigInt fields: keep what is printable
+      return JSON.stringify({ time: entry.time, level, context, message: String(message), stack });
     }
   }
 }
@@ -0,0 +1,37 @@
+import { MetricsService } from '../metrics.service';
+
+describe('MetricsService', () => {
+  let metrics: MetricsService;
+
+  beforeEach(() => {
+    metrics = new MetricsService();
+  });
+
+  it('should accumulate counters', () => {
+    metrics.increment('requests');
+    metrics.increment('requests', 2);
+
+    expect(metrics.snapshot().counters.requests).toBe(3);
+  });
+
+  it('should read gauges when a snapshot is taken', () => {
+    let depth = 1;
+    metrics.gauge('queue_depth', () => depth);
+    depth = 5;
+
+    expect(metrics.snapshot().gauges.queue_depth).toBe(5);
+  });
+
+  it('should summarize histogram percentiles', () => {
+    for (let i = 1; i <= 100; i++) {
+      metrics.observe('latency_ms', i);
+    }
+
+    const summary = metrics.snapshot().histograms.latency_ms;
+
+    expect(summary.count).toBe(100);
+    expect(summary.p50).toBe(51);
+    expect(summary.p99).toBe(100);
+    expect(summary.max).toBe(100);
+  });
+});
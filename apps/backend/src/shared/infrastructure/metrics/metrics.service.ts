@@ -0,0 +1,100 @@
+import { Injectable } from '@nestjs/common';
+
+export interface HistogramSummary {
+  count: number;
+  p50: number;
+  p95: number;
+  p99: number;
+  max: number;
+}
+
+export interface MetricsSnapshot {
+  counters: Record<string, number>;
+  gauges: Record<string, number>;
+  histograms: Record<string, HistogramSummary>;
+}
+
+/**
+ * Sliding window of the most recent samples of one histogram
+ */
+class SampleWindow {
+  private readonly samples: Float64Array;
+  private next = 0;
+  private filled = 0;
+  private total = 0;
+
+  constructor(capacity: number) {
+    this.samples = new Float64Array(capacity);
+  }
+
+  add(value: number): void {
+    this.samples[this.next] = value;
+    this.next = (this.next + 1) % this.samples.length;
+    this.filled = Math.min(this.filled + 1, this.samples.length);
+    this.total += 1;
+  }
+
+  summarize(): HistogramSummary {
+    const sorted = Array.from(this.samples.subarray(0, this.filled)).sort((a, b) => a - b);
+    const at = (q: number) =>
+      sorted.length === 0 ? 0 : sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * q))];
+
+    return {
+      count: this.total,
+      p50: at(0.5),
+      p95: at(0.95),
+      p99: at(0.99),
+      max: sorted.length === 0 ? 0 : sorted[sorted.length - 1],
+    };
+  }
+}
+
+/**
+ * Metrics Service
+ *
+ * In-process counters, gauges and latency histograms shared by all
+ * bounded contexts. Histograms keep the last WINDOW_SIZE samples, so
+ * percentiles describe recent behaviour rather than the whole uptime.
+ */
+@Injectable()
+export class MetricsService {
+  private static readonly WINDOW_SIZE = 2048;
+
+  private readonly counters = new Map<string, number>();
+  private readonly gauges = new Map<string, () => number>();
+  private readonly histograms = new Map<string, SampleWindow>();
+
+  increment(name: string, value: number = 1): void {
+    this.counters.set(name, (this.counters.get(name) ?? 0) + value);
+  }
+
+  /**
+   * Register a gauge whose value is read when a snapshot is taken
+   */
+  gauge(name: string, read: () => number): void {
+    this.gauges.set(name, read);
+  }
+
+  observe(name: string, value: number): void {
+    let window = this.histograms.get(name);
+    if (!window) {
+      window = new SampleWindow(MetricsService.WINDOW_SIZE);
+      this.histograms.set(name, window);
+    }
+    window.add(value);
+  }
+
+  snapshot(): MetricsSnapshot {
+    const gauges: Record<string, number> = {};
+    for (const [name, read] of this.gauges) {
+      gauges[name] = read();
+    }
+
+    const histograms: Record<string, HistogramSummary> = {};
+    for (const [name, window] of this.histograms) {
+      histograms[name] = window.summarize();
+    }
+
+    return { counters: Object.fromEntries(this.counters), gauges, histograms };
+  }
+}
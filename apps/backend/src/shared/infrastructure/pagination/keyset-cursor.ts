@@ -0,0 +1,22 @@
+/**
+ * Keyset Cursor
+ *
+ * Opaque pagination cursor holding the sort key of the last item of a
+ * page. Clients pass it back unchanged; the next page starts strictly
+ * after that key, so deep pages cost the same as the first one.
+ */
+export function encodeCursor(key: unknown[]): string {
+  return Buffer.from(JSON.stringify(key)).toString('base64url');
+}
+
+/**
+ * Decode a cursor, or return null if it was not produced by encodeCursor
+ */
+export function decodeCursor(cursor: string): unknown[] | null {
+  try {
+    const key = JSON.parse(Buffer.from(cursor, 'base64url').toString());
+    return Array.isArray(key) ? key : null;
+  } catch {
+    return null;
+  }
+}
@@ -0,0 +1,60 @@
+import { DeadlineQueue } from '../deadline-queue';
+
+describe('DeadlineQueue', () => {
+  it('should pop due keys earliest first', () => {
+    const queue = new DeadlineQueue<string>();
+    queue.schedule('c', 30);
+    queue.schedule('a', 10);
+    queue.schedule('d', 40);
+    queue.schedule('b', 20);
+
+    expect(queue.popDue(25)).toEqual(['a', 'b']);
+    expect(queue.peek()).toBe(30);
+    expect(queue.size).toBe(2);
+  });
+
+  it('should respect the batch limit', () => {
+    const queue = new DeadlineQueue<number>();
+    for (let i = 0; i < 10; i++) {
+      queue.schedule(i, 100 - i);
+    }
+
+    expect(queue.popDue(1000, 3)).toEqual([9, 8, 7]);
+    expect(queue.size).toBe(7);
+  });
+
+  it('should cancel and reschedule keys', () => {
+    const queue = new DeadlineQueue<string>();
+    queue.schedule('a', 10);
+    queue.schedule('b', 20);
+    queue.schedule('c', 30);
+
+    expect(queue.cancel('a')).toBe(true);
+    expect(queue.cancel('a')).toBe(false);
+    queue.schedule('c', 5);
+
+    expect(queue.has('a')).toBe(false);
+    expect(queue.popDue(25)).toEqual(['c', 'b']);
+  });
+
+  it('should stay ordered under random operations', () => {
+    const queue = new DeadlineQueue<number>();
+    const expected = new Map<number, number>();
+
+    for (let i = 0; i < 500; i++) {
+      const key = Math.floor(Math.random() * 100);
+      if (Math.random() < 0.3) {
+        queue.cancel(key);
+        expected.delete(key);
+      } else {
+        const at = Math.floor(Math.random() * 1000);
+        queue.schedule(key, at);
+        expected.set(key, at);
+      }
+    }
+
+    const popped = queue.popDue(Infinity).map((key) => expected.get(key)!);
+    expect(popped).toHaveLength(expected.size);
+    expect(popped).toEqual([...popped].sort((a, b) => a - b));
+  });
+});
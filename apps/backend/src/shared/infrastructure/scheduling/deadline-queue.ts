@@ -0,0 +1,139 @@
+interface Entry<K> {
+  key: K;
+  at: number;
+}
+
+/**
+ * Deadline Queue
+ *
+ * Binary min-heap of keys ordered by deadline (epoch milliseconds), with
+ * a key -> position index so a key can be rescheduled or cancelled in
+ * O(log n) instead of being left behind as a stale entry.
+ */
+export class DeadlineQueue<K> {
+  private readonly heap: Entry<K>[] = [];
+  private readonly positions = new Map<K, number>();
+
+  get size(): number {
+    return this.heap.length;
+  }
+
+  /**
+   * Earliest deadline, if any
+   */
+  peek(): number | undefined {
+    return this.heap[0]?.at;
+  }
+
+  has(key: K): boolean {
+    return this.positions.has(key);
+  }
+
+  /**
+   * Add `key` at deadline `at`, or move it there if already queued
+   */
+  schedule(key: K, at: number): void {
+    const position = this.positions.get(key);
+    if (position === undefined) {
+      this.heap.push({ key, at });
+      this.positions.set(key, this.heap.length - 1);
+      this.siftUp(this.heap.length - 1);
+      return;
+    }
+
+    const previous = this.heap[position].at;
+    this.heap[position].at = at;
+    if (at < previous) {
+      this.siftUp(position);
+    } else {
+      this.siftDown(position);
+    }
+  }
+
+  cancel(key: K): boolean {
+    const position = this.positions.get(key);
+    if (position === undefined) {
+      return false;
+    }
+
+    this.removeAt(position);
+    return true;
+  }
+
+  /**
+   * Remove and return up to `max` keys whose deadline is at or before `now`,
+   * earliest first
+   */
+  popDue(now: number, max: number = Infinity): K[] {
+    const due: K[] = [];
+    while (due.length < max && this.heap.length > 0 && this.heap[0].at <= now) {
+      due.push(this.heap[0].key);
+      this.removeAt(0);
+    }
+    return due;
+  }
+
+  clear(): void {
+    this.heap.length = 0;
+    this.positions.clear();
+  }
+
+  private removeAt(position: number): void {
+    const removed = this.heap[position];
+    const last = this.heap.pop()!;
+    this.positions.delete(removed.key);
+
+    if (position === this.heap.length) {
+      return;
+    }
+
+    this.heap[position] = last;
+    this.positions.set(last.key, position);
+    if (last.at < removed.at) {
+      this.siftUp(position);
+    } else {
+      this.siftDown(position);
+    }
+  }
+
+  private siftUp(position: number): void {
+    while (position > 0) {
+      const parent = (position - 1) >> 1;
+      if (this.heap[parent].at <= this.heap[position].at) {
+        return;
+      }
+      this.swap(parent, position);
+      position = parent;
+    }
+  }
+
+  private siftDown(position: number): void {
+    const size = this.heap.length;
+    for (;;) {
+      const left = 2 * position + 1;
+      const right = left + 1;
+      let smallest = position;
+
+      if (left < size && this.heap[left].at < this.heap[smallest].at) {
+        smallest = left;
+      }
+      if (right < size && this.heap[right].at < this.heap[smallest].at) {
+        smallest = right;
+      }
+      if (smallest === position) {
+        return;
+      }
+
+      this.swap(smallest, position);
+      position = smallest;
+    }
+  }
+
+  private swap(a: number, b: number): void {
+    const entry = this.heap[a];
+    this.heap[a] = this.heap[b];
+    this.heap[b] = entry;
+    this.positions.set(this.heap[a].key, a);
+    this.positions.set(this.heap[b].key, b);
+  }
+}
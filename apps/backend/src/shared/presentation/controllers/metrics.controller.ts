@@ -0,0 +1,28 @@
+import { Controller, Get, UseGuards } from '@nestjs/common';
+import { ApiTags, ApiOperation, ApiResponse, ApiBearerAuth } from '@nestjs/swagger';
+import { JwtAuthGuard } from '../guards/jwt-auth.guard';
+import { RolesGuard } from '../guards/roles.guard';
+import { Roles } from '../decorators/roles.decorator';
+import { MetricsService, MetricsSnapshot } from '../../infrastructure/metrics/metrics.service';
+
+/**
+ * Metrics Controller
+ *
+ * Exposes the in-process metrics snapshot (Admin only).
+ */
+@ApiTags('metrics')
+@ApiBearerAuth()
+@Controller('metrics')
+@UseGuards(JwtAuthGuard, RolesGuard)
+export class MetricsController {
+  constructor(private readonly metrics: MetricsService) {}
+
+  @Get()
+  @Roles('ADMIN', 'SUPER_ADMIN')
+  @ApiOperation({ summary: 'Get runtime metrics (Admin only)' })
+  @ApiResponse({ status: 200, description: 'Metrics snapshot' })
+  @ApiResponse({ status: 403, description: 'Forbidden - Admin access required' })
+  getMetrics(): MetricsSnapshot {
+    return this.metrics.snapshot();
+  }
+}
@@ -0,0 +1,19 @@
+import { applyDecorators, SetMetadata, UseInterceptors } from '@nestjs/common';
+import {
+  CONDITIONAL_GET_METADATA,
+  ConditionalGetOptions,
+} from '../../infrastructure/cache/response-cache.service';
+import { ConditionalGetInterceptor } from '../interceptors/conditional-get.interceptor';
+
+/**
+ * Conditional GET Decorator
+ *
+ * Answers repeated GETs of unchanged data with 304 Not Modified, without
+ * running the query.
+ * Usage: @ConditionalGet({ resource: 'wallet', invalidatedBy: ['coins.earned'] })
+ */
+export const ConditionalGet = (options: ConditionalGetOptions) =>
+  applyDecorators(
+    SetMetadata(CONDITIONAL_GET_METADATA, options),
+    UseInterceptors(ConditionalGetInterceptor),
+  );
@@ -0,0 +1,148 @@
+import { CallHandler, ExecutionContext } from '@nestjs/common';
+import { DiscoveryService, MetadataScanner, Reflector } from '@nestjs/core';
+import { EventEmitter2 } from '@nestjs/event-emitter';
+import { AsyncLocalStorage, AsyncResource } from 'async_hooks';
+import { defer, lastValueFrom, Observable, of } from 'rxjs';
+import { ConditionalGetInterceptor } from '../conditional-get.interceptor';
+import { ConditionalGet } from '../../decorators/conditional-get.decorator';
+import { ResponseCache } from '../../../infrastructure/cache/response-cache.service';
+import { MetricsService } from '../../../infrastructure/metrics/metrics.service';
+import { PrismaService } from '../../../infrastructure/database/prisma.service';
+
+class PlayerController {
+  @ConditionalGet({ resource: 'wallet', invalidatedBy: ['coins.earned'] })
+  getWallet() {}
+
+  @ConditionalGet({ resource: 'lives', validUntil: (lives) => lives.nextLifeAt })
+  getLives() {}
+
+  @ConditionalGet({ resource: 'leaderboard', shared: true })
+  getLeaderboard() {}
+}
+
+describe('ConditionalGetInterceptor', () => {
+  let eventEmitter: EventEmitter2;
+  let interceptor: ConditionalGetInterceptor;
+  const primaryScope = new AsyncLocalStorage<true>();
+
+  const coinsEarned = (userId: string) => ({ getAggregateId: () => userId });
+
+  /**
+   * Run a GET through the interceptor, with Express' freshness check
+   */
+  const get = async (
+    route: keyof PlayerController,
+    {
+      ifNoneMatch,
+      userId = 'user-1',
+      handle = () => of({ balance: 100 }),
+    }: { ifNoneMatch?: string; userId?: string; handle?: () => Observable<unknown> } = {},
+  ) => {
+    const headers: Record<string, string> = {};
+    const request = {
+      method: 'GET',
+      originalUrl: `/${route}`,
+      user: { userId },
+      get fresh() {
+        return ifNoneMatch !== undefined && ifNoneMatch === headers.ETag;
+      },
+    };
+    const context = {
+      getHandler: () => PlayerController.prototype[route],
+      switchToHttp: () => ({
+        getRequest: () => request,
+        getResponse: () => ({ setHeader: (name: string, value: string) => (headers[name] = value) }),
+      }),
+    } as unknown as ExecutionContext;
+    const next = { handle: jest.fn(handle) };
+
+    const body = await lastValueFrom(interceptor.intercept(context, next as CallHandler));
+
+    return { body, etag: headers.ETag, ran: next.handle.mock.calls.length > 0 };
+  };
+
+  beforeEach(() => {
+    eventEmitter = new EventEmitter2();
+    const metrics = new MetricsService();
+    const cache = new ResponseCache(
+      eventEmitter,
+      {
+        getControllers: () => [{ instance: new PlayerController() }],
+      } as unknown as DiscoveryService,
+      new MetadataScanner(),
+      metrics,
+    );
+    cache.onModuleInit();
+
+    interceptor = new ConditionalGetInterceptor(new Reflector(), cache, metrics, {
+      runOnPrimary: (work: () => unknown) => primaryScope.run(true, work),
+    } as unknown as PrismaService);
+  });
+
+  it('should answer an unchanged resource without running the query', async () => {
+    const first = await get('getWallet');
+    expect(first.ran).toBe(true);
+    expect(first.etag).toMatch(/^W\/".+"$/);
+
+    const again = await get('getWallet', { ifNoneMatch: first.etag });
+    expect(again.ran).toBe(false);
+    expect(again.etag).toBe(first.etag);
+    expect(again.body).toBeUndefined();
+  });
+
+  it('should run the query again once an event changed the resource', async () => {
+    const { etag } = await get('getWallet');
+
+    eventEmitter.emit('coins.earned', coinsEarned('user-2'));
+    expect((await get('getWallet', { ifNoneMatch: etag })).ran).toBe(false);
+
+    eventEmitter.emit('coins.earned', coinsEarned('user-1'));
+    expect((await get('getWallet', { ifNoneMatch: etag })).ran).toBe(true);
+  });
+
+  it('should not remember a response built while the resource changed', async () => {
+    const { etag } = await get('getWallet', {
+      handle: () =>
+        defer(() => {
+          eventEmitter.emit('coins.earned', coinsEarned('user-1'));
+          return of({ balance: 100 });
+        }),
+    });
+
+    expect((await get('getWallet', { ifNoneMatch: etag })).ran).toBe(true);
+  });
+
+  it('should not remember a response past its validity', async () => {
+    const handle = () => of({ currentLives: 4, nextLifeAt: new Date(Date.now() - 1000) });
+    const { etag } = await get('getLives', { handle });
+
+    expect((await get('getLives', { ifNoneMatch: etag, handle })).ran).toBe(true);
+  });
+
+  it('should serve shared resources to every player from one copy', async () => {
+    const first = await get('getLeaderboard', { handle: () => of([{ rank: 1 }]) });
+    const other = await get('getLeaderboard', { userId: 'user-2' });
+
+    expect(first.ran).toBe(true);
+    expect(other.ran).toBe(false);
+    expect(other.body).toEqual([{ rank: 1 }]);
+    expect(other.etag).toBe(first.etag);
+  });
+
+  it('should not pin the pre-event copy served by a lagging replica', async () => {
+    let primary = { balance: 100 };
+    const replica = { balance: 100 };
+    // Like Nest, run the handler in the async context handle() was called in
+    const handle = () =>
+      defer(AsyncResource.bind(() => of(primaryScope.getStore() ? primary : replica)));
+
+    const { etag } = await get('getWallet', { handle });
+
+    primary = { balance: 150 };
+    eventEmitter.emit('coins.earned', coinsEarned('user-1'));
+
+    const after = await get('getWallet', { ifNoneMatch: etag, handle });
+    expect(after.body).toEqual({ balance: 150 });
+    expect((await get('getWallet', { ifNoneMatch: etag, handle })).ran).toBe(true);
+  });
+});
@@ -0,0 +1,101 @@
+import { CallHandler, ExecutionContext, Injectable, NestInterceptor } from '@nestjs/common';
+import { Reflector } from '@nestjs/core';
+import { Request, Response } from 'express';
+import { Observable, of } from 'rxjs';
+import { map } from 'rxjs/operators';
+import {
+  CONDITIONAL_GET_METADATA,
+  ConditionalGetOptions,
+  ResponseCache,
+} from '../../infrastructure/cache/response-cache.service';
+import { MetricsService } from '../../infrastructure/metrics/metrics.service';
+import { PrismaService } from '../../infrastructure/database/prisma.service';
+
+/**
+ * Conditional GET Interceptor
+ *
+ * Sets an ETag on the responses of `@ConditionalGet` routes. When the
+ * request's If-None-Match matches the ETag known for the player's current
+ * copy, the handler is skipped and Express answers 304 Not Modified.
+ * Shared routes are served from the short-lived shared copy when there is
+ * one. See ResponseCache.
+ *
+ * Player responses are built on the primary: a lagging replica could return
+ * the copy from before an invalidating event, whose ETag would then be
+ * remembered as current.
+ */
+@Injectable()
+export class ConditionalGetInterceptor implements NestInterceptor {
+  constructor(
+    private readonly reflector: Reflector,
+    private readonly cache: ResponseCache,
+    private readonly metrics: MetricsService,
+    private readonly prisma: PrismaService,
+  ) {}
+
+  intercept(context: ExecutionContext, next: CallHandler): Observable<unknown> {
+    const options = this.reflector.get<ConditionalGetOptions | undefined>(
+      CONDITIONAL_GET_METADATA,
+      context.getHandler(),
+    );
+    const request = context.switchToHttp().getRequest<Request & { user?: { userId: string } }>();
+    const response = context.switchToHttp().getResponse<Response>();
+
+    if (!options || request.method !== 'GET') {
+      return next.handle();
+    }
+    response.setHeader('Cache-Control', 'private, no-cache');
+
+    if (options.shared) {
+      return this.shared(`${options.resource}:${request.originalUrl}`, request, response, next);
+    }
+
+    const userId = request.user?.userId;
+    if (!userId) {
+      return next.handle();
+    }
+
+    // Express answers 304 when If-None-Match matches the ETag header (req.fresh)
+    const etag = this.cache.etagOf(options.resource, userId);
+    if (etag) {
+      response.setHeader('ETag', etag);
+      if (request.fresh) {
+        this.metrics.increment('response_cache.not_modified');
+        return of(undefined);
+      }
+    }
+
+    const stamp = this.cache.stamp(options.resource, userId);
+    // Nest binds the handler to the async context handle() is called in
+    return this.prisma.runOnPrimary(() => next.handle()).pipe(
+      map((body) => {
+        const validUntil = options.validUntil?.(body) ?? null;
+        response.setHeader(
+          'ETag',
+          this.cache.remember(options.resource, userId, stamp, body, validUntil),
+        );
+        return body;
+      }),
+    );
+  }
+
+  private shared(
+    key: string,
+    request: Request,
+    response: Response,
+    next: CallHandler,
+  ): Observable<unknown> {
+    const cached = this.cache.getShared(key);
+    if (cached) {
+      response.setHeader('ETag', cached.etag);
+      return of(request.fresh ? undefined : cached.body);
+    }
+
+    return next.handle().pipe(
+      map((body) => {
+        response.setHeader('ETag', this.cache.setShared(key, body).etag);
+        return body;
+      }),
+    );
+  }
+}
@@ -1,7 +1,16 @@
 import { Global, Module } from '@nestjs/common';
+import { DiscoveryModule } from '@nestjs/core';
+import { CqrsModule } from '@nestjs/cqrs';
 import { PrismaService } from './infrastructure/database/prisma.service';
+import { ReplicaRouting } from './infrastructure/database/replica-routing.service';
 import { EventBusService } from './infrastructure/events/event-bus.service';
+import { OutboxDispatcher } from './infrastructure/events/outbox-dispatcher.service';
 import { LoggerService } from './infrastructure/logging/logger.service';
+import { UserLoader } from './infrastructure/cache/user-loader.service';
+import { ReferenceCatalog } from './infrastructure/cache/reference-catalog.service';
+import { ResponseCache } from './infrastructure/cache/response-cache.service';
+import { MetricsService } from './infrastructure/metrics/metrics.service';
+import { MetricsController } from './presentation/controllers/metrics.controller';
 
 /**
  * Shared Module
@@ -11,7 +20,27 @@ import { LoggerService } from './infrastructure/logging/logger.service';
  */
 @Global()
 @Module({
-  providers: [PrismaService, EventBusService, LoggerService],
-  exports: [PrismaService, EventBusService, LoggerService],
+  imports: [DiscoveryModule, CqrsModule],
+  controllers: [MetricsController],
+  providers: [
+    PrismaService,
+    ReplicaRouting,
+    EventBusService,
+    OutboxDispatcher,
+    LoggerService,
+    UserLoader,
+    ReferenceCatalog,
+    ResponseCache,
+    MetricsService,
+  ],
+  exports: [
+    PrismaService,
+    EventBusService,
+    LoggerService,
+    UserLoader,
+    ReferenceCatalog,
+    ResponseCache,
+    MetricsService,
+  ],
 })
 export class SharedModule {}
@@ -10,6 +10,7 @@ import { tokenStorage, clearAllData } from '../utils/storage';
  * - Request interceptor for auth tokens
  * - Response interceptor for error handling
  * - Token refresh logic
+ * - Conditional GETs (ETag / 304 Not Modified)
  */
 
 export const apiClient = axios.create({
@@ -18,8 +19,17 @@ export const apiClient = axios.create({
   headers: {
     'Content-Type': 'application/json',
   },
+  // 304 is answered from the ETag cache below
+  validateStatus: (status) => (status >= 200 && status < 300) || status === 304,
 });
 
+// Last ETag and body of each GET: sent back as If-None-Match, and reused
+// when the server answers 304 Not Modified
+const etagCache = new Map<string, { etag: string; data: unknown }>();
+
+const cacheKey = (config: InternalAxiosRequestConfig) =>
+  `${config.url}?${JSON.stringify(config.params ?? {})}`;
+
 // Request interceptor - Add auth token to requests
 apiClient.interceptors.request.use(
   async (config: InternalAxiosRequestConfig) => {
@@ -29,6 +39,11 @@ apiClient.interceptors.request.use(
       config.headers.Authorization = `Bearer ${token}`;
     }
 
+    const cached = config.method === 'get' ? etagCache.get(cacheKey(config)) : undefined;
+    if (cached && config.headers) {
+      config.headers['If-None-Match'] = cached.etag;
+    }
+
     return config;
   },
   (error) => {
@@ -38,7 +53,23 @@ apiClient.interceptors.request.use(
 
 // Response interceptor - Handle errors and token refresh
 apiClient.interceptors.response.use(
-  (response) => response,
+  (response) => {
+    if (response.config.method !== 'get') {
+      return response;
+    }
+
+    const key = cacheKey(response.config);
+    const cached = etagCache.get(key);
+    if (response.status === 304 && cached) {
+      return { ...response, status: 200, data: cached.data };
+    }
+
+    const etag = response.headers.etag;
+    if (typeof etag === 'string') {
+      etagCache.set(key, { etag, data: response.data });
+    }
+    return response;
+  },
   async (error: AxiosError) => {
     const originalRequest = error.config as InternalAxiosRequestConfig & { _retry?: boolean };
 
@@ -51,6 +82,7 @@ apiClient.interceptors.response.use(
 
         if (!refreshToken) {
           // No refresh token, logout user
+          etagCache.clear();
           await clearAllData();
           return Promise.reject(error);
         }
@@ -74,6 +106,7 @@ apiClient.interceptors.response.use(
         return apiClient(originalRequest);
       } catch (refreshError) {
         // Refresh failed, logout user
+        etagCache.clear();
         await clearAllData();
         return Promise.reject(refreshError);
       }